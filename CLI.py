@@ -15,26 +15,14 @@ import time
 import random
 import json
 import threading
+import importlib
 import importlib.util
-try:
-    import sounddevice as sd
-except Exception:
-    sd = None
-try:
-    import soundfile as sf
-except Exception:
-    sf = None
 from collections import deque
 import numpy as np
 from typing import Any
 import argparse
 import os
 
-try:
-    import cv2
-except Exception:
-    cv2 = None
-
 # Set Qt platform before importing PyQt5
 if os.environ.get('DISPLAY') is None or '--headless' in sys.argv:
     os.environ['QT_QPA_PLATFORM'] = 'offscreen'
@@ -72,12 +60,21 @@ import matplotlib
 matplotlib.use("Qt5Agg")
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
-try:
-    from reportlab.pdfgen import canvas as pdfcanvas
-    from reportlab.lib.pagesizes import A4
-except Exception:
-    pdfcanvas = None
-    A4 = None
+
+# Device and export backends (OpenCV, sounddevice, soundfile, reportlab) are
+# only needed once the user toggles the camera/microphone or exports a PDF,
+# so they are imported on first use instead of at start-up.
+_OPTIONAL_MODULES: dict = {}
+
+
+def _optional_import(name: str):
+    """Return module ``name`` or ``None`` when it is not installed."""
+    if name not in _OPTIONAL_MODULES:
+        try:
+            _OPTIONAL_MODULES[name] = importlib.import_module(name)
+        except Exception:
+            _OPTIONAL_MODULES[name] = None
+    return _OPTIONAL_MODULES[name]
 
 # --- IMPORT SILNIKA CIEL/Ω ---
 try:
@@ -506,6 +503,7 @@ class CIELUltra(QWidget):
         self.canvas_tensor.draw()
 
         # Camera
+        cv2 = _optional_import("cv2")
         if cv2 is not None and self.cap and self.cap.isOpened():
             ret, frame = self.cap.read()
             if ret:
@@ -528,6 +526,7 @@ class CIELUltra(QWidget):
             self.btn_pause.setText("▶ Resume EEG" if self.paused else "⏸ Pause EEG")
 
     def toggle_camera(self):
+        cv2 = _optional_import("cv2")
         if cv2 is None:
             safe_chat_add(self.chat_log, "⚠ OpenCV is not available; camera requires opencv-python.")
             return
@@ -543,6 +542,8 @@ class CIELUltra(QWidget):
                 self.video_label.setText("📷 Camera error")
 
     def toggle_mic(self):
+        sd = _optional_import("sounddevice")
+        sf = _optional_import("soundfile")
         if sd is None or sf is None:
             safe_chat_add(self.chat_log, "⚠ Microphone requires sounddevice and soundfile.")
             return
@@ -556,6 +557,8 @@ class CIELUltra(QWidget):
             safe_chat_add(self.chat_log, "🛑 Microphone: stopped")
 
     def record_audio(self):
+        sd = _optional_import("sounddevice")
+        sf = _optional_import("soundfile")
         if sd is None or sf is None:
             return
         try:
@@ -762,9 +765,12 @@ class CIELUltra(QWidget):
         safe_chat_add(self.chat_log, "✅ JSON export completed.")
 
     def export_pdf(self):
-        if pdfcanvas is None or A4 is None:
+        pdfcanvas = _optional_import("reportlab.pdfgen.canvas")
+        pagesizes = _optional_import("reportlab.lib.pagesizes")
+        if pdfcanvas is None or pagesizes is None:
             safe_chat_add(self.chat_log, "⚠ PDF export requires reportlab.")
             return
+        A4 = pagesizes.A4
         try:
             pdf = pdfcanvas.Canvas("ciel_report.pdf", pagesize=A4)
             textobject = pdf.beginText(40, 800)
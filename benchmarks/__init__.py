@@ -0,0 +1,29 @@
+"""CIEL/Ω Quantum Consciousness Suite
+
+Copyright (c) 2025 Adrian Lipa / Intention Lab
+Licensed under the CIEL Research Non-Commercial License v1.1.
+
+Benchmark suite with a JSON results history and baseline regression checks.
+Run ``python -m benchmarks --help`` for the command-line runner.
+"""
+
+from __future__ import annotations
+
+from .cases import BENCHMARKS, register, select
+from .harness import Benchmark, Measurement, measure
+from .history import Baseline, ResultsHistory, compare, make_run
+from .runner import run_suite
+
+__all__ = [
+    "BENCHMARKS",
+    "Baseline",
+    "Benchmark",
+    "Measurement",
+    "ResultsHistory",
+    "compare",
+    "make_run",
+    "measure",
+    "register",
+    "run_suite",
+    "select",
+]
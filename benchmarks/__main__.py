@@ -0,0 +1,125 @@
+"""CIEL/Ω Quantum Consciousness Suite
+
+Copyright (c) 2025 Adrian Lipa / Intention Lab
+Licensed under the CIEL Research Non-Commercial License v1.1.
+
+Command-line runner: ``python -m benchmarks``.
+
+Examples::
+
+    python -m benchmarks --list
+    python -m benchmarks --quick
+    python -m benchmarks --only memory. tmp. --save-baseline
+    python -m benchmarks --tolerance wall_time=0.4
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .cases import select
+from .history import Baseline, ResultsHistory, compare, make_run
+from .runner import run_suite
+
+DEFAULT_HISTORY = Path("data/benchmarks/history.json")
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+
+def _parse_tolerances(items: List[str]) -> Dict[str, float]:
+    tolerances: Dict[str, float] = {}
+    for item in items:
+        metric, sep, value = item.partition("=")
+        if not sep:
+            raise argparse.ArgumentTypeError(f"expected METRIC=FRACTION, got {item!r}")
+        tolerances[metric.strip()] = float(value)
+    return tolerances
+
+
+def _format(record: Dict) -> str:
+    rss = record.get("peak_rss_bytes")
+    rss_text = f"{rss / 2**20:8.1f} MiB" if rss is not None else "       n/a"
+    return (
+        f"{record['key']:<40} {record['wall_time'] * 1e3:10.3f} ms "
+        f"{record['throughput']:12.1f} {record['unit']}/s "
+        f"alloc {record['alloc_peak_bytes'] / 2**10:10.1f} KiB  rss {rss_text}"
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Run the CIEL benchmark suite")
+    parser.add_argument("--only", nargs="*", default=None, help="benchmark name prefixes to run")
+    parser.add_argument("--list", action="store_true", help="list benchmarks and exit")
+    parser.add_argument("--quick", action="store_true", help="run only the smallest size of each benchmark")
+    parser.add_argument("--repeat", type=int, default=5, help="timed repetitions per case")
+    parser.add_argument("--warmup", type=int, default=1, help="untimed warm-up calls per case")
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="run all cases in this process (faster; peak RSS becomes a suite-wide high-water mark)",
+    )
+    parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY, help="JSON results history")
+    parser.add_argument("--no-history", action="store_true", help="do not append this run to the history")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the new baseline")
+    parser.add_argument(
+        "--tolerance",
+        action="append",
+        default=[],
+        metavar="METRIC=FRACTION",
+        help="relative tolerance override, e.g. wall_time=0.3 (repeatable)",
+    )
+    parser.add_argument("--no-fail", action="store_true", help="exit 0 even when regressions are found")
+    parser.add_argument("--label", default="", help="free-form label stored with the run")
+    args = parser.parse_args(argv)
+
+    benchmarks = select(args.only)
+    if args.list:
+        for bench in benchmarks:
+            sizes = ", ".join(str(size) for size in bench.sizes)
+            print(f"{bench.name:<28} [{sizes}]  {bench.description}")
+        return 0
+    if not benchmarks:
+        parser.error(f"no benchmark matches {args.only}")
+    tolerances = _parse_tolerances(args.tolerance)
+
+    results = run_suite(
+        benchmarks,
+        quick=args.quick,
+        repeat=args.repeat,
+        warmup=args.warmup,
+        isolate=not args.in_process,
+        on_result=lambda record: print(_format(record), flush=True),
+    )
+    run = make_run(results, label=args.label)
+    if not args.no_history:
+        ResultsHistory(args.history).append(run)
+
+    status = 0
+    baseline = Baseline.load(args.baseline)
+    if baseline is not None:
+        comparisons = compare(run["results"], baseline, tolerances)
+        print(f"\ncompared with baseline {args.baseline}:")
+        for item in comparisons:
+            print(item.describe())
+        regressions = [item for item in comparisons if item.regressed]
+        if regressions:
+            print(f"\n{len(regressions)} metric(s) regressed beyond tolerance", file=sys.stderr)
+            status = 0 if args.no_fail else 1
+    if args.save_baseline:
+        if baseline is not None:
+            # Keep cases that were not part of this (possibly filtered) run.
+            baseline.results.update(run["results"])
+            baseline.tolerances.update(tolerances)
+            baseline.environment = run["environment"]
+        else:
+            baseline = Baseline.from_run(run, tolerances)
+        baseline.save(args.baseline)
+        print(f"baseline written to {args.baseline}")
+    return status
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
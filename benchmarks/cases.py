@@ -0,0 +1,273 @@
+"""CIEL/Ω Quantum Consciousness Suite
+
+Copyright (c) 2025 Adrian Lipa / Intention Lab
+Licensed under the CIEL Research Non-Commercial License v1.1.
+
+Benchmark cases for the hot paths of the suite.
+
+Every case imports its subject inside ``setup`` so listing the suite stays
+cheap, and everything runs offline: the engine case wires the stub LLM
+backends from :mod:`ciel.llm_registry` instead of loading any model.
+"""
+
+from __future__ import annotations
+
+import itertools
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from .harness import Benchmark
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def register(benchmark: Benchmark) -> Benchmark:
+    """Add ``benchmark`` to the default suite."""
+
+    BENCHMARKS[benchmark.name] = benchmark
+    return benchmark
+
+
+def select(names: Optional[Iterable[str]] = None) -> List[Benchmark]:
+    """Return the registered benchmarks whose name starts with any of ``names``."""
+
+    if not names:
+        return list(BENCHMARKS.values())
+    prefixes = tuple(names)
+    return [bench for name, bench in BENCHMARKS.items() if name.startswith(prefixes)]
+
+
+_ROOT = Path(__file__).resolve().parents[1]
+_PROMPT = "resonance check: describe the current intention field and its coherence"
+
+
+def _engine_interact(samples: int):
+    from ciel.engine import CielEngine
+    from ciel.llm_registry import LLMBackendBundle, StubAux, StubPrimary
+    from ciel_wave.fourier_kernel import SimConfig, SpectralWaveField12D
+
+    reason = "offline benchmark"
+    bundle = LLMBackendBundle(
+        lite=StubPrimary("bench-lite", reason),
+        standard=StubPrimary("bench-standard", reason),
+        science=StubPrimary("bench-science", reason),
+        analysis=StubAux("bench-analysis", reason),
+        validator=StubAux("bench-validator", reason),
+    )
+    engine = CielEngine(
+        kernel=SpectralWaveField12D(SimConfig(sample_rate=float(samples))),
+        language_backend=bundle.primary_for("standard"),
+        aux_backend=bundle.composite_aux(),
+    )
+    dialogue = [{"role": "user", "content": _PROMPT}]
+    return lambda: engine.interact(_PROMPT, dialogue)
+
+
+def _fourier_simulate(samples: int):
+    import numpy as np
+
+    from ciel_wave.fourier_kernel import FourierWaveConsciousnessKernel12D, SimConfig
+
+    kernel = FourierWaveConsciousnessKernel12D(SimConfig(sample_rate=float(samples)))
+    signal = np.sin(np.linspace(0.0, 8.0 * np.pi, samples)) + 0.1 * np.random.default_rng(0).normal(size=samples)
+    return lambda: kernel.simulate(signal)
+
+
+def _universal_law_step(grid, precision: str = "double"):
+    from universal_law_4d.universal_engine import UniversalLawEngine4D
+
+    engine = UniversalLawEngine4D(tuple(grid), precision=precision)
+    return lambda: engine.cosmic_evolution_step_4d(0.01)
+
+
+def _universal_law_step_single(grid):
+    return _universal_law_step(grid, precision="single")
+
+
+def _eeg_stream(samples: int):
+    import numpy as np
+
+    from bio.eeg_processor import StreamingEEGProcessor
+
+    stream = StreamingEEGProcessor(sample_rate=500.0, channels=32, low=1.0, high=40.0)
+    chunk = np.random.default_rng(0).normal(size=(32, samples))
+    return (lambda: stream.process(chunk)), samples
+
+
+def _soul_invariant(n: int):
+    import numpy as np
+
+    from fields.soul_invariant import SoulInvariant
+
+    rng = np.random.default_rng(0)
+    field = rng.normal(size=(n, n)) + 1j * rng.normal(size=(n, n))
+    soul = SoulInvariant()
+    return lambda: soul.compute(field)
+
+
+def _tsm_sql_save(records: int):
+    from core.memory.vendor.ultimate.durable_tsm_sqlite import TSMWriterSQL
+    from core.memory.vendor.ultimate.types import MemoriseD
+
+    writer = TSMWriterSQL(Path("bench_tsm") / "ledger.db")
+    ids = itertools.count()
+
+    def write() -> None:
+        for _ in range(records):
+            i = next(ids)
+            writer.save(
+                MemoriseD(
+                    memorise_id=f"bench-{i:08d}",
+                    created_at="2025-01-01T00:00:00",
+                    D_id=f"D-{i}",
+                    D_context="benchmark",
+                    D_sense=_PROMPT,
+                    D_associations=[],
+                    D_timestamp="2025-01-01T00:00:00",
+                    D_meta={"i": i},
+                    D_type="text",
+                    D_attr={"tokens": 10},
+                    weights={"W_L": 0.5, "W_S": 0.5, "W_K": 0.5, "W_E": 0.5, "W_F": True},
+                )
+            )
+
+    return write, records
+
+
+def _memory_orchestrator(entries: int):
+    from ciel_memory.orchestrator import UnifiedMemoryOrchestrator
+
+    orchestrator = UnifiedMemoryOrchestrator()
+
+    def ingest() -> None:
+        for i in range(entries):
+            D = orchestrator.capture(context="benchmark", sense=f"{_PROMPT} #{i}", meta={"novelty_hint": True})
+            orchestrator.promote_if_bifurcated(D, orchestrator.run_tmp(D))
+
+    return ingest, entries
+
+
+def _memory_recall(memories: int):
+    import numpy as np
+
+    from ciel_memory.recall import MemoryIndex
+
+    rng = np.random.default_rng(0)
+    words = np.array(_PROMPT.split() + [f"w{i}" for i in range(2000)])
+    texts = [" ".join(rng.choice(words, 12)) for _ in range(memories)]
+    index = MemoryIndex()
+    index.add_many({"memorise_id": str(i), "text": text, "d_type": "text"} for i, text in enumerate(texts))
+    queries = itertools.cycle(texts[:64])
+    return lambda: index.search(next(queries), k=5)
+
+
+def _tmp_pipeline(entries: int):
+    from tmp import Policy, analyze_input, decide_branch, prefilter, spectral_weight
+
+    policy = Policy()
+    raw = [f"{_PROMPT} variant {i}" for i in range(entries)]
+
+    def run() -> None:
+        for item in raw:
+            text = prefilter(item)
+            features = analyze_input(text)
+            decide_branch(spectral_weight({"data": text}, features, 0.2, 0.1, policy))
+
+    return run, entries
+
+
+def _lie4_field_strength(edge: int):
+    from mathematics.lie4_engine import Lie4ConsciousnessField, Lie4Constants
+
+    field = Lie4ConsciousnessField((edge, edge, edge, 2), Lie4Constants())
+    return field.field_energy_density
+
+
+def _zeta_arguments(count: int):
+    import numpy as np
+
+    t = np.linspace(2.0, 60.0, count)
+    return np.concatenate([1.5 + 1j * t[: count // 2], -1.5 + 1j * t[count // 2 :]])
+
+
+def _zeta_scalar_loop(count: int):
+    from mathematics.zeta_series import zeta_scalar_loop
+
+    points = _zeta_arguments(count).tolist()
+    return (lambda: [zeta_scalar_loop(s) for s in points]), count
+
+
+def _zeta_vectorised(count: int):
+    from mathematics.zeta_series import zeta
+
+    points = _zeta_arguments(count)
+    return (lambda: zeta(points)), count
+
+
+def _soft_clip_values(count: int):
+    import numpy as np
+
+    return np.random.default_rng(0).normal(scale=80.0, size=count)
+
+
+def _soft_clip_scalar_loop(count: int):
+    from mathematics.safe_operations import heisenberg_soft_clip_range
+
+    values = _soft_clip_values(count).tolist()
+    return (lambda: [heisenberg_soft_clip_range(v, -100.0, 100.0) for v in values]), count
+
+
+def _soft_clip_vectorised(count: int):
+    from mathematics.safe_operations import heisenberg_soft_clip_range
+
+    values = _soft_clip_values(count)
+    out = values.copy()
+    return (lambda: heisenberg_soft_clip_range(values, -100.0, 100.0, out=out)), count
+
+
+def _import_time(module: str):
+    # A fresh interpreter per call: imports are cached for the life of a process.
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(_ROOT), os.environ.get("PYTHONPATH")])))
+    command = [sys.executable, "-c", f"import {module}"]
+    return lambda: subprocess.run(command, env=env, check=True, stdout=subprocess.DEVNULL)
+
+
+register(Benchmark("engine.interact", _engine_interact, (128, 1024, 8192),
+                   "CielEngine.interact with stub LLM backends; size = kernel samples"))
+register(Benchmark("fourier.simulate", _fourier_simulate, (128, 1024, 8192),
+                   "FourierWaveConsciousnessKernel12D.simulate; size = samples"))
+register(Benchmark("universal_law_4d.step", _universal_law_step, ((4, 4, 4, 3), (6, 6, 6, 4), (8, 8, 8, 6)),
+                   "UniversalLawEngine4D.cosmic_evolution_step_4d; size = 4D grid"))
+register(Benchmark("universal_law_4d.step_single", _universal_law_step_single,
+                   ((4, 4, 4, 3), (6, 6, 6, 4), (8, 8, 8, 6)),
+                   "UniversalLawEngine4D step with float32/complex64 fields; size = 4D grid"))
+register(Benchmark("eeg.stream", _eeg_stream, (16, 128, 1024),
+                   "StreamingEEGProcessor.process, 32 channels; size = samples per chunk", unit="sample"))
+register(Benchmark("soul_invariant.compute", _soul_invariant, (64, 256, 1024),
+                   "SoulInvariant.compute; size = field edge length"))
+register(Benchmark("memory.tsm_sql_save", _tsm_sql_save, (10, 100, 1000),
+                   "TSMWriterSQL.save; size = records per call", unit="record"))
+register(Benchmark("memory.orchestrator", _memory_orchestrator, (10, 100, 1000),
+                   "capture/run_tmp/promote with persistence; size = entries", unit="entry"))
+register(Benchmark("memory.recall", _memory_recall, (1000, 10000, 100000),
+                   "MemoryIndex.search top-5 (exact below 20k, IVF-PQ above); size = stored memories", unit="query"))
+register(Benchmark("tmp.pipeline", _tmp_pipeline, (100, 1000, 10000),
+                   "prefilter/analyze/spectral weight/decide; size = entries", unit="entry"))
+register(Benchmark("lie4.field_strength", _lie4_field_strength, (8, 16, 32),
+                   "Lie4ConsciousnessField.field_energy_density; size = grid edge (x2 time slices)"))
+register(Benchmark("zeta.scalar_loop", _zeta_scalar_loop, (100, 1000, 10000),
+                   "historical per-argument zeta series; size = arguments", unit="value"))
+register(Benchmark("zeta.vectorised", _zeta_vectorised, (100, 1000, 10000),
+                   "array zeta via blocked Dirichlet series; size = arguments", unit="value"))
+register(Benchmark("soft_clip.scalar_loop", _soft_clip_scalar_loop, (100, 1000, 10000),
+                   "heisenberg_soft_clip_range called per value; size = values", unit="value"))
+register(Benchmark("soft_clip.vectorised", _soft_clip_vectorised, (100, 1000, 10000),
+                   "heisenberg_soft_clip_range on one array with out=; size = values", unit="value"))
+register(Benchmark("startup.import", _import_time, ("sys", "ciel", "ciel.engine"),
+                   "fresh interpreter running `import <size>`; 'sys' is the bare interpreter baseline"))
+
+
+__all__ = ["BENCHMARKS", "register", "select"]
@@ -0,0 +1,197 @@
+"""CIEL/Ω Quantum Consciousness Suite
+
+Copyright (c) 2025 Adrian Lipa / Intention Lab
+Licensed under the CIEL Research Non-Commercial License v1.1.
+
+Measurement harness for the benchmark suite.
+
+A :class:`Benchmark` pairs a name with a ``setup(size)`` factory returning the
+zero-argument operation to time, so fixtures (engines, grids, databases) are
+built outside the measured region.  :func:`measure` records wall time over a
+number of repeats, Python allocations through :mod:`tracemalloc` on a separate
+pass (tracing slows the code down, so it never overlaps the timed runs) and
+the peak resident set size of the process.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+try:  # pragma: no cover - unavailable on Windows
+    import resource
+except ImportError:  # pragma: no cover - peak RSS is reported as ``None``
+    resource = None
+
+Operation = Callable[[], Any]
+
+
+@dataclass(slots=True)
+class Benchmark:
+    """A hot path measured at several problem sizes.
+
+    ``setup`` receives one entry of ``sizes`` and returns either the operation
+    to time or ``(operation, units)`` where ``units`` is the amount of work a
+    single call performs (records written, entries processed, ...).
+    """
+
+    name: str
+    setup: Callable[[Any], Operation | Tuple[Operation, int]]
+    sizes: Sequence[Any]
+    description: str = ""
+    unit: str = "call"
+
+
+@dataclass(slots=True)
+class Measurement:
+    """Metrics collected for one benchmark at one size."""
+
+    name: str
+    size: Any
+    repeat: int
+    wall_time: float
+    wall_time_min: float
+    wall_time_mean: float
+    wall_time_stdev: float
+    units: int
+    unit: str
+    alloc_peak_bytes: int
+    alloc_net_bytes: int
+    alloc_blocks: int
+    peak_rss_bytes: Optional[int]
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def key(self) -> str:
+        return case_key(self.name, self.size)
+
+    @property
+    def throughput(self) -> float:
+        """Units of work per second based on the median wall time."""
+
+        return self.units / self.wall_time if self.wall_time > 0 else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "size": self.size,
+            "key": self.key,
+            "repeat": self.repeat,
+            "wall_time": self.wall_time,
+            "wall_time_min": self.wall_time_min,
+            "wall_time_mean": self.wall_time_mean,
+            "wall_time_stdev": self.wall_time_stdev,
+            "units": self.units,
+            "unit": self.unit,
+            "throughput": self.throughput,
+            "alloc_peak_bytes": self.alloc_peak_bytes,
+            "alloc_net_bytes": self.alloc_net_bytes,
+            "alloc_blocks": self.alloc_blocks,
+            "peak_rss_bytes": self.peak_rss_bytes,
+            **({"extra": self.extra} if self.extra else {}),
+        }
+
+
+def case_key(name: str, size: Any) -> str:
+    """Identifier of a benchmark/size pair used by the history and baseline."""
+
+    if isinstance(size, (tuple, list)):
+        size = "x".join(str(s) for s in size)
+    return f"{name}[{size}]"
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """High-water mark of the resident set size of this process."""
+
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return int(peak if sys.platform == "darwin" else peak * 1024)
+
+
+@contextlib.contextmanager
+def scratch_directory() -> Iterator[str]:
+    """Run inside a throw-away working directory.
+
+    Several components persist to paths relative to the working directory
+    (e.g. ``CIEL_MEMORY_SYSTEM``); benchmarks must not litter the checkout.
+    """
+
+    previous = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="ciel-bench-") as tmp:
+        os.chdir(tmp)
+        try:
+            yield tmp
+        finally:
+            os.chdir(previous)
+
+
+def _prepare(benchmark: Benchmark, size: Any) -> Tuple[Operation, int]:
+    prepared = benchmark.setup(size)
+    if isinstance(prepared, tuple):
+        op, units = prepared
+        return op, int(units)
+    return prepared, 1
+
+
+def measure(benchmark: Benchmark, size: Any, *, repeat: int = 5, warmup: int = 1) -> Measurement:
+    """Time ``benchmark`` at ``size`` and collect allocation/RSS metrics."""
+
+    op, units = _prepare(benchmark, size)
+    for _ in range(max(0, warmup)):
+        op()
+
+    timings: List[float] = []
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        op()
+        timings.append(time.perf_counter() - start)
+
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        before_current, _ = tracemalloc.get_traced_memory()
+        before = tracemalloc.take_snapshot()
+        op()
+        after = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    blocks = sum(max(stat.count_diff, 0) for stat in after.compare_to(before, "filename"))
+
+    return Measurement(
+        name=benchmark.name,
+        size=size,
+        repeat=len(timings),
+        wall_time=statistics.median(timings),
+        wall_time_min=min(timings),
+        wall_time_mean=statistics.fmean(timings),
+        wall_time_stdev=statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        units=units,
+        unit=benchmark.unit,
+        alloc_peak_bytes=max(0, peak - before_current),
+        alloc_net_bytes=current - before_current,
+        alloc_blocks=blocks,
+        peak_rss_bytes=peak_rss_bytes(),
+    )
+
+
+__all__ = [
+    "Benchmark",
+    "Measurement",
+    "case_key",
+    "measure",
+    "peak_rss_bytes",
+    "scratch_directory",
+]
@@ -0,0 +1,219 @@
+"""CIEL/Ω Quantum Consciousness Suite
+
+Copyright (c) 2025 Adrian Lipa / Intention Lab
+Licensed under the CIEL Research Non-Commercial License v1.1.
+
+Benchmark results history and baseline comparison.
+
+The history is a JSON document holding one record per benchmark run (machine
+details, git revision and the metrics of every case).  A baseline stores the
+metrics of a reference run keyed by case together with per-metric relative
+tolerances; :func:`compare` flags every case whose metric grew beyond its
+tolerance.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+DEFAULT_TOLERANCES: Dict[str, float] = {
+    "wall_time": 0.25,
+    "alloc_peak_bytes": 0.25,
+    "peak_rss_bytes": 0.30,
+}
+
+
+def _atomic_write_json(path: Path, payload: Any) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).resolve().parent,
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def environment() -> Dict[str, Any]:
+    """Describe the machine and interpreter a run was recorded on."""
+
+    info: Dict[str, Any] = {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "git_revision": _git_revision(),
+    }
+    try:
+        import numpy
+
+        info["numpy"] = numpy.__version__
+    except ImportError:  # pragma: no cover - numpy is a hard dependency
+        pass
+    return info
+
+
+def make_run(results: Iterable[Mapping[str, Any]], *, label: str = "") -> Dict[str, Any]:
+    """Bundle case results into a history record."""
+
+    return {
+        "timestamp": datetime.utcnow().isoformat(),
+        "label": label,
+        "environment": environment(),
+        "results": {record["key"]: dict(record) for record in results},
+    }
+
+
+@dataclass
+class ResultsHistory:
+    """JSON file holding the most recent ``limit`` benchmark runs."""
+
+    path: Path
+    limit: int = 200
+
+    def __post_init__(self) -> None:
+        self.path = Path(self.path)
+
+    def load(self) -> List[Dict[str, Any]]:
+        if not self.path.exists():
+            return []
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError:
+            return []
+        return list(data.get("runs", [])) if isinstance(data, dict) else []
+
+    def append(self, run: Mapping[str, Any]) -> None:
+        runs = self.load()
+        runs.append(dict(run))
+        _atomic_write_json(self.path, {"runs": runs[-self.limit:]})
+
+    def series(self, key: str, metric: str = "wall_time") -> List[float]:
+        """Values of ``metric`` for case ``key`` across the recorded runs."""
+
+        return [
+            run["results"][key][metric]
+            for run in self.load()
+            if key in run.get("results", {}) and run["results"][key].get(metric) is not None
+        ]
+
+
+@dataclass
+class Baseline:
+    """Reference metrics with per-metric relative tolerances."""
+
+    results: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    tolerances: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_TOLERANCES))
+    environment: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Path | str) -> Optional["Baseline"]:
+        path = Path(path)
+        if not path.exists():
+            return None
+        data = json.loads(path.read_text(encoding="utf-8"))
+        tolerances = dict(DEFAULT_TOLERANCES)
+        tolerances.update(data.get("tolerances", {}))
+        return cls(results=data.get("results", {}), tolerances=tolerances, environment=data.get("environment", {}))
+
+    @classmethod
+    def from_run(cls, run: Mapping[str, Any], tolerances: Optional[Mapping[str, float]] = None) -> "Baseline":
+        merged = dict(DEFAULT_TOLERANCES)
+        merged.update(tolerances or {})
+        results = {key: dict(record) for key, record in run["results"].items()}
+        return cls(results=results, tolerances=merged, environment=dict(run.get("environment", {})))
+
+    def save(self, path: Path | str) -> None:
+        _atomic_write_json(
+            Path(path),
+            {"tolerances": self.tolerances, "environment": self.environment, "results": self.results},
+        )
+
+
+@dataclass(slots=True)
+class Comparison:
+    """Relative change of one metric of one case against the baseline."""
+
+    key: str
+    metric: str
+    baseline: float
+    current: float
+    tolerance: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+    @property
+    def regressed(self) -> bool:
+        return self.current > self.baseline * (1.0 + self.tolerance)
+
+    @property
+    def improved(self) -> bool:
+        return self.current < self.baseline * (1.0 - self.tolerance)
+
+    def describe(self) -> str:
+        status = "REGRESSION" if self.regressed else ("improved" if self.improved else "ok")
+        return (
+            f"{self.key:<40} {self.metric:<17} {self.baseline:>12.4g} -> {self.current:>12.4g} "
+            f"({self.ratio - 1.0:+.1%}, tol {self.tolerance:.0%}) {status}"
+        )
+
+
+def compare(
+    results: Mapping[str, Mapping[str, Any]],
+    baseline: Baseline,
+    tolerances: Optional[Mapping[str, float]] = None,
+) -> List[Comparison]:
+    """Compare ``results`` (keyed by case) with ``baseline``.
+
+    ``tolerances`` override the baseline's stored tolerances; only metrics
+    with a tolerance are compared, and cases missing from either side are
+    skipped.  Peak RSS is only compared between runs with the same isolation
+    mode.
+    """
+
+    limits = dict(baseline.tolerances)
+    limits.update(tolerances or {})
+    out: List[Comparison] = []
+    for key, current in results.items():
+        reference = baseline.results.get(key)
+        if reference is None:
+            continue
+        for metric, tolerance in limits.items():
+            before, after = reference.get(metric), current.get(metric)
+            if before is None or after is None:
+                continue
+            if metric == "peak_rss_bytes" and reference.get("isolated") != current.get("isolated"):
+                continue  # per-process and suite-wide high-water marks are not comparable
+            out.append(Comparison(key, metric, float(before), float(after), float(tolerance)))
+    return out
+
+
+__all__ = [
+    "Baseline",
+    "Comparison",
+    "DEFAULT_TOLERANCES",
+    "ResultsHistory",
+    "compare",
+    "environment",
+    "make_run",
+]
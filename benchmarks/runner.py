@@ -0,0 +1,62 @@
+"""CIEL/Ω Quantum Consciousness Suite
+
+Copyright (c) 2025 Adrian Lipa / Intention Lab
+Licensed under the CIEL Research Non-Commercial License v1.1.
+
+Run benchmark cases in-process or one fresh interpreter per case.
+
+Peak RSS is a process-wide high-water mark, so it is only attributable to a
+single case when that case runs in its own process (``isolate=True``).
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .cases import BENCHMARKS, select
+from .harness import Benchmark, measure, scratch_directory
+
+
+def _measure_isolated(name: str, size: Any, repeat: int, warmup: int) -> Dict[str, Any]:
+    with scratch_directory():
+        return measure(BENCHMARKS[name], size, repeat=repeat, warmup=warmup).as_dict()
+
+
+def run_suite(
+    benchmarks: Optional[Iterable[Benchmark]] = None,
+    *,
+    quick: bool = False,
+    repeat: int = 5,
+    warmup: int = 1,
+    isolate: bool = False,
+    on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> List[Dict[str, Any]]:
+    """Measure every benchmark at each of its sizes.
+
+    ``quick`` restricts every benchmark to its smallest size.  Results are
+    returned as plain dictionaries ready for :func:`benchmarks.history.make_run`.
+    """
+
+    selected = list(benchmarks) if benchmarks is not None else select()
+    results: List[Dict[str, Any]] = []
+    for bench in selected:
+        sizes = list(bench.sizes)[:1] if quick else list(bench.sizes)
+        for size in sizes:
+            if isolate:
+                if bench.name not in BENCHMARKS:
+                    raise ValueError(f"isolated runs need a registered benchmark, got {bench.name!r}")
+                with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+                    record = pool.submit(_measure_isolated, bench.name, size, repeat, warmup).result()
+            else:
+                with scratch_directory():
+                    record = measure(bench, size, repeat=repeat, warmup=warmup).as_dict()
+            record["isolated"] = isolate
+            results.append(record)
+            if on_result is not None:
+                on_result(record)
+    return results
+
+
+__all__ = ["run_suite"]
@@ -4,12 +4,21 @@ Copyright (c) 2025 Adrian Lipa / Intention Lab
 Licensed under the CIEL Research Non-Commercial License v1.1.
 
 Pre-process EEG traces for the rest of the pipeline.
+
+:meth:`EEGProcessor.filter` low-passes a complete trace in one FFT.  Live
+acquisition uses :class:`StreamingEEGProcessor` instead: a Butterworth
+band-pass held as second-order sections whose state is carried between
+chunks, so a recording fed in arbitrary pieces is filtered exactly as if it
+had arrived in one piece.  Cost per sample is constant and there is no block
+latency beyond the filter's own group delay.  The most recent filtered
+samples of every channel are kept in a fixed-size ring buffer.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Iterable, Optional
 
 import numpy as np
 
@@ -27,5 +36,131 @@ class EEGProcessor:
         spectrum[freqs > 40.0] = 0.0
         return np.fft.irfft(spectrum, n=values.size)
 
+    def stream(self, channels: int = 1, **kwargs) -> "StreamingEEGProcessor":
+        """Streaming counterpart with the same sample rate and 40 Hz cut-off."""
+
+        kwargs.setdefault("high", 40.0)
+        return StreamingEEGProcessor(sample_rate=self.sample_rate, channels=channels, **kwargs)
+
+
+@lru_cache(maxsize=32)
+def _design_sos(sample_rate: float, low: Optional[float], high: Optional[float], order: int) -> Optional[np.ndarray]:
+    """Butterworth sections for the band; ``None`` when the band is the whole spectrum."""
+
+    from scipy import signal
+
+    nyquist = 0.5 * sample_rate
+    low = low if low is not None and 0.0 < low < nyquist else None
+    high = high if high is not None and 0.0 < high < nyquist else None
+    if low is None and high is None:
+        return None
+    if low is not None and high is not None:
+        sos = signal.butter(order, (low, high), btype="bandpass", fs=sample_rate, output="sos")
+    elif high is not None:
+        sos = signal.butter(order, high, btype="lowpass", fs=sample_rate, output="sos")
+    else:
+        sos = signal.butter(order, low, btype="highpass", fs=sample_rate, output="sos")
+    sos.setflags(write=False)
+    return sos
+
+
+@dataclass(slots=True)
+class StreamingEEGProcessor:
+    """Chunk-in/chunk-out band-pass filter for multi-channel EEG.
+
+    ``process`` accepts ``(samples,)`` for a single channel or
+    ``(channels, samples)`` and returns the filtered chunk in the same shape.
+    ``low``/``high`` are the band edges in Hz; either may be ``None`` for a
+    low- or high-pass, and edges at or above Nyquist are ignored.
+    """
+
+    sample_rate: float = 128.0
+    channels: int = 1
+    low: Optional[float] = None
+    high: Optional[float] = 40.0
+    order: int = 4
+    history: int = 1024
+    sos: Optional[np.ndarray] = field(init=False, repr=False)
+    _zi: Optional[np.ndarray] = field(init=False, repr=False, default=None)
+    _ring: np.ndarray = field(init=False, repr=False)
+    _head: int = field(init=False, repr=False, default=0)
+    _filled: int = field(init=False, repr=False, default=0)
+    samples_seen: int = field(init=False, default=0)
+
+    def __post_init__(self) -> None:
+        if self.channels < 1 or self.history < 1:
+            raise ValueError("channels and history must be positive")
+        sos = _design_sos(float(self.sample_rate), self.low, self.high, int(self.order))
+        # The design is cached read-only; sosfilt needs a writable buffer.
+        self.sos = None if sos is None else sos.copy()
+        self._ring = np.zeros((self.channels, self.history))
+        self.reset()
+
+    # ------------------------------------------------------------ streaming
+    def process(self, chunk: Iterable[float] | np.ndarray) -> np.ndarray:
+        """Filter the next chunk, continuing from the state left by the previous one."""
+
+        values = np.asarray(chunk, dtype=float)
+        single = values.ndim == 1
+        block = values[None, :] if single else values
+        if block.ndim != 2 or block.shape[0] != self.channels:
+            raise ValueError(f"expected {self.channels} channel(s), got shape {values.shape}")
+        if block.shape[1] == 0:
+            return values.copy()
+
+        if self.sos is None:
+            filtered = block.copy()
+        else:
+            from scipy import signal
+
+            if self._zi is None:
+                # Start from the steady state of the first sample to avoid a step transient.
+                base = signal.sosfilt_zi(self.sos)
+                self._zi = base[:, None, :] * block[None, :, :1]
+            filtered, self._zi = signal.sosfilt(self.sos, block, axis=-1, zi=self._zi)
+
+        self._push(filtered)
+        self.samples_seen += block.shape[1]
+        return filtered[0] if single else filtered
+
+    def reset(self) -> None:
+        """Forget the filter state and the buffered history."""
+
+        self._zi = None
+        self._ring.fill(0.0)
+        self._head = 0
+        self._filled = 0
+        self.samples_seen = 0
+
+    # ------------------------------------------------------------ history
+    def _push(self, filtered: np.ndarray) -> None:
+        n = filtered.shape[1]
+        if n >= self.history:
+            self._ring[:] = filtered[:, -self.history:]
+            self._head = 0
+        else:
+            first = min(n, self.history - self._head)
+            self._ring[:, self._head:self._head + first] = filtered[:, :first]
+            self._ring[:, : n - first] = filtered[:, first:]
+            self._head = (self._head + n) % self.history
+        self._filled = min(self.history, self._filled + n)
+
+    def latest(self, samples: Optional[int] = None) -> np.ndarray:
+        """The last ``samples`` filtered values per channel, oldest first."""
+
+        count = self._filled if samples is None else max(0, min(int(samples), self._filled))
+        index = (self._head - count + np.arange(count)) % self.history
+        return self._ring[:, index]
+
+    def group_delay(self, frequency: float) -> float:
+        """Group delay of the filter at ``frequency`` Hz, in samples."""
+
+        if self.sos is None:
+            return 0.0
+        from scipy import signal
+
+        _, delay = signal.group_delay(signal.sos2tf(self.sos), w=[float(frequency)], fs=self.sample_rate)
+        return float(delay[0])
+
 
-__all__ = ["EEGProcessor"]
+__all__ = ["EEGProcessor", "StreamingEEGProcessor"]
@@ -5,7 +5,34 @@ Licensed under the CIEL Research Non-Commercial License v1.1.
 
 from __future__ import annotations
 
-from .engine import CielEngine
-from .llm_registry import LLMBackendBundle, build_default_bundle
+import importlib
+from typing import TYPE_CHECKING, Any
 
-__all__: list[str] = ["CielEngine", "LLMBackendBundle", "build_default_bundle"]
+if TYPE_CHECKING:  # pragma: no cover - static analysers only
+    from .engine import CielEngine
+    from .llm_registry import LLMBackendBundle, build_default_bundle
+    from .timing import SpanRecorder
+
+# The engine drags in the wave, cognition, affect and memory stacks; resolve
+# the public names on first access (PEP 562) so ``import ciel`` stays cheap.
+_LAZY_ATTRS = {
+    "CielEngine": ".engine",
+    "LLMBackendBundle": ".llm_registry",
+    "build_default_bundle": ".llm_registry",
+    "SpanRecorder": ".timing",
+}
+
+__all__: list[str] = ["CielEngine", "LLMBackendBundle", "SpanRecorder", "build_default_bundle"]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -12,9 +12,10 @@ import json
 import logging
 import os
 import sys
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List
 
-from .engine import CielEngine
+if TYPE_CHECKING:  # pragma: no cover - imported lazily in main()
+    from .engine import CielEngine
 
 
 def setup_logging(level: str) -> None:
@@ -127,6 +128,9 @@ def main(argv: list[str] | None = None) -> None:
     log = logging.getLogger("CIEL.CLI")
     log.info("Starting CielEngine in mode=%s", args.mode)
 
+    # Deferred so argument errors and --help do not pay for the engine stack.
+    from .engine import CielEngine
+
     engine = CielEngine()
     if args.enable_llm:
         try:
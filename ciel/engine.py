@@ -20,10 +20,15 @@ from ciel_wave.fourier_kernel import SpectralWaveField12D
 from ethics.lambda0_operator import Lambda0Operator
 from fields.soul_invariant import SoulInvariant
 from .language_backend import AuxiliaryBackend, LanguageBackend
+from .timing import SpanRecorder
+from core.memory.profile import get_orchestrator_vendor
 # UnifiedMemoryOrchestrator is available in vendor profiles; fall back to
 # the test-friendly implementation in ``ciel_memory`` or the compatibility
-# orchestrator in the open-source profile if needed.
+# orchestrator in the open-source profile if needed.  The repo profile never
+# provides it, so skip importing the vendor stack just to hit ImportError.
 try:  # pragma: no cover - vendor profile
+    if get_orchestrator_vendor() == "repo":
+        raise ImportError("repo memory profile has no UnifiedMemoryOrchestrator")
     from core.memory.orchestrator import UnifiedMemoryOrchestrator
 except ImportError:  # pragma: no cover - open-source/test profile
     try:
@@ -51,6 +56,8 @@ class CielEngine:
     )
     language_backend: LanguageBackend | None = None
     aux_backend: AuxiliaryBackend | None = None
+    timing: SpanRecorder = field(default_factory=SpanRecorder, repr=False)
+    recall_k: int = 3
 
     def boot(self) -> None:
         """Initialise the engine (placeholder for future lifecycle hooks)."""
@@ -62,24 +69,51 @@ class CielEngine:
 
         log.info("Shutting down CIEL Engine")
 
+    def timing_stats(self) -> Dict[str, Dict[str, float]]:
+        """Per-stage latency summaries (count, mean, p50/p95/p99 in ms)."""
+
+        return self.timing.stats()
+
     def step(self, text: str, *, context: str = "dialogue") -> Dict[str, object]:
-        """Run a single processing step over the provided text input."""
+        """Run a single processing step over the provided text input.
+
+        With :attr:`timing` enabled the result carries a ``timings`` mapping of
+        this step's per-stage durations in milliseconds.
+        """
+
+        mark = self.timing.mark()
+        with self.timing.span("step"):
+            result = self._step(text, context)
+        if self.timing.enabled:
+            result["timings"] = self.timing.last(since=mark)
+        return result
 
+    def _step(self, text: str, context: str) -> Dict[str, object]:
         cleaned = (text or "").strip()
         if not cleaned:
             return {"status": "empty"}
 
-        intention_vector = self._intention_to_list(self.intention.generate())
-        simulation = self._run_kernel(intention_vector)
-
-        D = self.memory.capture(context=context, sense=cleaned)
-        tmp_out = self.memory.run_tmp(D)
-        memorised = self.memory.promote_if_bifurcated(D, tmp_out)
-
-        cognition_out = self.cognition.evaluate(
-            stimulus=intention_vector, goals=intention_vector
-        )
-        affect_out = self.affect.run(ego=intention_vector, other=intention_vector)
+        span = self.timing.span
+        with span("intention"):
+            intention_vector = self._intention_to_list(self.intention.generate())
+        with span("kernel"):
+            simulation = self._run_kernel(intention_vector)
+
+        with span("recall"):
+            recalled = self._recall(cleaned)
+        with span("capture"):
+            D = self.memory.capture(context=context, sense=cleaned)
+        with span("tmp"):
+            tmp_out = self.memory.run_tmp(D)
+        with span("promote"):
+            memorised = self.memory.promote_if_bifurcated(D, tmp_out)
+
+        with span("cognition"):
+            cognition_out = self.cognition.evaluate(
+                stimulus=intention_vector, goals=intention_vector
+            )
+        with span("affect"):
+            affect_out = self.affect.run(ego=intention_vector, other=intention_vector)
 
         return {
             "status": "ok",
@@ -87,6 +121,7 @@ class CielEngine:
             "simulation": simulation,
             "tmp_outcome": tmp_out,
             "memorised": memorised,
+            "recalled": recalled,
             "cognition": cognition_out,
             "affect": affect_out,
         }
@@ -100,11 +135,26 @@ class CielEngine:
     ) -> Dict[str, Any]:
         """Run the core step and optionally generate/assess language outputs."""
 
+        mark = self.timing.mark()
+        with self.timing.span("interact"):
+            result = self._interact(user_text, dialogue, context, use_aux_analysis)
+        if self.timing.enabled:
+            result["timings"] = self.timing.last(since=mark)
+        return result
+
+    def _interact(
+        self,
+        user_text: str,
+        dialogue: List[Dict[str, str]],
+        context: str,
+        use_aux_analysis: bool,
+    ) -> Dict[str, Any]:
         ciel_state = self.step(user_text, context=context)
         if self.language_backend is None:
             return {"status": "no_language_backend", "ciel_state": ciel_state}
 
-        reply = self.language_backend.generate_reply(dialogue, ciel_state)
+        with self.timing.span("llm"):
+            reply = self.language_backend.generate_reply(dialogue, ciel_state)
 
         result: Dict[str, Any] = {
             "status": "ok",
@@ -113,11 +163,24 @@ class CielEngine:
         }
 
         if use_aux_analysis and self.aux_backend is not None:
-            analysis = self.aux_backend.analyse_state(ciel_state, reply)
+            with self.timing.span("aux"):
+                analysis = self.aux_backend.analyse_state(ciel_state, reply)
             result["analysis"] = analysis
 
         return result
 
+    def _recall(self, text: str) -> List[Dict[str, Any]]:
+        """Related persisted memories for grounding; empty when unsupported."""
+
+        recall = getattr(self.memory, "recall", None)
+        if self.recall_k <= 0 or not callable(recall):
+            return []
+        try:
+            return recall(text, k=self.recall_k)
+        except Exception:  # pragma: no cover - recall must never break a step
+            log.exception("memory recall failed")
+            return []
+
     def _intention_to_list(self, vec: Any) -> List[float]:
         if hasattr(vec, "tolist"):
             try:
@@ -0,0 +1,227 @@
+"""Per-stage span timing for the CIEL engine.
+
+:class:`SpanRecorder` times named stages with ``time.perf_counter_ns`` and
+folds every duration into a log-bucketed :class:`StageHistogram`, so memory
+stays constant however long the engine runs while p50/p95/p99 remain
+available.  The most recent spans are also kept as trace events which can be
+exported as JSONL or in the Chrome trace-event format (load the file in
+``chrome://tracing`` or Perfetto).
+
+Recording is switchable at runtime; a disabled recorder hands out a shared
+no-op span, so instrumented code costs one attribute check per stage.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+# Eight buckets per octave bound the percentile error to ~9%.
+_BUCKETS_PER_OCTAVE = 8
+
+
+class StageHistogram:
+    """Log-bucketed histogram of durations in nanoseconds."""
+
+    __slots__ = ("count", "total_ns", "min_ns", "max_ns", "_buckets")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+        self._buckets: Dict[int, int] = {}
+
+    def add(self, duration_ns: int) -> None:
+        duration_ns = max(int(duration_ns), 1)
+        if self.count == 0 or duration_ns < self.min_ns:
+            self.min_ns = duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+        self.count += 1
+        self.total_ns += duration_ns
+        index = int(math.log2(duration_ns) * _BUCKETS_PER_OCTAVE)
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+
+    def percentile(self, q: float) -> float:
+        """Approximate ``q``-th percentile (0-100) in nanoseconds."""
+
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(self.count * q / 100.0))
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= rank:
+                # Geometric centre of the bucket, clamped to the observed range.
+                centre = 2.0 ** ((index + 0.5) / _BUCKETS_PER_OCTAVE)
+                return float(min(max(centre, self.min_ns), self.max_ns))
+        return float(self.max_ns)
+
+    def summary(self) -> Dict[str, float]:
+        """Count, mean, p50/p95/p99 and extrema in milliseconds."""
+
+        scale = 1e-6
+        return {
+            "count": self.count,
+            "mean_ms": (self.total_ns / self.count) * scale if self.count else 0.0,
+            "p50_ms": self.percentile(50) * scale,
+            "p95_ms": self.percentile(95) * scale,
+            "p99_ms": self.percentile(99) * scale,
+            "min_ms": self.min_ns * scale,
+            "max_ms": self.max_ns * scale,
+        }
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("_recorder", "_name", "_start")
+
+    def __init__(self, recorder: "SpanRecorder", name: str) -> None:
+        self._recorder = recorder
+        self._name = name
+        self._start = 0
+
+    def __enter__(self) -> "_Span":
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        end = time.perf_counter_ns()
+        self._recorder.record(self._name, self._start, end - self._start)
+
+
+class SpanRecorder:
+    """Collect per-stage durations, percentiles and recent trace events.
+
+    ``enabled`` defaults to the ``CIEL_ENGINE_TIMING`` environment variable and
+    can be flipped at any time with :meth:`enable`/:meth:`disable`.
+    """
+
+    def __init__(self, enabled: Optional[bool] = None, max_events: int = 10_000) -> None:
+        if enabled is None:
+            enabled = os.getenv("CIEL_ENGINE_TIMING", "").strip().lower() in {"1", "true", "yes", "on"}
+        self.enabled = bool(enabled)
+        self._histograms: Dict[str, StageHistogram] = {}
+        self._events: Deque[Tuple[str, int, int, int]] = deque(maxlen=max_events)
+        self._last: Dict[str, Tuple[int, float]] = {}
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------ switching
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    # ------------------------------------------------------------ recording
+    def span(self, name: str) -> _Span | _NullSpan:
+        """Context manager timing the enclosed block as stage ``name``."""
+
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name)
+
+    def record(self, name: str, start_ns: int, duration_ns: int) -> None:
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = StageHistogram()
+            histogram.add(duration_ns)
+            self._events.append((name, start_ns, duration_ns, threading.get_ident()))
+            self._seq += 1
+            self._last[name] = (self._seq, duration_ns * 1e-6)
+
+    def mark(self) -> int:
+        """Position token for :meth:`last`; spans recorded later compare greater."""
+
+        return self._seq
+
+    def last(self, since: int = 0) -> Dict[str, float]:
+        """Most recent duration in milliseconds of each stage recorded after ``since``."""
+
+        with self._lock:
+            return {name: ms for name, (seq, ms) in self._last.items() if seq > since}
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Per-stage histogram summaries (count, mean, p50/p95/p99, min, max)."""
+
+        with self._lock:
+            return {name: hist.summary() for name, hist in self._histograms.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._events.clear()
+            self._last.clear()
+            self._seq = 0
+
+    # ------------------------------------------------------------ exporting
+    def events(self) -> List[Dict[str, Any]]:
+        """Recorded spans, oldest first, with microsecond timestamps."""
+
+        with self._lock:
+            snapshot = list(self._events)
+        return [
+            {"name": name, "ts_us": start / 1e3, "dur_us": duration / 1e3, "tid": tid}
+            for name, start, duration, tid in snapshot
+        ]
+
+    def export(self, path: Path | str, fmt: str = "jsonl") -> Path:
+        """Write the recorded spans to ``path`` as ``"jsonl"`` or ``"chrome"``.
+
+        JSONL holds one span per line followed by one ``{"stats": ...}`` line;
+        the Chrome format is a ``traceEvents`` document of complete events.
+        """
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        events = self.events()
+        if fmt == "jsonl":
+            with path.open("w", encoding="utf-8") as fh:
+                for event in events:
+                    fh.write(json.dumps(event) + "\n")
+                fh.write(json.dumps({"stats": self.stats()}) + "\n")
+        elif fmt == "chrome":
+            pid = os.getpid()
+            trace = {
+                "traceEvents": [
+                    {
+                        "name": event["name"],
+                        "cat": "ciel.engine",
+                        "ph": "X",
+                        "ts": event["ts_us"],
+                        "dur": event["dur_us"],
+                        "pid": pid,
+                        "tid": event["tid"],
+                    }
+                    for event in events
+                ],
+                "displayTimeUnit": "ms",
+            }
+            path.write_text(json.dumps(trace), encoding="utf-8")
+        else:
+            raise ValueError(f"unknown trace format {fmt!r}; expected 'jsonl' or 'chrome'")
+        return path
+
+
+__all__ = ["SpanRecorder", "StageHistogram"]
@@ -14,6 +14,20 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from .verification import VerificationQueue
+
+
+def default_memory_root() -> Path:
+    """Storage root used when the orchestrator is not given one."""
+
+    return Path("CIEL_MEMORY_SYSTEM")
+
+
+def verification_queue_path(base: Path | str | None = None) -> Path:
+    """Location of the verification queue database under ``base``."""
+
+    return (Path(base) if base is not None else default_memory_root()) / "TSM" / "verification_queue.db"
+
 
 @dataclass
 class DataVector:
@@ -38,24 +52,55 @@ class DataVector:
 class UnifiedMemoryOrchestrator:
     """Very small orchestrator used for the kata exercises.
 
-    The class tracks a ledger stored in ``CIEL_MEMORY_SYSTEM`` and exposes just
+    The class tracks a ledger stored in ``CIEL_MEMORY_SYSTEM`` (created on the
+    first persisted entry, not at construction) and exposes just
     enough functionality for the tests: capturing data vectors, running them
     through a toy TMP pipeline and persisting the result when bifurcation or a
-    manual override requests it.
+    manual override requests it.  Reports that need user verification are
+    buffered in memory and written to the persistent :attr:`verification`
+    queue in one transaction on the next persisted entry, on
+    :meth:`flush_verifications` / :meth:`close`, or when the queue is read.
     """
 
-    def __init__(self) -> None:
-        base = Path("CIEL_MEMORY_SYSTEM")
+    def __init__(self, base: Path | str | None = None, *, verification: VerificationQueue | None = None) -> None:
+        base = Path(base) if base is not None else default_memory_root()
+        self.base = base
         self._ledger_path = base / "TSM" / "ledger" / "memory_ledger.db"
         self._wave_dir = base / "WPM" / "wave_snapshots"
-        self._ledger_path.parent.mkdir(parents=True, exist_ok=True)
-        self._wave_dir.mkdir(parents=True, exist_ok=True)
-        if not self._ledger_path.exists():
-            self._ledger_path.write_text("", encoding="utf-8")
+        self._storage_ready = False
         self._tmp_reports: List[Dict[str, Any]] = []
-        self._verification_queue: List[Dict[str, Any]] = []
+        self._verification = verification
+        self._unqueued: List[Dict[str, Any]] = []
+        self._recall_index: Any = None
         self.allow_user_force_save = True
 
+    @property
+    def verification(self) -> VerificationQueue:
+        """The persistent verification queue, with buffered reports flushed into it."""
+
+        self.flush_verifications()
+        return self._queue()
+
+    def _queue(self) -> VerificationQueue:
+        if self._verification is None:
+            self._verification = VerificationQueue(verification_queue_path(self.base))
+        return self._verification
+
+    def flush_verifications(self) -> int:
+        """Write buffered reports to the verification queue; returns how many were new."""
+
+        if not self._unqueued:
+            return 0
+        reports, self._unqueued = self._unqueued, []
+        return self._queue().enqueue_many(reports)
+
+    def close(self) -> None:
+        """Flush buffered verification reports and release the queue connection."""
+
+        self.flush_verifications()
+        if self._verification is not None:
+            self._verification.close()
+
     # ------------------------------------------------------------------ TMP
     def capture(
         self,
@@ -93,7 +138,7 @@ class UnifiedMemoryOrchestrator:
         }
         self._tmp_reports.append(report)
         if report["requires_user_verification"]:
-            self._verification_queue.append(report)
+            self._unqueued.append(report)
         return out
 
     # ----------------------------------------------------------------- save
@@ -106,15 +151,35 @@ class UnifiedMemoryOrchestrator:
             "meta": D.meta or {},
             "rationale": rationale,
             "source": source,
+            "d_type": tmp_out.get("A1", {}).get("D_TYPE", "unknown"),
             "tmp_out": tmp_out.get("OUT", {}),
         }
         return entry
 
-    def _persist_entry(self, entry: Dict[str, Any]) -> Dict[str, str]:
+    def _ensure_storage(self) -> None:
+        """Create the ledger and wave directories on first write."""
+
+        if self._storage_ready:
+            return
+        self._ledger_path.parent.mkdir(parents=True, exist_ok=True)
+        self._wave_dir.mkdir(parents=True, exist_ok=True)
+        if not self._ledger_path.exists():
+            self._ledger_path.write_text("", encoding="utf-8")
+        self._storage_ready = True
+
+    def _persist_entry(self, entry: Dict[str, Any], wave_arrays: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
+        self._ensure_storage()
+        self.flush_verifications()
         with self._ledger_path.open("a", encoding="utf-8") as fh:
             fh.write(json.dumps(entry, ensure_ascii=False) + "\n")
         wave_file = self._wave_dir / f"{entry['memorise_id']}.json"
         wave_file.write_text(json.dumps(entry["tmp_out"], ensure_ascii=False, indent=2), encoding="utf-8")
+        if self._recall_index is not None:
+            # Wave arrays are not in the ledger, so index the entry directly;
+            # the next ledger sync skips it by id.
+            from .recall import ledger_record
+
+            self._recall_index.add_many([ledger_record(entry, wave_arrays)])
         return {
             "tsm_ref": str(self._ledger_path),
             "wpm_ref": str(wave_file),
@@ -130,7 +195,7 @@ class UnifiedMemoryOrchestrator:
     ) -> Optional[Dict[str, str]]:
         if tmp_out.get("OUT", {}).get("bifurcation") == 1:
             entry = self._make_entry(D, tmp_out, "Auto promotion after bifurcation", "TMP")
-            return self._persist_entry(entry)
+            return self._persist_entry(entry, wave_arrays)
         return None
 
     def user_force_save(
@@ -144,19 +209,42 @@ class UnifiedMemoryOrchestrator:
         if not self.allow_user_force_save:
             return None
         entry = self._make_entry(D, tmp_out, f"User override: {reason}", "USER_OVERRIDE")
-        return self._persist_entry(entry)
+        return self._persist_entry(entry, wave_arrays)
+
+    # ---------------------------------------------------------------- recall
+    def recall_index(self) -> Any:
+        """The :class:`~ciel_memory.recall.MemoryIndex`, synced with the ledger."""
+
+        if self._recall_index is None:
+            from .recall import MemoryIndex
+
+            self._recall_index = MemoryIndex()
+        self._recall_index.sync_jsonl(self._ledger_path)
+        return self._recall_index
+
+    def recall(self, query: str | DataVector, k: int = 5, **filters: Any) -> List[Dict[str, Any]]:
+        """Persisted memories most similar to ``query``, best first.
+
+        ``filters`` are passed to :meth:`MemoryIndex.search`: ``d_type``,
+        ``since``/``until`` and ``weights`` (e.g. ``{"novelty": (0.8, None)}``).
+        """
+
+        if isinstance(query, DataVector):
+            query = f"{query.context} {query.sense}"
+        if self._recall_index is None and not self._ledger_path.exists():
+            return []
+        return self.recall_index().search(str(query), k, **filters)
 
     # ----------------------------------------------------------- maintenance
     def daily_maintenance(self) -> Dict[str, int]:
         kept = [r for r in self._tmp_reports if r["requires_user_verification"]]
         purged = len(self._tmp_reports) - len(kept)
         self._tmp_reports = kept
-        self._verification_queue = [r for r in kept if not r["verified_by_user"]]
         return {
             "kept": len(kept),
             "purged": purged,
-            "pending_verifications": len(self._verification_queue),
+            "pending_verifications": self.verification.count("pending"),
         }
 
 
-__all__ = ["UnifiedMemoryOrchestrator", "DataVector"]
+__all__ = ["UnifiedMemoryOrchestrator", "DataVector", "default_memory_root", "verification_queue_path"]
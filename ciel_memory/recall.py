@@ -0,0 +1,524 @@
+"""CIEL/Ω Quantum Consciousness Suite
+
+Copyright (c) 2025 Adrian Lipa / Intention Lab
+Licensed under the CIEL Research Non-Commercial License v1.1.
+
+Similarity recall over persisted memories.
+
+:class:`HashedNgramEmbedder` maps text to a fixed-size vector by hashing
+UTF-8 byte n-grams into signed buckets.  It needs no model or vocabulary,
+and a whole batch is embedded with array operations only.  Wave arrays
+stored with a memory can be folded in through :meth:`~HashedNgramEmbedder.embed_wave`.
+
+:class:`MemoryIndex` keeps the unit vectors and the filterable metadata
+(``D_type``, capture time, named weights) in growable columns, and is
+updated one memory at a time.  Queries are scored by cosine similarity:
+
+* below ``ivf_threshold`` rows every row passing the filters is scored
+  exactly;
+* above it, an inverted file (spherical k-means lists) picks the
+  ``nprobe`` nearest lists.  The candidates are scored from product-
+  quantised codes, and the best ``rerank * k`` are re-scored against the
+  stored vectors.
+
+The coarse quantiser is trained by :meth:`MemoryIndex.build`, which
+:meth:`~MemoryIndex.add_many` calls once the store crosses the threshold and
+again whenever it has grown fourfold, so :meth:`~MemoryIndex.search` never
+trains.  Rows added in between are assigned to their nearest list as they
+arrive.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+_MIX = np.uint64(0x9E3779B97F4A7C15)
+
+
+def _normalise_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    return matrix / np.where(norms > 0, norms, 1.0)
+
+
+def _timestamp(value: Any) -> float:
+    """Seconds since the epoch for a datetime, ISO string or number; NaN if unknown."""
+
+    if value is None or value == "":
+        return float("nan")
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return float("nan")
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)  # ledgers record naive UTC
+        return value.timestamp()
+    return float("nan")
+
+
+@dataclass(frozen=True, slots=True)
+class HashedNgramEmbedder:
+    """Signed feature hashing of lower-cased UTF-8 byte n-grams."""
+
+    dim: int = 128
+    ngram: int = 3
+    wave_weight: float = 0.5
+
+    def embed_many(self, texts: Sequence[str]) -> np.ndarray:
+        """``(len(texts), dim)`` float32 unit vectors (zero rows for empty texts)."""
+
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        if not len(texts):
+            return out
+        encoded = [(" " + str(text).lower() + " ").encode("utf-8") for text in texts]
+        lengths = np.fromiter((len(b) for b in encoded), dtype=np.int64, count=len(encoded))
+        data = np.frombuffer(b"".join(encoded), dtype=np.uint8).astype(np.uint64)
+        starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        row = np.repeat(np.arange(len(texts)), lengths)
+        # An n-gram is valid when it does not run past the end of its text.
+        valid = np.arange(len(data)) - starts[row] <= (lengths[row] - self.ngram)
+        h = np.zeros(len(data), dtype=np.uint64)
+        for offset in range(self.ngram):
+            shifted = np.zeros_like(data)
+            shifted[: len(data) - offset] = data[offset:]
+            h = h * np.uint64(257) + shifted
+        h = h[valid] * _MIX
+        h ^= h >> np.uint64(29)
+        bucket = (h % np.uint64(self.dim)).astype(np.int64)
+        sign = np.where((h >> np.uint64(63)) == 0, 1.0, -1.0)
+        flat = np.bincount(row[valid] * self.dim + bucket, weights=sign, minlength=len(texts) * self.dim)
+        out[:] = flat.reshape(len(texts), self.dim)
+        return _normalise_rows(out).astype(np.float32, copy=False)
+
+    def embed(self, text: str) -> np.ndarray:
+        return self.embed_many([text])[0]
+
+    def embed_wave(self, arrays: Mapping[str, Any]) -> np.ndarray:
+        """Unit vector of the magnitude spectrum of the concatenated wave arrays."""
+
+        parts = [np.abs(np.asarray(a)).astype(float).reshape(-1) for a in arrays.values()]
+        samples = np.concatenate(parts) if parts else np.zeros(0)
+        if samples.size < 2:
+            return np.zeros(self.dim, dtype=np.float32)
+        spectrum = np.abs(np.fft.rfft(samples - samples.mean()))
+        grid = np.linspace(0.0, 1.0, self.dim)
+        resampled = np.interp(grid, np.linspace(0.0, 1.0, spectrum.size), spectrum)
+        return _normalise_rows(resampled).astype(np.float32)
+
+    def combine(self, text_vector: np.ndarray, wave_vector: Optional[np.ndarray]) -> np.ndarray:
+        if wave_vector is None or not np.any(wave_vector):
+            return text_vector
+        return _normalise_rows(text_vector + self.wave_weight * wave_vector).astype(np.float32)
+
+
+def _cluster_sums(data: np.ndarray, labels: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-cluster sums and counts (sort + reduceat; ``np.add.at`` is far slower)."""
+
+    order = np.argsort(labels, kind="stable")
+    counts = np.bincount(labels, minlength=k)
+    sums = np.zeros((k, data.shape[1]), dtype=data.dtype)
+    filled = np.flatnonzero(counts)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))[filled]
+    sums[filled] = np.add.reduceat(data[order], starts, axis=0)
+    return sums, counts
+
+
+def _spherical_kmeans(data: np.ndarray, k: int, iterations: int, rng: np.random.Generator) -> np.ndarray:
+    centroids = data[rng.choice(len(data), size=k, replace=False)].copy()
+    for _ in range(iterations):
+        labels = np.argmax(data @ centroids.T, axis=1)
+        sums, _ = _cluster_sums(data, labels, k)
+        empty = ~np.any(sums, axis=1)
+        sums[empty] = data[rng.choice(len(data), size=int(empty.sum()))]
+        centroids = _normalise_rows(sums).astype(np.float32)
+    return centroids
+
+
+def _kmeans(data: np.ndarray, k: int, iterations: int, rng: np.random.Generator) -> np.ndarray:
+    centroids = data[rng.choice(len(data), size=k, replace=len(data) < k)].copy()
+    for _ in range(iterations):
+        d2 = (centroids * centroids).sum(1)[None, :] - 2.0 * data @ centroids.T
+        labels = np.argmin(d2, axis=1)
+        sums, counts = _cluster_sums(data, labels, k)
+        filled = counts > 0
+        centroids[filled] = sums[filled] / counts[filled, None]
+    return centroids
+
+
+class MemoryIndex:
+    """Incrementally updated cosine-similarity index with metadata filters."""
+
+    def __init__(
+        self,
+        embedder: Optional[HashedNgramEmbedder] = None,
+        *,
+        ivf_threshold: int = 20_000,
+        nprobe: int = 8,
+        pq_subvectors: int = 16,
+        rerank: int = 8,
+        seed: int = 0,
+    ) -> None:
+        self.embedder = embedder or HashedNgramEmbedder()
+        self.ivf_threshold = int(ivf_threshold)
+        self.nprobe = int(nprobe)
+        self.pq_subvectors = int(pq_subvectors)
+        self.rerank = int(rerank)
+        self._rng = np.random.default_rng(seed)
+
+        dim = self.embedder.dim
+        self._size = 0
+        self._vectors = np.zeros((0, dim), dtype=np.float32)
+        self._time = np.zeros(0)
+        self._dtype = np.zeros(0, dtype=np.int32)
+        self._weights: Dict[str, np.ndarray] = {}
+        self._dtype_codes: Dict[str, int] = {}
+        self.ids: List[str] = []
+        self.payloads: List[Dict[str, Any]] = []
+        self._rows: Dict[str, int] = {}
+        self._sources: Dict[str, int] = {}
+
+        # IVF / PQ state
+        self._centroids: Optional[np.ndarray] = None
+        self._assign = np.zeros(0, dtype=np.int32)
+        self._codebooks: Optional[np.ndarray] = None  # (m, 256, dim / m)
+        self._codes = np.zeros((0, 0), dtype=np.uint8)
+        self._trained_size = 0
+        self._list_order = np.zeros(0, dtype=np.int64)
+        self._list_offsets = np.zeros(1, dtype=np.int64)
+        self._organised = 0  # rows covered by the CSR lists
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, memorise_id: str) -> bool:
+        return memorise_id in self._rows
+
+    # ------------------------------------------------------------ storage
+    def _reserve(self, extra: int) -> None:
+        needed = self._size + extra
+        capacity = len(self._time)
+        if needed <= capacity:
+            return
+        capacity = max(needed, 2 * capacity, 1024)
+
+        def grown(array: np.ndarray, fill: Any = 0) -> np.ndarray:
+            new = np.full((capacity,) + array.shape[1:], fill, dtype=array.dtype)
+            new[: self._size] = array[: self._size]
+            return new
+
+        self._vectors = grown(self._vectors)
+        self._time = grown(self._time, np.nan)
+        self._dtype = grown(self._dtype, -1)
+        self._assign = grown(self._assign, -1)
+        self._codes = grown(self._codes)
+        self._weights = {name: grown(column, np.nan) for name, column in self._weights.items()}
+
+    def add_many(self, records: Iterable[Mapping[str, Any]]) -> int:
+        """Index memories; each record needs ``memorise_id`` and ``text``.
+
+        Optional keys: ``d_type``, ``captured_at``, ``weights`` (name ->
+        number), ``wave`` (name -> array) and ``payload`` (returned with
+        hits).  Already indexed ids are skipped.  Returns the number added.
+        The batch that takes the store past ``ivf_threshold`` (or fourfold past
+        the last training) pays for training the inverted file.
+        """
+
+        fresh = []
+        seen = set()
+        for record in records:
+            key = str(record["memorise_id"])
+            if key not in self._rows and key not in seen:
+                seen.add(key)
+                fresh.append(record)
+        if not fresh:
+            return 0
+        vectors = self.embedder.embed_many([r.get("text", "") for r in fresh])
+        for i, record in enumerate(fresh):
+            wave = record.get("wave")
+            if wave:
+                vectors[i] = self.embedder.combine(vectors[i], self.embedder.embed_wave(wave))
+
+        self._reserve(len(fresh))
+        rows = slice(self._size, self._size + len(fresh))
+        self._vectors[rows] = vectors
+        self._time[rows] = [_timestamp(r.get("captured_at")) for r in fresh]
+        self._dtype[rows] = [
+            self._dtype_codes.setdefault(str(r.get("d_type") or "unknown"), len(self._dtype_codes)) for r in fresh
+        ]
+        for offset, record in enumerate(fresh):
+            for name, value in (record.get("weights") or {}).items():
+                try:
+                    value = float(value)
+                except (TypeError, ValueError):
+                    continue
+                column = self._weights.get(name)
+                if column is None:
+                    column = self._weights[name] = np.full(len(self._time), np.nan)
+                column[self._size + offset] = value
+        for offset, record in enumerate(fresh):
+            key = str(record["memorise_id"])
+            self._rows[key] = self._size + offset
+            self.ids.append(key)
+            self.payloads.append(dict(record.get("payload") or {}))
+        if self._centroids is not None:
+            self._encode(rows)
+        self._size += len(fresh)
+        self.build()
+        return len(fresh)
+
+    def add(self, memorise_id: str, text: str, **fields: Any) -> bool:
+        return self.add_many([{"memorise_id": memorise_id, "text": text, **fields}]) == 1
+
+    # ------------------------------------------------------------ ledger sync
+    def sync_jsonl(self, path: Path | str) -> int:
+        """Index entries appended to a JSON-lines ledger since the last sync."""
+
+        path = Path(path)
+        if not path.exists():
+            return 0
+        key = f"jsonl:{path.resolve()}"
+        with path.open("rb") as fh:
+            fh.seek(self._sources.get(key, 0))
+            lines = fh.readlines()
+        complete = lines if not lines or lines[-1].endswith(b"\n") else lines[:-1]
+        self._sources[key] = self._sources.get(key, 0) + sum(len(line) for line in complete)
+        records = []
+        for line in complete:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(entry, dict) and entry.get("memorise_id") is not None:
+                records.append(ledger_record(entry))
+        return self.add_many(records)
+
+    def sync_sqlite(self, db_path: Path | str) -> int:
+        """Index rows of a ``TSMWriterSQL`` ``memories`` table added since the last sync."""
+
+        db_path = Path(db_path)
+        if not db_path.exists():
+            return 0
+        key = f"sqlite:{db_path.resolve()}"
+        with sqlite3.connect(str(db_path)) as conn:
+            rows = conn.execute(
+                "SELECT rowid, memorise_id, created_at, D_context, D_sense, D_type, W_L, W_S, W_K, W_E "
+                "FROM memories WHERE rowid > ? ORDER BY rowid",
+                (self._sources.get(key, 0),),
+            ).fetchall()
+        if rows:
+            self._sources[key] = rows[-1][0]
+        return self.add_many(
+            {
+                "memorise_id": memorise_id,
+                "text": f"{context or ''} {sense or ''}",
+                "d_type": d_type,
+                "captured_at": created_at,
+                "weights": {"W_L": w_l, "W_S": w_s, "W_K": w_k, "W_E": w_e},
+                "payload": {"context": context, "sense": sense, "captured_at": created_at},
+            }
+            for _, memorise_id, created_at, context, sense, d_type, w_l, w_s, w_k, w_e in rows
+        )
+
+    # ------------------------------------------------------------ IVF / PQ
+    def train(self) -> None:
+        """(Re)build the coarse quantiser and product codebooks from the stored vectors."""
+
+        n, dim = self._size, self.embedder.dim
+        if n == 0:
+            return
+        nlist = int(min(1024, max(1, 4 * np.sqrt(n))))
+        sample_size = min(n, 16 * nlist)
+        sample = self._vectors[self._rng.choice(n, size=sample_size, replace=False)]
+        self._centroids = _spherical_kmeans(sample, min(nlist, sample_size), 6, self._rng)
+
+        m = self.pq_subvectors if self.pq_subvectors and dim % self.pq_subvectors == 0 else 0
+        if m:
+            sub = sample[: 32 * 256].reshape(-1, m, dim // m)
+            ks = min(256, len(sub))
+            self._codebooks = np.stack([_kmeans(sub[:, j], ks, 6, self._rng) for j in range(m)]).astype(np.float32)
+            self._codes = np.zeros((len(self._time), m), dtype=np.uint8)
+        else:
+            self._codebooks = None
+        self._encode(slice(0, n))
+        self._trained_size = n
+        self._organise()
+
+    def _encode(self, rows: slice, block: int = 65536) -> None:
+        for start in range(rows.start, rows.stop, block):
+            part = slice(start, min(start + block, rows.stop))
+            vectors = self._vectors[part]
+            self._assign[part] = np.argmax(vectors @ self._centroids.T, axis=1)
+            if self._codebooks is not None:
+                m, _, sub_dim = self._codebooks.shape
+                sub = vectors.reshape(len(vectors), m, sub_dim)
+                for j in range(m):
+                    book = self._codebooks[j]
+                    d2 = (book * book).sum(1)[None, :] - 2.0 * sub[:, j] @ book.T
+                    self._codes[part, j] = np.argmin(d2, axis=1)
+
+    def _organise(self) -> None:
+        assign = self._assign[: self._size]
+        self._list_order = np.argsort(assign, kind="stable")
+        counts = np.bincount(assign, minlength=len(self._centroids))
+        self._list_offsets = np.concatenate(([0], np.cumsum(counts)))
+        self._organised = self._size
+
+    def build(self) -> None:
+        """Train the inverted file if the store has outgrown it, else file new rows into its lists.
+
+        Below ``ivf_threshold`` this does nothing.  :meth:`add_many` calls it
+        after every batch.
+        """
+
+        if self._size < self.ivf_threshold:
+            return
+        if self._centroids is None or self._size >= 4 * self._trained_size:
+            self.train()
+        elif self._size - self._organised > max(1024, self._organised // 10):
+            self._organise()
+
+    def _ivf_candidates(self, query: np.ndarray) -> np.ndarray:
+        probes = np.argsort(self._centroids @ query)[-self.nprobe:]
+        parts = [self._list_order[self._list_offsets[p]: self._list_offsets[p + 1]] for p in probes]
+        if self._organised < self._size:
+            probed = np.zeros(len(self._centroids), dtype=bool)
+            probed[probes] = True
+            tail = np.arange(self._organised, self._size)
+            parts.append(tail[probed[self._assign[tail]]])
+        return np.concatenate(parts)
+
+    def _approximate_scores(self, query: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        m, ks, sub_dim = self._codebooks.shape
+        table = np.einsum("mcd,md->mc", self._codebooks, query.reshape(m, sub_dim)).ravel()
+        return table[self._codes[rows] + np.arange(0, m * ks, ks, dtype=np.intp)].sum(axis=1)
+
+    # ------------------------------------------------------------ search
+    def _filter_mask(
+        self,
+        rows: Optional[np.ndarray],
+        d_type: Optional[str | Sequence[str]],
+        since: Any,
+        until: Any,
+        weights: Optional[Mapping[str, Tuple[Optional[float], Optional[float]]]],
+    ) -> np.ndarray:
+        """Which of ``rows`` (all rows when ``None``) pass the filters."""
+
+        index = slice(0, self._size) if rows is None else rows
+        mask = np.ones(self._size if rows is None else len(rows), dtype=bool)
+        if d_type is not None:
+            allowed = np.zeros(len(self._dtype_codes) + 1, dtype=bool)
+            for name in [d_type] if isinstance(d_type, str) else d_type:
+                if name in self._dtype_codes:
+                    allowed[self._dtype_codes[name]] = True
+            mask &= allowed[self._dtype[index]]
+        if since is not None:
+            mask &= self._time[index] >= _timestamp(since)
+        if until is not None:
+            mask &= self._time[index] <= _timestamp(until)
+        for name, (low, high) in (weights or {}).items():
+            column = self._weights.get(name)
+            if column is None:
+                return np.zeros_like(mask)
+            if low is not None:
+                mask &= column[index] >= low
+            if high is not None:
+                mask &= column[index] <= high
+        return mask
+
+    def search(
+        self,
+        query: str | np.ndarray,
+        k: int = 5,
+        *,
+        d_type: Optional[str | Sequence[str]] = None,
+        since: Any = None,
+        until: Any = None,
+        weights: Optional[Mapping[str, Tuple[Optional[float], Optional[float]]]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Top-``k`` memories for a text or vector query, best first.
+
+        ``d_type`` is one type or a sequence of types.  ``since``/``until``
+        bound the capture time (datetime, ISO string or epoch seconds), and
+        ``weights`` maps a weight name to an inclusive ``(low, high)`` range,
+        either end of which may be ``None``.  With the inverted file active,
+        filters apply to the probed candidates.  When fewer than ``k`` of
+        them pass, the filtered rows are scanned exactly.
+        """
+
+        if self._size == 0 or k <= 0:
+            return []
+        q = self.embedder.embed(query) if isinstance(query, str) else _normalise_rows(np.asarray(query, dtype=np.float32))
+        filters = (d_type, since, until, weights)
+        filtered = any(f is not None for f in filters)
+
+        rows: Optional[np.ndarray] = None
+        if self._centroids is not None and self._size >= self.ivf_threshold:
+            rows = self._ivf_candidates(q)
+            if filtered:
+                rows = rows[self._filter_mask(rows, *filters)]
+            if filtered and rows.size < k:
+                rows = None
+            elif self._codebooks is not None and rows.size > self.rerank * k:
+                approx = self._approximate_scores(q, rows)
+                rows = rows[np.argpartition(approx, -self.rerank * k)[-self.rerank * k:]]
+        if rows is None and not filtered:
+            rows = np.arange(self._size)
+            scores = self._vectors[: self._size] @ q  # contiguous: no gather
+        else:
+            if rows is None:
+                rows = np.flatnonzero(self._filter_mask(None, *filters))
+            scores = np.empty(rows.size, dtype=np.float32)
+            for start in range(0, rows.size, 65536):
+                part = rows[start:start + 65536]
+                scores[start:start + len(part)] = self._vectors[part] @ q
+        if rows.size == 0:
+            return []
+        top = np.argpartition(scores, -k)[-k:] if rows.size > k else np.arange(rows.size)
+        top = top[np.argsort(scores[top])[::-1]]
+        names = {code: name for name, code in self._dtype_codes.items()}
+        hits = []
+        for i in top:
+            row = int(rows[i])
+            hit = {
+                "memorise_id": self.ids[row],
+                "score": float(scores[i]),
+                "d_type": names.get(int(self._dtype[row]), "unknown"),
+                "weights": {n: float(c[row]) for n, c in self._weights.items() if not np.isnan(c[row])},
+            }
+            hit.update(self.payloads[row])
+            hits.append(hit)
+        return hits
+
+
+def ledger_record(entry: Mapping[str, Any], wave: Optional[Mapping[str, Any]] = None) -> Dict[str, Any]:
+    """Index record for an entry written by ``ciel_memory``'s orchestrator."""
+
+    out = entry.get("tmp_out") or {}
+    context, sense = entry.get("context", ""), entry.get("sense", "")
+    return {
+        "memorise_id": entry["memorise_id"],
+        "text": f"{context} {sense}",
+        "d_type": entry.get("d_type", "unknown"),
+        "captured_at": entry.get("captured_at"),
+        "weights": out.get("weights") or {},
+        "wave": wave,
+        "payload": {
+            "context": context,
+            "sense": sense,
+            "captured_at": entry.get("captured_at"),
+            "source": entry.get("source"),
+        },
+    }
+
+
+__all__ = ["HashedNgramEmbedder", "MemoryIndex", "ledger_record"]
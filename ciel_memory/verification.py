@@ -0,0 +1,208 @@
+"""CIEL/Ω Quantum Consciousness Suite
+
+Copyright (c) 2025 Adrian Lipa / Intention Lab
+Licensed under the CIEL Research Non-Commercial License v1.1.
+
+Persistent queue of TMP reports awaiting user verification.
+
+Reports live in one SQLite table.  ``seq`` is the insertion order, and an
+index on ``(status, seq)`` lets enqueue, dequeue, status updates and page
+fetches each touch O(log n) rows, whatever the backlog size.  Pages use a
+keyset cursor (the last ``seq`` seen), so page 1000 is as cheap as page 1.
+Batch decisions are applied in a single transaction.  The database file is
+only created when the first report is queued.
+"""
+from __future__ import annotations
+
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+STATUSES = ("pending", "approved", "rejected")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS verifications (
+    seq        INTEGER PRIMARY KEY AUTOINCREMENT,
+    report_id  TEXT NOT NULL UNIQUE,
+    created_at TEXT,
+    level      TEXT,
+    status     TEXT NOT NULL DEFAULT 'pending',
+    decided_at TEXT,
+    note       TEXT,
+    report     TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS verifications_by_status ON verifications (status, seq);
+"""
+_COLUMNS = "seq, report_id, status, decided_at, note, report"
+
+
+def _check_status(status: str) -> str:
+    if status not in STATUSES:
+        raise ValueError(f"unknown status {status!r}; expected one of {STATUSES}")
+    return status
+
+
+class VerificationQueue:
+    """SQLite-backed verification queue keyed by ``report_id``.
+
+    Reports are the dictionaries produced by ``run_tmp``.  Rows come back as
+    those dictionaries with ``seq``, ``status``, ``decided_at`` and ``note``
+    added, and ``verified_by_user`` set once a decision has been recorded.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        self._conn: Optional[sqlite3.Connection] = None
+
+    # ------------------------------------------------------------ connection
+    def _connect(self, create: bool = True) -> Optional[sqlite3.Connection]:
+        if self._conn is None:
+            if not create and not self.path.exists():
+                return None
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path))
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    @staticmethod
+    def _row(row: Tuple[Any, ...]) -> Dict[str, Any]:
+        seq, report_id, status, decided_at, note, report = row
+        item = json.loads(report)
+        item.update(seq=seq, report_id=report_id, status=status, decided_at=decided_at, note=note)
+        item["verified_by_user"] = status != "pending"
+        return item
+
+    # ------------------------------------------------------------ writes
+    def enqueue(self, report: Mapping[str, Any]) -> bool:
+        """Queue ``report``; ``False`` if its ``report_id`` is already queued."""
+
+        return self.enqueue_many([report]) == 1
+
+    def enqueue_many(self, reports: Iterable[Mapping[str, Any]]) -> int:
+        """Queue several reports in one transaction; returns how many were new."""
+
+        rows = [
+            (r["report_id"], r.get("created_at"), r.get("level"), json.dumps(dict(r), ensure_ascii=False, default=str))
+            for r in reports
+        ]
+        if not rows:
+            return 0
+        conn = self._connect()
+        with conn:
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO verifications (report_id, created_at, level, report) VALUES (?, ?, ?, ?)", rows
+            )
+            return conn.total_changes - before
+
+    def dequeue(self, limit: int = 1) -> List[Dict[str, Any]]:
+        """Remove and return the ``limit`` oldest pending reports."""
+
+        conn = self._connect(create=False)
+        if conn is None:
+            return []
+        with conn:
+            rows = conn.execute(
+                f"SELECT {_COLUMNS} FROM verifications WHERE status = 'pending' ORDER BY seq LIMIT ?", (int(limit),)
+            ).fetchall()
+            conn.executemany("DELETE FROM verifications WHERE seq = ?", [(row[0],) for row in rows])
+        return [self._row(row) for row in rows]
+
+    def update(self, report_id: str, status: str, note: Optional[str] = None) -> bool:
+        """Set the status of one report; ``False`` if it is not queued."""
+
+        return self.decide_many([(report_id, status, note)]) == 1
+
+    def decide_many(self, decisions: Iterable[Tuple[str, Any, Optional[str]] | Tuple[str, Any]] | Mapping[str, Any]) -> int:
+        """Record several decisions in a single transaction.
+
+        ``decisions`` is a mapping ``report_id -> decision`` or an iterable of
+        ``(report_id, decision)`` / ``(report_id, decision, note)``.  A decision
+        is ``True``/``False`` (approve/reject) or a status name.  Returns the
+        number of reports updated; unknown ids are ignored.
+        """
+
+        items = decisions.items() if isinstance(decisions, Mapping) else decisions
+        stamp = datetime.utcnow().isoformat()
+        rows = []
+        for entry in items:
+            report_id, decision, note = (tuple(entry) + (None,))[:3]
+            if isinstance(decision, bool):
+                status = "approved" if decision else "rejected"
+            else:
+                status = _check_status(str(decision))
+            rows.append((status, None if status == "pending" else stamp, note, report_id))
+        if not rows:
+            return 0
+        conn = self._connect(create=False)
+        if conn is None:
+            return 0
+        with conn:
+            before = conn.total_changes
+            conn.executemany("UPDATE verifications SET status = ?, decided_at = ?, note = ? WHERE report_id = ?", rows)
+            return conn.total_changes - before
+
+    def approve_many(self, report_ids: Iterable[str], note: Optional[str] = None) -> int:
+        return self.decide_many((report_id, True, note) for report_id in report_ids)
+
+    def reject_many(self, report_ids: Iterable[str], note: Optional[str] = None) -> int:
+        return self.decide_many((report_id, False, note) for report_id in report_ids)
+
+    def purge(self, status: str) -> int:
+        """Delete every report with ``status`` (e.g. decided ones after export)."""
+
+        conn = self._connect(create=False)
+        if conn is None:
+            return 0
+        with conn:
+            return conn.execute("DELETE FROM verifications WHERE status = ?", (_check_status(status),)).rowcount
+
+    # ------------------------------------------------------------ reads
+    def get(self, report_id: str) -> Optional[Dict[str, Any]]:
+        conn = self._connect(create=False)
+        if conn is None:
+            return None
+        row = conn.execute(f"SELECT {_COLUMNS} FROM verifications WHERE report_id = ?", (report_id,)).fetchone()
+        return None if row is None else self._row(row)
+
+    def page(
+        self, status: str = "pending", limit: int = 50, after: Optional[int] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Up to ``limit`` reports with ``status``, oldest first, after cursor ``after``.
+
+        Returns ``(items, cursor)``; pass ``cursor`` back as ``after`` for the
+        next page.  ``cursor`` is ``None`` on the last page.
+        """
+
+        conn = self._connect(create=False)
+        if conn is None:
+            return [], None
+        rows = conn.execute(
+            f"SELECT {_COLUMNS} FROM verifications WHERE status = ? AND seq > ? ORDER BY seq LIMIT ?",
+            (_check_status(status), -1 if after is None else int(after), int(limit) + 1),
+        ).fetchall()
+        more = len(rows) > limit
+        rows = rows[:limit]
+        return [self._row(row) for row in rows], (rows[-1][0] if more and rows else None)
+
+    def pending(self, limit: int = 50, after: Optional[int] = None) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        return self.page("pending", limit, after)
+
+    def count(self, status: str = "pending") -> int:
+        conn = self._connect(create=False)
+        if conn is None:
+            return 0
+        return conn.execute("SELECT COUNT(*) FROM verifications WHERE status = ?", (_check_status(status),)).fetchone()[0]
+
+    def __len__(self) -> int:
+        return self.count("pending")
+
+
+__all__ = ["STATUSES", "VerificationQueue"]
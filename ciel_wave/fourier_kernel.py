@@ -16,6 +16,7 @@ from typing import Dict, Iterable, Sequence
 
 import numpy as np
 
+from config.simulation_config import PrecisionPolicy, resolve_precision
 from emotion.utils import fractional_distribution
 from fields.intention_field import IntentionField
 from fields.soul_invariant import SoulInvariant
@@ -92,15 +93,19 @@ class SpectralWaveField12D:
     clipper: HeisenbergSoftClipper = field(
         default_factory=HeisenbergSoftClipper, repr=False
     )
+    precision: PrecisionPolicy | str | None = None
+
+    def __post_init__(self) -> None:
+        self.precision = resolve_precision(self.precision)
 
     def synthesise(self, signal: Sequence[float] | None) -> tuple[np.ndarray, np.ndarray]:
-        samples = self._prepare_signal(signal)
+        samples = self.precision.cast(self._prepare_signal(signal))
         segments = np.array_split(samples, self.config.channels)
         segment_length = max(segment.size for segment in segments) or 1
         field = np.stack(
             [np.pad(segment, (0, segment_length - segment.size)) for segment in segments]
         )
-        time_axis = np.linspace(0.0, self.config.duration, segment_length, endpoint=False)
+        time_axis = self.precision.linspace(0.0, self.config.duration, segment_length, endpoint=False)
         return field, time_axis
 
     def _prepare_signal(self, signal: Sequence[float] | None) -> np.ndarray:
@@ -128,11 +133,13 @@ class FourierWaveConsciousnessKernel12D:
     intention: IntentionField = field(default_factory=IntentionField)
     soul: SoulInvariant = field(default_factory=SoulInvariant)
     tensor: MultiresonanceTensor = field(default_factory=MultiresonanceTensor)
+    precision: PrecisionPolicy | str | None = None
     spectral: SpectralWaveField12D = field(init=False)
     history: list[KernelSnapshot] = field(default_factory=list, init=False, repr=False)
 
     def __post_init__(self) -> None:
-        self.spectral = SpectralWaveField12D(self.config)
+        self.precision = resolve_precision(self.precision)
+        self.spectral = SpectralWaveField12D(self.config, precision=self.precision)
 
     def simulate(self, signal: Sequence[float] | None) -> KernelSnapshot:
         field, time_axis = self.spectral.synthesise(signal)
@@ -152,8 +159,8 @@ class FourierWaveConsciousnessKernel12D:
         coherence = float(np.clip(projection, -1.0, 1.0))
 
         soul_measure = self.soul.compute(field)
-        normalised_field = self.soul.normalise(field)
-        purity = float(np.mean(np.square(normalised_field)))
+        normalised_field = self.precision.cast(self.soul.normalise(field))
+        purity = self.precision.mean(np.square(normalised_field))
 
         probs = np.array(list(distribution.values()), dtype=float)
         entropy = float(-np.sum(probs * np.log(probs + 1e-12)))
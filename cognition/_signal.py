@@ -0,0 +1,35 @@
+"""CIEL/Ω Quantum Consciousness Suite
+
+Copyright (c) 2025 Adrian Lipa / Intention Lab
+Licensed under the CIEL Research Non-Commercial License v1.1.
+
+Array coercion shared by the cognition layers.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+import numpy as np
+
+
+def as_signal(signal: Iterable[float]) -> np.ndarray:
+    """Return ``signal`` as a 1-D float array, without copying float arrays."""
+
+    if isinstance(signal, np.ndarray):
+        return np.asarray(signal, dtype=float).reshape(-1)
+    return np.fromiter(signal, dtype=float)
+
+
+def as_batch(signals: Iterable[Iterable[float]] | np.ndarray) -> np.ndarray:
+    """Return ``signals`` as a ``(batch, samples)`` float matrix."""
+
+    batch = np.asarray(signals if isinstance(signals, np.ndarray) else list(signals), dtype=float)
+    if batch.ndim == 1:
+        batch = batch.reshape(1, -1) if batch.size else batch.reshape(0, 0)
+    if batch.ndim != 2:
+        raise ValueError(f"expected a (batch, samples) matrix, got shape {batch.shape}")
+    return batch
+
+
+__all__ = ["as_batch", "as_signal"]
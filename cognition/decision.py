@@ -13,6 +13,8 @@ from typing import Iterable
 
 import numpy as np
 
+from ._signal import as_signal
+
 from .prediction import PredictiveCore
 
 
@@ -22,8 +24,28 @@ class DecisionCore:
 
     def decide(self, perception: Iterable[float], goals: Iterable[float]) -> float:
         score = self.predictor.forecast(perception)
-        goal_alignment = np.mean(list(goals)) if list(goals) else 0.0
-        return float(score + goal_alignment)
+        return float(score + self.goal_alignment(goals))
+
+    def decide_many(
+        self, perception: Iterable[Iterable[float]] | np.ndarray, goals: Iterable[float] | np.ndarray
+    ) -> np.ndarray:
+        """:meth:`decide` for every row of ``perception``.
+
+        ``goals`` is either one goal vector shared by all rows or a
+        ``(batch, goals)`` matrix with one goal vector per row.
+        """
+
+        score = self.predictor.forecast_many(perception)
+        if isinstance(goals, np.ndarray) and goals.ndim == 2:
+            alignment = goals.mean(axis=1) if goals.shape[1] else np.zeros(goals.shape[0])
+        else:
+            alignment = self.goal_alignment(goals)
+        return score + alignment
+
+    @staticmethod
+    def goal_alignment(goals: Iterable[float]) -> float:
+        values = as_signal(goals)
+        return float(values.mean()) if values.size else 0.0
 
 
 __all__ = ["DecisionCore"]
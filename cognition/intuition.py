@@ -13,12 +13,20 @@ from typing import Iterable
 
 import numpy as np
 
+from ._signal import as_batch, as_signal
+
 
 @dataclass(slots=True)
 class IntuitiveCortex:
     def infer(self, signal: Iterable[float]) -> float:
-        arr = np.fromiter(signal, dtype=float)
+        arr = as_signal(signal)
         return float(np.median(arr) if arr.size else 0.0)
 
+    def infer_many(self, signals: Iterable[Iterable[float]] | np.ndarray) -> np.ndarray:
+        """:meth:`infer` for every row of a ``(batch, samples)`` matrix."""
+
+        arr = as_batch(signals)
+        return np.median(arr, axis=1) if arr.shape[1] else np.zeros(arr.shape[0])
+
 
 __all__ = ["IntuitiveCortex"]
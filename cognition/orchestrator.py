@@ -4,6 +4,11 @@ Copyright (c) 2025 Adrian Lipa / Intention Lab
 Licensed under the CIEL Research Non-Commercial License v1.1.
 
 Glue logic combining cognition submodules.
+
+The stimulus is converted to an array once and that array is handed to every
+layer, so one-shot iterables (generators) are not exhausted by the first
+layer.  :meth:`CognitionOrchestrator.evaluate_batch` scores a whole
+``(batch, samples)`` matrix of candidate stimuli with row-wise reductions.
 """
 
 from __future__ import annotations
@@ -11,6 +16,9 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Iterable
 
+import numpy as np
+
+from ._signal import as_batch, as_signal
 from .decision import DecisionCore
 from .intuition import IntuitiveCortex
 from .perception import PerceptiveLayer
@@ -25,15 +33,31 @@ class CognitionOrchestrator:
     decision: DecisionCore = field(default_factory=DecisionCore)
 
     def evaluate(self, stimulus: Iterable[float], goals: Iterable[float]) -> dict[str, float]:
-        perception_value = self.perception.perceive(stimulus)
-        intuition_value = self.intuition.infer(stimulus)
-        prediction_value = self.prediction.forecast(stimulus)
-        decision_value = self.decision.decide(stimulus, goals)
+        signal = as_signal(stimulus)
+        return {
+            "perception": self.perception.perceive(signal),
+            "intuition": self.intuition.infer(signal),
+            "prediction": self.prediction.forecast(signal),
+            "decision": self.decision.decide(signal, as_signal(goals)),
+        }
+
+    def evaluate_batch(
+        self, stimuli: Iterable[Iterable[float]] | np.ndarray, goals: Iterable[float] | np.ndarray
+    ) -> dict[str, np.ndarray]:
+        """Score every row of ``stimuli``; each output is an array of length ``batch``.
+
+        ``goals`` is one goal vector shared by all candidates or a
+        ``(batch, goals)`` matrix, as in :meth:`DecisionCore.decide_many`.
+        """
+
+        batch = as_batch(stimuli)
+        if not (isinstance(goals, np.ndarray) and goals.ndim == 2):
+            goals = as_signal(goals)
         return {
-            "perception": perception_value,
-            "intuition": intuition_value,
-            "prediction": prediction_value,
-            "decision": decision_value,
+            "perception": self.perception.perceive_many(batch),
+            "intuition": self.intuition.infer_many(batch),
+            "prediction": self.prediction.forecast_many(batch),
+            "decision": self.decision.decide_many(batch, goals),
         }
 
 
@@ -13,17 +13,28 @@ from typing import Iterable
 
 import numpy as np
 
+from ._signal import as_batch, as_signal
+
 
 @dataclass(slots=True)
 class PerceptiveLayer:
     window: int = 5
 
     def perceive(self, signal: Iterable[float]) -> float:
-        values = np.fromiter(signal, dtype=float)
+        values = as_signal(signal)
         if values.size == 0:
             return 0.0
         w = min(self.window, values.size)
         return float(values[-w:].mean())
 
+    def perceive_many(self, signals: Iterable[Iterable[float]] | np.ndarray) -> np.ndarray:
+        """:meth:`perceive` for every row of a ``(batch, samples)`` matrix."""
+
+        values = as_batch(signals)
+        if values.shape[1] == 0:
+            return np.zeros(values.shape[0])
+        w = min(self.window, values.shape[1])
+        return values[:, -w:].mean(axis=1)
+
 
 __all__ = ["PerceptiveLayer"]
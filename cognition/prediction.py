@@ -13,18 +13,30 @@ from typing import Iterable
 
 import numpy as np
 
+from ._signal import as_batch, as_signal
+
 
 @dataclass(slots=True)
 class PredictiveCore:
     horizon: int = 3
 
     def forecast(self, signal: Iterable[float]) -> float:
-        values = np.fromiter(signal, dtype=float)
+        values = as_signal(signal)
         if values.size == 0:
             return 0.0
         coeffs = np.linspace(1.0, 2.0, min(self.horizon, values.size))
         recent = values[-coeffs.size :]
         return float(np.dot(coeffs, recent) / coeffs.sum())
 
+    def forecast_many(self, signals: Iterable[Iterable[float]] | np.ndarray) -> np.ndarray:
+        """:meth:`forecast` for every row of a ``(batch, samples)`` matrix."""
+
+        values = as_batch(signals)
+        if values.shape[1] == 0:
+            return np.zeros(values.shape[0])
+        coeffs = np.linspace(1.0, 2.0, min(self.horizon, values.shape[1]))
+        recent = values[:, -coeffs.size :]
+        return recent @ coeffs / coeffs.sum()
+
 
 __all__ = ["PredictiveCore"]
@@ -3,11 +3,150 @@
 Copyright (c) 2025 Adrian Lipa / Intention Lab
 Licensed under the CIEL Research Non-Commercial License v1.1.
 
-Convenience import for the :class:`~fields.intention_field.IntentionField`.
+Simulation-wide settings: the :class:`~fields.intention_field.IntentionField`
+convenience import and the floating point precision policy.
+
+Every field engine accepts ``precision=`` (a :class:`PrecisionPolicy` or one
+of ``"double"``/``"single"``); ``None`` falls back to the process default set
+with :func:`set_precision` or the ``CIEL_PRECISION`` environment variable.
+Fields are allocated in the policy's ``real``/``complex`` dtypes while the
+reductions the engines report — norms, purities, Lagrangian integrals — are
+accumulated in float64 whatever the field precision.
 """
 
 from __future__ import annotations
 
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator
+
+import numpy as np
+
 from fields.intention_field import IntentionField
 
-__all__ = ["IntentionField"]
+
+@dataclass(frozen=True, slots=True)
+class PrecisionPolicy:
+    """Dtypes used for field storage; reductions always use float64."""
+
+    name: str
+    real: type
+    complex: type
+
+    accumulate = np.float64
+
+    # ------------------------------------------------------------ allocation
+    def zeros(self, shape: Any, *, complex: bool = True) -> np.ndarray:
+        return np.zeros(shape, dtype=self.complex if complex else self.real)
+
+    def ones(self, shape: Any, *, complex: bool = True) -> np.ndarray:
+        return np.ones(shape, dtype=self.complex if complex else self.real)
+
+    def linspace(self, start: float, stop: float, num: int, **kwargs: Any) -> np.ndarray:
+        """Coordinate axis computed in float64 and stored in the real dtype."""
+
+        return np.linspace(start, stop, num, **kwargs).astype(self.real, copy=False)
+
+    def cast(self, array: Any) -> np.ndarray:
+        """``array`` in the policy dtype matching its kind (no copy when it already is)."""
+
+        array = np.asarray(array)
+        dtype = self.complex if np.iscomplexobj(array) else self.real
+        return array.astype(dtype, copy=False)
+
+    def enforce(self, owner: Any, names: Iterable[str]) -> None:
+        """Cast the array attributes ``names`` of ``owner`` back to the policy.
+
+        NumPy promotes freely (float64 scalars, helper tables); calling this
+        at the end of an evolution step keeps the stored state at the policy
+        precision.
+        """
+
+        for name in names:
+            value = getattr(owner, name, None)
+            if isinstance(value, np.ndarray) and value.dtype.kind in "fc":
+                setattr(owner, name, self.cast(value))
+
+    # ------------------------------------------------------------ reductions
+    def norm(self, array: np.ndarray) -> float:
+        """L2 norm accumulated in float64."""
+
+        return float(np.sqrt(np.sum(np.abs(array) ** 2, dtype=np.float64)))
+
+    def mean(self, array: np.ndarray) -> float:
+        return float(np.mean(array, dtype=np.complex128 if np.iscomplexobj(array) else np.float64).real)
+
+    def total(self, array: np.ndarray) -> float:
+        return float(np.sum(array, dtype=np.complex128 if np.iscomplexobj(array) else np.float64).real)
+
+
+DOUBLE = PrecisionPolicy("double", np.float64, np.complex128)
+SINGLE = PrecisionPolicy("single", np.float32, np.complex64)
+
+_ALIASES = {
+    "double": DOUBLE,
+    "float64": DOUBLE,
+    "complex128": DOUBLE,
+    "single": SINGLE,
+    "float32": SINGLE,
+    "complex64": SINGLE,
+}
+
+
+def _lookup(name: str) -> PrecisionPolicy:
+    try:
+        return _ALIASES[name.strip().lower()]
+    except KeyError:
+        raise ValueError(f"unknown precision {name!r}; expected one of {sorted(_ALIASES)}") from None
+
+
+_default: PrecisionPolicy = _lookup(os.getenv("CIEL_PRECISION", "double") or "double")
+
+
+def get_precision() -> PrecisionPolicy:
+    """Process-wide default policy."""
+
+    return _default
+
+
+def set_precision(policy: PrecisionPolicy | str) -> PrecisionPolicy:
+    """Set the process-wide default and return the previous one."""
+
+    global _default
+    previous = _default
+    _default = resolve_precision(policy)
+    return previous
+
+
+def resolve_precision(policy: PrecisionPolicy | str | None = None) -> PrecisionPolicy:
+    """Normalise an engine's ``precision=`` argument."""
+
+    if policy is None:
+        return _default
+    if isinstance(policy, PrecisionPolicy):
+        return policy
+    return _lookup(str(policy))
+
+
+@contextmanager
+def precision_scope(policy: PrecisionPolicy | str) -> Iterator[PrecisionPolicy]:
+    """Temporarily change the default policy (engines keep the one they were built with)."""
+
+    previous = set_precision(policy)
+    try:
+        yield _default
+    finally:
+        set_precision(previous)
+
+
+__all__ = [
+    "DOUBLE",
+    "IntentionField",
+    "PrecisionPolicy",
+    "SINGLE",
+    "get_precision",
+    "precision_scope",
+    "resolve_precision",
+    "set_precision",
+]
@@ -21,6 +21,8 @@ from typing import Tuple, List, Dict, Optional, Union, Callable
 import warnings
 warnings.filterwarnings('ignore')
 
+from config.simulation_config import PrecisionPolicy, resolve_precision
+
 
 @dataclass
 class CIELParameters:
@@ -49,13 +51,18 @@ class CIELParameters:
 class CIEL0Framework:
     """Complete implementation of Adrian Lipa's CIEL/0 Theory of Everything"""
     
-    def __init__(self, params: CIELParameters = None, grid_size: int = 64):
+    FIELD_NAMES = ('I_field', 'tau_field', 'F_field', 'S_field', 'Lambda0_field',
+                   'R_field', 'mass_field')
+
+    def __init__(self, params: CIELParameters = None, grid_size: int = 64,
+                 precision: Optional[Union[PrecisionPolicy, str]] = None):
         self.params = params or CIELParameters()
         self.grid_size = grid_size
+        self.precision = resolve_precision(precision)
         
         # Initialize spacetime grid
-        self.x = np.linspace(-5, 5, grid_size)
-        self.t = np.linspace(0, 10, grid_size)
+        self.x = self.precision.linspace(-5, 5, grid_size)
+        self.t = self.precision.linspace(0, 10, grid_size)
         self.X, self.T = np.meshgrid(self.x, self.t)
         
         # Initialize fields
@@ -63,30 +70,33 @@ class CIEL0Framework:
         
     def _initialize_fields(self):
         """Initialize all fundamental fields in CIEL/0"""
+        p = self.precision
+        n = self.grid_size
+
         # Complex intention field I(x,t) - dimensionless
-        self.I_field = np.zeros((self.grid_size, self.grid_size), dtype=complex)
+        self.I_field = p.zeros((n, n))
         
         # Temporal field τ(x,t) - seconds or radians
-        self.tau_field = np.zeros((self.grid_size, self.grid_size))
+        self.tau_field = p.zeros((n, n), complex=False)
         
         # Resonant aether field F^μ(x,t) - vector field
-        self.F_field = np.zeros((self.grid_size, self.grid_size, 4))
+        self.F_field = p.zeros((n, n, 4), complex=False)
         
         # Symbolic state field S(x,t) - dimensionless
-        self.S_field = np.zeros((self.grid_size, self.grid_size), dtype=complex)
+        self.S_field = p.zeros((n, n))
         
         # Lambda0 operator field - m^-2
-        self.Lambda0_field = np.zeros((self.grid_size, self.grid_size))
+        self.Lambda0_field = p.zeros((n, n), complex=False)
         
         # Resonance function R(S,I) - dimensionless
-        self.R_field = np.zeros((self.grid_size, self.grid_size))
+        self.R_field = p.zeros((n, n), complex=False)
         
         # Mass field m(x,t) - kg
-        self.mass_field = np.zeros((self.grid_size, self.grid_size))
+        self.mass_field = p.zeros((n, n), complex=False)
         
         # Curvature tensors
-        self.Ricci_tensor = np.zeros((self.grid_size, self.grid_size, 4, 4))
-        self.Einstein_tensor = np.zeros((self.grid_size, self.grid_size, 4, 4))
+        self.Ricci_tensor = p.zeros((n, n, 4, 4), complex=False)
+        self.Einstein_tensor = p.zeros((n, n, 4, 4), complex=False)
         
     def compute_resonance(self, S: np.ndarray, I: np.ndarray) -> np.ndarray:
         """
@@ -177,7 +187,7 @@ class CIEL0Framework:
         grad_entropy = np.gradient(entropy_field)
         
         # Temporal flow is negative gradient
-        temporal_flow = np.zeros((*entropy_field.shape, 4))
+        temporal_flow = self.precision.zeros((*entropy_field.shape, 4), complex=False)
         temporal_flow[..., 0] = -grad_entropy[0]  # Time component
         if len(grad_entropy) > 1:
             temporal_flow[..., 1] = -grad_entropy[1]  # Space component
@@ -292,8 +302,11 @@ class CIEL0Framework:
     
     def unified_lagrangian(self, fields: Dict[str, np.ndarray]) -> float:
         """Compute total L = L_I + L_τ + L_F + L_V + L_shear"""
-        I = fields['I']; tau = fields['tau']
-        F = fields['F']; Λ0 = fields['Lambda0']
+        # The action integral is precision sensitive: evaluate it in double.
+        I = np.asarray(fields['I'], dtype=np.complex128)
+        tau = np.asarray(fields['tau'], dtype=np.float64)
+        F = np.asarray(fields['F'], dtype=np.float64)
+        Λ0 = np.asarray(fields['Lambda0'], dtype=np.float64)
         # Gradients
         dI0, dI1 = np.gradient(I)
         L_I = 0.5*(np.abs(dI0)**2 + np.abs(dI1)**2)
@@ -344,6 +357,7 @@ class CIEL0Framework:
         
         # Evolve symbolic field (coupled to intention)
         self.S_field = self.S_field + dt * 0.1 * self.I_field
+        self.precision.enforce(self, self.FIELD_NAMES)
         
     def initialize_gaussian_pulse(self, center: Tuple[int, int] = None, 
                                 sigma: float = 1.0, amplitude: float = 1.0):
@@ -365,6 +379,7 @@ class CIEL0Framework:
         
         # Initialize temporal field
         self.tau_field = gaussian * 0.1
+        self.precision.enforce(self, ('I_field', 'S_field', 'tau_field'))
         
     def analyze_coherence_dynamics(self, steps: int = 100) -> Dict[str, List[float]]:
         """Analyze the evolution of coherence and other key metrics"""
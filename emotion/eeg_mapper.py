@@ -11,7 +11,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Iterable, List
 
-from .utils import fractional_distribution, to_signal_list
+from .utils import fractional_distribution, to_signal_array
 
 
 @dataclass(slots=True)
@@ -23,7 +23,7 @@ class EEGEmotionMapper:
             self.bands = ["delta", "theta", "alpha", "beta", "gamma"]
 
     def map(self, signal: Iterable[float]) -> dict[str, float]:
-        values = to_signal_list(signal)
+        values = to_signal_array(signal)
         return fractional_distribution(values, self.bands)
 
 
@@ -8,23 +8,40 @@ Compact emotional core used by the high level tests.
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, Iterable
+from typing import Deque, Dict, Iterable, List, Optional
 
-from .utils import mean_and_variance, to_signal_list
+import numpy as np
+
+from .utils import batch_mean_and_variance, mean_and_variance, to_signal_array
 
 
 @dataclass(slots=True)
 class EmotionCore:
+    """Mood/variance tracker; ``history_limit`` bounds the kept results (``None`` keeps all)."""
+
     baseline: float = 0.0
-    history: list[Dict[str, float]] = field(default_factory=list, init=False, repr=False)
+    history_limit: Optional[int] = 1024
+    history: Deque[Dict[str, float]] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.history = deque(maxlen=self.history_limit)
 
     def process(self, signal: Iterable[float]) -> Dict[str, float]:
-        values = to_signal_list(signal)
+        values = to_signal_array(signal)
         mood, variance = mean_and_variance(values, baseline=self.baseline)
         result = {"mood": mood, "variance": variance}
         self.history.append(result)
         return result
 
+    def process_batch(self, signals: Iterable[Iterable[float]] | np.ndarray) -> List[Dict[str, float]]:
+        """:meth:`process` for many signals: rows of a 2D array or a sequence of traces."""
+
+        moods, variances = batch_mean_and_variance(signals, baseline=self.baseline)
+        results = [{"mood": m, "variance": v} for m, v in zip(moods.tolist(), variances.tolist())]
+        self.history.extend(results)
+        return results
+
 
 __all__ = ["EmotionCore"]
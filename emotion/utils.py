@@ -20,6 +20,24 @@ import numpy as np
 from mathematics.safe_operations import heisenberg_soft_clip
 
 
+def to_signal_array(signal: Iterable[float] | np.ndarray) -> np.ndarray:
+    """Coerce ``signal`` into a flat float64 array, skipping ``None`` entries.
+
+    Numeric arrays and lists without ``None`` are converted in one call;
+    other iterables fall back to a filtered :func:`numpy.fromiter`.
+    """
+
+    if isinstance(signal, np.ndarray) and signal.dtype != object:
+        return signal.astype(float, copy=False).reshape(-1)
+    if isinstance(signal, (list, tuple)):
+        try:
+            if None not in signal:
+                return np.asarray(signal, dtype=float).reshape(-1)
+        except (TypeError, ValueError):
+            pass
+    return np.fromiter((float(value) for value in signal if value is not None), dtype=float)
+
+
 def to_signal_list(signal: Iterable[float]) -> List[float]:
     """Coerce an arbitrary iterable of numbers into a concrete ``list``.
 
@@ -27,36 +45,66 @@ def to_signal_list(signal: Iterable[float]) -> List[float]:
     ignored so callers can pass data directly from mocked hardware streams.
     """
 
-    values: List[float] = []
-    for value in signal:
-        if value is None:
-            continue
-        values.append(float(value))
-    return values
+    return to_signal_array(signal).tolist()
 
 
-def mean_and_variance(values: Sequence[float], *, baseline: float = 0.0) -> Tuple[float, float]:
+def mean_and_variance(values: Sequence[float] | np.ndarray, *, baseline: float = 0.0) -> Tuple[float, float]:
     """Compute mean and (population) variance for a sequence of floats.
 
     Parameters
     ----------
     values:
-        Sequence of numeric values.  If empty the baseline is returned as the
-        mean and the variance defaults to ``0.0``.
+        Sequence or array of numeric values.  If empty the baseline is
+        returned as the mean and the variance defaults to ``0.0``.
     baseline:
         Optional baseline value that is blended with the empirical mean.  This
         keeps the behaviour consistent with the simplified vendor expectation
-        where a neutral mood may be configured externally.
+        where a neutral mood may be configured externally.  The variance is
+        taken about the blended mean.
     """
 
-    if not values:
+    values = np.asarray(values, dtype=float).reshape(-1)
+    if values.size == 0:
         return baseline, 0.0
 
-    mean = baseline + sum(values) / len(values)
-    variance = sum((value - mean) ** 2 for value in values) / len(values)
+    mean = baseline + float(values.mean())
+    variance = float(np.mean((values - mean) ** 2))
     return mean, variance
 
 
+def batch_mean_and_variance(
+    signals: Iterable[Iterable[float]] | np.ndarray, *, baseline: float = 0.0
+) -> Tuple[np.ndarray, np.ndarray]:
+    """:func:`mean_and_variance` for many signals at once.
+
+    A 2D array is reduced along its rows.  Ragged inputs are concatenated and
+    reduced per segment with :func:`numpy.add.reduceat`; empty signals give
+    ``(baseline, 0.0)``.
+    """
+
+    if isinstance(signals, np.ndarray) and signals.ndim == 2 and signals.dtype != object:
+        block = signals.astype(float, copy=False)
+        if block.shape[1] == 0:
+            return np.full(block.shape[0], float(baseline)), np.zeros(block.shape[0])
+        means = baseline + block.mean(axis=1)
+        return means, np.mean((block - means[:, None]) ** 2, axis=1)
+
+    arrays = [to_signal_array(signal) for signal in signals]
+    lengths = np.array([a.size for a in arrays], dtype=np.int64)
+    means = np.full(len(arrays), float(baseline))
+    variances = np.zeros(len(arrays))
+    filled = lengths > 0
+    if filled.any():
+        flat = np.concatenate([a for a in arrays if a.size])
+        counts = lengths[filled]
+        offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        seg_means = baseline + np.add.reduceat(flat, offsets) / counts
+        centred = flat - np.repeat(seg_means, counts)
+        means[filled] = seg_means
+        variances[filled] = np.add.reduceat(centred * centred, offsets) / counts
+    return means, variances
+
+
 def fractional_distribution(
     values: Sequence[float],
     labels: Sequence[str],
@@ -74,10 +122,11 @@ def fractional_distribution(
     if not labels:
         return {}
 
-    counts = [abs(float(value)) for value in values if value is not None]
-    counts = counts or [1.0]
+    counts = np.abs(to_signal_array(values))
+    if counts.size == 0:
+        counts = np.ones(1)
 
-    expanded = np.array([counts[i % len(counts)] for i in range(len(labels))], dtype=float)
+    expanded = counts[np.arange(len(labels)) % counts.size]
 
     sigma = float(np.std(expanded))
     if sigma == 0.0:
@@ -98,6 +147,8 @@ def fractional_distribution(
 
 
 __all__ = [
+    "batch_mean_and_variance",
+    "to_signal_array",
     "to_signal_list",
     "mean_and_variance",
     "fractional_distribution",
@@ -8,8 +8,9 @@ Compact ethical engine used by the tests.
 
 from __future__ import annotations
 
+from collections import Counter, deque
 from dataclasses import dataclass, field
-from typing import Dict, Iterable
+from typing import Deque, Dict, Iterable, Optional
 
 
 @dataclass(slots=True)
@@ -18,12 +19,20 @@ class EthicalEngine:
 
     positive_words: Iterable[str] = ("love", "peace", "harmony")
     negative_words: Iterable[str] = ("hate", "war", "chaos")
-    history: list[Dict[str, float]] = field(default_factory=list, init=False, repr=False)
+    history_limit: Optional[int] = 1024
+    history: Deque[Dict[str, float]] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Materialise once: the keyword lists may be one-shot iterables.
+        self.positive_words = tuple(self.positive_words)
+        self.negative_words = tuple(self.negative_words)
+        self.history = deque(maxlen=self.history_limit)
 
     def evaluate(self, text: str) -> Dict[str, float]:
         words = text.lower().split()
-        pos = sum(words.count(w) for w in self.positive_words)
-        neg = sum(words.count(w) for w in self.negative_words)
+        counts = Counter(words)  # one pass over the text, then O(1) per keyword
+        pos = sum(counts[w] for w in self.positive_words)
+        neg = sum(counts[w] for w in self.negative_words)
         score = (pos - neg) / max(len(words), 1)
         coherence = 1.0 - min(abs(score), 1.0) * 0.5
         result = {"score": score, "coherence": coherence}
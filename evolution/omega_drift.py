@@ -19,6 +19,29 @@ def _field_norm(field: np.ndarray) -> float:
     return float(np.sqrt(np.mean(np.abs(field) ** 2)) + 1e-12)
 
 
+def drift_stacked(
+    psi: np.ndarray,
+    sigma: np.ndarray,
+    carrier: complex,
+    drift_gain: float = 0.05,
+    renorm: bool = True,
+) -> np.ndarray:
+    """Apply one drift step in place to a ``(nodes, *shape)`` stack.
+
+    ``sigma`` holds one scalar per node and ``carrier`` is the uniform clock
+    value shared by all nodes for this step.
+    """
+
+    expand = (slice(None),) + (np.newaxis,) * (psi.ndim - 1)
+    factor = np.exp(1j * drift_gain * np.asarray(sigma, dtype=float)) * carrier
+    psi *= factor[expand]
+    if renorm:
+        axes = tuple(range(1, psi.ndim))
+        norms = np.sqrt(np.mean(np.abs(psi) ** 2, axis=axes)) + 1e-12
+        psi /= norms[expand]
+    return psi
+
+
 @dataclass(slots=True)
 class OmegaDriftCore:
     clock: SchumannClock
@@ -27,11 +50,17 @@ class OmegaDriftCore:
     renorm: bool = True
 
     def step(self, psi: np.ndarray, sigma_scalar: float = 1.0) -> np.ndarray:
-        carrier = self.clock.carrier(psi.shape, amp=1.0, k=self.harmonic)
-        psi_next = psi * np.exp(1j * self.drift_gain * sigma_scalar) * carrier
+        carrier = self.clock.carrier_scalar(amp=1.0, k=self.harmonic)
+        psi_next = psi * (np.exp(1j * self.drift_gain * sigma_scalar) * carrier)
         if self.renorm:
             psi_next /= _field_norm(psi_next)
         return psi_next
 
+    def step_stacked(self, psi: np.ndarray, sigma: np.ndarray) -> np.ndarray:
+        """Drift every node of a ``(nodes, *shape)`` stack in place."""
+
+        carrier = self.clock.carrier_scalar(amp=1.0, k=self.harmonic)
+        return drift_stacked(psi, sigma, carrier, self.drift_gain, self.renorm)
+
 
-__all__ = ["OmegaDriftCore"]
+__all__ = ["OmegaDriftCore", "drift_stacked"]
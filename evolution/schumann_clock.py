@@ -26,6 +26,12 @@ class SchumannClock:
         now = (time.perf_counter() - self.start_t) if at is None else at
         return (2.0 * math.pi * self.base_hz * k * now) % (2.0 * math.pi)
 
+    def carrier_scalar(self, amp: float = 1.0, k: int = 1) -> complex:
+        """Uniform carrier value; broadcasting it avoids materialising an array."""
+
+        ph = self.phase(k=k)
+        return amp * complex(math.cos(ph), math.sin(ph))
+
     def carrier(self, shape: Tuple[int, int], amp: float = 1.0, k: int = 1) -> np.ndarray:
         ph = self.phase(k=k)
         return amp * np.exp(1j * ph) * np.ones(shape, dtype=np.complex128)
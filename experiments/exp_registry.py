@@ -9,7 +9,9 @@ Minimal experiment registry used in tests.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Callable, Dict, Any, Iterable
+from typing import Callable, Dict, Any, Iterable, Mapping
+
+from .sweep import SweepReport, run_sweep
 
 
 @dataclass(slots=True)
@@ -22,5 +24,14 @@ class ExpRegistry:
     def run(self, names: Iterable[str]) -> Dict[str, Dict[str, Any]]:
         return {name: self.experiments[name]() for name in names if name in self.experiments}
 
+    def sweep(self, name: str, grid: Mapping[str, Iterable[Any]], **options: Any) -> SweepReport:
+        """Run experiment ``name`` over a parameter grid in a process pool.
+
+        The registered callable receives each parameter set as keyword
+        arguments and must be picklable; see :func:`experiments.sweep.run_sweep`.
+        """
+
+        return run_sweep(self.experiments[name], grid, **options)
+
 
 __all__ = ["ExpRegistry"]
@@ -0,0 +1,268 @@
+"""CIEL/Ω Quantum Consciousness Suite
+
+Copyright (c) 2025 Adrian Lipa / Intention Lab
+Licensed under the CIEL Research Non-Commercial License v1.1.
+
+Process-pool parameter sweeps.
+
+A sweep expands a parameter grid into individual runs, fans them out over a
+:class:`~concurrent.futures.ProcessPoolExecutor` and appends every finished
+run to a JSONL results store as soon as it completes.  Each run is keyed by a
+stable hash of its parameters, so re-launching a sweep against the same store
+skips runs that already succeeded.
+
+Workers are started with the ``spawn`` method and their initializer sets
+BLAS/OpenMP thread caps before they import NumPy, which keeps ``max_workers``
+processes from oversubscribing the machine.  This module deliberately avoids
+importing NumPy at import time for the same reason.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import itertools
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence
+
+THREAD_LIMIT_VARS = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "BLIS_NUM_THREADS",
+)
+
+
+def parameter_grid(grid: Mapping[str, Iterable[Any]]) -> List[Dict[str, Any]]:
+    """Expand ``{"dt": [0.01, 0.02], "steps": [10]}`` into a list of runs."""
+
+    keys = list(grid)
+    values = [list(grid[key]) for key in keys]
+    return [dict(zip(keys, combo)) for combo in itertools.product(*values)]
+
+
+def run_id(params: Mapping[str, Any]) -> str:
+    """Stable identifier for a parameter set."""
+
+    payload = json.dumps(params, sort_keys=True, default=repr)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _limit_worker_threads(threads: int) -> None:
+    """Pool initializer capping BLAS/OpenMP threads in a spawned worker.
+
+    It runs before the worker unpickles its first task, so the environment
+    caps reach any library that task loads.  Libraries the worker already
+    loaded are capped through threadpoolctl when it is installed.
+    """
+
+    os.environ.update({var: str(threads) for var in THREAD_LIMIT_VARS})
+    try:  # pragma: no cover - optional dependency
+        from threadpoolctl import threadpool_limits
+    except ImportError:  # pragma: no cover - the env vars are sufficient
+        return
+    threadpool_limits(threads)
+
+
+def _execute(fn: Callable[..., Mapping[str, Any]], params: Dict[str, Any]) -> Dict[str, Any]:
+    start = time.perf_counter()
+    try:
+        metrics = dict(fn(**params))
+        status, error = "ok", None
+    except Exception as exc:  # noqa: BLE001 - a failing run must not kill the sweep
+        metrics, status, error = {}, "error", f"{type(exc).__name__}: {exc}"
+    return {
+        "metrics": metrics,
+        "status": status,
+        "error": error,
+        "elapsed": time.perf_counter() - start,
+        "pid": os.getpid(),
+    }
+
+
+@dataclass
+class SweepResultStore:
+    """Append-only JSONL store of finished runs."""
+
+    path: Path
+
+    def __post_init__(self) -> None:
+        self.path = Path(self.path)
+
+    def completed(self) -> Dict[str, Dict[str, Any]]:
+        """Return successfully finished runs keyed by run id."""
+
+        done: Dict[str, Dict[str, Any]] = {}
+        if not self.path.exists():
+            return done
+        with self.path.open("r", encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # torn final line from an interrupted sweep
+                if record.get("status") == "ok":
+                    done[record["run_id"]] = record
+        return done
+
+    def append(self, record: Mapping[str, Any]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as fh:
+            fh.write(json.dumps(record, ensure_ascii=False, default=_json_default) + "\n")
+            fh.flush()
+
+
+def _json_default(value: Any) -> Any:
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    return repr(value)
+
+
+@dataclass
+class SweepReport:
+    """Summary of a sweep invocation."""
+
+    total: int
+    completed: int = 0
+    skipped: int = 0
+    failed: int = 0
+    elapsed: float = 0.0
+    results: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def runs_per_second(self) -> float:
+        return self.completed / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.completed}/{self.total} runs in {self.elapsed:.2f}s "
+            f"({self.runs_per_second:.2f} runs/s, {self.skipped} resumed, {self.failed} failed)"
+        )
+
+
+def run_sweep(
+    fn: Callable[..., Mapping[str, Any]],
+    grid: Mapping[str, Iterable[Any]] | Sequence[Mapping[str, Any]],
+    *,
+    results_path: Path | str = Path("data/logs/sweep.jsonl"),
+    max_workers: Optional[int] = None,
+    threads_per_worker: int = 1,
+    resume: bool = True,
+    on_result: Optional[Callable[[Dict[str, Any], SweepReport], None]] = None,
+) -> SweepReport:
+    """Run ``fn(**params)`` for every parameter set of ``grid`` in parallel.
+
+    ``fn`` must be a picklable module-level callable returning a mapping of
+    metrics.  ``grid`` is either a mapping of parameter lists (expanded with
+    :func:`parameter_grid`) or an explicit sequence of parameter dicts.
+    """
+
+    runs = parameter_grid(grid) if isinstance(grid, Mapping) else [dict(p) for p in grid]
+    store = SweepResultStore(Path(results_path))
+    finished = store.completed() if resume else {}
+    report = SweepReport(total=len(runs))
+
+    pending = []
+    for params in runs:
+        rid = run_id(params)
+        if rid in finished:
+            report.skipped += 1
+            report.results.append(finished[rid])
+        else:
+            pending.append((rid, params))
+
+    start = time.perf_counter()
+    if pending:
+        workers = max_workers or max(1, (os.cpu_count() or 1) // max(1, threads_per_worker))
+        workers = min(workers, len(pending))
+        threads = max(1, int(threads_per_worker))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_limit_worker_threads,
+            initargs=(threads,),
+        ) as pool:
+            futures = {pool.submit(_execute, fn, params): (rid, params) for rid, params in pending}
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    rid, params = futures.pop(future)
+                    record = {
+                        "run_id": rid,
+                        "params": params,
+                        "finished": datetime.utcnow().isoformat(),
+                        **future.result(),
+                    }
+                    store.append(record)
+                    report.results.append(record)
+                    if record["status"] == "ok":
+                        report.completed += 1
+                    else:
+                        report.failed += 1
+                    report.elapsed = time.perf_counter() - start
+                    if on_result is not None:
+                        on_result(record, report)
+    report.elapsed = time.perf_counter() - start
+    return report
+
+
+# ---------------------------------------------------------------------------
+# engine runs usable as sweep targets
+# ---------------------------------------------------------------------------
+
+
+def universal_law_4d_run(
+    grid_size: Sequence[int] = (8, 8, 8, 6),
+    steps: int = 10,
+    dt: float = 0.01,
+) -> Dict[str, float]:
+    """Evolve a :class:`UniversalLawEngine4D` and return its final state."""
+
+    from universal_law_4d.universal_engine import UniversalLawEngine4D
+
+    engine = UniversalLawEngine4D(tuple(grid_size))
+    state: Dict[str, float] = engine.get_cosmic_state_4d()
+    for _ in range(int(steps)):
+        state = engine.cosmic_evolution_step_4d(dt)
+    return state
+
+
+def unified_reality_kernel_run(
+    grid_size: int = 32,
+    steps: int = 10,
+    constants: Optional[Mapping[str, float]] = None,
+) -> Dict[str, float]:
+    """Evolve a :class:`UnifiedRealityKernel` with optional constant overrides."""
+
+    import io
+
+    from integration.ultimate_engine import UnifiedRealityKernel
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        kernel = UnifiedRealityKernel(grid_size=int(grid_size), time_steps=int(steps))
+        for name, value in (constants or {}).items():
+            if not hasattr(kernel.constants, name):
+                raise AttributeError(f"unknown reality constant {name!r}")
+            setattr(kernel.constants, name, value)
+        history = kernel.evolve_reality(int(steps))
+    return {key: float(values[-1]) for key, values in history.items() if values}
+
+
+__all__ = [
+    "SweepReport",
+    "SweepResultStore",
+    "parameter_grid",
+    "run_id",
+    "run_sweep",
+    "unified_reality_kernel_run",
+    "universal_law_4d_run",
+]
@@ -3,9 +3,11 @@
 from .braid_runtime_orchestrator import BraidEnabledRuntime
 from .information_flow import InformationFlow
 from .runtime_orchestrator import RuntimeOrchestrator
+from .streaming_flow import StreamingInformationFlow
 
 __all__ = [
     "BraidEnabledRuntime",
     "InformationFlow",
     "RuntimeOrchestrator",
+    "StreamingInformationFlow",
 ]
@@ -70,26 +70,41 @@ class InformationFlow:
     def step(self, signal: Iterable[float]) -> Dict[str, Any]:
         """Process *signal* through the entire information pipeline."""
 
-        filtered = self.eeg.filter(signal)
+        frame = self.analyse(self.project(self.eeg.filter(signal)))
+        entry = self.to_entry(frame)
+        self.memory.store(entry)
+        return entry
+
+    # The stages below pass arrays along; only :meth:`to_entry` converts to lists.
+    def project(self, filtered: np.ndarray) -> Dict[str, Any]:
+        """Project a filtered trace into the intention field."""
+
         prepared = self._match_channels(filtered)
         intention_vector = self.receiver.receive(prepared)
         modulated = self.forcing.stimulate(prepared)
-        emotional_input = modulated if modulated.size else intention_vector
-
-        distribution = self.mapper.map(emotional_input)
-        emotion_state = self.emotion.process(emotional_input)
-        invariant_value = self.soul.compute(self._reshape_for_invariant(emotional_input))
-
-        entry = {
-            "filtered": prepared.tolist(),
-            "intention": intention_vector.tolist(),
-            "modulated": emotional_input.tolist(),
-            "distribution": distribution,
-            "emotion": emotion_state,
-            "soul_invariant": invariant_value,
+        return {
+            "filtered": prepared,
+            "intention": intention_vector,
+            "modulated": modulated if modulated.size else intention_vector,
+        }
+
+    def analyse(self, frame: Dict[str, Any]) -> Dict[str, Any]:
+        """Add the emotional reading and the soul invariant to a projected frame."""
+
+        emotional_input = frame["modulated"]
+        frame["distribution"] = self.mapper.map(emotional_input)
+        frame["emotion"] = self.emotion.process(emotional_input)
+        frame["soul_invariant"] = self.soul.compute(self._reshape_for_invariant(emotional_input))
+        return frame
+
+    @staticmethod
+    def to_entry(frame: Dict[str, Any]) -> Dict[str, Any]:
+        """JSON-ready memory entry for an analysed frame."""
+
+        return {
+            key: frame[key].tolist() if isinstance(frame[key], np.ndarray) else frame[key]
+            for key in ("filtered", "intention", "modulated", "distribution", "emotion", "soul_invariant")
         }
-        self.memory.store(entry)
-        return entry
 
     @staticmethod
     def _reshape_for_invariant(vector: np.ndarray) -> np.ndarray:
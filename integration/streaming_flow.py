@@ -0,0 +1,333 @@
+"""CIEL/Ω Quantum Consciousness Suite
+
+Copyright (c) 2025 Adrian Lipa / Intention Lab
+Licensed under the CIEL Research Non-Commercial License v1.1.
+
+Staged, backpressure-aware variant of :class:`InformationFlow`.
+
+:class:`StreamingInformationFlow` runs the pipeline as four stages, each
+with its own worker thread and bounded input queue::
+
+    submit() -> filter -> project -> analyse -> sink
+
+``filter`` runs a :class:`~bio.eeg_processor.StreamingEEGProcessor`, so
+filter state carries across chunks.  This is a causal Butterworth low-pass,
+not the zero-phase FFT brick-wall of :meth:`EEGProcessor.filter` that
+:meth:`InformationFlow.step` uses.  A brick-wall needs the whole trace, so it
+cannot be applied chunk by chunk.  Streamed entries therefore match
+``flow.eeg.stream().process(signal)`` sliced per chunk, not
+``flow.step(chunk)``: the Butterworth roll-off is gentler and the output
+lags by the filter's group delay.  ``project`` and ``analyse`` reuse
+:meth:`InformationFlow.project` and :meth:`InformationFlow.analyse` and pass
+NumPy arrays along.  ``sink`` converts to JSON only at the end and writes
+every entry waiting in its queue with one
+:meth:`~memory.long_term_memory.LongTermMemory.store_many` call.
+
+When a queue is full its policy decides what happens:
+
+``"block"``
+    wait for space, which pushes backpressure upstream;
+``"drop_oldest"`` / ``"drop_newest"``
+    discard the oldest queued item or the incoming one;
+``"coalesce"``
+    merge the incoming item into the newest queued one.  Raw chunks are
+    concatenated, so no samples are lost; later stages keep the newer frame.
+
+By default acquisition never stalls.  The input queue coalesces and the
+inner stages block, so a slow sink makes the filter handle larger chunks
+instead of holding up :meth:`~StreamingInformationFlow.submit`.
+:meth:`~StreamingInformationFlow.stats` reports per-stage throughput, queue
+depth, drops and errors.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, Iterable, List, Mapping, Optional
+
+import numpy as np
+
+from bio.eeg_processor import StreamingEEGProcessor
+
+from .information_flow import InformationFlow
+
+POLICIES = ("block", "drop_oldest", "drop_newest", "coalesce")
+
+
+def _keep_newest(_old: Any, new: Any) -> Any:
+    return new
+
+
+def _concatenate(old: np.ndarray, new: np.ndarray) -> np.ndarray:
+    return np.concatenate([old, new], axis=-1)
+
+
+class StageQueue:
+    """Bounded FIFO with an overflow policy and ``join`` bookkeeping."""
+
+    def __init__(self, maxsize: int, policy: str = "block", merge: Callable[[Any, Any], Any] = _keep_newest) -> None:
+        if policy not in POLICIES:
+            raise ValueError(f"unknown overflow policy {policy!r}; expected one of {POLICIES}")
+        self.maxsize = max(1, int(maxsize))
+        self.policy = policy
+        self.merge = merge
+        self._items: Deque[Any] = deque()
+        self._cond = threading.Condition()
+        self._unfinished = 0
+        self._closed = False
+        self.dropped = 0
+        self.coalesced = 0
+        self.max_depth = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def put(self, item: Any, timeout: Optional[float] = None) -> bool:
+        """Enqueue ``item``; ``False`` when it was dropped or could not be queued."""
+
+        with self._cond:
+            if self._closed:
+                return False
+            if len(self._items) >= self.maxsize:
+                if self.policy == "drop_newest":
+                    self.dropped += 1
+                    return False
+                if self.policy == "drop_oldest":
+                    self._items.popleft()
+                    self.dropped += 1
+                    self._unfinished -= 1
+                elif self.policy == "coalesce":
+                    self._items[-1] = self.merge(self._items[-1], item)
+                    self.coalesced += 1
+                    return True
+                elif not self._cond.wait_for(lambda: len(self._items) < self.maxsize or self._closed, timeout):
+                    self.dropped += 1
+                    return False
+                if self._closed:
+                    return False
+            self._items.append(item)
+            self._unfinished += 1
+            self.max_depth = max(self.max_depth, len(self._items))
+            self._cond.notify_all()
+            return True
+
+    def get_batch(self, limit: int = 1, timeout: Optional[float] = None) -> List[Any]:
+        """Up to ``limit`` items, waiting for the first; empty once closed and drained."""
+
+        with self._cond:
+            self._cond.wait_for(lambda: self._items or self._closed, timeout)
+            batch = [self._items.popleft() for _ in range(min(limit, len(self._items)))]
+            if batch:
+                self._cond.notify_all()
+            return batch
+
+    def task_done(self, count: int = 1) -> None:
+        with self._cond:
+            self._unfinished -= count
+            self._cond.notify_all()
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        with self._cond:
+            return self._cond.wait_for(lambda: self._unfinished <= 0, timeout)
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+
+@dataclass(slots=True)
+class StageStats:
+    """Counters for one stage; ``busy_time`` is seconds spent inside the stage."""
+
+    processed: int = 0
+    batches: int = 0
+    errors: int = 0
+    busy_time: float = 0.0
+    last_error: Optional[str] = None
+
+    @property
+    def throughput(self) -> float:
+        """Items per second of busy time."""
+
+        return self.processed / self.busy_time if self.busy_time > 0 else 0.0
+
+
+@dataclass(slots=True)
+class _Stage:
+    name: str
+    run: Callable[[List[Any]], List[Any]]
+    queue: StageQueue
+    batch: int = 1
+    stats: StageStats = field(default_factory=StageStats)
+    thread: Optional[threading.Thread] = None
+
+
+class StreamingInformationFlow:
+    """Run an :class:`InformationFlow` as concurrent stages with bounded queues.
+
+    ``policies`` and ``queue_sizes`` map stage names (``filter``, ``project``,
+    ``analyse``, ``sink``) to an overflow policy and a capacity.  ``on_entry``
+    receives each stored entry on the sink thread.  ``recorder`` is an
+    optional :class:`ciel.timing.SpanRecorder` that gets one span per batch
+    and stage, named ``flow.<stage>``.
+    """
+
+    STAGES = ("filter", "project", "analyse", "sink")
+    DEFAULT_POLICIES = {"filter": "coalesce", "project": "block", "analyse": "block", "sink": "block"}
+
+    def __init__(
+        self,
+        flow: InformationFlow,
+        *,
+        channels: int = 1,
+        stream: Optional[StreamingEEGProcessor] = None,
+        policies: Optional[Mapping[str, str]] = None,
+        queue_sizes: Optional[Mapping[str, int]] = None,
+        sink_batch: int = 64,
+        on_entry: Optional[Callable[[Dict[str, Any]], None]] = None,
+        recorder: Any = None,
+    ) -> None:
+        unknown = set(policies or {}) | set(queue_sizes or {})
+        if unknown - set(self.STAGES):
+            raise ValueError(f"unknown stage(s) {sorted(unknown - set(self.STAGES))}; expected {self.STAGES}")
+        self.flow = flow
+        self.stream = stream if stream is not None else flow.eeg.stream(channels=channels)
+        self.on_entry = on_entry
+        self.recorder = recorder
+        chosen = {**self.DEFAULT_POLICIES, **dict(policies or {})}
+        sizes = {name: 8 for name in self.STAGES} | {"sink": 256} | dict(queue_sizes or {})
+
+        runners = {
+            "filter": self._filter,
+            "project": lambda frames: [self.flow.project(f) for f in frames],
+            "analyse": lambda frames: [self.flow.analyse(f) for f in frames],
+            "sink": self._sink,
+        }
+        self._stages: List[_Stage] = [
+            _Stage(
+                name,
+                runners[name],
+                StageQueue(sizes[name], chosen[name], _concatenate if name == "filter" else _keep_newest),
+                batch=max(1, int(sink_batch)) if name == "sink" else 1,
+            )
+            for name in self.STAGES
+        ]
+        self._running = False
+
+    # ------------------------------------------------------------ stage bodies
+    def _filter(self, chunks: List[np.ndarray]) -> List[np.ndarray]:
+        out = []
+        for chunk in chunks:
+            filtered = self.stream.process(chunk)
+            # Multi-channel chunks are flattened channel-major, like a single trace.
+            out.append(filtered.reshape(-1) if filtered.ndim > 1 else filtered)
+        return out
+
+    def _sink(self, frames: List[Dict[str, Any]]) -> List[Any]:
+        entries = [InformationFlow.to_entry(frame) for frame in frames]
+        self.flow.memory.store_many(entries)
+        if self.on_entry is not None:
+            for entry in entries:
+                self.on_entry(entry)
+        return []
+
+    # ------------------------------------------------------------ lifecycle
+    def start(self) -> "StreamingInformationFlow":
+        if self._running:
+            return self
+        self._running = True
+        for index, stage in enumerate(self._stages):
+            downstream = self._stages[index + 1] if index + 1 < len(self._stages) else None
+            stage.thread = threading.Thread(
+                target=self._work, args=(stage, downstream), name=f"ciel-flow-{stage.name}", daemon=True
+            )
+            stage.thread.start()
+        return self
+
+    def _work(self, stage: _Stage, downstream: Optional[_Stage]) -> None:
+        while True:
+            batch = stage.queue.get_batch(stage.batch)
+            if not batch:
+                return  # closed and drained
+            start = time.perf_counter_ns()
+            try:
+                outputs = stage.run(batch)
+            except Exception as exc:  # keep the worker alive; the error is reported in stats
+                outputs = []
+                stage.stats.errors += 1
+                stage.stats.last_error = f"{type(exc).__name__}: {exc}"
+            duration = time.perf_counter_ns() - start
+            stage.stats.processed += len(batch)
+            stage.stats.batches += 1
+            stage.stats.busy_time += duration * 1e-9
+            if self.recorder is not None:
+                self.recorder.record(f"flow.{stage.name}", start, duration)
+            if downstream is not None:
+                for item in outputs:
+                    downstream.queue.put(item)
+            stage.queue.task_done(len(batch))
+
+    def submit(self, chunk: Iterable[float] | np.ndarray, timeout: Optional[float] = None) -> bool:
+        """Queue a raw chunk, ``(samples,)`` or ``(channels, samples)``.
+
+        Returns ``False`` when the input policy dropped it.
+        """
+
+        if not self._running:
+            self.start()
+        return self._stages[0].queue.put(np.asarray(chunk, dtype=float), timeout)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until everything submitted so far has been stored."""
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for stage in self._stages:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not stage.queue.join(remaining):
+                return False
+        return True
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Drain the queues stage by stage and stop the workers."""
+
+        for stage in self._stages:
+            stage.queue.close()
+            if stage.thread is not None:
+                stage.thread.join(timeout)
+        self._running = False
+
+    def __enter__(self) -> "StreamingInformationFlow":
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    # ------------------------------------------------------------ observability
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-stage counters, throughput and current/maximum queue depth."""
+
+        report = {}
+        for stage in self._stages:
+            q, s = stage.queue, stage.stats
+            report[stage.name] = {
+                "processed": s.processed,
+                "batches": s.batches,
+                "throughput": s.throughput,
+                "busy_time": s.busy_time,
+                "queue_depth": len(q),
+                "max_depth": q.max_depth,
+                "capacity": q.maxsize,
+                "policy": q.policy,
+                "dropped": q.dropped,
+                "coalesced": q.coalesced,
+                "errors": s.errors,
+                "last_error": s.last_error,
+            }
+        return report
+
+
+__all__ = ["POLICIES", "StageQueue", "StageStats", "StreamingInformationFlow"]
@@ -15,10 +15,12 @@ import numpy as np
 import matplotlib.pyplot as plt
 from scipy import integrate, optimize, special
 from dataclasses import dataclass
-from typing import Dict, List, Tuple, Any, Optional
+from typing import Dict, List, Tuple, Any, Optional, Union
 import warnings
 warnings.filterwarnings('ignore')
 
+from config.simulation_config import PrecisionPolicy, resolve_precision
+
 # =============================================================================
 # FUNDAMENTAL EMERGENT CONSTANTS - CORE OF REALITY
 # =============================================================================
@@ -171,9 +173,14 @@ class UnifiedRealityKernel:
     Complete unified kernel implementing all reality laws and dynamics
     """
     
-    def __init__(self, grid_size: int = 128, time_steps: int = 256):
+    FIELD_NAMES = ('consciousness_field', 'symbolic_field', 'temporal_field',
+                   'resonance_field', 'mass_field', 'energy_field')
+
+    def __init__(self, grid_size: int = 128, time_steps: int = 256,
+                 precision: Optional[Union[PrecisionPolicy, str]] = None):
         self.grid_size = grid_size
         self.time_steps = time_steps
+        self.precision = resolve_precision(precision)
         
         # Fundamental constants and laws
         self.constants = RealityConstants()
@@ -210,8 +217,8 @@ class UnifiedRealityKernel:
         shape = (self.grid_size, self.grid_size)
         
         # Create coordinate system
-        x = np.linspace(-5, 5, self.grid_size)
-        y = np.linspace(-5, 5, self.grid_size)
+        x = self.precision.linspace(-5, 5, self.grid_size)
+        y = self.precision.linspace(-5, 5, self.grid_size)
         X, Y = np.meshgrid(x, y)
         
         # Initialize consciousness field with coherent Gaussian packet
@@ -225,7 +232,7 @@ class UnifiedRealityKernel:
         self.symbolic_field = envelope * np.exp(symbolic_phase)
         
         # Temporal field starts at fundamental flow rate
-        self.temporal_field = np.ones(shape) * self.constants.TEMPORAL_FLOW
+        self.temporal_field = self.precision.ones(shape, complex=False) * self.constants.TEMPORAL_FLOW
         
         # Initialize derived fields
         self.update_reality_fields()
@@ -260,24 +267,26 @@ class UnifiedRealityKernel:
         kinetic_energy = sum(np.abs(g)**2 for g in grad_Ψ)
         potential_energy = self.constants.SYMBOLIC_COUPLING * (1 - self.resonance_field)
         self.energy_field = kinetic_energy + potential_energy
+        self.precision.enforce(self, self.FIELD_NAMES)
         
         # Update quantum metrics
         self.update_quantum_metrics()
     
     def update_quantum_metrics(self):
         """Update quantum information metrics"""
-        # Quantum purity
-        density_matrix = np.outer(self.consciousness_field.flatten(),
-                                self.consciousness_field.flatten().conj())
-        self.quantum_purity = np.trace(density_matrix @ density_matrix).real
+        # Quantum purity Tr(ρ²) of ρ = |Ψ⟩⟨Ψ| is ⟨Ψ|Ψ⟩², so the N²×N² density
+        # matrix never needs to be formed; accumulate in double precision.
+        self.quantum_purity = self.precision.norm(self.consciousness_field) ** 4
         
         # Reality coherence
-        self.reality_coherence = np.mean(self.resonance_field)
+        self.reality_coherence = self.precision.mean(self.resonance_field)
         
-        # Information fidelity (LAW 7)
-        current_fidelity = np.abs(np.vdot(self.initial_state.flatten(),
-                                        self.consciousness_field.flatten()))**2
-        self.information_fidelity = current_fidelity
+        # Information fidelity (LAW 7); the reference state is stored once
+        # initialisation has finished, so the first update compares Ψ to itself.
+        initial_state = getattr(self, 'initial_state', self.consciousness_field)
+        current_fidelity = np.abs(np.vdot(initial_state.astype(np.complex128).ravel(),
+                                          self.consciousness_field.astype(np.complex128).ravel()))**2
+        self.information_fidelity = float(current_fidelity)
     
     def evolve_reality(self, steps: int = None) -> Dict[str, List[float]]:
         """Evolve unified reality through specified number of steps"""
@@ -398,7 +407,7 @@ class UnifiedRealityKernel:
     
     def normalize_field(self, field: np.ndarray):
         """Normalize field to preserve quantum information"""
-        norm = np.sqrt(np.sum(np.abs(field)**2))
+        norm = self.precision.norm(field)
         if norm > 0:
             field /= norm
 
@@ -1,8 +1,33 @@
 
-from .lie4 import Lie4Algebra, Lie4Element
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover - static analysers only
+    from .lie4 import Lie4Algebra, Lie4Element
+
+# ``mathematics.lie4`` pulls in scipy.linalg; load it only when the algebra is
+# actually requested so light helpers such as ``safe_operations`` stay cheap.
+_LAZY_ATTRS = {
+    "Lie4Algebra": ".lie4",
+    "Lie4Element": ".lie4",
+}
 
 __all__ = [
     "Lie4Algebra",
     "Lie4Element",
 ]
 
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
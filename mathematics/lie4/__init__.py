@@ -1,6 +1,21 @@
-from .algebra import Lie4Algebra, Lie4Element
+from .algebra import (
+    BASIS,
+    KILLING_MATRIX,
+    STRUCTURE_CONSTANTS,
+    Lie4Algebra,
+    Lie4Element,
+    bracket,
+    field_strength,
+    killing_form,
+)
 
 __all__ = [
+    "BASIS",
+    "KILLING_MATRIX",
+    "STRUCTURE_CONSTANTS",
     "Lie4Algebra",
     "Lie4Element",
+    "bracket",
+    "field_strength",
+    "killing_form",
 ]
@@ -5,6 +5,7 @@ including Lie4 elements, basis generation, and algebraic operations.
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Tuple, Optional
 import numpy as np
 try:
@@ -26,6 +27,109 @@ def expm(a: np.ndarray) -> np.ndarray:
     return exp_a
 
 
+# Index pairs (i, j), i < j, of the standard so(4) generators e_ij = E_ij - E_ji.
+BASIS_PAIRS: Tuple[Tuple[int, int], ...] = tuple((i, j) for i in range(4) for j in range(i + 1, 4))
+
+
+def _frozen(array: np.ndarray) -> np.ndarray:
+    array.setflags(write=False)
+    return array
+
+
+def _build_basis() -> np.ndarray:
+    basis = np.zeros((len(BASIS_PAIRS), 4, 4))
+    rows, cols = np.array(BASIS_PAIRS).T
+    basis[np.arange(len(BASIS_PAIRS)), rows, cols] = 1.0
+    basis[np.arange(len(BASIS_PAIRS)), cols, rows] = -1.0
+    return _frozen(basis)
+
+
+@lru_cache(maxsize=256)
+def _contraction_path(subscripts: str, shapes: Tuple[Tuple[int, ...], ...]) -> list:
+    operands = [np.empty(shape, dtype=np.uint8) for shape in shapes]
+    return np.einsum_path(subscripts, *operands, optimize="optimal")[0]
+
+
+def cached_einsum(subscripts: str, *operands: np.ndarray) -> np.ndarray:
+    """``np.einsum`` with the contraction path cached per subscripts and shapes."""
+
+    operands = tuple(np.asarray(op) for op in operands)
+    if len(operands) < 3:
+        return np.einsum(subscripts, *operands)  # nothing to reorder
+    path = _contraction_path(subscripts, tuple(op.shape for op in operands))
+    return np.einsum(subscripts, *operands, optimize=path)
+
+
+# so(4) basis matrices, shape (6, 4, 4).
+BASIS = _build_basis()
+
+# f[i, j, k] with [e_i, e_j] = sum_k f[i, j, k] e_k; the basis is orthogonal
+# under <X, Y> = tr(X Y^T) / 2, which projects each commutator onto e_k.
+_COMMUTATORS = np.einsum("aij,bjk->abik", BASIS, BASIS) - np.einsum("bij,ajk->abik", BASIS, BASIS)
+STRUCTURE_CONSTANTS = _frozen(np.einsum("abij,cij->abc", _COMMUTATORS, BASIS) / 2.0)
+del _COMMUTATORS
+
+# Killing form K[a, b] = f[a, c, d] f[b, d, c] in the basis coordinates.
+KILLING_MATRIX = _frozen(np.einsum("acd,bdc->ab", STRUCTURE_CONSTANTS, STRUCTURE_CONSTANTS))
+
+
+def to_matrices(coefficients: np.ndarray) -> np.ndarray:
+    """Map basis coefficients of shape ``(..., 6)`` to matrices ``(..., 4, 4)``."""
+
+    return np.einsum("...a,aij->...ij", coefficients, BASIS)
+
+
+def from_matrices(matrices: np.ndarray) -> np.ndarray:
+    """Project matrices ``(..., 4, 4)`` onto so(4) basis coefficients ``(..., 6)``."""
+
+    return np.einsum("...ij,aij->...a", matrices, BASIS) / 2.0
+
+
+def bracket(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Lie bracket of coefficient fields ``(..., 6)`` via the structure constants."""
+
+    return cached_einsum("...a,...b,abc->...c", x, y, STRUCTURE_CONSTANTS)
+
+
+def killing_form(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Killing form of coefficient fields ``(..., 6)``, one value per field point."""
+
+    return cached_einsum("...a,ab,...b->...", x, KILLING_MATRIX, y)
+
+
+def field_strength(
+    gauge: np.ndarray,
+    spacing: float | Tuple[float, ...] = 1.0,
+    pairs: Optional[Tuple[Tuple[int, int], ...]] = None,
+) -> np.ndarray:
+    """Field strength ``F_mn = d_m A_n - d_n A_m + [A_m, A_n]`` of a matrix gauge field.
+
+    ``gauge`` has shape ``grid + (D, n, n)`` where the ``D`` leading grid axes
+    are the directions ``m``.  Only the independent components ``m < n`` (or
+    the requested ``pairs``) are returned, stacked as ``grid + (len(pairs), n, n)``
+    so a 64^3 grid never materialises the full ``D x D`` commutator tensor.
+    """
+
+    dims = gauge.shape[-3]
+    grid_ndim = gauge.ndim - 3
+    if grid_ndim != dims:
+        raise ValueError(f"gauge field with {dims} directions needs {dims} grid axes, got {grid_ndim}")
+    if pairs is None:
+        pairs = tuple((m, n) for m in range(dims) for n in range(m + 1, dims))
+    steps = (spacing,) * dims if np.isscalar(spacing) else tuple(spacing)
+    first, second = (list(index) for index in zip(*pairs))
+    a_m, a_n = gauge[..., first, :, :], gauge[..., second, :, :]
+    strength = np.einsum("...pij,...pjk->...pik", a_m, a_n)
+    strength -= np.einsum("...pij,...pjk->...pik", a_n, a_m)
+    for p, (m, n) in enumerate(pairs):
+        # Axes with a single sample carry no derivative.
+        if gauge.shape[m] > 1:
+            strength[..., p, :, :] += np.gradient(gauge[..., n, :, :], steps[m], axis=m)
+        if gauge.shape[n] > 1:
+            strength[..., p, :, :] -= np.gradient(gauge[..., m, :, :], steps[n], axis=n)
+    return strength
+
+
 @dataclass
 class Lie4Element:
     """Represents an element of the Lie4 algebra."""
@@ -85,31 +189,21 @@ class Lie4Algebra:
     
     def __init__(self):
         # Generate the standard basis for so(4)
-        self.basis = []
-        for i in range(4):
-            for j in range(i+1, 4):
-                self.basis.append(Lie4Element.basis_generator(i, j))
-    
+        self.basis = [Lie4Element(matrix.copy()) for matrix in BASIS]
+
     def random_element(self) -> Lie4Element:
         """Generate a random element of the Lie4 algebra."""
-        coeffs = np.random.randn(self.DIMENSION)
-        element = Lie4Element(np.zeros((4, 4)))
-        for c, basis in zip(coeffs, self.basis):
-            element += c * basis
-        return element
-    
+        return Lie4Element(to_matrices(np.random.randn(self.DIMENSION)))
+
     def structure_constants(self) -> np.ndarray:
-        """Compute the structure constants of the algebra.
-        
+        """Return the structure constants of the algebra.
+
         Returns:
-            A 3D numpy array f_ijk where [e_i, e_j] = sum_k f_ijk e_k
+            A read-only 3D numpy array f_ijk where [e_i, e_j] = sum_k f_ijk e_k,
+            computed once at import time.
         """
-        f = np.zeros((self.DIMENSION, self.DIMENSION, self.DIMENSION))
-        for i, ei in enumerate(self.basis):
-            for j, ej in enumerate(self.basis):
-                # [ei, ej] = sum_k f_ijk ek
-                comm = ei.commutator(ej)
-                # Project onto each basis element to find the coefficients
-                for k, ek in enumerate(self.basis):
-                    f[i, j, k] = np.trace(comm.basis_elements @ ek.basis_elements.T) / 2.0
-        return f
+        return STRUCTURE_CONSTANTS
+
+    def killing_matrix(self) -> np.ndarray:
+        """Return the Killing form in basis coordinates, K_ab = f_acd f_bdc."""
+        return KILLING_MATRIX
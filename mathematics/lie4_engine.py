@@ -13,15 +13,22 @@ FIXED: Broadcasting + Visualization errors resolved
 
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy import linalg, integrate, special
+from scipy import linalg, integrate
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Dict, List, Tuple, Optional, Callable, Any, Union
 import warnings
 warnings.filterwarnings('ignore')
 
+from config.simulation_config import PrecisionPolicy, resolve_precision
+from mathematics import zeta_series
+from mathematics.lie4 import algebra as lie4_algebra
 from mathematics.safe_operations import heisenberg_soft_clip_range
 
+# Soft ranges for (LAMBDA_I, LAMBDA_ZETA, OMEGA_LIFE) after emotional mapping.
+_EMOTION_LOWER = np.array([0.001, 0.001, 0.5])
+_EMOTION_UPPER = np.array([0.1, 0.05, 1.0])
+
 # =============================================================================
 # 🎯 REALITY LAYERS FRAMEWORK
 # =============================================================================
@@ -98,38 +105,14 @@ class StableRiemannZetaOperator:
     """Numerically stable Riemann zeta function"""
 
     @staticmethod
-    def zeta(s: complex, terms: int = 100) -> complex:
-        try:
-            if s.real > 1:
-                result = 0.0
-                for n in range(1, terms):
-                    term = 1.0 / (n ** s)
-                    result += term
-                    if abs(term) < 1e-15:
-                        break
-                return result
-            else:
-                pi = np.pi
-                if abs(s.imag) < 1e-10 and s.real < 0 and abs(s.real - round(s.real)) < 1e-10:
-                    if round(s.real) % 2 == 0:
-                        return 0.0
-                if abs(s.imag) < 1e-10:
-                    s += 1e-10j
-
-                return (2 ** s * pi ** (s - 1) * np.sin(pi * s / 2) * 
-                        special.gamma(1 - s) * StableRiemannZetaOperator.zeta(1 - s, terms))
-        except (OverflowError, ValueError, ZeroDivisionError):
-            return complex(0, 0)
+    def zeta(s: complex | np.ndarray, terms: int = 100, method: str = "direct") -> complex | np.ndarray:
+        """Zeta of a scalar or complex array; see :func:`mathematics.zeta_series.zeta`."""
+        return zeta_series.zeta(s, terms=terms, method=method)
 
     @staticmethod
-    def critical_line_modulation(t: float, amplitude: float = 0.001) -> complex:
-        try:
-            t_clipped = heisenberg_soft_clip_range(t, -100.0, 100.0)
-            s = 0.5 + 1j * t_clipped
-            zeta_val = StableRiemannZetaOperator.zeta(s)
-            return amplitude * zeta_val
-        except:
-            return complex(0, 0)
+    def critical_line_modulation(t: float | np.ndarray, amplitude: float = 0.001) -> complex | np.ndarray:
+        t_clipped = heisenberg_soft_clip_range(t, -100.0, 100.0)
+        return amplitude * zeta_series.zeta_critical_line(t_clipped)
 
 class EnhancedMathematicalStructure:
     """Enhanced mathematical structure generators"""
@@ -177,28 +160,34 @@ class EnhancedMathematicalStructure:
 class UnifiedSevenFundamentalFields:
     """Seven fundamental fields with fixed broadcasting"""
 
-    def __init__(self, constants: UnifiedCIELConstants, spacetime_shape: tuple):
+    FIELD_NAMES = ('psi', 'I_field', 'zeta_field', 'sigma_field', 'g_metric',
+                   'M_field', 'G_info', 'ramanujan_field')
+
+    def __init__(self, constants: UnifiedCIELConstants, spacetime_shape: tuple,
+                 precision: Optional[Union[PrecisionPolicy, str]] = None):
         self.C = constants
         self.spacetime_shape = spacetime_shape
+        self.precision = p = resolve_precision(precision)
 
-        self.psi = np.zeros(spacetime_shape, dtype=np.complex128)
-        self.I_field = np.zeros(spacetime_shape, dtype=np.complex128)
-        self.zeta_field = np.zeros(spacetime_shape, dtype=np.complex128)
-        self.sigma_field = np.zeros(spacetime_shape, dtype=np.complex128)
-        self.g_metric = np.zeros(spacetime_shape + (4, 4), dtype=np.float64)
-        self.M_field = np.zeros(spacetime_shape + (3,), dtype=np.complex128)
-        self.G_info = np.zeros(spacetime_shape + (2, 2), dtype=np.float64)
-        self.ramanujan_field = np.zeros(spacetime_shape, dtype=np.complex128)
+        self.psi = p.zeros(spacetime_shape)
+        self.I_field = p.zeros(spacetime_shape)
+        self.zeta_field = p.zeros(spacetime_shape)
+        self.sigma_field = p.zeros(spacetime_shape)
+        self.g_metric = p.zeros(spacetime_shape + (4, 4), complex=False)
+        self.M_field = p.zeros(spacetime_shape + (3,))
+        self.G_info = p.zeros(spacetime_shape + (2, 2), complex=False)
+        self.ramanujan_field = p.zeros(spacetime_shape)
 
         self._initialize_fields_vectorized()
+        p.enforce(self, self.FIELD_NAMES)
 
     def _initialize_fields_vectorized(self):
         nx, ny, nt = self.spacetime_shape
 
         x, y, t = np.meshgrid(
-            np.linspace(-1, 1, nx),
-            np.linspace(-1, 1, ny), 
-            np.linspace(0, 2*np.pi, nt),
+            self.precision.linspace(-1, 1, nx),
+            self.precision.linspace(-1, 1, ny),
+            self.precision.linspace(0, 2*np.pi, nt),
             indexing='ij'
         )
 
@@ -233,9 +222,9 @@ class UnifiedSevenFundamentalFields:
     def _initialize_information_geometry(self):
         nx, ny, nt = self.spacetime_shape
         x, y, t = np.meshgrid(
-            np.linspace(0, 2*np.pi, nx),
-            np.linspace(0, 2*np.pi, ny),
-            np.linspace(0, 2*np.pi, nt),
+            self.precision.linspace(0, 2*np.pi, nx),
+            self.precision.linspace(0, 2*np.pi, ny),
+            self.precision.linspace(0, 2*np.pi, nt),
             indexing='ij'
         )
 
@@ -257,6 +246,7 @@ class UnifiedCIELLagrangian:
         self.epsilon = 1e-12
 
     def compute_lagrangian_density(self) -> np.ndarray:
+        # Accumulated in float64 whatever the field precision.
         L = np.zeros(self.fields.spacetime_shape)
 
         L += self._kinetic_terms()
@@ -292,7 +282,8 @@ class UnifiedCIELLagrangian:
 
         dI_dt = np.gradient(self.fields.I_field, axis=2)
         temporal_term = np.real(np.conj(self.fields.I_field) * dI_dt)
-        L += self.C.LAMBDA_TAU * np.nan_to_num(temporal_term) * 1e-44
+        # Fold the constants first: LAMBDA_TAU alone overflows float32.
+        L += (self.C.LAMBDA_TAU * 1e-44) * np.nan_to_num(temporal_term)
 
         return L
 
@@ -429,24 +420,27 @@ class Lie4Algebra:
         return gens
 
 class Lie4ConsciousnessField:
-    def __init__(self, spacetime_shape: Tuple[int, int, int, int], constants: Lie4Constants):
+    def __init__(self, spacetime_shape: Tuple[int, int, int, int], constants: Lie4Constants,
+                 precision: Optional[Union[PrecisionPolicy, str]] = None):
         self.C = constants
         self.shape = spacetime_shape
+        self.precision = p = resolve_precision(precision)
 
-        self.I = np.zeros(spacetime_shape + (4,), dtype=np.complex128)
-        self.J = np.zeros(spacetime_shape, dtype=np.complex128)
-        self.A = np.zeros(spacetime_shape + (4, 4, 4), dtype=np.complex128)
+        self.I = p.zeros(spacetime_shape + (4,))
+        self.J = p.zeros(spacetime_shape)
+        self.A = p.zeros(spacetime_shape + (4, 4, 4))
 
         self._initialize_fields()
+        p.enforce(self, ('I', 'J', 'A'))
 
     def _initialize_fields(self):
         Nx, Ny, Nz, Nt = self.shape
 
         x, y, z, t = np.meshgrid(
-            np.linspace(-1, 1, Nx),
-            np.linspace(-1, 1, Ny),
-            np.linspace(-1, 1, Nz), 
-            np.linspace(0, 2*np.pi, Nt),
+            self.precision.linspace(-1, 1, Nx),
+            self.precision.linspace(-1, 1, Ny),
+            self.precision.linspace(-1, 1, Nz),
+            self.precision.linspace(0, 2*np.pi, Nt),
             indexing='ij'
         )
 
@@ -459,11 +453,30 @@ class Lie4ConsciousnessField:
 
         self.J = np.exp(1j * 1.0 * (x + y + z)) * np.exp(-r/0.35)
 
-        for mu in range(4):
-            phase = np.exp(1j * 0.3 * (mu + 0.5*x + 0.3*y))
-            base = 0.05 * phase
-            for i in range(4):
-                self.A[..., mu, i, i] = base
+        mu = np.arange(4)
+        base = 0.05 * np.exp(1j * 0.3 * (mu + (0.5*x + 0.3*y)[..., None]))
+        diag = np.arange(4)
+        self.A[..., diag, diag] = base[..., None]
+
+    @property
+    def spacing(self) -> Tuple[float, float, float, float]:
+        """Grid steps of the (x, y, z, t) axes set up in ``_initialize_fields``."""
+        spans = (2.0, 2.0, 2.0, 2*np.pi)
+        return tuple(span / max(n - 1, 1) for span, n in zip(spans, self.shape))
+
+    def field_strength(self, pairs: Optional[Tuple[Tuple[int, int], ...]] = None) -> np.ndarray:
+        """F_mn = d_m A_n - d_n A_m + [A_m, A_n] for m < n, shape grid + (6, 4, 4)."""
+        return lie4_algebra.field_strength(self.A, self.spacing, pairs)
+
+    def field_energy_density(self) -> np.ndarray:
+        """sum_{m<n} tr(F_mn F_mn^dagger) at every grid point."""
+        F = self.field_strength()
+        return np.einsum('...pij,...pij->...', F, F.conj()).real
+
+    def killing_density(self) -> np.ndarray:
+        """sum_m K(A_m, A_m) of the so(4) projection of the gauge field."""
+        coeffs = lie4_algebra.from_matrices(self.A)
+        return lie4_algebra.cached_einsum('...ma,ab,...mb->...', coeffs, lie4_algebra.KILLING_MATRIX, coeffs)
 
 # =============================================================================
 # 🧠 SEMANTIC COMPUTATION LANGUAGE
@@ -543,13 +556,15 @@ class SCLParser:
 class UnifiedCIELReality:
     """Complete CIEL/0 + LIE₄ + SCL - FULLY FIXED"""
 
-    def __init__(self, base_shape: Tuple[int, int] = (32, 32), time_steps: int = 16):
+    def __init__(self, base_shape: Tuple[int, int] = (32, 32), time_steps: int = 16,
+                 precision: Optional[Union[PrecisionPolicy, str]] = None):
         self.constants = UnifiedCIELConstants()
         self.base_shape = base_shape
         self.spacetime_shape = base_shape + (time_steps,)
+        self.precision = resolve_precision(precision)
 
         print("🌌 Initializing unified fields...")
-        self.fields = UnifiedSevenFundamentalFields(self.constants, self.spacetime_shape)
+        self.fields = UnifiedSevenFundamentalFields(self.constants, self.spacetime_shape, self.precision)
         self.lagrangian = UnifiedCIELLagrangian(self.constants, self.fields)
         self.consciousness = UnifiedConsciousnessDynamics(self.constants, self.fields)
 
@@ -557,7 +572,7 @@ class UnifiedCIELReality:
         self.lie4_constants = Lie4Constants()
         self.lie4_algebra = Lie4Algebra(self.lie4_constants)
         self.lie4_spacetime_shape = base_shape + (8, time_steps)
-        self.lie4_field = Lie4ConsciousnessField(self.lie4_spacetime_shape, self.lie4_constants)
+        self.lie4_field = Lie4ConsciousnessField(self.lie4_spacetime_shape, self.lie4_constants, self.precision)
 
         self.time = 0.0
         self.evolution_history = []
@@ -585,8 +600,8 @@ class UnifiedCIELReality:
                 'time': self.time,
                 'total_action': total_action,
                 'winding_number': avg_winding,
-                'consciousness_intensity': np.mean(np.abs(self.fields.I_field)),
-                'matter_density': np.mean(np.abs(self.fields.psi)),
+                'consciousness_intensity': self.precision.mean(np.abs(self.fields.I_field)),
+                'matter_density': self.precision.mean(np.abs(self.fields.psi)),
                 'lie4_resonance': lie4_resonance,
                 'lagrangian_density': L_density
             }
@@ -760,15 +775,13 @@ class CIEL0Bridge:
         self.core.constants.LAMBDA_ZETA = 0.005 + 0.02 * (e['peace'] + e['love'] - e['anger'])
         self.core.constants.OMEGA_LIFE = 0.7 + 0.3 * (e['love'] + e['peace'])
 
-        self.core.constants.LAMBDA_I = float(
-            heisenberg_soft_clip_range(self.core.constants.LAMBDA_I, 0.001, 0.1)
-        )
-        self.core.constants.LAMBDA_ZETA = float(
-            heisenberg_soft_clip_range(self.core.constants.LAMBDA_ZETA, 0.001, 0.05)
-        )
-        self.core.constants.OMEGA_LIFE = float(
-            heisenberg_soft_clip_range(self.core.constants.OMEGA_LIFE, 0.5, 1.0)
+        constants = self.core.constants
+        clipped = heisenberg_soft_clip_range(
+            [constants.LAMBDA_I, constants.LAMBDA_ZETA, constants.OMEGA_LIFE],
+            _EMOTION_LOWER,
+            _EMOTION_UPPER,
         )
+        constants.LAMBDA_I, constants.LAMBDA_ZETA, constants.OMEGA_LIFE = map(float, clipped)
 
     def _apply_intent_modulation(self, intent: str):
         intent_lower = intent.lower()
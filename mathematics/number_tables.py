@@ -0,0 +1,255 @@
+"""CIEL/Ω Quantum Consciousness Suite
+
+Copyright (c) 2025 Adrian Lipa / Intention Lab
+Licensed under the CIEL Research Non-Commercial License v1.1.
+
+Shared number-theory lookup tables for the resonance operators.
+
+Every table is built once per process, grows on demand ("up to N") and is
+returned as a read-only NumPy array indexed by the integer itself, so a
+resonance operator reduces to a gather such as ``collatz_lengths(10000)[n]``
+with ``n`` an integer array of any shape.  Tables can be written to a
+directory with :func:`persist_tables` and memory-mapped back with
+:func:`preload_tables` to skip the build in later processes.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable, Dict, Sequence, Tuple
+
+import numpy as np
+
+# name -> table covering indices 0..len-1; grown by doubling.
+_TABLES: Dict[str, np.ndarray] = {}
+
+COLLATZ_CAP = 1000
+
+
+def _frozen(table: np.ndarray) -> np.ndarray:
+    table.setflags(write=False)
+    return table
+
+
+def _cached(name: str, limit: int, build: Callable[[int], np.ndarray]) -> np.ndarray:
+    """Return table ``name`` covering ``0..limit`` (inclusive)."""
+
+    limit = int(limit)
+    table = _TABLES.get(name)
+    if table is None or len(table) <= limit:
+        size = max(limit + 1, 2 * len(table) if table is not None else 1024)
+        table = _TABLES[name] = _frozen(build(size - 1))
+    return table[: limit + 1]
+
+
+# ---------------------------------------------------------------------------
+# primes
+# ---------------------------------------------------------------------------
+
+
+def _build_sieve(limit: int) -> np.ndarray:
+    sieve = np.ones(limit + 1, dtype=bool)
+    sieve[:2] = False
+    for p in range(2, int(limit**0.5) + 1):
+        if sieve[p]:
+            sieve[p * p :: p] = False
+    return sieve
+
+
+def prime_sieve(limit: int) -> np.ndarray:
+    """Boolean primality mask for ``0..limit``."""
+
+    return _cached("prime_sieve", limit, _build_sieve)
+
+
+def is_prime(n: int | np.ndarray) -> bool | np.ndarray:
+    """Primality of ``n`` (scalar or integer array) via the cached sieve."""
+
+    values = np.asarray(n, dtype=np.int64)
+    top = int(values.max()) if values.size else 0
+    mask = prime_sieve(max(top, 2))[np.maximum(values, 0)]
+    return bool(mask) if mask.ndim == 0 else mask
+
+
+def primes_up_to(limit: int) -> np.ndarray:
+    """All primes ``<= limit`` in ascending order."""
+
+    return np.flatnonzero(prime_sieve(limit))
+
+
+def constellation_mask(limit: int, offsets: Sequence[int] = (0, 2)) -> np.ndarray:
+    """``mask[n]`` is true when every ``n + offset`` is prime, for ``n <= limit``.
+
+    ``offsets=(0, 2)`` marks the lower member of twin primes, ``(0, 2, 6, 8)``
+    the start of prime quadruplets.
+    """
+
+    offsets = tuple(int(o) for o in offsets)
+    sieve = prime_sieve(int(limit) + max(offsets))
+    mask = np.ones(int(limit) + 1, dtype=bool)
+    for offset in offsets:
+        mask &= sieve[offset : offset + len(mask)]
+    return mask
+
+
+def twin_prime_mask(limit: int) -> np.ndarray:
+    """``mask[p]`` is true when ``p`` and ``p + 2`` are both prime."""
+
+    return constellation_mask(limit, (0, 2))
+
+
+def twin_prime_pairs(count: int, start: int = 3) -> np.ndarray:
+    """The first ``count`` twin-prime pairs ``(p, p + 2)`` with ``p >= start``."""
+
+    limit = 1024
+    while True:
+        lower = np.flatnonzero(twin_prime_mask(limit))
+        lower = lower[lower >= start]
+        if len(lower) >= count:
+            lower = lower[:count]
+            return np.stack([lower, lower + 2], axis=1)
+        limit *= 2
+
+
+def consecutive_prime_groups(count: int, size: int = 4, start: int = 3, limit: int = 1000) -> np.ndarray:
+    """Up to ``count`` runs of ``size`` consecutive primes in ``[start, limit)``."""
+
+    primes = primes_up_to(limit - 1)
+    primes = primes[primes >= start]
+    n_groups = max(0, min(count, len(primes) - size + 1))
+    index = np.arange(n_groups)[:, None] + np.arange(size)[None, :]
+    return primes[index]
+
+
+# ---------------------------------------------------------------------------
+# Collatz
+# ---------------------------------------------------------------------------
+
+
+def _extend_collatz(known: np.ndarray, limit: int) -> np.ndarray:
+    """Extend uncapped sequence lengths ``known`` (valid below ``len(known)``) to ``limit``."""
+
+    lo = len(known)
+    table = np.empty(limit + 1, dtype=np.int64)
+    table[:lo] = known
+    start = np.arange(lo, limit + 1, dtype=np.int64)
+    values = start.copy()
+    steps = np.zeros_like(start)
+    pending = np.ones(len(start), dtype=bool)
+    # Iterate every start value until its trajectory drops into the known range.
+    while pending.any():
+        v = values[pending]
+        values[pending] = np.where(v % 2 == 0, v // 2, 3 * v + 1)
+        steps[pending] += 1
+        pending = values >= lo
+    table[lo:] = steps + table[values]
+    return table
+
+
+def _collatz_seed() -> np.ndarray:
+    # Index 0 is unused; the sequence of 1 is just ``[1]``.
+    return np.array([1, 1], dtype=np.int64)
+
+
+def _build_collatz(limit: int) -> np.ndarray:
+    previous = _TABLES.get("collatz_lengths")
+    known = previous if previous is not None else _collatz_seed()
+    return _extend_collatz(np.asarray(known), limit) if limit >= len(known) else known[: limit + 1].copy()
+
+
+def collatz_lengths(limit: int, cap: int | None = COLLATZ_CAP) -> np.ndarray:
+    """Length of the Collatz sequence of ``n`` (including ``n`` and the final 1).
+
+    ``cap`` truncates like the historical ``len(sequence) < 1000`` loops; pass
+    ``None`` for the exact lengths.
+    """
+
+    lengths = _cached("collatz_lengths", limit, _build_collatz)
+    return lengths if cap is None else np.minimum(lengths, cap)
+
+
+def collatz_stopping_times(limit: int) -> np.ndarray:
+    """Number of Collatz steps needed to reach 1 for ``n <= limit``."""
+
+    times = collatz_lengths(limit, cap=None) - 1
+    times[0] = 0
+    return times
+
+
+# ---------------------------------------------------------------------------
+# taxicab
+# ---------------------------------------------------------------------------
+
+
+def _build_taxicab(limit: int) -> np.ndarray:
+    root = int(round(limit ** (1 / 3))) + 1
+    i, j = np.triu_indices(root)
+    sums = (i + 1) ** 3 + (j + 1) ** 3
+    table = np.zeros(limit + 1, dtype=np.int64)
+    np.add.at(table, sums[sums <= limit], 1)
+    return table
+
+
+def taxicab_counts(limit: int) -> np.ndarray:
+    """Number of ways to write ``n`` as ``i**3 + j**3`` with ``1 <= i <= j``."""
+
+    return _cached("taxicab_counts", limit, _build_taxicab)
+
+
+# ---------------------------------------------------------------------------
+# persistence
+# ---------------------------------------------------------------------------
+
+
+def persist_tables(directory: Path | str) -> Tuple[Path, ...]:
+    """Write every table built so far to ``directory`` as ``.npy`` files."""
+
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    written = []
+    for name, table in _TABLES.items():
+        path = directory / f"{name}.npy"
+        np.save(path, table)
+        written.append(path)
+    return tuple(written)
+
+
+def preload_tables(directory: Path | str) -> Tuple[str, ...]:
+    """Memory-map tables saved by :func:`persist_tables` into the cache.
+
+    A stored table only replaces a cached one when it covers a larger range.
+    """
+
+    loaded = []
+    for path in sorted(Path(directory).glob("*.npy")):
+        name = path.stem
+        current = _TABLES.get(name)
+        table = np.load(path, mmap_mode="r")
+        if current is None or len(table) > len(current):
+            _TABLES[name] = table
+            loaded.append(name)
+    return tuple(loaded)
+
+
+def clear_tables() -> None:
+    """Drop all cached tables (mainly for tests)."""
+
+    _TABLES.clear()
+
+
+__all__ = [
+    "COLLATZ_CAP",
+    "clear_tables",
+    "collatz_lengths",
+    "collatz_stopping_times",
+    "consecutive_prime_groups",
+    "constellation_mask",
+    "is_prime",
+    "persist_tables",
+    "preload_tables",
+    "prime_sieve",
+    "primes_up_to",
+    "taxicab_counts",
+    "twin_prime_mask",
+    "twin_prime_pairs",
+]
@@ -50,7 +50,26 @@ def coherence(field: np.ndarray, eps: float = 1e-12) -> float:
     return float(np.abs(np.sum(vec)) / (denom * np.sqrt(vec.size)))
 
 
-def heisenberg_soft_clip(x: np.ndarray | float, scale: float, eps: float = 1e-12) -> np.ndarray:
+def _out_array(shape: tuple[int, ...], out: np.ndarray | None, dtype: type = float) -> np.ndarray:
+    if out is None:
+        return np.empty(shape, dtype=dtype)
+    if out.shape != shape:
+        raise ValueError(f"out has shape {out.shape}, expected {shape}")
+    return out
+
+
+def _result(res: np.ndarray, out: np.ndarray | None) -> np.ndarray:
+    # Like a ufunc, a scalar input gives a NumPy scalar rather than a 0-d array.
+    return res[()] if out is None and res.ndim == 0 else res
+
+
+def heisenberg_soft_clip(
+    x: np.ndarray | float,
+    scale: float,
+    eps: float = 1e-12,
+    *,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
     """Smoothly saturate values without introducing hard cut-offs.
 
     Parameters
@@ -64,27 +83,117 @@ def heisenberg_soft_clip(x: np.ndarray | float, scale: float, eps: float = 1e-12
     eps:
         Tiny constant preventing division by zero when ``scale`` is extremely
         small.
+    out:
+        Optional float array of the same shape as ``x`` that receives the
+        result; it may be ``x`` itself for in-place clipping.
     """
 
     s = float(scale) if scale is not None else 1.0
     if s <= 0.0:
         s = 1.0
-    return s * np.tanh(np.asarray(x, dtype=float) / (s + eps))
+    arr = np.asarray(x, dtype=float)
+    if out is None and arr.ndim == 0:
+        return s * np.tanh(arr / (s + eps))
+    res = _out_array(arr.shape, out)
+    np.divide(arr, s + eps, out=res)
+    np.tanh(res, out=res)
+    np.multiply(res, s, out=res)
+    return _result(res, out)
 
 
 def heisenberg_soft_clip_range(
     x: np.ndarray | float,
-    lower: float,
-    upper: float,
+    lower: float | np.ndarray,
+    upper: float | np.ndarray,
     eps: float = 1e-12,
+    *,
+    out: np.ndarray | None = None,
 ) -> np.ndarray:
-    """Heisenberg-inspired clip that honours an arbitrary numeric range."""
+    """Heisenberg-inspired clip that honours an arbitrary numeric range.
+
+    ``lower`` and ``upper`` may be arrays broadcasting against ``x``, so
+    several quantities with different ranges are clipped in one call.  The
+    computation runs in place in ``out`` (or one fresh array) without
+    intermediate temporaries.
+    """
 
-    if upper <= lower:
-        raise ValueError("upper bound must be greater than lower bound")
+    scalar_bounds = isinstance(lower, (int, float)) and isinstance(upper, (int, float))
+    if scalar_bounds:
+        if upper <= lower:
+            raise ValueError("upper bound must be greater than lower bound")
+    else:
+        lower = np.asarray(lower, dtype=float)
+        upper = np.asarray(upper, dtype=float)
+        if np.any(upper <= lower):
+            raise ValueError("upper bound must be greater than lower bound")
     midpoint = 0.5 * (upper + lower)
     radius = 0.5 * (upper - lower)
-    return midpoint + heisenberg_soft_clip(np.asarray(x, dtype=float) - midpoint, radius, eps)
+    arr = np.asarray(x, dtype=float)
+    if scalar_bounds:
+        if out is None and arr.ndim == 0:
+            # Scalar fast path: plain scalar arithmetic beats the ufunc set-up below.
+            return midpoint + radius * np.tanh((arr - midpoint) / (radius + eps))
+        shape = arr.shape
+    else:
+        shape = np.broadcast_shapes(arr.shape, midpoint.shape)
+    res = _out_array(shape, out)
+    np.subtract(arr, midpoint, out=res)
+    np.divide(res, radius + eps, out=res)
+    np.tanh(res, out=res)
+    np.multiply(res, radius, out=res)
+    np.add(res, midpoint, out=res)
+    return _result(res, out)
+
+
+def soft_clip_exp(
+    x: np.ndarray | float | complex,
+    lower: float,
+    upper: float,
+    eps: float = 1e-12,
+    *,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """``exp`` of ``x`` with the real part soft-clipped to ``[lower, upper]``.
+
+    For complex ``x`` the imaginary part is kept as a phase, giving
+    ``exp(clip(Re x)) * exp(1j * Im x)``.  This is the overflow-safe exponential
+    the 4D engine uses.
+    """
+
+    if np.iscomplexobj(x):
+        arr = np.asarray(x)
+        magnitude = np.exp(heisenberg_soft_clip_range(arr.real, lower, upper, eps))
+        res = _out_array(arr.shape, out, complex)
+        np.multiply(arr.imag, 1j, out=res)
+        np.exp(res, out=res)
+        res *= magnitude
+        return _result(res, out)
+    res = heisenberg_soft_clip_range(x, lower, upper, eps, out=out)
+    if np.ndim(res) == 0:
+        return np.exp(res)
+    return np.exp(res, out=res)
+
+
+def soft_clip_log(
+    x: np.ndarray | float,
+    lower: float,
+    upper: float,
+    eps: float = 1e-12,
+    *,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """``log`` of ``x`` soft-clipped to ``[lower, upper]``, where ``lower >= 0``.
+
+    The clipped value stays inside the range, so the logarithm is finite
+    unless ``lower`` is zero and ``x`` saturates onto it.
+    """
+
+    if np.any(np.asarray(lower) < 0.0):
+        raise ValueError("soft_clip_log needs a non-negative lower bound")
+    res = heisenberg_soft_clip_range(x, lower, upper, eps, out=out)
+    if np.ndim(res) == 0:
+        return np.log(res)
+    return np.log(res, out=res)
 
 
 __all__ = [
@@ -95,6 +204,8 @@ __all__ = [
     "resonance",
     "heisenberg_soft_clip",
     "heisenberg_soft_clip_range",
+    "soft_clip_exp",
+    "soft_clip_log",
 ]
 
 
@@ -10,7 +10,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, Dict, Iterable
 
 import json
 
@@ -21,7 +21,12 @@ class LongTermMemory:
     entries: list[Dict[str, Any]] = field(default_factory=list, init=False)
 
     def store(self, entry: Dict[str, Any]) -> None:
-        self.entries.append(entry)
+        self.store_many((entry,))
+
+    def store_many(self, entries: Iterable[Dict[str, Any]]) -> None:
+        """Append several entries with a single rewrite of the file."""
+
+        self.entries.extend(entries)
         self.path.parent.mkdir(parents=True, exist_ok=True)
         self.path.write_text(json.dumps(self.entries, ensure_ascii=False, indent=2), encoding="utf-8")
 
@@ -12,7 +12,7 @@ from datetime import datetime
 from typing import Dict, List, Mapping
 
 from tmp.bifurcation import decide_branch
-from tmp.policy import Policy
+from tmp.policy import PolicyHolder
 from tmp.weighting import spectral_weight
 
 
@@ -25,7 +25,7 @@ class OrchestratedEntry:
     timestamp: datetime = field(default_factory=datetime.utcnow)
 
 
-class Orchestrator:
+class Orchestrator(PolicyHolder):
     """A tiny orchestration facade with deterministic behaviour.
 
     The goal of this class is to provide predictable, easy to reason about
@@ -39,7 +39,6 @@ class Orchestrator:
 
     def __init__(self) -> None:
         self.tmp_memory: List[OrchestratedEntry] = []
-        self.policy = Policy()
 
     def _features_for(self, data: str) -> Dict[str, Mapping[str, object]]:
         tokens = data.split()
@@ -73,14 +72,15 @@ class Orchestrator:
             return {"status": "WTF", "question": "Not enough context"}
 
         entry = {"data": raw}
-        weight = spectral_weight(entry, features, user_subjective, self_subjective, self.policy)
+        policy = self.policy
+        weight = spectral_weight(entry, features, user_subjective, self_subjective, policy)
 
         if user_save_override or system_save_override:
             result = OrchestratedEntry(data=raw, weight=weight, status="MEM", override=True)
             self.tmp_memory.append(result)
             return {"status": "MEM", "override": True, "weight": weight}
 
-        branch = decide_branch(weight, self.policy.spectral_conf().get("decision"))
+        branch = decide_branch(weight, policy.spectral_conf().get("decision"))
         if branch == "mem":
             result = OrchestratedEntry(data=raw, weight=weight, status="MEM")
             self.tmp_memory.append(result)
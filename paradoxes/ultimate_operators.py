@@ -22,12 +22,14 @@ from typing import Dict, List, Tuple, Optional, Callable, Any, Union
 import warnings
 warnings.filterwarnings('ignore')
 import numpy.typing as npt
-from sympy import isprime, factorint, primepi
+from sympy import factorint, primepi
 import networkx as nx
 from collections import defaultdict, deque
 import itertools
 from functools import lru_cache
 
+from config.simulation_config import PrecisionPolicy, resolve_precision
+from mathematics import number_tables
 from mathematics.safe_operations import heisenberg_soft_clip_range
 
 # =============================================================================
@@ -256,9 +258,20 @@ class UltimateParadoxOperators:
     
     def twin_prime_resonance(self, n: int) -> float:
         """Twin prime distribution resonance"""
-        if isprime(n) and isprime(n + 2):
+        if number_tables.is_prime(n) and number_tables.is_prime(n + 2):
             return 1.0 / np.log(n)
         return 0.0
+
+    def twin_prime_resonance_array(self, n: np.ndarray) -> np.ndarray:
+        """Vectorised :meth:`twin_prime_resonance` over an integer array"""
+        n = np.asarray(n, dtype=np.int64)
+        mask = number_tables.twin_prime_mask(max(int(n.max(initial=0)), 0))[np.maximum(n, 0)] & (n >= 0)
+        return np.where(mask, 1.0 / np.log(np.where(mask, n, 2)), 0.0)
+
+    def collatz_length_array(self, n: np.ndarray) -> np.ndarray:
+        """Length of :meth:`collatz_chaos_order` for every entry of a positive integer array"""
+        n = np.asarray(n, dtype=np.int64)
+        return number_tables.collatz_lengths(int(n.max(initial=1)))[n]
     
     def hilbert_hotel_operator(self, occupied_rooms: List[bool], 
                              new_guests: int) -> List[bool]:
@@ -495,9 +508,15 @@ class UltimateParadoxOperators:
 class UltimateUniversalLawEngine4D:
     """ULTIMATE 4D Universal Law Engine - Complete Integration"""
 
-    def __init__(self, grid_size: Tuple[int, int, int, int] = (16, 16, 16, 12)):
+    FIELD_NAMES = ('symbolic_field', 'intention_field', 'resonance_field', 'creation_field',
+                   'consciousness_field', 'ethical_field', 'temporal_field', 'paradox_field',
+                   'quantum_gravity_field', 'holographic_field')
+
+    def __init__(self, grid_size: Tuple[int, int, int, int] = (16, 16, 16, 12),
+                 precision: Optional[Union[PrecisionPolicy, str]] = None):
         self.grid_size = grid_size
         self.dimensions = 4
+        self.precision = resolve_precision(precision)
         
         # Initialize all components
         self.constants = UltimateCIELConstants()
@@ -526,10 +545,7 @@ class UltimateUniversalLawEngine4D:
         print("Initializing ULTIMATE 4D cosmic fields...")
         
         # Create 4D coordinate system
-        x = np.linspace(-2*np.pi, 2*np.pi, self.grid_size[0])
-        y = np.linspace(-2*np.pi, 2*np.pi, self.grid_size[1])
-        z = np.linspace(-2*np.pi, 2*np.pi, self.grid_size[2])
-        w = np.linspace(-2*np.pi, 2*np.pi, self.grid_size[3])
+        x, y, z, w = (self.precision.linspace(-2*np.pi, 2*np.pi, n) for n in self.grid_size)
         
         self.X, self.Y, self.Z, self.W = np.meshgrid(x, y, z, w, indexing='ij')
         self.hyper_coordinates = np.stack([self.X, self.Y, self.Z, self.W], axis=-1)
@@ -547,26 +563,22 @@ class UltimateUniversalLawEngine4D:
         # Compute initial resonances
         self.resonance_field = self.compute_ultimate_resonance()
         self.creation_field = np.zeros_like(self.symbolic_field)
+        self.precision.enforce(self, self.FIELD_NAMES)
 
     def initialize_symbolic_field(self):
         """Initialize symbolic reality field"""
-        symbolic_states = []
-        for i in range(self.grid_size[0]):
-            for j in range(self.grid_size[1]):
-                for k in range(self.grid_size[2]):
-                    for l in range(self.grid_size[3]):
-                        # Complex symbolic state with multiple frequencies
-                        state = (np.sin(i + j) * np.cos(k + l) + 
-                                1j * np.sin(k + l) * np.cos(i + j))
-                        state *= np.exp(1j * (i * k + j * l) * 0.05)
-                        symbolic_states.append(state)
-        
-        self.symbolic_field = np.array(symbolic_states).reshape(self.grid_size)
-        self.symbolic_field /= (np.linalg.norm(self.symbolic_field) + 1e-10)
+        i, j, k, l = np.ogrid[:self.grid_size[0], :self.grid_size[1], :self.grid_size[2], :self.grid_size[3]]
+        # Complex symbolic state with multiple frequencies, broadcast over the 4D grid
+        symbolic = (np.sin(i + j) * np.cos(k + l) +
+                    1j * np.sin(k + l) * np.cos(i + j))
+        symbolic = symbolic * np.exp(1j * (i * k + j * l) * 0.05)
+
+        self.symbolic_field = self.precision.cast(symbolic)
+        self.symbolic_field /= (self.precision.norm(self.symbolic_field) + 1e-10)
 
     def initialize_intention_field(self):
         """Initialize intention field with mathematical beauty"""
-        intention = np.ones(self.grid_size, dtype=complex)
+        intention = self.precision.ones(self.grid_size)
         
         # Ramanujan modular forms contribution
         for i in range(4):
@@ -577,11 +589,11 @@ class UltimateUniversalLawEngine4D:
         phi_mod = np.exp(1j * self.constants.PHI * np.sum(self.hyper_coordinates, axis=-1))
         intention *= phi_mod
         
-        self.intention_field = intention / (np.linalg.norm(intention) + 1e-10)
+        self.intention_field = intention / (self.precision.norm(intention) + 1e-10)
 
     def initialize_consciousness_field(self):
         """Initialize pure consciousness field"""
-        consciousness = np.zeros(self.grid_size, dtype=complex)
+        consciousness = self.precision.zeros(self.grid_size)
         
         # Consciousness as standing wave in 4D
         for i in range(4):
@@ -593,11 +605,11 @@ class UltimateUniversalLawEngine4D:
         self_ref = np.exp(1j * consciousness.real)
         consciousness = 0.7 * consciousness + 0.3 * self_ref
         
-        self.consciousness_field = consciousness / (np.linalg.norm(consciousness) + 1e-10)
+        self.consciousness_field = consciousness / (self.precision.norm(consciousness) + 1e-10)
 
     def initialize_ethical_field(self):
         """Initialize ethical potential field"""
-        ethical = np.ones(self.grid_size, dtype=complex)
+        ethical = self.precision.ones(self.grid_size)
         
         # Ethical curvature based on information density
         info_density = np.abs(self.symbolic_field)**2 + np.abs(self.intention_field)**2
@@ -611,7 +623,7 @@ class UltimateUniversalLawEngine4D:
 
     def initialize_temporal_field(self):
         """Initialize temporal superfluid field"""
-        temporal = np.ones(self.grid_size, dtype=complex)
+        temporal = self.precision.ones(self.grid_size)
         
         # Time as quantum fluid with viscosity
         time_flow = self.hyper_coordinates[..., 3]  # Time coordinate
@@ -625,7 +637,7 @@ class UltimateUniversalLawEngine4D:
 
     def initialize_paradox_field(self):
         """Initialize paradox resonance field"""
-        paradox = np.ones(self.grid_size, dtype=complex)
+        paradox = self.precision.ones(self.grid_size)
         
         # Paradox coherence from all operators
         coherence = self.paradox_operators.compute_paradox_coherence()
@@ -644,14 +656,20 @@ class UltimateUniversalLawEngine4D:
                       1j * np.random.normal(0, 1, self.grid_size)
         
         # Planck-scale structure
-        planck_modulation = np.exp(-np.sum(self.hyper_coordinates**2, axis=-1) / 
-                                 (2 * self.constants.L_p**2))
-        
-        self.quantum_gravity_field = quantum_foam * planck_modulation
+        self.quantum_gravity_field = quantum_foam * self.planck_modulation()
+
+    def planck_modulation(self) -> np.ndarray:
+        """Gaussian envelope of width ``L_p`` over the hyper-coordinates.
+
+        ``L_p**2`` underflows to zero in float32, so the exponent is always
+        evaluated in float64 and only the result is cast to the field dtype.
+        """
+        radius2 = np.sum(np.square(self.hyper_coordinates, dtype=np.float64), axis=-1)
+        return self.precision.cast(np.exp(-radius2 / (2 * self.constants.L_p**2)))
 
     def initialize_holographic_field(self):
         """Initialize holographic boundary field"""
-        holographic = np.ones(self.grid_size, dtype=complex)
+        holographic = self.precision.ones(self.grid_size)
         
         # Holographic projection from boundary
         boundary_distance = np.sqrt(np.sum(self.hyper_coordinates[..., :3]**2, axis=-1))
@@ -665,7 +683,7 @@ class UltimateUniversalLawEngine4D:
 
     def compute_ultimate_resonance(self) -> np.ndarray:
         """Compute ULTIMATE resonance across all fields"""
-        resonance = np.zeros(self.grid_size, dtype=float)
+        resonance = self.precision.zeros(self.grid_size, complex=False)
         
         # Field interactions
         fields = [
@@ -679,10 +697,12 @@ class UltimateUniversalLawEngine4D:
             'temporal', 'paradox', 'quantum_gravity', 'holographic'
         ]
         
-        # Compute complex resonance network
+        # Compute complex resonance network; the global overlaps are
+        # accumulated in double precision whatever the field dtype.
+        flat = [f.ravel().astype(np.complex128, copy=False) for f in fields]
         for i, field1 in enumerate(fields):
             for j, field2 in enumerate(fields[i+1:], i+1):
-                correlation = np.real(np.vdot(field1.flatten(), field2.flatten()))
+                correlation = np.real(np.vdot(flat[i], flat[j]))
                 resonance += correlation * np.abs(field1) * np.abs(field2)
         
         # Normalize and return
@@ -706,6 +726,7 @@ class UltimateUniversalLawEngine4D:
         # Update resonances and creation
         self.resonance_field = self.compute_ultimate_resonance()
         self.evolve_creation_field(dt)
+        self.precision.enforce(self, self.FIELD_NAMES)
         
         return self.get_ultimate_cosmic_state()
 
@@ -725,7 +746,7 @@ class UltimateUniversalLawEngine4D:
         self.symbolic_field += dt * (1j * laplacian - potential * self.symbolic_field + creative_term)
         
         # Normalize
-        norm = np.linalg.norm(self.symbolic_field)
+        norm = self.precision.norm(self.symbolic_field)
         if norm > 0:
             self.symbolic_field /= norm
 
@@ -740,7 +761,7 @@ class UltimateUniversalLawEngine4D:
         self.intention_field *= np.exp(1j * (ramanujan_correction + golden_attractor))
         
         # Normalize
-        norm = np.linalg.norm(self.intention_field)
+        norm = self.precision.norm(self.intention_field)
         if norm > 0:
             self.intention_field /= norm
 
@@ -759,7 +780,7 @@ class UltimateUniversalLawEngine4D:
         self.consciousness_field *= np.exp(1j * evolution * dt)
         
         # Normalize
-        norm = np.linalg.norm(self.consciousness_field)
+        norm = self.precision.norm(self.consciousness_field)
         if norm > 0:
             self.consciousness_field /= norm
 
@@ -781,7 +802,7 @@ class UltimateUniversalLawEngine4D:
         viscosity = self.constants.TEMPORAL_VISCOSITY
         
         # Causal structure influence
-        causal_structure = 0.1 * np.gradient(self.hyper_coordinates[..., 3])
+        causal_structure = 0.1 * np.gradient(self.hyper_coordinates[..., 3], axis=3)
         
         # Paradoxical time loops
         time_loops = 0.05 * np.angle(self.paradox_field)
@@ -816,9 +837,7 @@ class UltimateUniversalLawEngine4D:
         self.quantum_gravity_field += dt * (fluctuation + 1j * curvature_coupling)
         
         # Maintain planck-scale structure
-        planck_modulation = np.exp(-np.sum(self.hyper_coordinates**2, axis=-1) / 
-                                 (2 * self.constants.L_p**2))
-        self.quantum_gravity_field *= planck_modulation
+        self.quantum_gravity_field *= self.planck_modulation()
 
     def evolve_holographic_field(self, dt: float):
         """Evolve holographic boundary field"""
@@ -869,16 +888,17 @@ class UltimateUniversalLawEngine4D:
         metrics = {}
         
         # Basic field metrics
-        metrics['symbolic_coherence'] = float(np.mean(np.abs(self.symbolic_field)))
-        metrics['intention_strength'] = float(np.mean(np.abs(self.intention_field)))
-        metrics['consciousness_amplitude'] = float(np.mean(np.abs(self.consciousness_field)))
-        metrics['ethical_potential'] = float(np.mean(np.abs(self.ethical_field)))
-        metrics['temporal_flow'] = float(np.mean(np.abs(self.temporal_field)))
-        metrics['paradox_coherence'] = float(np.mean(np.abs(self.paradox_field)))
-        metrics['quantum_foam_density'] = float(np.mean(np.abs(self.quantum_gravity_field)))
-        metrics['holographic_encoding'] = float(np.mean(np.abs(self.holographic_field)))
-        metrics['creation_intensity'] = float(np.mean(np.abs(self.creation_field)))
-        metrics['universal_resonance'] = float(np.mean(self.resonance_field))
+        mean = self.precision.mean
+        metrics['symbolic_coherence'] = mean(np.abs(self.symbolic_field))
+        metrics['intention_strength'] = mean(np.abs(self.intention_field))
+        metrics['consciousness_amplitude'] = mean(np.abs(self.consciousness_field))
+        metrics['ethical_potential'] = mean(np.abs(self.ethical_field))
+        metrics['temporal_flow'] = mean(np.abs(self.temporal_field))
+        metrics['paradox_coherence'] = mean(np.abs(self.paradox_field))
+        metrics['quantum_foam_density'] = mean(np.abs(self.quantum_gravity_field))
+        metrics['holographic_encoding'] = mean(np.abs(self.holographic_field))
+        metrics['creation_intensity'] = mean(np.abs(self.creation_field))
+        metrics['universal_resonance'] = mean(self.resonance_field)
         
         # Derived metrics
         metrics['reality_stability'] = float(1.0 - metrics['paradox_coherence'])
@@ -8,8 +8,21 @@ Helpers for persisting lightweight artefacts in the tests.
 from __future__ import annotations
 
 from .archive import rotate_tmp_reports
+from .checkpoint import CheckpointManager, load_checkpoint, restore_checkpoint, save_checkpoint
 from .clusters import PersistentMemory
 from .journal import Journal
 from .store_hdf5 import H5Store
+from .vector_store import VectorStore, migrate_legacy_files
 
-__all__ = ["H5Store", "Journal", "PersistentMemory", "rotate_tmp_reports"]
+__all__ = [
+    "CheckpointManager",
+    "H5Store",
+    "Journal",
+    "PersistentMemory",
+    "VectorStore",
+    "load_checkpoint",
+    "migrate_legacy_files",
+    "restore_checkpoint",
+    "rotate_tmp_reports",
+    "save_checkpoint",
+]
@@ -0,0 +1,493 @@
+"""CIEL/Ω Quantum Consciousness Suite
+
+Copyright (c) 2025 Adrian Lipa / Intention Lab
+Licensed under the CIEL Research Non-Commercial License v1.1.
+
+Checkpoint/restore support for long running simulation engines.
+
+A checkpoint is a single ``.ckpt`` container: an 8 byte magic, a little
+endian header length, a JSON header and then every field array laid out as
+raw C-ordered bytes aligned to 64 bytes.  Uncompressed arrays can therefore
+be memory-mapped straight out of the file, which keeps resuming a large run
+close to instant; arrays only page in once the engine touches them.
+
+Engine state is captured generically by walking the instance attributes of
+the engine (and of the field containers / sub-engines it owns).  Arrays go
+into the container, counters and metric histories into the header and the
+global NumPy / :mod:`random` generator states are stored alongside.  An owned
+object is only captured if it holds arrays or a generator, so constants,
+configuration and loggers are left as ``__init__`` made them.  Any of
+``UnifiedRealityKernel``, ``UniversalLawEngine4D``,
+``CompleteUnifiedEvolutionEngine``, ``UltimateEvolutionEngine``,
+``CIEL0Framework`` or ``UnifiedCIELReality`` can be saved and resumed without
+per-class code.  Restoring expects an engine constructed with the same shape
+parameters; attributes that cannot be represented (callables, caches keyed by
+non-string values, foreign objects) are left as created by ``__init__``.
+"""
+from __future__ import annotations
+
+import json
+import os
+import random
+import re
+import struct
+import uuid
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import Enum
+from pathlib import Path
+from types import FunctionType, MethodType, ModuleType
+from typing import Any, Dict, Iterator, List, Mapping, Optional
+
+import numpy as np
+
+MAGIC = b"CIELCKP1"
+FORMAT_VERSION = 1
+ALIGNMENT = 64
+COMPRESSIONS = ("none", "zlib")
+
+_MAX_DEPTH = 4
+_FOREIGN_MODULES = (
+    "numpy", "scipy", "matplotlib", "networkx", "sympy", "pandas", "builtins", "logging", "threading",
+)
+_FILE_PATTERN = re.compile(r"^ckpt-(\d+)\.ckpt$")
+
+
+class _Unsupported(Exception):
+    """Raised while encoding a value that cannot be stored in a checkpoint."""
+
+
+@dataclass
+class CheckpointState:
+    """Detached snapshot of an engine ready to be written to disk."""
+
+    arrays: Dict[str, np.ndarray] = field(default_factory=dict)
+    state: Dict[str, Any] = field(default_factory=dict)
+    rng: Dict[str, Any] = field(default_factory=dict)
+    meta: Dict[str, Any] = field(default_factory=dict)
+
+
+# ---------------------------------------------------------------------------
+# state capture
+# ---------------------------------------------------------------------------
+
+
+def _is_container_object(value: Any) -> bool:
+    if isinstance(value, (type, ModuleType, FunctionType, MethodType, Enum)):
+        return False
+    if not hasattr(value, "__dict__"):
+        return False
+    module = type(value).__module__.split(".")[0]
+    return module not in _FOREIGN_MODULES
+
+
+class _Encoder:
+    """Turns attribute values into JSON, registering arrays by key."""
+
+    def __init__(self, arrays: Dict[str, np.ndarray], copy: bool) -> None:
+        self.arrays = arrays
+        self.copy = copy
+        self.generators = 0
+
+    def array(self, key: str, value: np.ndarray) -> Dict[str, str]:
+        if value.dtype.hasobject:
+            raise _Unsupported(key)
+        arr = np.array(value, order="C", copy=True) if self.copy else np.ascontiguousarray(value)
+        self.arrays[key] = arr
+        return {"__ndarray__": key}
+
+    def encode(self, key: str, value: Any) -> Any:
+        if value is None or isinstance(value, (bool, int, float, str)):
+            if isinstance(value, float) and not np.isfinite(value):
+                return {"__float__": repr(value)}
+            return value
+        if isinstance(value, np.ndarray):
+            return self.array(key, value)
+        if isinstance(value, (complex, np.complexfloating)):
+            return {"__complex__": [float(value.real), float(value.imag)]}
+        if isinstance(value, np.generic):
+            return self.encode(key, value.item())
+        if isinstance(value, tuple):
+            return {"__tuple__": [self.encode(f"{key}[{i}]", v) for i, v in enumerate(value)]}
+        if isinstance(value, (list, deque)):
+            return [self.encode(f"{key}[{i}]", v) for i, v in enumerate(value)]
+        if isinstance(value, dict):
+            if not all(isinstance(k, str) for k in value):
+                raise _Unsupported(key)
+            return {"__dict__": {k: self.encode(f"{key}[{k}]", v) for k, v in value.items()}}
+        if isinstance(value, (np.random.Generator, np.random.RandomState)):
+            state = value.bit_generator.state if isinstance(value, np.random.Generator) else value.get_state(legacy=False)
+            self.generators += 1
+            return {"__rng__": self.encode(f"{key}.state", state)["__dict__"]}
+        raise _Unsupported(key)
+
+
+def _decode(value: Any, arrays: Mapping[str, np.ndarray]) -> Any:
+    if isinstance(value, list):
+        return [_decode(v, arrays) for v in value]
+    if not isinstance(value, dict):
+        return value
+    if "__ndarray__" in value:
+        return arrays[value["__ndarray__"]]
+    if "__complex__" in value:
+        re_part, im_part = value["__complex__"]
+        return complex(re_part, im_part)
+    if "__float__" in value:
+        return float(value["__float__"])
+    if "__tuple__" in value:
+        return tuple(_decode(v, arrays) for v in value["__tuple__"])
+    if "__dict__" in value:
+        return {k: _decode(v, arrays) for k, v in value["__dict__"].items()}
+    if "__rng__" in value:
+        return {"__rng__": {k: _decode(v, arrays) for k, v in value["__rng__"].items()}}
+    return value
+
+
+def _walk(obj: Any, prefix: str, encoder: _Encoder, out: Dict[str, Any], seen: set, depth: int) -> None:
+    seen.add(id(obj))
+    for name, value in vars(obj).items():
+        key = f"{prefix}{name}"
+        if _is_container_object(value):
+            if id(value) not in seen and depth < _MAX_DEPTH:
+                arrays, generators, owned = len(encoder.arrays), encoder.generators, {}
+                _walk(value, key + ".", encoder, owned, seen, depth + 1)
+                if len(encoder.arrays) > arrays or encoder.generators > generators:
+                    out.update(owned)
+            continue
+        try:
+            out[key] = encoder.encode(key, value)
+        except _Unsupported:
+            # Drop any arrays registered for the rejected value.
+            for stale in [k for k in encoder.arrays if k == key or k.startswith(key + "[")]:
+                del encoder.arrays[stale]
+
+
+def capture_state(engine: Any, *, meta: Optional[Mapping[str, Any]] = None, copy: bool = True) -> CheckpointState:
+    """Snapshot ``engine`` into a :class:`CheckpointState`.
+
+    With ``copy=True`` (the default) every array is copied so the engine may
+    keep stepping while the snapshot is written in the background.
+    """
+
+    snapshot = CheckpointState(meta=dict(meta or {}))
+    encoder = _Encoder(snapshot.arrays, copy)
+    _walk(engine, "", encoder, snapshot.state, set(), 0)
+    snapshot.rng = {
+        "numpy": encoder.encode("__rng__.numpy", np.random.get_state(legacy=False)),
+        "python": encoder.encode("__rng__.python", random.getstate()),
+    }
+    snapshot.meta.setdefault("engine", f"{type(engine).__module__}.{type(engine).__qualname__}")
+    snapshot.meta.setdefault("created", datetime.now(timezone.utc).isoformat())
+    return snapshot
+
+
+# ---------------------------------------------------------------------------
+# container format
+# ---------------------------------------------------------------------------
+
+
+def _align(offset: int) -> int:
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def write_checkpoint(path: Path | str, snapshot: CheckpointState, *, compression: str = "none") -> Path:
+    """Atomically write ``snapshot`` to ``path`` (temp file, fsync, rename)."""
+
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"compression must be one of {COMPRESSIONS}")
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    payloads: List[Any] = []
+    entries: Dict[str, Dict[str, Any]] = {}
+    offset = 0
+    for key, arr in snapshot.arrays.items():
+        data = memoryview(arr.reshape(-1).view(np.uint8)) if arr.size else b""
+        codec = "raw"
+        if compression == "zlib" and arr.size:
+            data = zlib.compress(data, 1)
+            codec = "zlib"
+        offset = _align(offset)
+        entries[key] = {
+            "dtype": arr.dtype.str,
+            "shape": list(arr.shape),
+            "offset": offset,
+            "nbytes": len(data),
+            "codec": codec,
+        }
+        payloads.append((offset, data))
+        offset += len(data)
+
+    header = json.dumps(
+        {
+            "version": FORMAT_VERSION,
+            "arrays": entries,
+            "state": snapshot.state,
+            "rng": snapshot.rng,
+            "meta": snapshot.meta,
+        },
+        ensure_ascii=False,
+    ).encode("utf-8")
+    data_start = _align(len(MAGIC) + 8 + len(header))
+
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{uuid.uuid4().hex}.tmp")
+    try:
+        with tmp.open("wb") as fh:
+            fh.write(MAGIC)
+            fh.write(struct.pack("<Q", len(header)))
+            fh.write(header)
+            for rel, data in payloads:
+                fh.seek(data_start + rel)
+                fh.write(data)
+            fh.truncate(data_start + offset)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+    return path
+
+
+class _LazyArrays(Mapping[str, np.ndarray]):
+    """Mapping that memory-maps (or decompresses) arrays on first access."""
+
+    def __init__(self, path: Path, entries: Mapping[str, Dict[str, Any]], data_start: int) -> None:
+        self._path = path
+        self._entries = entries
+        self._data_start = data_start
+        self._cache: Dict[str, np.ndarray] = {}
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        if key not in self._cache:
+            self._cache[key] = self._load(self._entries[key])
+        return self._cache[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _load(self, entry: Mapping[str, Any]) -> np.ndarray:
+        dtype = np.dtype(entry["dtype"])
+        shape = tuple(entry["shape"])
+        if entry["nbytes"] == 0:
+            return np.zeros(shape, dtype=dtype)
+        offset = self._data_start + entry["offset"]
+        if entry["codec"] == "raw":
+            # Copy-on-write: the resumed engine may mutate its fields in place
+            # without ever touching the checkpoint on disk.
+            return np.memmap(self._path, dtype=dtype, mode="c", offset=offset, shape=shape).view(np.ndarray)
+        with self._path.open("rb") as fh:
+            fh.seek(offset)
+            raw = bytearray(zlib.decompress(fh.read(entry["nbytes"])))
+        return np.frombuffer(raw, dtype=dtype).reshape(shape)
+
+
+@dataclass
+class Checkpoint:
+    """Handle on a checkpoint file; arrays are loaded lazily."""
+
+    path: Path
+    arrays: Mapping[str, np.ndarray]
+    state: Dict[str, Any]
+    rng: Dict[str, Any]
+    meta: Dict[str, Any]
+
+    @property
+    def step(self) -> Optional[int]:
+        return self.meta.get("step")
+
+
+def load_checkpoint(path: Path | str) -> Checkpoint:
+    """Open ``path`` without reading any array data."""
+
+    path = Path(path)
+    with path.open("rb") as fh:
+        if fh.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a CIEL checkpoint")
+        (header_len,) = struct.unpack("<Q", fh.read(8))
+        header = json.loads(fh.read(header_len).decode("utf-8"))
+    if header.get("version") != FORMAT_VERSION:
+        raise ValueError(f"unsupported checkpoint version {header.get('version')!r}")
+    data_start = _align(len(MAGIC) + 8 + header_len)
+    return Checkpoint(
+        path=path,
+        arrays=_LazyArrays(path, header["arrays"], data_start),
+        state=header["state"],
+        rng=header["rng"],
+        meta=header["meta"],
+    )
+
+
+# ---------------------------------------------------------------------------
+# restore
+# ---------------------------------------------------------------------------
+
+
+def _assign(obj: Any, name: str, value: Any) -> None:
+    current = getattr(obj, name, None)
+    if isinstance(value, dict) and "__rng__" in value:
+        state = value["__rng__"]
+        if isinstance(current, np.random.Generator):
+            current.bit_generator.state = state
+        elif isinstance(current, np.random.RandomState):
+            current.set_state(state)
+        return
+    # Refill existing containers so subclasses such as defaultdict/deque and
+    # references held elsewhere stay intact.
+    if isinstance(value, dict) and isinstance(current, dict):
+        current.clear()
+        current.update(value)
+    elif isinstance(value, list) and isinstance(current, (list, deque)):
+        current.clear()
+        current.extend(value)
+    else:
+        setattr(obj, name, value)
+
+
+def restore_state(engine: Any, checkpoint: Checkpoint, *, restore_rng: bool = True) -> Any:
+    """Overlay the state stored in ``checkpoint`` onto ``engine``."""
+
+    for key, encoded in checkpoint.state.items():
+        *parents, name = key.split(".")
+        target = engine
+        try:
+            for part in parents:
+                target = getattr(target, part)
+        except AttributeError:
+            continue
+        _assign(target, name, _decode(encoded, checkpoint.arrays))
+    if restore_rng and checkpoint.rng:
+        np.random.set_state(_decode(checkpoint.rng["numpy"], checkpoint.arrays))
+        random.setstate(_decode(checkpoint.rng["python"], checkpoint.arrays))
+    return engine
+
+
+def save_checkpoint(engine: Any, path: Path | str, *, compression: str = "none", meta: Optional[Mapping[str, Any]] = None) -> Path:
+    """Synchronously snapshot ``engine`` into ``path``."""
+
+    return write_checkpoint(path, capture_state(engine, meta=meta, copy=False), compression=compression)
+
+
+def restore_checkpoint(engine: Any, path: Path | str, *, restore_rng: bool = True) -> Checkpoint:
+    """Load ``path`` lazily and overlay it onto ``engine``."""
+
+    checkpoint = load_checkpoint(path)
+    restore_state(engine, checkpoint, restore_rng=restore_rng)
+    return checkpoint
+
+
+# ---------------------------------------------------------------------------
+# asynchronous manager
+# ---------------------------------------------------------------------------
+
+
+class CheckpointManager:
+    """Periodic, asynchronous checkpointing into a directory.
+
+    :meth:`save` snapshots the engine on the caller's thread (a memory copy)
+    and hands the disk write to a background thread, so the step loop only
+    stalls when more than ``max_pending`` writes are still in flight.  Files
+    are named ``ckpt-<step>.ckpt`` and only the newest ``keep`` are retained.
+    ``directory`` has no default, so checkpoints never land relative to
+    whatever the working directory happens to be.
+    """
+
+    def __init__(
+        self,
+        directory: Path | str,
+        *,
+        keep: int = 3,
+        compression: str = "none",
+        max_pending: int = 1,
+        asynchronous: bool = True,
+    ) -> None:
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"compression must be one of {COMPRESSIONS}")
+        self.directory = Path(directory)
+        self.keep = max(1, int(keep))
+        self.compression = compression
+        self.max_pending = max(1, int(max_pending))
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ciel-checkpoint") if asynchronous else None
+        self._pending: deque[Future] = deque()
+
+    def path_for(self, step: int) -> Path:
+        return self.directory / f"ckpt-{int(step):010d}.ckpt"
+
+    def checkpoints(self) -> List[Path]:
+        """Return existing checkpoint files ordered by step."""
+
+        if not self.directory.exists():
+            return []
+        found = [(int(m.group(1)), p) for p in self.directory.iterdir() if (m := _FILE_PATTERN.match(p.name))]
+        return [p for _, p in sorted(found)]
+
+    def latest(self) -> Optional[Path]:
+        existing = self.checkpoints()
+        return existing[-1] if existing else None
+
+    def save(self, engine: Any, step: int, *, meta: Optional[Mapping[str, Any]] = None) -> Future | Path:
+        """Checkpoint ``engine`` at ``step``; returns a future when asynchronous."""
+
+        info = dict(meta or {})
+        info["step"] = int(step)
+        snapshot = capture_state(engine, meta=info, copy=self._executor is not None)
+        path = self.path_for(step)
+        if self._executor is None:
+            self._write(path, snapshot)
+            return path
+        while len(self._pending) >= self.max_pending:
+            self._pending.popleft().result()
+        future = self._executor.submit(self._write, path, snapshot)
+        self._pending.append(future)
+        return future
+
+    def _write(self, path: Path, snapshot: CheckpointState) -> Path:
+        write_checkpoint(path, snapshot, compression=self.compression)
+        for stale in self.checkpoints()[: -self.keep]:
+            stale.unlink(missing_ok=True)
+        return path
+
+    def restore(self, engine: Any, path: Path | str | None = None, *, restore_rng: bool = True) -> Optional[Checkpoint]:
+        """Restore ``engine`` from ``path`` or from the newest checkpoint."""
+
+        self.wait()
+        target = Path(path) if path is not None else self.latest()
+        if target is None:
+            return None
+        return restore_checkpoint(engine, target, restore_rng=restore_rng)
+
+    def wait(self) -> None:
+        """Block until every queued write has been committed."""
+
+        while self._pending:
+            self._pending.popleft().result()
+
+    def close(self) -> None:
+        self.wait()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "CheckpointManager":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+__all__ = [
+    "Checkpoint",
+    "CheckpointManager",
+    "CheckpointState",
+    "capture_state",
+    "load_checkpoint",
+    "restore_checkpoint",
+    "restore_state",
+    "save_checkpoint",
+    "write_checkpoint",
+]
@@ -3,12 +3,38 @@
 Copyright (c) 2025 Adrian Lipa / Intention Lab
 Licensed under the CIEL Research Non-Commercial License v1.1.
 
-Simple in-memory representation of persistent clusters.
+Persistent memory clusters grouped by symbol and intent.
+
+Each ``(symbol, intent)`` cluster keeps its tensors as rows of one growable,
+contiguous float32 matrix.  The ``metadata`` and ``table`` mappings stored
+with each entry live in column lists keyed by field name.  A running
+centroid and variance are updated with every batch (Welford/Chan), so they
+cost O(1) to read.  Nearest-neighbour queries are a single matrix-vector
+product over the cluster, and :meth:`PersistentMemory.nearest_clusters`
+compares a query against every centroid at once.
+
+:meth:`PersistentMemory.save` writes each cluster's matrix as an ``.npy``
+file next to a JSON manifest.  Clusters unchanged since they were last saved
+to (or loaded from) the same root are not written again.  :meth:`PersistentMemory.load` memory-maps
+those matrices, so a reloaded store with millions of rows answers queries
+without reading them into RAM first.  Column data is parsed only when an
+entry or column is first requested.
 """
 from __future__ import annotations
 
+import hashlib
+import json
+import os
 from dataclasses import dataclass, field
-from typing import Dict, List, Mapping, MutableMapping, Sequence
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+METRICS = ("cosine", "euclidean")
+
+_MISSING = object()  # marks a column that has no value for an entry
+_BLOCK = 262_144  # rows scored per matrix-vector product
 
 
 @dataclass
@@ -20,11 +46,273 @@ class ClusterEntry:
     table: Mapping[str, object]
 
 
+class _Columns:
+    """Column store for per-entry mappings; absent keys are ``_MISSING``."""
+
+    def __init__(self, columns: Optional[Dict[str, List[Any]]] = None, size: int = 0) -> None:
+        self.columns: Dict[str, List[Any]] = columns if columns is not None else {}
+        self.size = size
+
+    def extend(self, rows: Sequence[Mapping[str, Any]]) -> None:
+        for key in {k for row in rows for k in row}:
+            self.columns.setdefault(key, [_MISSING] * self.size)
+        for key, column in self.columns.items():
+            column.extend(row.get(key, _MISSING) for row in rows)
+        self.size += len(rows)
+
+    def row(self, index: int) -> Dict[str, Any]:
+        return {key: column[index] for key, column in self.columns.items() if column[index] is not _MISSING}
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "size": self.size,
+            "columns": {
+                key: {
+                    "values": [None if v is _MISSING else v for v in column],
+                    "missing": [i for i, v in enumerate(column) if v is _MISSING],
+                }
+                for key, column in self.columns.items()
+            },
+        }
+
+    @classmethod
+    def from_json(cls, doc: Mapping[str, Any]) -> "_Columns":
+        columns = {}
+        for key, spec in doc.get("columns", {}).items():
+            values = list(spec["values"])
+            for i in spec.get("missing", []):
+                values[i] = _MISSING
+            columns[key] = values
+        return cls(columns, int(doc.get("size", 0)))
+
+
+class Cluster:
+    """Entries of one ``(symbol, intent)`` pair backed by a float32 matrix."""
+
+    def __init__(self, symbol: str, intent: str, dim: Optional[int] = None) -> None:
+        self.symbol = symbol
+        self.intent = intent
+        self.dim = dim
+        self._size = 0
+        self._vectors = np.zeros((0, dim or 0), dtype=np.float32)
+        self._norms = np.zeros(0, dtype=np.float32)
+        self._mean = np.zeros(dim or 0)
+        self._m2 = np.zeros(dim or 0)
+        self._metadata: Optional[_Columns] = _Columns()
+        self._table: Optional[_Columns] = _Columns()
+        self._columns_path: Optional[Path] = None
+        self._saved_root: Optional[Path] = None  # root holding this cluster's current files
+
+    # ------------------------------------------------------------ storage
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int) -> ClusterEntry:
+        return self.entry(index)
+
+    def __iter__(self) -> Iterator[ClusterEntry]:
+        return (self.entry(i) for i in range(self._size))
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """``(len, dim)`` view of the stored tensors."""
+
+        return self._vectors[: self._size]
+
+    def _reserve(self, extra: int) -> None:
+        needed = self._size + extra
+        capacity = len(self._vectors)
+        if needed <= capacity and self._vectors.flags.writeable:
+            return
+        capacity = max(needed, 2 * capacity, 1024)
+        vectors = np.zeros((capacity, self.dim), dtype=np.float32)
+        vectors[: self._size] = self._vectors[: self._size]
+        norms = np.zeros(capacity, dtype=np.float32)
+        norms[: self._size] = self._norms[: self._size]
+        self._vectors, self._norms = vectors, norms  # also detaches a memory-mapped matrix
+
+    def _load_columns(self) -> None:
+        if self._metadata is None:
+            doc = json.loads(self._columns_path.read_text(encoding="utf-8"))
+            self._metadata = _Columns.from_json(doc["metadata"])
+            self._table = _Columns.from_json(doc["table"])
+
+    def add_many(
+        self,
+        tensors: Iterable[Sequence[float]] | np.ndarray,
+        metadata: Optional[Sequence[Mapping[str, Any]]] = None,
+        tables: Optional[Sequence[Mapping[str, Any]]] = None,
+    ) -> range:
+        """Append a batch of tensors with their mappings; returns the new row numbers."""
+
+        rows = tensors if isinstance(tensors, np.ndarray) else [np.asarray(t, dtype=np.float32).ravel() for t in tensors]
+        if len(rows) == 0:
+            return range(self._size, self._size)
+        batch = np.array(rows, dtype=np.float32, ndmin=2)
+        count = batch.shape[0]
+        if self.dim is None:
+            self.dim = batch.shape[1]
+            self._vectors = np.zeros((0, self.dim), dtype=np.float32)
+            self._mean, self._m2 = np.zeros(self.dim), np.zeros(self.dim)
+        if batch.shape[1] != self.dim:
+            raise ValueError(f"cluster {self.symbol}/{self.intent} holds {self.dim}-d tensors, got {batch.shape[1]}-d")
+        metadata = list(metadata) if metadata is not None else [{}] * count
+        tables = list(tables) if tables is not None else [{}] * count
+        if len(metadata) != count or len(tables) != count:
+            raise ValueError("metadata and tables must match the number of tensors")
+
+        self._load_columns()
+        self._reserve(count)
+        start, stop = self._size, self._size + count
+        self._vectors[start:stop] = batch
+        self._norms[start:stop] = np.linalg.norm(batch, axis=1)
+        self._metadata.extend(metadata)
+        self._table.extend(tables)
+
+        # Chan et al. merge of the running mean / sum of squared deviations.
+        values = batch.astype(np.float64)
+        batch_mean = values.mean(axis=0)
+        delta = batch_mean - self._mean
+        self._m2 = self._m2 + ((values - batch_mean) ** 2).sum(axis=0) + delta**2 * (start * count / stop)
+        self._mean = self._mean + delta * (count / stop)
+        self._size = stop
+        self._saved_root = None
+        return range(start, stop)
+
+    def add(self, tensor: Sequence[float], metadata: Mapping[str, Any] | None = None, table: Mapping[str, Any] | None = None) -> int:
+        return self.add_many([tensor], [metadata or {}], [table or {}])[0]
+
+    # ------------------------------------------------------------ reads
+    def entry(self, index: int) -> ClusterEntry:
+        if not -self._size <= index < self._size:
+            raise IndexError(f"entry {index} out of range for a cluster of {self._size}")
+        index %= self._size
+        self._load_columns()
+        return ClusterEntry(
+            symbol=self.symbol,
+            intent=self.intent,
+            tensor=self._vectors[index].tolist(),
+            metadata=self._metadata.row(index),
+            table=self._table.row(index),
+        )
+
+    def column(self, name: str, *, table: bool = True) -> np.ndarray:
+        """Values of one ``table`` (or ``metadata``) field as an array; absent values are ``None``."""
+
+        self._load_columns()
+        column = (self._table if table else self._metadata).columns.get(name, [_MISSING] * self._size)
+        return np.array([None if v is _MISSING else v for v in column])
+
+    @property
+    def centroid(self) -> np.ndarray:
+        return self._mean.copy()
+
+    @property
+    def variance(self) -> np.ndarray:
+        """Per-dimension population variance of the stored tensors."""
+
+        return self._m2 / self._size if self._size else np.zeros_like(self._m2)
+
+    def nearest(self, query: Sequence[float], k: int = 5, *, metric: str = "cosine") -> List[Tuple[int, float]]:
+        """``(row, score)`` of the ``k`` entries closest to ``query``, best first.
+
+        ``cosine`` scores are similarities (higher is closer) and
+        ``euclidean`` scores are distances (lower is closer).
+        """
+
+        if metric not in METRICS:
+            raise ValueError(f"unknown metric {metric!r}; expected one of {METRICS}")
+        if self._size == 0 or k <= 0:
+            return []
+        q = np.asarray(query, dtype=np.float32).ravel()
+        if q.size != self.dim:
+            raise ValueError(f"query has {q.size} dimensions, cluster holds {self.dim}")
+        dots = np.empty(self._size, dtype=np.float32)
+        for start in range(0, self._size, _BLOCK):
+            stop = min(start + _BLOCK, self._size)
+            dots[start:stop] = self._vectors[start:stop] @ q
+        norms = self._norms[: self._size]
+        if metric == "cosine":
+            denom = norms * np.float32(np.linalg.norm(q))
+            scores = np.divide(dots, denom, out=np.zeros_like(dots), where=denom > 0)
+            order = -scores
+        else:
+            scores = np.sqrt(np.maximum(norms * norms - 2.0 * dots + np.float32(q @ q), 0.0))
+            order = scores
+        top = np.argpartition(order, k - 1)[:k] if self._size > k else np.arange(self._size)
+        top = top[np.argsort(order[top], kind="stable")]
+        return [(int(i), float(scores[i])) for i in top]
+
+    def centroid_distances(self) -> np.ndarray:
+        """Euclidean distance of every entry from the centroid."""
+
+        return np.linalg.norm(self.vectors - self._mean.astype(np.float32), axis=1)
+
+    # ------------------------------------------------------------ persistence
+    def _spec(self, stem: str) -> Dict[str, Any]:
+        return {"symbol": self.symbol, "intent": self.intent, "stem": stem, "dim": self.dim, "size": self._size,
+                "mean": self._mean.tolist(), "m2": self._m2.tolist()}
+
+    def _save(self, root: Path, stem: str) -> Dict[str, Any]:
+        if self._saved_root == root.resolve():
+            return self._spec(stem)
+        self._load_columns()
+        _atomic_npy(root / f"{stem}.npy", self.vectors)
+        _atomic_npy(root / f"{stem}.norms.npy", self._norms[: self._size])
+        columns = {"metadata": self._metadata.to_json(), "table": self._table.to_json()}
+        tmp = root / f"{stem}.json.tmp"
+        tmp.write_text(json.dumps(columns, ensure_ascii=False, default=str), encoding="utf-8")
+        os.replace(tmp, root / f"{stem}.json")
+        self._saved_root = root.resolve()
+        return self._spec(stem)
+
+    @classmethod
+    def _load(cls, root: Path, spec: Mapping[str, Any], mmap: bool = True) -> "Cluster":
+        cluster = cls(spec["symbol"], spec["intent"], spec["dim"])
+        vectors = np.load(root / f"{spec['stem']}.npy", mmap_mode="r" if mmap else None)
+        cluster._vectors = vectors
+        cluster._size = int(spec["size"])
+        cluster._norms = np.load(root / f"{spec['stem']}.norms.npy", mmap_mode="r" if mmap else None)
+        cluster._mean = np.asarray(spec["mean"], dtype=float)
+        cluster._m2 = np.asarray(spec["m2"], dtype=float)
+        cluster._metadata = cluster._table = None
+        cluster._columns_path = root / f"{spec['stem']}.json"
+        cluster._saved_root = root.resolve()
+        return cluster
+
+
+def _stem(symbol: str, intent: str) -> str:
+    """File stem derived from the cluster key, so it survives re-ordering between saves."""
+
+    key = json.dumps([symbol, intent], ensure_ascii=False).encode("utf-8")
+    return "cluster-" + hashlib.sha1(key).hexdigest()[:16]
+
+
+def _atomic_npy(path: Path, array: np.ndarray) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("wb") as fh:
+        np.save(fh, np.ascontiguousarray(array))
+    os.replace(tmp, path)
+
+
 @dataclass
 class PersistentMemory:
-    """Stores entries grouped by symbol/intent in plain Python structures."""
+    """Stores entries grouped by symbol/intent in array-backed clusters."""
+
+    clusters: MutableMapping[str, MutableMapping[str, Cluster]] = field(default_factory=dict)
 
-    clusters: MutableMapping[str, MutableMapping[str, List[ClusterEntry]]] = field(default_factory=dict)
+    def cluster(self, symbol: str, intent: str) -> Cluster:
+        """The cluster for ``symbol``/``intent``, created empty if needed."""
+
+        intents = self.clusters.setdefault(symbol, {})
+        found = intents.get(intent)
+        if found is None:
+            found = intents[intent] = Cluster(symbol, intent)
+        return found
+
+    def iter_clusters(self) -> Iterator[Cluster]:
+        for intents in self.clusters.values():
+            yield from intents.values()
 
     def store(
         self,
@@ -34,17 +322,85 @@ class PersistentMemory:
         metadata: Mapping[str, object] | None = None,
         table: Mapping[str, object] | None = None,
     ) -> Dict[str, object]:
-        metadata = metadata or {}
-        table = table or {}
-        symbol_map = self.clusters.setdefault(symbol, {})
-        intent_entries = symbol_map.setdefault(intent, [])
-        entry = ClusterEntry(symbol=symbol, intent=intent, tensor=list(tensor), metadata=metadata, table=table)
-        intent_entries.append(entry)
+        cluster = self.cluster(symbol, intent)
+        cluster.add(tensor, metadata, table)
         return {
             "symbol": symbol,
             "intent": intent,
-            "count": len(intent_entries),
+            "count": len(cluster),
         }
 
+    def store_many(
+        self,
+        symbol: str,
+        intent: str,
+        tensors: Iterable[Sequence[float]] | np.ndarray,
+        metadata: Optional[Sequence[Mapping[str, object]]] = None,
+        tables: Optional[Sequence[Mapping[str, object]]] = None,
+    ) -> Dict[str, object]:
+        cluster = self.cluster(symbol, intent)
+        added = cluster.add_many(tensors, metadata, tables)
+        return {"symbol": symbol, "intent": intent, "count": len(cluster), "added": len(added)}
+
+    # ------------------------------------------------------------ queries
+    def nearest(
+        self, symbol: str, intent: str, query: Sequence[float], k: int = 5, *, metric: str = "cosine"
+    ) -> List[Tuple[ClusterEntry, float]]:
+        """Nearest entries to ``query`` within one cluster, best first."""
+
+        cluster = self.clusters.get(symbol, {}).get(intent)
+        if cluster is None:
+            return []
+        return [(cluster.entry(row), score) for row, score in cluster.nearest(query, k, metric=metric)]
+
+    def nearest_clusters(self, query: Sequence[float], k: int = 5, *, metric: str = "cosine") -> List[Tuple[str, str, float]]:
+        """``(symbol, intent, score)`` of the ``k`` clusters whose centroid is closest to ``query``.
+
+        Only clusters with the query's dimensionality take part.
+        """
+
+        q = np.asarray(query, dtype=float).ravel()
+        candidates = [c for c in self.iter_clusters() if len(c) and c.dim == q.size]
+        if not candidates or k <= 0:
+            return []
+        index = Cluster("", "", q.size)
+        index.add_many(np.stack([c.centroid for c in candidates]))
+        return [(candidates[row].symbol, candidates[row].intent, score) for row, score in index.nearest(q, k, metric=metric)]
+
+    # ------------------------------------------------------------ persistence
+    def save(self, root: Path | str) -> Path:
+        """Write the clusters changed since their last save to ``root``; the manifest is replaced last."""
+
+        root = Path(root)
+        root.mkdir(parents=True, exist_ok=True)
+        clusters = list(self.iter_clusters())
+        # Loaded clusters read their columns lazily from files under the old
+        # root, which may be this one; pull them in before anything is replaced.
+        for cluster in clusters:
+            if cluster._saved_root != root.resolve():
+                cluster._load_columns()
+        specs = [cluster._save(root, _stem(cluster.symbol, cluster.intent)) for cluster in clusters]
+        manifest = root / "clusters.json"
+        tmp = manifest.with_name(manifest.name + ".tmp")
+        tmp.write_text(json.dumps({"version": 1, "clusters": specs}, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, manifest)
+        current = {spec["stem"] for spec in specs}
+        for stale in root.glob("cluster-*"):
+            if stale.name.split(".")[0] not in current:
+                stale.unlink()
+        return manifest
+
+    @classmethod
+    def load(cls, root: Path | str, *, mmap: bool = True) -> "PersistentMemory":
+        """Reopen a store written by :meth:`save`; matrices are memory-mapped unless ``mmap`` is false."""
+
+        root = Path(root)
+        memory = cls()
+        manifest = json.loads((root / "clusters.json").read_text(encoding="utf-8"))
+        for spec in manifest["clusters"]:
+            cluster = Cluster._load(root, spec, mmap=mmap)
+            memory.clusters.setdefault(cluster.symbol, {})[cluster.intent] = cluster
+        return memory
+
 
-__all__ = ["PersistentMemory", "ClusterEntry"]
+__all__ = ["METRICS", "Cluster", "ClusterEntry", "PersistentMemory"]
@@ -3,39 +3,21 @@
 Copyright (c) 2025 Adrian Lipa / Intention Lab
 Licensed under the CIEL Research Non-Commercial License v1.1.
 
-Minimal stand-in for the vendor HDF5 store.
+Vector store used by the repo orchestrator.
+
+``H5Store`` keeps its historical name and ``append(symbol, intent, tensor)``
+signature.  It no longer writes one JSON ``.h5`` document per vector.  It is
+now the packed :class:`~persistent.vector_store.VectorStore`, and ``append``
+returns the new vector's id.  Directories written by the old implementation
+can be imported with ``python -m persistent.vector_store migrate``.
 """
 from __future__ import annotations
 
-import json
-import uuid
-from pathlib import Path
-from typing import Iterable, Sequence
-
-
-class H5Store:
-    """Persist vectors inside simple ``.h5`` JSON files.
-
-    The implementation purposely avoids pulling heavy dependencies such as
-    ``h5py`` while still exercising the filesystem interactions expected by the
-    tests.  Each call to :meth:`append` creates a new ``.h5`` file containing a
-    JSON payload with the stored vectors.
-    """
-
-    def __init__(self, root: Path | str = Path("data/waves")) -> None:
-        self.root = Path(root)
-        self.root.mkdir(parents=True, exist_ok=True)
-
-    def append(self, symbol: str, intent: str, tensor: Sequence[float] | Iterable[float]) -> str:
-        file_name = f"{symbol}_{intent}_{uuid.uuid4().hex}.h5"
-        path = self.root / file_name
-        data = {
-            "symbol": symbol,
-            "intent": intent,
-            "tensor": list(tensor),
-        }
-        path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
-        return str(path)
+from .vector_store import VectorStore
+
+
+class H5Store(VectorStore):
+    """Packed vector store rooted at ``data/waves`` by default."""
 
 
 __all__ = ["H5Store"]
@@ -0,0 +1,393 @@
+"""CIEL/Ω Quantum Consciousness Suite
+
+Copyright (c) 2025 Adrian Lipa / Intention Lab
+Licensed under the CIEL Research Non-Commercial License v1.1.
+
+Packed, append-only vector store.
+
+Vectors are packed back to back as little-endian float64 into segment files
+``vectors-NNNNNN.seg``.  A new segment starts once the current one reaches
+``segment_bytes``.  Each vector gets one fixed-width record in ``index.bin``
+holding its segment, element offset, length and label codes.  Symbol and
+intent strings are interned in ``labels.json``.  A vector's id is its
+position in the index.
+
+A batch append makes one write per touched segment and one index write.  The
+index is written last, so a crash mid-append leaves at most unindexed bytes
+at the end of the active segment.  Appends hold an exclusive ``flock`` on
+``.lock`` and, inside it, first pick up whatever other instances or
+processes appended and trim any crash remnants, so several stores can share
+one root.
+
+Reads memory-map the segments.  Random access by id is an index lookup plus
+a slice, and :meth:`VectorStore.scan` streams each segment sequentially.
+
+The module can also be run as a tool.  It imports the legacy
+one-JSON-document-per-vector ``.h5`` directories written by earlier
+``H5Store`` versions::
+
+    python -m persistent.vector_store migrate data/waves data/waves
+
+Imported files are listed in the store's ``migrated.json``, so rerunning a
+migration skips them.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:  # POSIX advisory locks; elsewhere appends are only safe from a single writer
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+VALUE_DTYPE = np.dtype("<f8")
+INDEX_DTYPE = np.dtype(
+    [("segment", "<u4"), ("symbol", "<u4"), ("intent", "<u4"), ("length", "<u4"), ("offset", "<u8")]
+)
+DEFAULT_SEGMENT_BYTES = 64 * 1024 * 1024
+LEGACY_SUFFIX = ".h5"
+MIGRATED_FILE = "migrated.json"
+
+Entry = Tuple[str, str, Sequence[float]]
+
+
+class VectorStore:
+    """Append-only store of labelled float vectors packed into segment files."""
+
+    def __init__(self, root: Path | str = Path("data/waves"), *, segment_bytes: int = DEFAULT_SEGMENT_BYTES) -> None:
+        if segment_bytes < VALUE_DTYPE.itemsize:
+            raise ValueError("segment_bytes must hold at least one value")
+        self.root = Path(root)
+        self.segment_bytes = int(segment_bytes)
+        self._records = np.zeros(0, dtype=INDEX_DTYPE)
+        self._index = self._records
+        self._labels: List[str] = []
+        self._codes: Dict[str, int] = {}
+        self._maps: Dict[int, np.memmap] = {}
+        self._active = self._end = 0
+        self.refresh()
+
+    # ------------------------------------------------------------ layout
+    @property
+    def index_path(self) -> Path:
+        return self.root / "index.bin"
+
+    @property
+    def labels_path(self) -> Path:
+        return self.root / "labels.json"
+
+    def segment_path(self, segment: int) -> Path:
+        return self.root / f"vectors-{segment:06d}.seg"
+
+    @property
+    def lock_path(self) -> Path:
+        return self.root / ".lock"
+
+    def refresh(self) -> int:
+        """Pick up vectors appended by other instances since the last look; returns how many."""
+
+        known = self._index.nbytes
+        try:
+            with self.index_path.open("rb") as fh:
+                fh.seek(known)
+                raw = fh.read()
+        except FileNotFoundError:
+            raw = b""
+        whole = len(raw) - len(raw) % INDEX_DTYPE.itemsize  # a record still being written is left for later
+        if whole:
+            self._push(np.frombuffer(raw[:whole], dtype=INDEX_DTYPE))
+            if self.labels_path.exists():
+                self._labels = list(json.loads(self.labels_path.read_text(encoding="utf-8")))
+                self._codes = {label: code for code, label in enumerate(self._labels)}
+        return whole // INDEX_DTYPE.itemsize
+
+    def _push(self, records: np.ndarray) -> None:
+        start, stop = len(self), len(self) + records.size
+        if stop > self._records.size:  # grow geometrically so single appends stay amortised O(1)
+            grown = np.zeros(max(stop, 2 * self._records.size, 1024), dtype=INDEX_DTYPE)
+            grown[:start] = self._index
+            self._records = grown
+        self._records[start:stop] = records
+        self._index = self._records[:stop]
+        for segment in np.unique(records["segment"]).tolist():
+            self._maps.pop(segment, None)  # the mapping may predate the new bytes
+        last = records[-1]
+        self._active, self._end = int(last["segment"]), int(last["offset"] + last["length"])
+
+    def _trim(self) -> None:
+        """Cut whatever an interrupted append wrote past the end of the index.
+
+        Only called with the write lock held, after :meth:`refresh`, so any
+        unindexed bytes belong to a writer that died mid-append.
+        """
+
+        if self.index_path.exists() and self.index_path.stat().st_size != self._index.nbytes:
+            with self.index_path.open("r+b") as fh:
+                fh.truncate(self._index.nbytes)
+        path = self.segment_path(self._active)
+        if path.exists() and path.stat().st_size > self._end * VALUE_DTYPE.itemsize:
+            with path.open("r+b") as fh:
+                fh.truncate(self._end * VALUE_DTYPE.itemsize)
+        for path in self.root.glob("vectors-*.seg"):
+            if int(path.stem.split("-")[1]) > self._active:
+                path.unlink()
+
+    # ------------------------------------------------------------ writes
+    def _code(self, label: str) -> int:
+        code = self._codes.get(label)
+        if code is None:
+            code = self._codes[label] = len(self._labels)
+            self._labels.append(label)
+        return code
+
+    def _save_labels(self) -> None:
+        tmp = self.labels_path.with_name(self.labels_path.name + ".tmp")
+        tmp.write_text(json.dumps(self._labels, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, self.labels_path)
+
+    def append(self, symbol: str, intent: str, tensor: Sequence[float] | Iterable[float]) -> int:
+        """Store one vector and return its id."""
+
+        return self.append_many([(symbol, intent, tensor)])[0]
+
+    def append_many(self, entries: Iterable[Entry]) -> range:
+        """Store ``(symbol, intent, tensor)`` entries in one batch; returns their ids."""
+
+        entries = list(entries)
+        if not entries:
+            return range(len(self), len(self))
+        vectors = [np.asarray(tensor if isinstance(tensor, np.ndarray) else list(tensor), dtype=VALUE_DTYPE).ravel()
+                   for _, _, tensor in entries]
+        self.root.mkdir(parents=True, exist_ok=True)
+        with self.lock_path.open("a") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                self.refresh()
+                self._trim()
+                return self._append_locked(entries, vectors)
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _append_locked(self, entries: List[Entry], vectors: List[np.ndarray]) -> range:
+        label_count = len(self._labels)
+        records = np.zeros(len(entries), dtype=INDEX_DTYPE)
+        records["symbol"] = [self._code(str(symbol)) for symbol, _, _ in entries]
+        records["intent"] = [self._code(str(intent)) for _, intent, _ in entries]
+        records["length"] = [vec.size for vec in vectors]
+
+        capacity = self.segment_bytes // VALUE_DTYPE.itemsize
+        segment, end = self._active, self._end
+        segments, offsets = [], []
+        pending: Dict[int, List[np.ndarray]] = {}
+        for vec in vectors:
+            if end and end + vec.size > capacity:
+                segment, end = segment + 1, 0
+            segments.append(segment)
+            offsets.append(end)
+            pending.setdefault(segment, []).append(vec)
+            end += vec.size
+        records["segment"] = segments
+        records["offset"] = offsets
+
+        for seg, chunk in pending.items():
+            with self.segment_path(seg).open("ab") as fh:
+                fh.write(np.concatenate(chunk).tobytes())
+            self._maps.pop(seg, None)
+        if len(self._labels) != label_count or not self.labels_path.exists():
+            self._save_labels()
+        with self.index_path.open("ab") as fh:
+            fh.write(records.tobytes())
+        start = len(self)
+        self._push(records)
+        return range(start, len(self))
+
+    def close(self) -> None:
+        """Drop the memory maps (the store stays usable and remaps on demand)."""
+
+        self._maps.clear()
+
+    # ------------------------------------------------------------ reads
+    def __len__(self) -> int:
+        return int(self._index.size)
+
+    def _segment(self, segment: int) -> np.ndarray:
+        mapped = self._maps.get(segment)
+        if mapped is None:
+            path = self.segment_path(segment)
+            if not path.exists() or path.stat().st_size == 0:
+                return np.zeros(0, dtype=VALUE_DTYPE)
+            mapped = self._maps[segment] = np.memmap(path, dtype=VALUE_DTYPE, mode="r")
+        return mapped
+
+    def get(self, vector_id: int) -> np.ndarray:
+        """Read-only view of vector ``vector_id`` straight out of its memory-mapped segment."""
+
+        if not -len(self) <= vector_id < len(self):
+            self.refresh()  # possibly appended by another instance
+            if not -len(self) <= vector_id < len(self):
+                raise IndexError(f"vector id {vector_id} out of range for a store of {len(self)}")
+        record = self._index[vector_id]
+        start = int(record["offset"])
+        return self._segment(int(record["segment"]))[start : start + int(record["length"])]
+
+    __getitem__ = get
+
+    @property
+    def labels(self) -> Tuple[str, ...]:
+        """Every symbol and intent seen so far."""
+
+        return tuple(self._labels)
+
+    def label(self, vector_id: int) -> Tuple[str, str]:
+        record = self._index[vector_id]
+        return self._labels[int(record["symbol"])], self._labels[int(record["intent"])]
+
+    def ids(self, symbol: Optional[str] = None, intent: Optional[str] = None) -> np.ndarray:
+        """Ids of the vectors stored under ``symbol``/``intent`` (``None`` matches anything)."""
+
+        mask = np.ones(len(self), dtype=bool)
+        for name, value in (("symbol", symbol), ("intent", intent)):
+            if value is not None:
+                code = self._codes.get(value)
+                if code is None:
+                    return np.zeros(0, dtype=np.int64)
+                mask &= self._index[name] == code
+        return np.flatnonzero(mask)
+
+    def scan(self, symbol: Optional[str] = None, intent: Optional[str] = None) -> Iterator[Tuple[int, str, str, np.ndarray]]:
+        """Yield ``(id, symbol, intent, vector)`` in storage order, one segment at a time."""
+
+        ids = self.ids(symbol, intent)
+        records = self._index[ids]
+        for segment in np.unique(records["segment"]):
+            data = self._segment(int(segment))
+            chosen = records["segment"] == segment
+            rows = records[chosen]
+            columns = (ids[chosen].tolist(), rows["symbol"].tolist(), rows["intent"].tolist(),
+                       rows["offset"].tolist(), (rows["offset"] + rows["length"]).tolist())
+            for vector_id, symbol_code, intent_code, start, stop in zip(*columns):
+                yield vector_id, self._labels[symbol_code], self._labels[intent_code], data[start:stop]
+
+    def matrix(self, symbol: Optional[str] = None, intent: Optional[str] = None) -> np.ndarray:
+        """Stack the selected vectors into an ``(n, length)`` array (they must share a length)."""
+
+        ids = self.ids(symbol, intent)
+        lengths = np.unique(self._index["length"][ids])
+        if lengths.size > 1:
+            raise ValueError(f"vectors have different lengths: {lengths.tolist()}")
+        width = int(lengths[0]) if lengths.size else 0
+        out = np.empty((ids.size, width), dtype=VALUE_DTYPE)
+        records = self._index[ids]
+        columns = np.arange(width, dtype=np.int64)
+        for segment in np.unique(records["segment"]):
+            chosen = records["segment"] == segment
+            offsets = records["offset"][chosen].astype(np.int64)
+            out[chosen] = self._segment(int(segment))[offsets[:, None] + columns]
+        return out
+
+
+# ---------------------------------------------------------------------------
+# migration from the legacy per-file layout
+# ---------------------------------------------------------------------------
+
+
+def iter_legacy_files(source: Path | str) -> Iterator[Tuple[Path, Entry]]:
+    """``(path, (symbol, intent, tensor))`` for each legacy JSON ``.h5`` file, oldest first."""
+
+    files = sorted(Path(source).glob(f"*{LEGACY_SUFFIX}"), key=lambda p: (p.stat().st_mtime_ns, p.name))
+    for path in files:
+        try:
+            doc = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, UnicodeDecodeError, ValueError):
+            continue  # a real HDF5 file or a damaged document: not ours to import
+        if isinstance(doc, dict) and "tensor" in doc:
+            yield path, (str(doc.get("symbol", "")), str(doc.get("intent", "")), doc["tensor"])
+
+
+def migrate_legacy_files(
+    source: Path | str, store: VectorStore, *, batch_size: int = 4096, remove: bool = False
+) -> Dict[str, Any]:
+    """Import every legacy per-vector file under ``source`` into ``store``.
+
+    Files are appended in batches of ``batch_size``.  After each batch the
+    files' paths are added to the store's ``migrated.json``, and files listed
+    there are skipped, so an interrupted or repeated migration does not
+    duplicate vectors.  With ``remove`` each batch's files are deleted once
+    that batch has been recorded.
+    """
+
+    ledger = store.root / MIGRATED_FILE
+    try:
+        migrated = set(json.loads(ledger.read_text(encoding="utf-8")))
+    except FileNotFoundError:
+        migrated = set()
+    imported, skipped, first = 0, 0, len(store)
+    batch: List[Tuple[Path, Entry]] = []
+
+    def flush() -> None:
+        nonlocal imported
+        store.append_many(entry for _, entry in batch)
+        imported += len(batch)
+        migrated.update(str(path.resolve()) for path, _ in batch)
+        tmp = ledger.with_name(ledger.name + ".tmp")
+        tmp.write_text(json.dumps(sorted(migrated), ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, ledger)
+        if remove:
+            for path, _ in batch:
+                path.unlink()
+        batch.clear()
+
+    for item in iter_legacy_files(source):
+        if str(item[0].resolve()) in migrated:
+            skipped += 1
+            continue
+        batch.append(item)
+        if len(batch) >= batch_size:
+            flush()
+    if batch:
+        flush()
+    return {"imported": imported, "skipped": skipped, "first_id": first, "store": str(store.root), "removed": bool(remove)}
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m persistent.vector_store", description="Packed vector store tools")
+    sub = parser.add_subparsers(dest="command", required=True)
+    migrate = sub.add_parser("migrate", help="import a legacy per-file .h5 directory (files already imported are skipped)")
+    migrate.add_argument("source", type=Path)
+    migrate.add_argument("destination", type=Path)
+    migrate.add_argument("--batch-size", type=int, default=4096)
+    migrate.add_argument("--remove", action="store_true", help="delete legacy files once imported")
+    info = sub.add_parser("info", help="summarise a packed store")
+    info.add_argument("root", type=Path)
+    args = parser.parse_args(argv)
+
+    if args.command == "migrate":
+        result = migrate_legacy_files(args.source, VectorStore(args.destination), batch_size=args.batch_size, remove=args.remove)
+    else:
+        store = VectorStore(args.root)
+        segments = sorted(store.root.glob("vectors-*.seg"))
+        result = {"vectors": len(store), "labels": len(store.labels), "segments": len(segments),
+                  "bytes": sum(p.stat().st_size for p in segments)}
+    print(json.dumps(result, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    raise SystemExit(main())
+
+
+__all__ = [
+    "DEFAULT_SEGMENT_BYTES",
+    "INDEX_DTYPE",
+    "VectorStore",
+    "iter_legacy_files",
+    "migrate_legacy_files",
+]
@@ -4,6 +4,17 @@ Copyright (c) 2025 Adrian Lipa / Intention Lab
 Licensed under the CIEL Research Non-Commercial License v1.1.
 
 Tensor container aggregating resonance amplitudes.
+
+The tensor is stored as ``scale * raw``.  Exponential decay only multiplies
+``scale``, and new outer products are added to ``raw`` divided by ``scale``.
+The full matrix is therefore touched once per update, never once per decay.
+The squared Frobenius norm is kept up to date in closed form:
+
+    ||d A + M||^2 = d^2 ||A||^2 + 2 d <A, M> + ||M||^2
+
+so reading :attr:`MultiresonanceTensor.norm` costs O(1).
+:meth:`MultiresonanceTensor.normalised` caches its result until the next
+update.
 """
 
 from __future__ import annotations
@@ -13,25 +24,154 @@ from typing import Iterable
 
 import numpy as np
 
+# Below this ``scale`` is folded back into ``raw`` to keep ``raw`` finite.
+_MIN_SCALE = 1e-100
+
 
 @dataclass(slots=True)
 class MultiresonanceTensor:
     channels: int = 12
-    tensor: np.ndarray = field(init=False, repr=False)
+    decay: float = 1.0
+    _raw: np.ndarray = field(init=False, repr=False)
+    _scale: float = field(init=False, repr=False, default=1.0)
+    _sq_norm: float | None = field(init=False, repr=False, default=0.0)
+    _normalised: np.ndarray | None = field(init=False, repr=False, default=None)
 
     def __post_init__(self) -> None:
-        self.tensor = np.zeros((self.channels, self.channels), dtype=float)
+        if not 0.0 < self.decay <= 1.0:
+            raise ValueError("decay must lie in (0, 1]")
+        self._raw = np.zeros((self.channels, self.channels), dtype=float)
 
-    def accumulate(self, samples: Iterable[float]) -> None:
-        vec = np.fromiter(samples, dtype=float, count=self.channels)
+    # ------------------------------------------------------------------ state
+    @property
+    def tensor(self) -> np.ndarray:
+        """The accumulated matrix.
+
+        The array is writable so that callers can update it in place.  For
+        that reason the cached norm is invalidated and recomputed on the next
+        read.
+        """
+
+        self._fold()
+        self._sq_norm = None
+        self._normalised = None
+        return self._raw
+
+    @tensor.setter
+    def tensor(self, value: np.ndarray) -> None:
+        value = np.array(value, dtype=float)
+        if value.shape != (self.channels, self.channels):
+            raise ValueError(f"expected a {self.channels}x{self.channels} matrix, got shape {value.shape}")
+        self._raw, self._scale = value, 1.0
+        self._sq_norm = None
+        self._normalised = None
+
+    @property
+    def norm(self) -> float:
+        """Frobenius norm of :attr:`tensor`."""
+
+        if self._sq_norm is None:
+            self.refresh_norm()
+        return float(np.sqrt(self._sq_norm))
+
+    @property
+    def coefficient(self) -> float:
+        """Factor turning :meth:`view` into :meth:`normalised`."""
+
+        return self._scale / (self.norm or 1.0)
+
+    def view(self) -> np.ndarray:
+        """Read-only view of the unscaled storage.
+
+        ``coefficient * view()`` equals :meth:`normalised` without allocating
+        a new matrix.
+        """
+
+        out = self._raw.view()
+        out.flags.writeable = False
+        return out
+
+    def refresh_norm(self) -> float:
+        """Recompute the norm from the matrix, discarding accumulated rounding error."""
+
+        self._sq_norm = float(np.vdot(self._raw, self._raw)) * self._scale**2
+        return float(np.sqrt(self._sq_norm))
+
+    def _fold(self) -> None:
+        if self._scale != 1.0:
+            self._raw *= self._scale
+            self._scale = 1.0
+
+    def as_vector(self, samples: Iterable[float]) -> np.ndarray:
+        """``samples`` as a float vector of length ``channels`` (zero padded or truncated)."""
+
+        if isinstance(samples, np.ndarray):
+            vec = np.asarray(samples, dtype=float).reshape(-1)
+        else:
+            vec = np.fromiter(samples, dtype=float)
         if vec.size < self.channels:
-            vec = np.pad(vec, (0, self.channels - vec.size))
-        outer = np.outer(vec, vec)
-        self.tensor += outer
+            return np.pad(vec, (0, self.channels - vec.size))
+        return vec[: self.channels]
+
+    def _add(self, update: np.ndarray, decay: float) -> None:
+        """Set ``tensor = decay * tensor + update`` and update the norm in closed form."""
+
+        if self._sq_norm is None:
+            self.refresh_norm()
+        cross = float(np.vdot(self._raw, update)) * self._scale
+        self._sq_norm = max(0.0, decay * decay * self._sq_norm + 2.0 * decay * cross + float(np.vdot(update, update)))
+        self._scale *= decay
+        if self._scale < _MIN_SCALE:
+            self._fold()
+        if self._scale != 1.0:
+            np.divide(update, self._scale, out=update)
+        self._raw += update
+        self._normalised = None
+
+    # ---------------------------------------------------------------- updates
+    def accumulate(self, samples: Iterable[float]) -> None:
+        """Decay the tensor and add the outer product of ``samples`` with itself."""
+
+        vec = self.as_vector(samples)
+        self._add(np.outer(vec, vec), self.decay)
+
+    def accumulate_many(self, samples: Iterable[Iterable[float]] | np.ndarray) -> None:
+        """Same as calling :meth:`accumulate` for every row of ``samples``.
+
+        The decayed outer products are summed with a single matrix product.
+        """
+
+        if isinstance(samples, np.ndarray):
+            rows = np.atleast_2d(np.asarray(samples, dtype=float))
+        else:
+            rows = np.array([self.as_vector(s) for s in samples], dtype=float)
+        if rows.size == 0:
+            return
+        if rows.shape[1] != self.channels:
+            rows = np.array([self.as_vector(row) for row in rows])
+        count = rows.shape[0]
+        weights = self.decay ** np.arange(count - 1, -1, -1, dtype=float)
+        self._add((rows * weights[:, None]).T @ rows, self.decay**count)
+
+    def add_outer(self, left: Iterable[float], right: Iterable[float], weight: float = 1.0) -> None:
+        """Add ``weight * outer(left, right)`` without applying decay."""
+
+        self._add(weight * np.outer(self.as_vector(left), self.as_vector(right)), 1.0)
+
+    # ------------------------------------------------------------------ reads
+    def dot(self, vector: np.ndarray, *, normalised: bool = False) -> np.ndarray:
+        """``tensor @ vector`` (or ``normalised() @ vector``) without materialising the matrix."""
+
+        return (self.coefficient if normalised else self._scale) * (self._raw @ vector)
 
     def normalised(self) -> np.ndarray:
-        norm = np.linalg.norm(self.tensor) or 1.0
-        return self.tensor / norm
+        """Tensor divided by its Frobenius norm (read-only, cached until the next update)."""
+
+        if self._normalised is None:
+            out = self._raw * self.coefficient
+            out.flags.writeable = False
+            self._normalised = out
+        return self._normalised
 
 
 __all__ = ["MultiresonanceTensor"]
@@ -20,7 +20,7 @@ class ResonanceOperator:
     tensor: MultiresonanceTensor
 
     def apply(self, vector: np.ndarray) -> np.ndarray:
-        return self.tensor.normalised() @ vector
+        return self.tensor.dot(vector, normalised=True)
 
 
 __all__ = ["ResonanceOperator"]
@@ -11,8 +11,6 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Iterable
 
-import numpy as np
-
 from .multiresonance_tensor import MultiresonanceTensor
 
 
@@ -22,11 +20,9 @@ class ResonanceOptimizer:
     lr: float = 0.1
 
     def step(self, target: Iterable[float]) -> None:
-        vec = np.fromiter(target, dtype=float, count=self.tensor.channels)
-        if vec.size < self.tensor.channels:
-            vec = np.pad(vec, (0, self.tensor.channels - vec.size))
-        grad = self.tensor.tensor @ vec
-        self.tensor.tensor += self.lr * np.outer(vec, grad)
+        vec = self.tensor.as_vector(target)
+        grad = self.tensor.dot(vec)
+        self.tensor.add_outer(vec, grad, self.lr)
 
 
 __all__ = ["ResonanceOptimizer"]
@@ -4,16 +4,25 @@ Copyright (c) 2025 Adrian Lipa / Intention Lab
 Licensed under the CIEL Research Non-Commercial License v1.1.
 
 Parallel resonance simulation.
+
+Node fields are kept in a single ``(nodes, *shape)`` stack and every node
+exposes a view into it, so drift, sigma saturation and empathy run as
+broadcast operations over the whole network.  With ``workers > 0`` the stack
+lives in shared memory and node groups are stepped by a process pool.
 """
 
 from __future__ import annotations
 
+import multiprocessing
+import weakref
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Dict, Any
+from multiprocessing import shared_memory
+from typing import List, Dict, Any, Optional, Tuple
 
 import numpy as np
 
-from evolution.omega_drift import OmegaDriftCore
+from evolution.omega_drift import OmegaDriftCore, drift_stacked
 from evolution.schumann_clock import SchumannClock
 from mathematics.safe_operations import heisenberg_soft_clip_range
 
@@ -25,27 +34,213 @@ class ResonanceNode:
     sigma: float
 
 
+def _node_axes(stack: np.ndarray) -> Tuple[int, ...]:
+    return tuple(range(1, stack.ndim))
+
+
+def _saturate_sigma(psi: np.ndarray) -> np.ndarray:
+    return heisenberg_soft_clip_range(np.mean(np.abs(psi) ** 2, axis=_node_axes(psi)), 0.0, 1.2)
+
+
+def _empathy_terms(base: np.ndarray, others: np.ndarray) -> np.ndarray:
+    return np.exp(-np.mean(np.abs(others - base), axis=_node_axes(others)))
+
+
+# ---------------------------------------------------------------------------
+# shared-memory shards
+# ---------------------------------------------------------------------------
+
+
+def _attach(spec: Tuple[str, Tuple[int, ...], str]) -> Tuple[shared_memory.SharedMemory, np.ndarray]:
+    name, shape, dtype = spec
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+
+
+def _shard_drift(psi_spec, sigma_spec, lo: int, hi: int, carrier: complex, gain: float, renorm: bool) -> None:
+    psi_shm, psi = _attach(psi_spec)
+    sigma_shm, sigma = _attach(sigma_spec)
+    try:
+        block = psi[lo:hi]
+        drift_stacked(block, sigma[lo:hi], carrier, gain, renorm)
+        sigma[lo:hi] = _saturate_sigma(block)
+    finally:
+        del psi, sigma, block
+        psi_shm.close()
+        sigma_shm.close()
+
+
+def _shard_empathy(psi_spec, lo: int, hi: int) -> float:
+    psi_shm, psi = _attach(psi_spec)
+    try:
+        return float(np.sum(_empathy_terms(psi[0], psi[max(lo, 1):hi])))
+    finally:
+        del psi
+        psi_shm.close()
+
+
+def _release(pool: ProcessPoolExecutor, segments: Tuple[shared_memory.SharedMemory, ...]) -> None:
+    pool.shutdown(wait=True)
+    for shm in segments:
+        try:
+            shm.close()
+        except BufferError:
+            pass  # node views still map the segment; the mapping goes with them
+        shm.unlink()
+
+
+class _SharedStack:
+    """Shared-memory backing for the node stack and its sigma vector.
+
+    The pool and both segments are released by :meth:`close`, or by a
+    finalizer when the stack is garbage collected without being closed.
+    """
+
+    def __init__(self, shape: Tuple[int, ...], workers: int) -> None:
+        psi_bytes = int(np.prod(shape)) * np.dtype(np.complex128).itemsize
+        self.psi_shm = shared_memory.SharedMemory(create=True, size=max(psi_bytes, 1))
+        self.sigma_shm = shared_memory.SharedMemory(create=True, size=max(shape[0] * 8, 1))
+        self.psi = np.ndarray(shape, dtype=np.complex128, buffer=self.psi_shm.buf)
+        self.sigma = np.ndarray((shape[0],), dtype=np.float64, buffer=self.sigma_shm.buf)
+        self.psi_spec = (self.psi_shm.name, shape, np.dtype(np.complex128).str)
+        self.sigma_spec = (self.sigma_shm.name, (shape[0],), np.dtype(np.float64).str)
+        self.pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        bounds = np.linspace(0, shape[0], min(workers, shape[0]) + 1).astype(int)
+        self.shards = [(int(lo), int(hi)) for lo, hi in zip(bounds[:-1], bounds[1:]) if hi > lo]
+        self._finalizer = weakref.finalize(self, _release, self.pool, (self.psi_shm, self.sigma_shm))
+
+    def close(self) -> None:
+        del self.psi, self.sigma
+        self._finalizer()
+
+
 @dataclass(slots=True)
 class ResConnectParallel:
     nodes: List[ResonanceNode]
     drift_factory: callable = lambda: OmegaDriftCore(SchumannClock())
+    workers: int = 0
     history: List[Dict[str, Any]] = field(default_factory=list, init=False)
+    _psi: Optional[np.ndarray] = field(default=None, init=False, repr=False)
+    _views: List[np.ndarray] = field(default_factory=list, init=False, repr=False)
+    _shared: Optional[_SharedStack] = field(default=None, init=False, repr=False)
+
+    @property
+    def psi_stack(self) -> np.ndarray:
+        """All node fields as one ``(nodes, *shape)`` array."""
+
+        self._ensure_stack()
+        return self._psi
+
+    def _ensure_stack(self) -> None:
+        """(Re)build the stack when nodes were added or their fields replaced."""
+
+        if len(self._views) == len(self.nodes) and all(
+            node.psi is view for node, view in zip(self.nodes, self._views)
+        ):
+            return
+        shape = (len(self.nodes),) + np.shape(self.nodes[0].psi)
+        previous = self._shared
+        if self.workers > 0:
+            self._shared = _SharedStack(shape, self.workers)
+            stack = self._shared.psi
+        else:
+            self._shared = None
+            stack = np.empty(shape, dtype=np.complex128)
+        for i, node in enumerate(self.nodes):
+            stack[i] = node.psi
+        self._psi = stack
+        self._views = [stack[i] for i in range(len(self.nodes))]
+        for node, view in zip(self.nodes, self._views):
+            node.psi = view
+        if previous is not None:
+            previous.close()
 
     def step(self) -> None:
+        if not self.nodes:
+            return
         drift = self.drift_factory()
+        if len({np.shape(node.psi) for node in self.nodes}) > 1:
+            self._step_sequential(drift)
+            return
+
+        self._ensure_stack()
+        sigma_in = np.fromiter((node.sigma for node in self.nodes), dtype=float, count=len(self.nodes))
+        if self._shared is not None:
+            sigma, empathy = self._step_sharded(drift, sigma_in)
+        else:
+            drift.step_stacked(self._psi, sigma_in)
+            sigma = _saturate_sigma(self._psi)
+            empathy = None
+            if len(self.nodes) >= 2:
+                empathy = float(np.mean(_empathy_terms(self._psi[0], self._psi[1:])))
+        for node, value in zip(self.nodes, sigma.tolist()):
+            node.sigma = value
+        if empathy is not None:
+            self.history.append({"empathy": empathy})
+
+    def _step_sharded(self, drift: OmegaDriftCore, sigma_in: np.ndarray) -> Tuple[np.ndarray, Optional[float]]:
+        shared = self._shared
+        shared.sigma[:] = sigma_in
+        # One carrier value per step keeps every shard on the same clock phase.
+        carrier = drift.clock.carrier_scalar(amp=1.0, k=drift.harmonic)
+        futures = [
+            shared.pool.submit(
+                _shard_drift, shared.psi_spec, shared.sigma_spec, lo, hi, carrier, drift.drift_gain, drift.renorm
+            )
+            for lo, hi in shared.shards
+        ]
+        for future in futures:
+            future.result()
+        empathy = None
+        if len(self.nodes) >= 2:
+            parts = [shared.pool.submit(_shard_empathy, shared.psi_spec, lo, hi) for lo, hi in shared.shards]
+            empathy = sum(part.result() for part in parts) / (len(self.nodes) - 1)
+        return shared.sigma.copy(), empathy
+
+    def _step_sequential(self, drift: OmegaDriftCore) -> None:
         for node in self.nodes:
             node.psi = drift.step(node.psi, node.sigma)
-            node.sigma = float(
-                heisenberg_soft_clip_range(
-                    np.mean(np.abs(node.psi) ** 2),
-                    0.0,
-                    1.2,
-                )
-            )
+        energies = [np.mean(np.abs(node.psi) ** 2) for node in self.nodes]
+        for node, sigma in zip(self.nodes, heisenberg_soft_clip_range(energies, 0.0, 1.2).tolist()):
+            node.sigma = sigma
+        self._views = []
         if len(self.nodes) >= 2:
             base = self.nodes[0].psi
             empathy = [float(np.exp(-np.mean(np.abs(base - n.psi)))) for n in self.nodes[1:]]
             self.history.append({"empathy": float(np.mean(empathy))})
 
+    def empathy_matrix(self, block: Optional[int] = None) -> np.ndarray:
+        """Pairwise ``exp(-mean|psi_i - psi_j|)`` for all nodes, in row blocks."""
+
+        stack = self.psi_stack
+        n = stack.shape[0]
+        flat = stack.reshape(n, -1)
+        if block is None:
+            # Bound the (block, n, size) temporary to a few million elements.
+            block = max(1, (1 << 22) // max(1, n * flat.shape[1]))
+        out = np.empty((n, n))
+        for lo in range(0, n, block):
+            hi = min(lo + block, n)
+            out[lo:hi] = np.exp(-np.mean(np.abs(flat[lo:hi, np.newaxis, :] - flat[np.newaxis, :, :]), axis=-1))
+        return out
+
+    def close(self) -> None:
+        """Release the worker pool and shared memory of the sharded mode."""
+
+        if self._shared is not None:
+            for i, node in enumerate(self.nodes[: len(self._views)]):
+                if node.psi is self._views[i]:
+                    node.psi = node.psi.copy()
+            self._views = []
+            self._psi = None
+            self._shared.close()
+            self._shared = None
+
+    def __enter__(self) -> "ResConnectParallel":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
 
 __all__ = ["ResConnectParallel", "ResonanceNode"]
@@ -8,3 +8,36 @@ Licensed under the CIEL Research Non-Commercial License v1.1.
 def test_4d_engine_imports():
     from universal_law_4d.universal_engine import UniversalLawEngine4D
     assert UniversalLawEngine4D is not None
+
+
+def test_cached_resize_weights_match_linear_zoom():
+    import numpy as np
+    from scipy import ndimage
+    from universal_law_4d.universal_engine import _resize_weights
+
+    field = np.random.default_rng(0).normal(size=(6, 5))
+    W_x, W_y = _resize_weights((6, 5), (13, 9))
+    assert np.allclose(W_x @ field @ W_y.T, ndimage.zoom(field, [13 / 6, 9 / 5], order=1))
+    assert _resize_weights((6, 5), (13, 9))[0] is W_x
+
+
+def test_vectorised_initialisers_match_scalar_definitions():
+    import numpy as np
+    from universal_law_4d.universal_engine import UniversalLawEngine4D
+
+    engine = UniversalLawEngine4D((3, 4, 3, 2))
+    i, j, k, l = 2, 1, 2, 1
+    state = (np.sin(i + j) + 1j * np.cos(k + l)) * np.exp(1j * (i * k + j * l) * 0.1)
+    ratio = engine.symbolic_field / engine.symbolic_field[0, 0, 0, 0]
+    first = (np.sin(0) + 1j * np.cos(0)) * 1.0
+    assert np.isclose(ratio[i, j, k, l], state / first)
+
+    rhythm = engine.collatz_twinprime
+    coords = engine.hyper_coordinates.reshape(-1, 4)
+    for coord, value in zip(coords, rhythm.collatz_resonance_4d(coords)):
+        n = int(np.sum(np.abs(coord * 1000))) % 10000 + 1
+        assert value == np.exp(-len(rhythm.collatz_sequence(n)) / 100.0)
+    ramanujan = engine.ramanujan
+    for coord, value in zip(coords, ramanujan.taxicab_resonance_4d(coords)):
+        n = int(abs(np.sqrt(np.sum(coord**2)) * 100)) + 1
+        assert value == ramanujan._calculate_taxicab_representations(n % 1000 + 1) / 10.0
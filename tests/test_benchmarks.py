@@ -0,0 +1,42 @@
+"""CIEL/Ω Quantum Consciousness Suite
+
+Copyright (c) 2025 Adrian Lipa / Intention Lab
+Licensed under the CIEL Research Non-Commercial License v1.1.
+"""
+
+from benchmarks import Baseline, ResultsHistory, compare, make_run, run_suite, select
+from benchmarks.__main__ import main
+
+
+def test_quick_suite_records_history_and_flags_regressions(tmp_path):
+    results = run_suite(select(["tmp.", "soul_invariant."]), quick=True, repeat=2)
+    assert [r["key"] for r in results] == ["soul_invariant.compute[64]", "tmp.pipeline[100]"]
+    assert all(r["wall_time"] > 0 and r["alloc_peak_bytes"] >= 0 for r in results)
+
+    history = ResultsHistory(tmp_path / "history.json")
+    run = make_run(results)
+    history.append(run)
+    history.append(run)
+    assert len(history.series("tmp.pipeline[100]")) == 2
+
+    baseline = Baseline.from_run(run)
+    baseline.results["tmp.pipeline[100]"]["wall_time"] /= 10.0
+    flagged = {(c.key, c.metric) for c in compare(run["results"], baseline) if c.regressed}
+    assert flagged == {("tmp.pipeline[100]", "wall_time")}
+    assert not any(c.regressed for c in compare(run["results"], baseline, {"wall_time": 20.0}))
+
+
+def test_cli_saves_and_checks_baseline(tmp_path):
+    args = [
+        "--only", "tmp.", "--quick", "--repeat", "1", "--in-process",
+        "--history", str(tmp_path / "h.json"), "--baseline", str(tmp_path / "b.json"),
+    ]
+    assert main(args + ["--save-baseline"]) == 0
+    assert "tmp.pipeline[100]" in Baseline.load(tmp_path / "b.json").results
+    assert main(args + ["--tolerance", "wall_time=100"]) == 0
+    assert len(ResultsHistory(tmp_path / "h.json").load()) == 2
+
+
+def test_import_time_case_runs_in_a_fresh_interpreter():
+    results = run_suite(select(["startup.import"]), quick=True, repeat=1, warmup=0)
+    assert [r["key"] for r in results] == ["startup.import[sys]"] and results[0]["wall_time"] > 0
@@ -0,0 +1,103 @@
+"""CIEL/Ω Quantum Consciousness Suite
+
+Copyright (c) 2025 Adrian Lipa / Intention Lab
+Licensed under the CIEL Research Non-Commercial License v1.1.
+"""
+
+import logging
+
+import numpy as np
+import pytest
+
+from core.physics import CIEL0Framework
+from integration.ultimate_engine import UnifiedRealityKernel
+from mathematics.lie4_engine import UnifiedCIELReality
+from paradoxes.ultimate_operators import UltimateEvolutionEngine, UltimateUniversalLawEngine4D
+from persistent.checkpoint import (
+    CheckpointManager,
+    capture_state,
+    load_checkpoint,
+    restore_checkpoint,
+    save_checkpoint,
+)
+from universal_law_4d.universal_engine import CompleteUnifiedEvolutionEngine, UniversalLawEngine4D
+
+ENGINES = {
+    "UnifiedRealityKernel": (lambda: UnifiedRealityKernel(grid_size=12, time_steps=2), lambda e: e.evolve_reality(1)),
+    "UniversalLawEngine4D": (lambda: UniversalLawEngine4D((4, 4, 4, 3)), lambda e: e.cosmic_evolution_step_4d()),
+    "CompleteUnifiedEvolutionEngine": (
+        lambda: CompleteUnifiedEvolutionEngine(spacetime_shape=(6, 6, 3), grid_4d_shape=(3, 3, 3, 2)),
+        lambda e: e.evolution_step(),
+    ),
+    "UltimateUniversalLawEngine4D": (lambda: UltimateUniversalLawEngine4D((4, 4, 4, 3)), lambda e: e.ultimate_evolution_step()),
+    "UltimateEvolutionEngine": (
+        lambda: UltimateEvolutionEngine(spacetime_shape=(6, 6, 3), grid_4d_shape=(3, 3, 3, 2)),
+        lambda e: e.ultimate_evolution_step(),
+    ),
+    "CIEL0Framework": (lambda: CIEL0Framework(grid_size=16), lambda e: e.evolution_step()),
+    "UnifiedCIELReality": (lambda: UnifiedCIELReality((6, 6), time_steps=3), lambda e: e.evolution_step()),
+}
+
+
+def _engine():
+    return CompleteUnifiedEvolutionEngine(spacetime_shape=(8, 8, 4), grid_4d_shape=(3, 3, 3, 2))
+
+
+def test_resumed_run_matches_uninterrupted_run(tmp_path):
+    np.random.seed(7)
+    engine = _engine()
+    engine.evolution_step()
+    with CheckpointManager(tmp_path, keep=1) as manager:
+        manager.save(engine, engine.step)
+    expected = engine.evolution_step()
+
+    np.random.seed(123)
+    resumed = _engine()
+    checkpoint = CheckpointManager(tmp_path).restore(resumed)
+
+    assert checkpoint.step == 1
+    assert resumed.history["energy"] == engine.history["energy"][:1]
+    assert resumed.evolution_step() == expected
+
+
+def test_compressed_checkpoint_roundtrip_and_lazy_arrays(tmp_path):
+    engine = _engine()
+    engine.evolution_step()
+    path = save_checkpoint(engine, tmp_path / "run.ckpt", compression="zlib")
+
+    checkpoint = load_checkpoint(path)
+    assert "fields.psi" in checkpoint.arrays
+
+    other = _engine()
+    restore_checkpoint(other, path)
+    assert other.step == engine.step
+    assert np.allclose(other.fields.psi, engine.fields.psi)
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+@pytest.mark.parametrize("name", sorted(ENGINES))
+def test_every_engine_resumes_where_it_stopped(tmp_path, name):
+    build, step = ENGINES[name]
+    np.random.seed(11)
+    engine = build()
+    step(engine)
+    path = save_checkpoint(engine, tmp_path / f"{name}.ckpt")
+    step(engine)
+
+    np.random.seed(99)
+    resumed = build()
+    restore_checkpoint(resumed, path)
+    step(resumed)
+
+    expected, actual = capture_state(engine).arrays, capture_state(resumed).arrays
+    assert expected.keys() == actual.keys()
+    for key, array in expected.items():
+        np.testing.assert_allclose(actual[key], array, rtol=1e-12, atol=1e-12, err_msg=key)
+
+
+def test_capture_skips_owned_objects_without_arrays():
+    engine = _engine()
+    engine.log = logging.getLogger("ciel.checkpoint.test")
+    state = capture_state(engine).state
+    assert not [key for key in state if key.startswith(("log.", "constants."))]
+    assert "fields.psi" in state and "step" in state
@@ -0,0 +1,35 @@
+"""CIEL/Ω Quantum Consciousness Suite
+
+Copyright (c) 2025 Adrian Lipa / Intention Lab
+Licensed under the CIEL Research Non-Commercial License v1.1.
+"""
+
+import numpy as np
+
+from cognition.orchestrator import CognitionOrchestrator
+
+
+def test_evaluate_accepts_one_shot_iterables():
+    orchestrator = CognitionOrchestrator()
+    values = [0.2, -1.0, 3.5, 0.7, 1.1, 2.0]
+    expected = orchestrator.evaluate(values, [0.5, 1.5])
+    assert orchestrator.evaluate(iter(values), (g for g in [0.5, 1.5])) == expected
+    assert expected["decision"] == expected["prediction"] + 1.0
+
+
+def test_evaluate_batch_matches_rows():
+    orchestrator = CognitionOrchestrator()
+    rng = np.random.default_rng(7)
+    for samples in (0, 1, 2, 4, 9):
+        stimuli = rng.normal(size=(6, samples))
+        goals = rng.normal(size=3)
+        batch = orchestrator.evaluate_batch(stimuli, goals)
+        rows = [orchestrator.evaluate(row, goals) for row in stimuli]
+        for key, column in batch.items():
+            assert column.shape == (6,)
+            np.testing.assert_allclose(column, [row[key] for row in rows], rtol=1e-12, atol=1e-12)
+
+    per_row_goals = rng.normal(size=(6, 2))
+    stimuli = rng.normal(size=(6, 5))
+    decisions = orchestrator.evaluate_batch(stimuli, per_row_goals)["decision"]
+    np.testing.assert_allclose(decisions, [orchestrator.evaluate(s, g)["decision"] for s, g in zip(stimuli, per_row_goals)])
@@ -0,0 +1,61 @@
+"""CIEL/Ω Quantum Consciousness Suite
+
+Copyright (c) 2025 Adrian Lipa / Intention Lab
+Licensed under the CIEL Research Non-Commercial License v1.1.
+"""
+
+import numpy as np
+import pytest
+
+from bio.eeg_processor import EEGProcessor, StreamingEEGProcessor
+
+
+def _recording(channels: int, samples: int, rate: float) -> np.ndarray:
+    t = np.arange(samples) / rate
+    rng = np.random.default_rng(1)
+    alpha = np.sin(2 * np.pi * 10.0 * t)
+    mains = 0.8 * np.sin(2 * np.pi * 60.0 * t)
+    return alpha + mains + 0.05 * rng.normal(size=(channels, samples))
+
+
+def test_chunked_stream_matches_single_pass():
+    data = _recording(3, 2000, 250.0)
+    whole = StreamingEEGProcessor(sample_rate=250.0, channels=3, low=1.0, high=40.0).process(data)
+
+    stream = StreamingEEGProcessor(sample_rate=250.0, channels=3, low=1.0, high=40.0)
+    bounds = [0, 1, 17, 250, 251, 999, 2000]
+    pieces = [stream.process(data[:, a:b]) for a, b in zip(bounds, bounds[1:])]
+    assert np.allclose(np.concatenate(pieces, axis=1), whole, atol=1e-12)
+    assert stream.samples_seen == 2000
+
+    single = StreamingEEGProcessor(sample_rate=250.0, channels=1, low=1.0, high=40.0).process(data[1])
+    assert single.shape == (2000,) and np.allclose(single, whole[1])
+
+
+def test_stream_attenuates_out_of_band_and_keeps_history():
+    stream = EEGProcessor(sample_rate=250.0).stream(channels=2, history=300)
+    data = _recording(2, 1500, 250.0)
+    for start in range(0, 1500, 125):
+        stream.process(data[:, start:start + 125])
+
+    tail = stream.latest()
+    assert tail.shape == (2, 300)
+    freqs = np.fft.rfftfreq(300, d=1.0 / 250.0)
+    mains, alpha = np.argmin(np.abs(freqs - 60.0)), np.argmin(np.abs(freqs - 10.0))
+
+    def mains_ratio(trace):
+        spectrum = np.abs(np.fft.rfft(trace))
+        return spectrum[mains] / spectrum[alpha]
+
+    assert mains_ratio(tail[0]) < 0.2 * mains_ratio(data[0, -300:])
+    assert np.array_equal(stream.latest(10), tail[:, -10:])
+    assert stream.group_delay(10.0) > 0
+
+
+def test_stream_validates_channels_and_passes_through_above_nyquist():
+    stream = StreamingEEGProcessor(sample_rate=64.0, channels=2, high=40.0)
+    assert stream.sos is None
+    data = np.ones((2, 8))
+    assert np.array_equal(stream.process(data), data)
+    with pytest.raises(ValueError):
+        stream.process(np.ones((3, 8)))
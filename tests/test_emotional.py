@@ -45,6 +45,37 @@ class TestEmotional(unittest.TestCase):
 
         self.assertAlmostEqual(distribution["beta"], 0.75, places=7)
 
+    def test_signal_helpers_accept_arrays_and_skip_none(self) -> None:
+        import numpy as np
+
+        from emotion.utils import mean_and_variance, to_signal_array, to_signal_list
+
+        self.assertEqual(to_signal_list([1, None, 2.5]), [1.0, 2.5])
+        self.assertEqual(to_signal_list(x for x in (3, None)), [3.0])
+        values = to_signal_array(np.arange(6, dtype=np.int32).reshape(2, 3))
+        self.assertEqual(values.dtype, np.float64)
+        self.assertEqual(mean_and_variance(values, baseline=1.0), mean_and_variance(list(range(6)), baseline=1.0))
+        self.assertEqual(mean_and_variance(np.array([]), baseline=0.25), (0.25, 0.0))
+
+    def test_process_batch_matches_process_and_bounds_history(self) -> None:
+        import numpy as np
+
+        from emotion.emotion_core import EmotionCore
+
+        signals = [[0.0, 1.0, 2.0], [], [5.0, None, -1.0], np.linspace(0.0, 1.0, 50)]
+        single = EmotionCore(baseline=0.5)
+        expected = [single.process(s) for s in signals]
+        batched = EmotionCore(baseline=0.5, history_limit=3).process_batch(signals)
+        for got, want in zip(batched, expected):
+            self.assertAlmostEqual(got["mood"], want["mood"], places=12)
+            self.assertAlmostEqual(got["variance"], want["variance"], places=12)
+
+        core = EmotionCore(history_limit=3)
+        rows = core.process_batch(np.arange(12.0).reshape(4, 3))
+        self.assertEqual([r["mood"] for r in rows], [1.0, 4.0, 7.0, 10.0])
+        self.assertEqual(len(core.history), 3)
+        self.assertEqual(core.history[-1]["mood"], 10.0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,43 @@
+"""CIEL/Ω Quantum Consciousness Suite
+
+Copyright (c) 2025 Adrian Lipa / Intention Lab
+Licensed under the CIEL Research Non-Commercial License v1.1.
+"""
+
+import json
+
+from ciel import CielEngine
+from ciel.llm_registry import StubAux, StubPrimary
+from ciel.timing import SpanRecorder, StageHistogram
+
+
+def test_engine_reports_per_stage_timings(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    engine = CielEngine(
+        language_backend=StubPrimary("stub", "offline"),
+        aux_backend=StubAux("stub-aux", "offline"),
+        timing=SpanRecorder(enabled=False),
+    )
+    assert "timings" not in engine.step("hello world")
+    assert engine.timing_stats() == {}
+
+    engine.timing.enable()
+    result = engine.interact("hello world", [{"role": "user", "content": "hello world"}])
+    assert {"interact", "step", "kernel", "tmp", "llm", "aux"} <= set(result["timings"])
+    engine.interact("hello again", [], use_aux_analysis=False)
+    stats = engine.timing_stats()
+    assert stats["step"]["count"] == 2 and stats["aux"]["count"] == 1
+    assert stats["step"]["p50_ms"] <= stats["step"]["p99_ms"] <= stats["step"]["max_ms"]
+
+    trace = json.loads(engine.timing.export(tmp_path / "trace.json", fmt="chrome").read_text())
+    assert {event["ph"] for event in trace["traceEvents"]} == {"X"}
+    lines = (engine.timing.export(tmp_path / "spans.jsonl")).read_text().splitlines()
+    assert "stats" in json.loads(lines[-1])
+
+
+def test_histogram_percentiles_are_within_bucket_error():
+    hist = StageHistogram()
+    for value in range(1, 1001):
+        hist.add(value * 1000)
+    assert abs(hist.percentile(50) - 500_000) / 500_000 < 0.1
+    assert abs(hist.percentile(99) - 990_000) / 990_000 < 0.1
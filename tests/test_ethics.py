@@ -8,3 +8,15 @@ Licensed under the CIEL Research Non-Commercial License v1.1.
 def test_ethics_imports():
     from ethics.ethical_engine import EthicalEngine
     assert EthicalEngine is not None
+
+
+def test_ethical_engine_counts_keywords_and_bounds_history():
+    from ethics.ethical_engine import EthicalEngine
+
+    engine = EthicalEngine(positive_words=iter(["love", "peace"]), history_limit=2)
+    result = engine.evaluate("Love and peace, love over war")
+    assert result["score"] == (2 - 1) / 6  # "peace," keeps its comma, as with str.split
+    for text in ("war", "chaos", "harmony"):
+        engine.evaluate(text)
+    assert len(engine.history) == 2
+    assert engine.evaluate("love love")["score"] == 1.0
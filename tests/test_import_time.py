@@ -0,0 +1,36 @@
+"""CIEL/Ω Quantum Consciousness Suite
+
+Copyright (c) 2025 Adrian Lipa / Intention Lab
+Licensed under the CIEL Research Non-Commercial License v1.1.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _loaded_after(statement: str) -> set:
+    code = f"import sys, json\n{statement}\nprint(json.dumps(sorted(sys.modules)))"
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    return set(json.loads(out.strip().splitlines()[-1]))
+
+
+def test_package_import_defers_engine_stack():
+    loaded = _loaded_after("import ciel")
+    assert not {"ciel.engine", "numpy", "scipy"} & loaded
+
+
+def test_mathematics_import_defers_lie4():
+    loaded = _loaded_after("import mathematics")
+    assert "mathematics.lie4" not in loaded
+    assert "scipy.linalg" not in loaded
+
+
+def test_engine_import_skips_vendor_orchestrators():
+    loaded = _loaded_after("import ciel.engine")
+    assert not any(name.startswith("core.memory.vendor") for name in loaded)
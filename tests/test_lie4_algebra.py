@@ -0,0 +1,50 @@
+"""CIEL/Ω Quantum Consciousness Suite
+
+Copyright (c) 2025 Adrian Lipa / Intention Lab
+Licensed under the CIEL Research Non-Commercial License v1.1.
+"""
+
+import numpy as np
+import pytest
+
+from mathematics.lie4 import Lie4Algebra
+from mathematics.lie4 import algebra
+from mathematics.lie4_engine import Lie4ConsciousnessField, Lie4Constants
+
+
+def test_structure_constants_are_cached_and_match_commutators():
+    alg = Lie4Algebra()
+    f = alg.structure_constants()
+    assert f is Lie4Algebra().structure_constants() and not f.flags.writeable
+    for i, ei in enumerate(alg.basis):
+        for j, ej in enumerate(alg.basis):
+            comm = ei.commutator(ej).basis_elements
+            assert np.allclose(comm, np.einsum("k,kab->ab", f[i, j], algebra.BASIS))
+
+
+def test_field_bracket_and_killing_form_match_matrix_formulas():
+    rng = np.random.default_rng(1)
+    x, y = rng.normal(size=(2, 3, 5, 6))
+    X, Y = algebra.to_matrices(x), algebra.to_matrices(y)
+    assert np.allclose(algebra.to_matrices(algebra.bracket(x, y)), X @ Y - Y @ X)
+    # so(4): K(X, Y) = (n - 2) tr(XY)
+    assert np.allclose(algebra.killing_form(x, y), 2 * np.einsum("...ij,...ji->...", X, Y))
+
+
+def test_field_strength_matches_per_component_reference():
+    field = Lie4ConsciousnessField((4, 5, 3, 2), Lie4Constants())
+    rng = np.random.default_rng(2)
+    field.A = rng.normal(size=field.A.shape) + 1j * rng.normal(size=field.A.shape)
+    F = field.field_strength()
+    assert F.shape == (4, 5, 3, 2, 6, 4, 4)
+    h = field.spacing
+    for p, (m, n) in enumerate(algebra.BASIS_PAIRS):
+        A_m, A_n = field.A[..., m, :, :], field.A[..., n, :, :]
+        expected = np.gradient(A_n, h[m], axis=m) - np.gradient(A_m, h[n], axis=n) + A_m @ A_n - A_n @ A_m
+        assert np.allclose(F[..., p, :, :], expected)
+    assert field.field_energy_density().shape == (4, 5, 3, 2)
+
+
+def test_field_strength_rejects_mismatched_grid():
+    with pytest.raises(ValueError):
+        algebra.field_strength(np.zeros((3, 3, 4, 4, 4)))
@@ -0,0 +1,132 @@
+"""CIEL/Ω Quantum Consciousness Suite
+
+Copyright (c) 2025 Adrian Lipa / Intention Lab
+Licensed under the CIEL Research Non-Commercial License v1.1.
+"""
+
+import copy
+import importlib
+import json
+import sqlite3
+
+import pytest
+
+from core.memory.vendor.bulk import IngestCheckpoint, iter_chunks
+from core.memory.vendor.ultimate.audit_log import AuditLog
+from core.memory.vendor.ultimate.durable_tsm_sqlite import TSMWriterSQL
+from core.memory.vendor.ultimate.tmp_kernel import DataVector, TMPKernel
+from core.memory.vendor.ultimate.types import MemoriseD
+
+
+# The ultimate profile's built-in defaults; the pro profile requires the files.
+_CONFIGS = {
+    "rules_immutable.json": {"require_context": True, "require_sense": True, "ethical_gate": True,
+                             "forbidden_patterns": ["illegal", "harm", "exploit"]},
+    "heuristics_user.json": {"weights": {"logic": 0.35, "semantic": 0.25, "context": 0.20, "emotion": 0.20},
+                             "boosts": {"novelty_hint": 0.15, "trusted_source": 0.10},
+                             "penalties": {"contradiction_flag": -0.25, "ethics_warning": -0.50}},
+    "heuristics_self.json": {"weights": {"logic": 0.30, "semantic": 0.25, "context": 0.25, "emotion": 0.20},
+                             "boosts": {"long_form": 0.10, "associations_present": 0.05},
+                             "penalties": {"too_short": -0.15}},
+}
+
+
+def _config_dir(path):
+    path.mkdir(parents=True, exist_ok=True)
+    for name, conf in _CONFIGS.items():
+        (path / name).write_text(json.dumps(conf), encoding="utf-8")
+    return path
+
+
+def _vectors(DataVector=DataVector):
+    senses = ["ok", "short text", "a harmless looking note", "this is an exploit walkthrough", None,
+              "a long and careful description of the experiment with many words " * 3]
+    metas = [{}, {"novelty_hint": True}, {"trusted_source": True, "contradiction_flag": True}, {"ethics_warning": True}]
+    return [DataVector(context="ctx" if i % 7 else "", sense=senses[i % len(senses)], associations=["a"] if i % 3 else None,
+                       timestamp="not-a-date" if i % 11 == 0 else None, meta=metas[i % len(metas)])
+            for i in range(200)]
+
+
+@pytest.mark.parametrize("profile", ["pro", "ultimate"])
+def test_process_many_matches_scalar_kernel(tmp_path, profile):
+    tmp_kernel = importlib.import_module(f"core.memory.vendor.{profile}.tmp_kernel")
+    kernel = tmp_kernel.TMPKernel(_config_dir(tmp_path))
+    vectors = _vectors(tmp_kernel.DataVector)
+    batch = kernel.process_many(copy.deepcopy(vectors))
+    assert batch == [kernel.process(D) for D in vectors]
+    assert {out["OUT"]["verdict"] for out in batch} >= {"FAIL", "HOLD", "PASS", "REJECT"}
+
+
+def test_batch_writers_use_one_transaction_and_one_write(tmp_path):
+    writer = TSMWriterSQL(tmp_path / "ledger.db")
+    records = [MemoriseD(f"id{i}", "2025-01-01T00:00:00", f"D{i}", "ctx", f"text {i}", [], "", {}, "text", {}, {"W_L": 0.5})
+               for i in range(5)]
+    refs = writer.save_many(records, [f"WPM:id{i}" for i in range(5)])
+    assert refs == [f"TSM:id{i}" for i in range(5)]
+    with sqlite3.connect(tmp_path / "ledger.db") as conn:
+        rows = conn.execute("SELECT memorise_id, wpm_ref, checksum FROM memories ORDER BY memorise_id").fetchall()
+    assert [(r[0], r[1]) for r in rows] == [(f"id{i}", f"WPM:id{i}") for i in range(5)] and all(r[2] for r in rows)
+
+    fresh = [MemoriseD(f"new{i}", "2025-01-01T00:00:00", "D", "c", "s", [], "", {}, "t", {}, {}) for i in range(2)]
+    unserialisable = MemoriseD("bad", "2025-01-01T00:00:00", "D", "c", "s", [], "", {"x": object()}, "t", {}, {})
+    with pytest.raises(TypeError):
+        writer.save_many(fresh + [unserialisable])
+    with sqlite3.connect(tmp_path / "ledger.db") as conn:
+        assert conn.execute("SELECT COUNT(*) FROM memories").fetchone()[0] == 5
+
+    audit = AuditLog(tmp_path / "audit.jsonl")
+    assert audit.append_many([("A", {"n": 1}), ("B", {"n": 2})]) == 2
+    assert [json.loads(line)["event"] for line in audit.path.read_text().splitlines()] == ["A", "B"]
+
+
+def test_iter_chunks_resumes_at_offset():
+    chunks = list(iter_chunks([("c", f"s{i}") for i in range(10)], 4, start=3, vector_type=DataVector))
+    assert [len(c) for c in chunks] == [4, 3]
+    assert chunks[0][0].offset == 3 and chunks[0][0].D.D_S == "s3"
+
+
+class _StubWPM:
+    """In-memory stand-in for ``WPMWriterHDF5`` so the ingest path runs without h5py."""
+
+    def __init__(self, h5_path):
+        self.saved = []
+
+    def save_many(self, records, waves=None, attrs=None):
+        self.saved.extend(record.memorise_id for record in records)
+        return [f"WPM:{record.memorise_id}" for record in records]
+
+
+@pytest.mark.parametrize("profile", ["pro", "ultimate"])
+def test_ingest_many_resumes_from_checkpoint(tmp_path, monkeypatch, profile):
+    vendor = importlib.import_module(f"core.memory.vendor.{profile}.orchestrator")
+    monkeypatch.setattr(vendor, "WPMWriterHDF5", _StubWPM)
+    paths = {"cfg_dir": _config_dir(tmp_path / "cfg"), "tsm_db": tmp_path / "ledger.db", "wpm_h5": tmp_path / "waves.h5"}
+    if profile == "ultimate":
+        paths["audit_path"] = tmp_path / "audit.jsonl"
+    orch = vendor.UnifiedMemoryOrchestrator(**paths)
+    rows = [{"context": "log", "sense": f"entry {i} is a long and detailed statement for the analysis",
+             "meta": {"novelty_hint": True, "trusted_source": True}} for i in range(50)]
+
+    class Stop(Exception):
+        pass
+
+    commit = IngestCheckpoint.commit
+
+    def interrupt_third(self, report):
+        if report.chunks == 3:  # chunk 3 is in SQLite but not checkpointed
+            raise Stop
+        commit(self, report)
+
+    with monkeypatch.context() as patch:
+        patch.setattr(IngestCheckpoint, "commit", interrupt_third)
+        with pytest.raises(Stop):
+            orch.ingest_many(rows, chunk_size=10, checkpoint=tmp_path / "ingest.json")
+    report = orch.ingest_many(rows, chunk_size=10, checkpoint=tmp_path / "ingest.json")
+    assert report.resumed_from == 20 and report.processed == 30 and report.chunks == 5
+    with sqlite3.connect(tmp_path / "ledger.db") as conn:
+        assert conn.execute("SELECT COUNT(*), COUNT(wpm_ref) FROM memories").fetchone() == (50, 50)
+    assert len(orch.wpm.saved) == 60 and len(set(orch.wpm.saved)) == 50
+    if profile == "ultimate":
+        events = [json.loads(line) for line in paths["audit_path"].read_text().splitlines()]
+        writes = [e["payload"]["memorise_id"] for e in events if e["event"] == "DURABLE_WRITE"]
+        assert len(writes) == len(set(writes)) == 50
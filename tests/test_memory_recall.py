@@ -0,0 +1,124 @@
+"""CIEL/Ω Quantum Consciousness Suite
+
+Copyright (c) 2025 Adrian Lipa / Intention Lab
+Licensed under the CIEL Research Non-Commercial License v1.1.
+"""
+
+import json
+
+import numpy as np
+
+from ciel_memory.orchestrator import UnifiedMemoryOrchestrator
+from ciel_memory.recall import HashedNgramEmbedder, MemoryIndex
+
+TOPICS = [
+    "the resonance of the crystal lattice at dawn",
+    "ethical boundaries of the intention field",
+    "memory consolidation during deep sleep cycles",
+    "spectral analysis of alpha waves in meditation",
+]
+
+
+def test_embedder_is_deterministic_and_similarity_aware():
+    embedder = HashedNgramEmbedder(dim=128)
+    vectors = embedder.embed_many(TOPICS + ["", "resonance of a crystal lattice at sunrise"])
+    assert vectors.shape == (6, 128) and vectors.dtype == np.float32
+    assert np.array_equal(vectors[0], embedder.embed(TOPICS[0]))
+    assert not vectors[4].any()
+    scores = vectors[:4] @ vectors[5]
+    assert int(np.argmax(scores)) == 0
+
+
+def test_exact_search_with_filters_and_duplicates():
+    index = MemoryIndex()
+    records = [
+        {
+            "memorise_id": f"m{i}",
+            "text": text,
+            "d_type": "text" if i % 2 else "wave",
+            "captured_at": f"2025-01-0{i + 1}T00:00:00",
+            "weights": {"novelty": i / 4},
+            "payload": {"sense": text},
+        }
+        for i, text in enumerate(TOPICS)
+    ]
+    assert index.add_many(records) == 4 and index.add_many(records[:2]) == 0
+
+    hits = index.search("alpha waves during meditation", k=2)
+    assert hits[0]["memorise_id"] == "m3" and hits[0]["sense"] == TOPICS[3]
+    assert hits[0]["score"] >= hits[1]["score"]
+    assert [h["memorise_id"] for h in index.search("crystal lattice", k=4, d_type="wave")] == ["m0", "m2"]
+    assert {h["memorise_id"] for h in index.search("x", k=4, since="2025-01-03")} == {"m2", "m3"}
+    assert {h["memorise_id"] for h in index.search("x", k=4, weights={"novelty": (0.5, None)})} == {"m2", "m3"}
+    assert index.search("x", weights={"missing": (0, 1)}) == []
+
+
+def test_inverted_file_search_finds_exact_matches():
+    rng = np.random.default_rng(3)
+    words = [f"token{i}" for i in range(400)]
+    texts = [" ".join(rng.choice(words, 8)) for _ in range(3000)]
+    index = MemoryIndex(ivf_threshold=1000, nprobe=16)
+    index.add_many({"memorise_id": str(i), "text": t, "d_type": "odd" if i % 2 else "even"} for i, t in enumerate(texts))
+    assert index._centroids is not None and index._codebooks is not None  # trained on add, not on search
+    for i in (5, 1234, 2999):
+        assert index.search(texts[i], k=3)[0]["memorise_id"] == str(i)
+
+    late = "a completely fresh memory about gravitational lensing"
+    index.add("late", late)  # assigned to a list without retraining
+    assert index._organised == 3000 and index.search(late, k=1)[0]["memorise_id"] == "late"
+    assert all(int(h["memorise_id"]) % 2 for h in index.search(texts[8], k=5, d_type="odd"))
+
+
+def test_sync_jsonl_skips_entries_without_an_id(tmp_path):
+    ledger = tmp_path / "ledger.jsonl"
+    entries = [{"memorise_id": "a", "context": "kept"}, {"context": "no id"}, ["not", "an", "entry"]]
+    ledger.write_text("".join(json.dumps(e) + "\n" for e in entries), encoding="utf-8")
+    index = MemoryIndex()
+    assert index.sync_jsonl(ledger) == 1 and index.ids == ["a"]
+
+
+def test_orchestrator_recall_survives_restart(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    orchestrator = UnifiedMemoryOrchestrator()
+    assert orchestrator.recall("anything") == []
+    for text in TOPICS:
+        D = orchestrator.capture(context="notes", sense=text, meta={"novelty_hint": True})
+        orchestrator.promote_if_bifurcated(D, orchestrator.run_tmp(D), wave_arrays={"w": np.sin(np.arange(64.0))})
+
+    hits = orchestrator.recall("deep sleep and memory", k=1)
+    assert hits[0]["sense"] == TOPICS[2] and hits[0]["d_type"] == "text"
+
+    restarted = UnifiedMemoryOrchestrator()
+    again = restarted.recall(restarted.capture(context="notes", sense="sleep cycles"), k=2)
+    assert again[0]["memorise_id"] == hits[0]["memorise_id"]
+    assert restarted.recall("x", k=10, weights={"novelty": (0.9, None)}) and len(restarted.recall_index()) == 4
+
+
+def test_sqlite_ledger_sync_is_incremental(tmp_path):
+    from core.memory.vendor.ultimate.durable_tsm_sqlite import TSMWriterSQL
+    from core.memory.vendor.ultimate.types import MemoriseD
+
+    writer = TSMWriterSQL(tmp_path / "ledger.db")
+
+    def save(i, text):
+        writer.save(MemoriseD(f"id{i}", "2025-01-01T00:00:00", f"D{i}", "ctx", text, [], "", {}, "text", {},
+                              {"W_L": 0.5, "W_S": 0.1}))
+
+    index = MemoryIndex()
+    save(0, TOPICS[0])
+    assert index.sync_sqlite(tmp_path / "ledger.db") == 1
+    save(1, TOPICS[1])
+    assert index.sync_sqlite(tmp_path / "ledger.db") == 1
+    hit = index.search("ethical intention", k=1)[0]
+    assert hit["memorise_id"] == "id1" and hit["weights"]["W_L"] == 0.5
+
+
+def test_engine_step_reports_recalled_memories(tmp_path, monkeypatch):
+    from ciel.engine import CielEngine
+
+    monkeypatch.chdir(tmp_path)
+    engine = CielEngine()
+    D = engine.memory.capture(context="dialogue", sense=TOPICS[1])
+    engine.memory.user_force_save(D, engine.memory.run_tmp(D), reason="seed")
+    result = engine.step("what are the ethical boundaries here?")
+    assert result["recalled"][0]["sense"] == TOPICS[1]
@@ -0,0 +1,46 @@
+"""CIEL/Ω Quantum Consciousness Suite
+
+Copyright (c) 2025 Adrian Lipa / Intention Lab
+Licensed under the CIEL Research Non-Commercial License v1.1.
+"""
+
+import numpy as np
+import pytest
+
+from resonance.multiresonance_tensor import MultiresonanceTensor
+from resonance.resonance_operator import ResonanceOperator
+from resonance.resonance_optimizer import ResonanceOptimizer
+
+
+def _reference(samples, channels, decay):
+    tensor = np.zeros((channels, channels))
+    for vec in samples:
+        tensor = decay * tensor + np.outer(vec, vec)
+    return tensor
+
+
+@pytest.mark.parametrize("decay", [1.0, 0.9, 0.05])
+def test_incremental_norm_and_decay_match_dense_reference(decay):
+    rng = np.random.default_rng(1)
+    samples = rng.normal(size=(300, 6))
+    tensor = MultiresonanceTensor(channels=6, decay=decay)
+    for vec in samples[:150]:
+        tensor.accumulate(vec)
+    tensor.accumulate_many(samples[150:])
+    expected = _reference(samples, 6, decay)
+    np.testing.assert_allclose(tensor.norm, np.linalg.norm(expected), rtol=1e-9)
+    np.testing.assert_allclose(tensor.normalised(), expected / np.linalg.norm(expected), rtol=1e-9, atol=1e-12)
+    np.testing.assert_allclose(tensor.tensor, expected, rtol=1e-9, atol=1e-12)
+    assert tensor.normalised() is tensor.normalised() and not tensor.normalised().flags.writeable
+
+
+def test_operator_optimizer_and_direct_writes_keep_norm_consistent():
+    tensor = MultiresonanceTensor(channels=4)
+    tensor.accumulate([1.0, 2.0])  # short inputs are zero padded
+    ResonanceOptimizer(tensor, lr=0.5).step([0.5, -1.0, 2.0, 0.0])
+    vector = np.array([1.0, 0.0, -1.0, 2.0])
+    np.testing.assert_allclose(ResonanceOperator(tensor).apply(vector), tensor.normalised() @ vector)
+    np.testing.assert_allclose(tensor.norm, np.linalg.norm(tensor.tensor))
+
+    tensor.tensor[0, 0] += 10.0
+    np.testing.assert_allclose(tensor.norm, np.linalg.norm(tensor.tensor))
@@ -0,0 +1,47 @@
+"""CIEL/Ω Quantum Consciousness Suite
+
+Copyright (c) 2025 Adrian Lipa / Intention Lab
+Licensed under the CIEL Research Non-Commercial License v1.1.
+"""
+
+import numpy as np
+
+from mathematics import number_tables as nt
+
+
+def _collatz_length(n: int) -> int:
+    length = 1
+    while n != 1:
+        n = n // 2 if n % 2 == 0 else 3 * n + 1
+        length += 1
+    return length
+
+
+def test_tables_match_direct_definitions():
+    nt.clear_tables()
+    primes = nt.primes_up_to(100)
+    assert primes[:6].tolist() == [2, 3, 5, 7, 11, 13] and len(primes) == 25
+    assert np.flatnonzero(nt.twin_prime_mask(50)).tolist() == [3, 5, 11, 17, 29, 41]
+    assert np.flatnonzero(nt.constellation_mask(200, (0, 2, 6, 8))).tolist() == [5, 11, 101, 191]
+    assert nt.taxicab_counts(5000)[[1729, 4104, 2, 9]].tolist() == [2, 2, 1, 1]
+
+    # Grow the Collatz table in steps; extensions must agree with the direct loop.
+    small = nt.collatz_lengths(50, cap=None)
+    large = nt.collatz_lengths(5000, cap=None)
+    assert np.array_equal(small, large[:51])
+    idx = np.array([[1, 27], [97, 4999]])
+    assert nt.collatz_lengths(5000, cap=None)[idx].tolist() == [[_collatz_length(int(n)) for n in row] for row in idx]
+    assert nt.collatz_lengths(5000, cap=50)[27] == 50
+    assert nt.collatz_stopping_times(30)[27] == 111
+
+
+def test_tables_persist_and_preload(tmp_path):
+    nt.clear_tables()
+    expected = nt.collatz_lengths(3000, cap=None).copy()
+    nt.prime_sieve(3000)
+    nt.persist_tables(tmp_path)
+    nt.clear_tables()
+    assert set(nt.preload_tables(tmp_path)) == {"collatz_lengths", "prime_sieve"}
+    assert np.array_equal(nt.collatz_lengths(3000, cap=None), expected)
+    assert nt.is_prime(2999) and not nt.is_prime(3001 * 3)
+    nt.clear_tables()
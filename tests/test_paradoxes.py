@@ -8,3 +8,18 @@ Licensed under the CIEL Research Non-Commercial License v1.1.
 def test_paradoxes_imports():
     from paradoxes.ultimate_operators import UltimateParadoxOperators
     assert UltimateParadoxOperators is not None
+
+
+def test_array_operators_match_scalar_versions():
+    import numpy as np
+
+    from paradoxes.ultimate_operators import UltimateParadoxOperators
+
+    ops = UltimateParadoxOperators()
+    n = np.array([[-3, 0, 1, 2, 3], [5, 9, 11, 17, 4001]])
+    expected = [[ops.twin_prime_resonance(int(v)) for v in row] for row in n]
+    assert np.allclose(ops.twin_prime_resonance_array(n), expected)
+    assert ops.twin_prime_resonance(3) == 1.0 / np.log(3) and ops.twin_prime_resonance(7) == 0.0
+
+    m = np.array([1, 2, 7, 27, 97])
+    assert ops.collatz_length_array(m).tolist() == [len(ops.collatz_chaos_order(int(v))) for v in m]
@@ -0,0 +1,97 @@
+"""CIEL/Ω Quantum Consciousness Suite
+
+Copyright (c) 2025 Adrian Lipa / Intention Lab
+Licensed under the CIEL Research Non-Commercial License v1.1.
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from persistent.clusters import PersistentMemory, _stem
+
+
+def test_incremental_statistics_and_nearest_match_brute_force():
+    rng = np.random.default_rng(2)
+    data = rng.normal(size=(500, 6)).astype(np.float32)
+    memory = PersistentMemory()
+    for i in range(0, 450, 150):
+        memory.store_many("nauka", "spec", data[i:i + 150])
+    for vec in data[450:]:
+        memory.store("nauka", "spec", vec, table={"Lp": 1})
+    cluster = memory.clusters["nauka"]["spec"]
+    assert len(cluster) == 500
+    np.testing.assert_allclose(cluster.centroid, data.astype(float).mean(axis=0), atol=1e-12)
+    np.testing.assert_allclose(cluster.variance, data.astype(float).var(axis=0), rtol=1e-9)
+
+    query = rng.normal(size=6)
+    distances = np.linalg.norm(data - query, axis=1)
+    rows = [row for row, _ in cluster.nearest(query, k=5, metric="euclidean")]
+    assert rows == np.argsort(distances)[:5].tolist()
+    cosine = data @ query / (np.linalg.norm(data, axis=1) * np.linalg.norm(query))
+    assert [row for row, _ in cluster.nearest(query, k=3)] == np.argsort(-cosine)[:3].tolist()
+    with pytest.raises(ValueError):
+        memory.store("nauka", "spec", [1.0, 2.0])
+
+
+def test_save_load_memory_maps_and_keeps_columns(tmp_path):
+    memory = PersistentMemory()
+    memory.store("a", "x", [1.0, 0.0], metadata={"data": "first"}, table={"Lp": 1, "G": 0.5})
+    memory.store("a", "x", [0.0, 1.0], table={"Lp": 2})
+    memory.store("b", "y", [10.0, 10.0, 10.0])
+    memory.store("c", "z", [-1.0, 0.1])
+    memory.save(tmp_path)
+
+    loaded = PersistentMemory.load(tmp_path)
+    cluster = loaded.clusters["a"]["x"]
+    assert isinstance(cluster.vectors.base, np.memmap) or isinstance(cluster.vectors, np.memmap)
+    assert cluster[0].metadata == {"data": "first"} and cluster[1].table == {"Lp": 2}
+    assert cluster.column("G").tolist() == [0.5, None]
+    assert [(s, i) for s, i, _ in loaded.nearest_clusters([1.0, 0.2], k=2)] == [("a", "x"), ("c", "z")]
+
+    loaded.store("a", "x", [3.0, 4.0])  # appending detaches from the read-only map
+    assert len(cluster) == 3 and cluster.nearest([3.0, 4.0], k=1)[0][0] == 2
+    loaded.save(tmp_path)
+    assert len(PersistentMemory.load(tmp_path).clusters["a"]["x"]) == 3
+
+
+def test_save_over_loaded_store_keeps_every_cluster_intact(tmp_path):
+    memory = PersistentMemory()
+    memory.store("b", "y", [1.0, 2.0], metadata={"who": "b/y"})
+    memory.store("c", "z", [3.0, 4.0], metadata={"who": "c/z"})
+    memory.save(tmp_path)
+
+    loaded = PersistentMemory.load(tmp_path)
+    loaded.store("a", "w", [5.0, 6.0], metadata={"who": "a/w"})  # iterates before the lazy clusters
+    loaded.clusters = {"a": loaded.clusters.pop("a"), **loaded.clusters}
+    loaded.save(tmp_path)
+
+    reloaded = PersistentMemory.load(tmp_path)
+    for symbol, intent, vector in [("a", "w", [5.0, 6.0]), ("b", "y", [1.0, 2.0]), ("c", "z", [3.0, 4.0])]:
+        cluster = reloaded.clusters[symbol][intent]
+        assert cluster[0].metadata == {"who": f"{symbol}/{intent}"}
+        assert cluster.vectors[0].tolist() == vector
+
+
+def test_save_skips_clusters_unchanged_since_the_last_save(tmp_path):
+    def touched():
+        found = {path.name for path in tmp_path.glob("cluster-*") if path.stat().st_mtime_ns != 1}
+        for path in tmp_path.glob("cluster-*"):
+            os.utime(path, ns=(1, 1))
+        return found
+
+    memory = PersistentMemory()
+    memory.store("a", "x", [1.0, 0.0])
+    memory.store("b", "y", [0.0, 1.0])
+    memory.save(tmp_path)
+    assert len(touched()) == 6
+
+    memory.store("a", "x", [2.0, 0.0])
+    memory.save(tmp_path)
+    assert touched() == {f"{_stem('a', 'x')}{suffix}" for suffix in (".npy", ".norms.npy", ".json")}
+
+    reloaded = PersistentMemory.load(tmp_path)
+    reloaded.save(tmp_path)
+    assert touched() == set()
+    assert len(reloaded.clusters["a"]["x"]) == 2 and reloaded.clusters["b"]["y"][0].tensor == [0.0, 1.0]
@@ -0,0 +1,114 @@
+"""CIEL/Ω Quantum Consciousness Suite
+
+Copyright (c) 2025 Adrian Lipa / Intention Lab
+Licensed under the CIEL Research Non-Commercial License v1.1.
+"""
+
+import json
+import os
+import random
+
+import numpy as np
+import pytest
+
+from tmp import analyze_input, get_policy, spectral_weight, spectral_weight_many
+from tmp.policy import Policy, clear_policy_cache
+
+
+def _linear_boosts(conf, data, features):
+    # The original rule walk, kept as the reference for the compiled tables.
+    meta = features.get("M", {})
+    immutable = 0.0
+    for rule in conf["immutable_rules"]:
+        weight = float(rule.get("weight", 0.0))
+        if rule["type"] == "keyword" and str(rule["value"]).lower() and str(rule["value"]).lower() in data.lower():
+            immutable = max(immutable, weight)
+        elif rule["type"] == "tag" and rule["value"] and rule["value"] in meta.get("tags", []):
+            immutable = max(immutable, weight)
+    user = 0.0
+    for rule in conf["float_rules_user"]:
+        if rule["type"] == "length_threshold" and len(data) >= int(rule["gte"]):
+            user += rule["add"]
+        elif rule["type"] == "contains" and any(str(v).lower() in data.lower() for v in rule["value"]):
+            user += rule["add"]
+    own = 0.0
+    for rule in conf["float_rules_self"]:
+        if rule["type"] == "interest_symbol" and meta.get("symbol") in rule["symbols"]:
+            own += rule["add"]
+        elif rule["type"] == "intent_match" and meta.get("intent") in rule["intents"]:
+            own += rule["add"]
+    return immutable, user, own
+
+
+def _random_conf(rng, words):
+    pick = lambda k: rng.sample(words, k)  # noqa: E731
+    return {
+        "immutable_rules": [{"type": rng.choice(["keyword", "tag"]), "value": rng.choice(words + ["", "Ab"]),
+                             "weight": rng.uniform(-0.2, 0.6)} for _ in range(40)],
+        "float_rules_user": [{"type": "length_threshold", "gte": rng.randint(0, 60), "add": rng.uniform(0, 0.3)} for _ in range(10)]
+        + [{"type": "contains", "value": pick(3), "add": rng.uniform(0, 0.3)} for _ in range(30)],
+        "float_rules_self": [{"type": "interest_symbol", "symbols": pick(4), "add": 0.1 * i} for i in range(15)]
+        + [{"type": "intent_match", "intents": pick(4), "add": 0.05 * i} for i in range(15)],
+    }
+
+
+def test_compiled_rules_match_linear_walk(tmp_path):
+    rng = random.Random(3)
+    words = ["ab", "abc", "b", "kernel", "memory", "mem", "design", "nauka", "x"]
+    conf = _random_conf(rng, words)
+    path = tmp_path / "policies.json"
+    path.write_text(json.dumps(conf))
+    policy = Policy(path)
+    for _ in range(300):
+        data = " ".join(rng.choice(words + ["ABC", "Kernel"]) for _ in range(rng.randint(0, 8)))
+        features = analyze_input(data)
+        features["M"]["tags"] = rng.sample(words, 2)
+        assert policy.boosts(data, features) == _linear_boosts(conf, data, features)
+
+
+def test_d_type_scoping_is_opt_in():
+    rule = {"type": "contains", "value": ["kernel"], "add": 0.5, "d_type": "code"}
+    features = analyze_input("kernel")
+    features["T"]["type"] = "text"
+    policy = Policy(None)
+    policy.conf = dict(policy.conf, float_rules_user=[rule])
+    assert policy.float_boost_user("kernel", features) == 0.5
+    policy.conf = dict(policy.conf, scope_rules_by_d_type=True)
+    assert policy.float_boost_user("kernel", features) == 0.0
+    features["T"]["type"] = "code"
+    assert policy.float_boost_user("kernel", features) == 0.5
+
+
+def test_reassigning_conf_drops_compiled_caches():
+    policy = Policy(None)
+    assert policy.boosts("kernel", analyze_input("kernel"))[1] == 0.0 and policy.spectral_conf()["base"] == 0.4
+    policy.conf = dict(policy.conf, float_rules_user=[{"type": "contains", "value": ["kernel"], "add": 0.5}], spectral={"base": 0.2})
+    assert policy.boosts("kernel", analyze_input("kernel"))[1] == 0.5 and policy.spectral_conf()["base"] == 0.2
+    with pytest.raises(TypeError):
+        policy.spectral_conf()["decision"]["to_mem"] = 0.0
+
+
+def test_registry_reloads_only_when_file_changes(tmp_path):
+    clear_policy_cache()
+    path = tmp_path / "policies.json"
+    path.write_text(json.dumps({"spectral": {"base": 0.1}}))
+    first = get_policy(path)
+    assert get_policy(path) is first and first.spectral_conf()["base"] == 0.1
+    path.write_text(json.dumps({"spectral": {"base": 0.25}}))
+    os.utime(path, ns=(1, 1))
+    second = get_policy(path)
+    assert second is not first and second.spectral_conf()["base"] == 0.25
+    path.unlink()
+    assert get_policy(path).spectral_conf()["base"] == 0.4
+
+
+def test_spectral_weight_many_matches_scalar(tmp_path):
+    rng = random.Random(5)
+    words = ["nauka", "design", "memory", "kernel", "a", "b"]
+    policy = Policy(None)
+    policy.conf = dict(policy.conf, **_random_conf(rng, words))
+    texts = [" ".join(rng.choice(words) for _ in range(rng.randint(0, 12))) for _ in range(200)]
+    user = np.array([rng.uniform(-1, 1) for _ in texts])
+    batch = spectral_weight_many(texts, None, user, 0.3, policy)
+    loop = [spectral_weight({"data": t}, analyze_input(t), u, 0.3, policy) for t, u in zip(texts, user)]
+    assert batch.tolist() == loop
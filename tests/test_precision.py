@@ -0,0 +1,111 @@
+"""CIEL/Ω Quantum Consciousness Suite
+
+Copyright (c) 2025 Adrian Lipa / Intention Lab
+Licensed under the CIEL Research Non-Commercial License v1.1.
+"""
+
+import numpy as np
+import pytest
+
+from config.simulation_config import DOUBLE, SINGLE, get_precision, precision_scope, resolve_precision
+
+
+def _run_pair(build, step, steps):
+    results = {}
+    for name in ("double", "single"):
+        np.random.seed(0)
+        engine = build(name)
+        for _ in range(steps):
+            state = step(engine)
+        results[name] = (engine, state)
+    return results["double"], results["single"]
+
+
+def _relative(a, b):
+    return float(np.max(np.abs(a - b)) / np.max(np.abs(a)))
+
+
+def test_policy_resolution_and_scope():
+    assert resolve_precision("float32") is SINGLE and resolve_precision(DOUBLE) is DOUBLE
+    with pytest.raises(ValueError):
+        resolve_precision("half")
+    before = get_precision()
+    with precision_scope("single"):
+        assert resolve_precision(None) is SINGLE
+    assert get_precision() is before
+    assert SINGLE.norm(np.full(4, 3.0, dtype=np.float32)) == 6.0
+
+
+def test_universal_law_engine_single_precision_tracks_double():
+    from universal_law_4d.universal_engine import UniversalLawEngine4D
+
+    (d, d_state), (s, s_state) = _run_pair(
+        lambda p: UniversalLawEngine4D((6, 6, 5, 4), precision=p),
+        lambda e: e.cosmic_evolution_step_4d(0.01),
+        3,
+    )
+    assert s.symbolic_field.dtype == np.complex64 and s.resonance_field.dtype == np.float32
+    assert s.symbolic_field.nbytes * 2 == d.symbolic_field.nbytes
+    assert _relative(d.symbolic_field, s.symbolic_field) < 1e-5
+    for key in ("quantum_coherence", "intention_strength", "universal_resonance"):
+        assert s_state[key] == pytest.approx(d_state[key], rel=1e-4)
+
+
+def test_ultimate_engine_single_precision_tracks_double():
+    from paradoxes.ultimate_operators import UltimateUniversalLawEngine4D
+
+    (d, _), (s, _) = _run_pair(
+        lambda p: UltimateUniversalLawEngine4D((6, 6, 5, 4), precision=p),
+        lambda e: e.ultimate_evolution_step(0.01),
+        2,
+    )
+    assert all(getattr(s, name).dtype in (np.complex64, np.float32) for name in s.FIELD_NAMES)
+    assert _relative(d.symbolic_field, s.symbolic_field) < 1e-5
+
+
+def test_ultimate_engine_single_precision_stays_finite_on_grid_through_origin():
+    from paradoxes.ultimate_operators import UltimateUniversalLawEngine4D
+
+    np.random.seed(0)
+    engine = UltimateUniversalLawEngine4D((5, 5, 5, 5), precision="single")
+    assert np.isfinite(engine.quantum_gravity_field).all()
+    with np.errstate(divide="raise", invalid="raise"):
+        engine.ultimate_evolution_step(0.01)
+    assert np.isfinite(engine.quantum_gravity_field).all()
+    assert np.isfinite(engine.resonance_field).all()
+
+
+def test_lie4_reality_keeps_lagrangian_in_double():
+    from mathematics.lie4_engine import UnifiedCIELReality
+
+    (d, d_state), (s, s_state) = _run_pair(
+        lambda p: UnifiedCIELReality((10, 10), 4, precision=p),
+        lambda e: e.evolution_step(0.01),
+        2,
+    )
+    assert s.fields.I_field.dtype == np.complex64 and s.lie4_field.A.dtype == np.complex64
+    assert np.isfinite(s_state["total_action"])
+    assert s_state["total_action"] == pytest.approx(d_state["total_action"], rel=1e-5)
+
+
+def test_ciel0_framework_and_fourier_kernel_single_precision():
+    from ciel_wave.fourier_kernel import FourierWaveConsciousnessKernel12D, SimConfig
+    from core.physics import CIEL0Framework
+
+    def build(p):
+        framework = CIEL0Framework(grid_size=24, precision=p)
+        framework.initialize_gaussian_pulse()
+        return framework
+
+    # The intention dynamics amplify round-off, so only a short horizon is compared.
+    (d, _), (s, _) = _run_pair(build, lambda f: f.evolution_step(), 2)
+    assert s.I_field.dtype == np.complex64 and s.F_field.dtype == np.float32
+    assert _relative(d.I_field, s.I_field) < 1e-5
+
+    signal = np.sin(np.linspace(0.0, 40.0, 256))
+    snapshots = [
+        FourierWaveConsciousnessKernel12D(SimConfig(sample_rate=256.0), precision=p).simulate(signal)
+        for p in ("double", "single")
+    ]
+    assert snapshots[1].field.dtype == np.float32
+    assert snapshots[1].purity == pytest.approx(snapshots[0].purity, rel=1e-5)
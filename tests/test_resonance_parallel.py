@@ -0,0 +1,67 @@
+"""CIEL/Ω Quantum Consciousness Suite
+
+Copyright (c) 2025 Adrian Lipa / Intention Lab
+Licensed under the CIEL Research Non-Commercial License v1.1.
+"""
+
+import gc
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+from evolution.omega_drift import OmegaDriftCore
+from evolution.schumann_clock import SchumannClock
+from resonance.resonance_parallel import ResConnectParallel, ResonanceNode
+
+
+class _FrozenClock(SchumannClock):
+    def phase(self, k=1, at=None):
+        return 0.3 * k
+
+
+def _drift():
+    return OmegaDriftCore(_FrozenClock())
+
+
+def _nodes(n=6, seed=0):
+    rng = np.random.default_rng(seed)
+    return [
+        ResonanceNode(f"n{i}", rng.normal(size=(8, 8)) + 1j * rng.normal(size=(8, 8)), 0.5 + 0.1 * i)
+        for i in range(n)
+    ]
+
+
+def test_stacked_step_matches_sequential_nodes():
+    stacked = ResConnectParallel(_nodes(), _drift)
+    sequential = ResConnectParallel(_nodes(), _drift)
+    for _ in range(3):
+        stacked.step()
+        sequential._step_sequential(_drift())
+
+    for a, b in zip(stacked.nodes, sequential.nodes):
+        assert np.allclose(a.psi, b.psi)
+        assert np.isclose(a.sigma, b.sigma)
+    assert np.allclose([h["empathy"] for h in stacked.history], [h["empathy"] for h in sequential.history])
+    assert stacked.nodes[2].psi.base is stacked.psi_stack
+
+
+def test_sharded_mode_matches_in_process_stack():
+    reference = ResConnectParallel(_nodes(), _drift)
+    reference.step()
+    with ResConnectParallel(_nodes(), _drift, workers=2) as sharded:
+        sharded.step()
+        assert np.allclose(sharded.psi_stack, reference.psi_stack)
+        assert np.isclose(sharded.history[-1]["empathy"], reference.history[-1]["empathy"])
+    assert sharded.nodes[0].psi.flags.owndata
+
+
+def test_unclosed_sharded_network_releases_its_segments():
+    network = ResConnectParallel(_nodes(), _drift, workers=2)
+    network.step()
+    names = [spec[0] for spec in (network._shared.psi_spec, network._shared.sigma_spec)]
+    del network
+    gc.collect()
+    for name in names:
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
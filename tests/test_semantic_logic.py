@@ -0,0 +1,47 @@
+"""CIEL/Ω Quantum Consciousness Suite
+
+Copyright (c) 2025 Adrian Lipa / Intention Lab
+Licensed under the CIEL Research Non-Commercial License v1.1.
+"""
+
+import random
+import time
+
+from core.memory.vendor.repo.semantic_logic import NEGATION_WORDS, analyse, semantic_checks, semantic_checks_many
+
+
+def _reference(text):
+    # The original quadratic implementation.
+    if not isinstance(text, str) or not text.strip():
+        return {"coherence": 0.4, "negations": 0, "contradiction": False}
+    toks = text.lower().split()
+    negs = sum(t in NEGATION_WORDS for t in toks)
+    contradiction = any(toks.count(w) >= 1 and ("nie " + w) in text.lower() for w in set(toks))
+    base = 0.3 + min(0.4, 0.02 * len(toks))
+    penal = min(0.3, 0.05 * negs) + (0.25 if contradiction else 0.0)
+    return {"coherence": float(max(0.0, min(1.0, base - penal))), "negations": int(negs), "contradiction": bool(contradiction)}
+
+
+def test_matches_reference_on_random_texts():
+    rng = random.Random(7)
+    words = ["nie", "Nie", "znie", "to", "prawda", "brak", "nigdy", "kot", "ŻADEN", "x"]
+    gaps = [" ", " ", " ", "  ", "\t", "\n", " ", " "]
+    texts = ["", "   ", None, 42, "nie", "nie ", " nie kot", "kot i nie kot", "to nie\tprawda"]
+    for _ in range(2000):
+        n = rng.randint(1, 12)
+        texts.append("".join(rng.choice(words) + rng.choice(gaps) for _ in range(n)).rstrip(rng.choice(["", " "])))
+    assert semantic_checks_many(texts) == [_reference(t) for t in texts]
+
+
+def test_pairs_link_negated_and_affirmed_words():
+    result = analyse("Kot jest tu i nie kot, nie pies")
+    assert result.negated == [5, 7] and result.contradiction
+    assert result.pairs == [] and analyse("kot i nie kot").pairs == [("kot", 0, 3)]
+
+
+def test_cost_is_linear_in_text_length():
+    text = " ".join(f"słowo{i} nie słowo{i}" for i in range(20000))
+    start = time.perf_counter()
+    checks = semantic_checks(text)
+    assert checks["contradiction"] and checks["negations"] == 20000
+    assert time.perf_counter() - start < 1.0
@@ -5,11 +5,14 @@ Licensed under the CIEL Research Non-Commercial License v1.1.
 """
 
 import numpy as np
+import pytest
 
 from mathematics.safe_operations import (
     HeisenbergSoftClipper,
     heisenberg_soft_clip,
     heisenberg_soft_clip_range,
+    soft_clip_exp,
+    soft_clip_log,
 )
 
 
@@ -41,3 +44,27 @@ def test_stateful_soft_clipper_tracks_scale_history():
     assert first_scale > 0.0
     assert second_scale >= first_scale
     assert clipper.average_scale >= first_scale
+
+
+def test_array_clip_matches_scalar_calls_and_supports_out():
+    x = np.linspace(-300.0, 300.0, 41).reshape(1, 41)
+    expected = np.array([[float(heisenberg_soft_clip_range(v, -100.0, 100.0)) for v in row] for row in x])
+    np.testing.assert_array_equal(heisenberg_soft_clip_range(x, -100.0, 100.0), expected)
+
+    buffer = x.copy()
+    assert heisenberg_soft_clip_range(buffer, -100.0, 100.0, out=buffer) is buffer
+    np.testing.assert_array_equal(buffer, expected)
+
+    bounded = heisenberg_soft_clip_range([5.0, 5.0], [0.0, 1.0], [1.0, 2.0])
+    assert 0.0 < bounded[0] < 1.0 < bounded[1] < 2.0
+
+
+def test_fused_exp_and_log_variants():
+    z = np.array([1000.0 + 0.5j, -3.0 - 1.0j, 0.25j])
+    expected = np.exp(heisenberg_soft_clip_range(z.real, -50.0, 50.0)) * np.exp(1j * z.imag)
+    np.testing.assert_allclose(soft_clip_exp(z, -50.0, 50.0), expected)
+    assert np.isfinite(soft_clip_exp(np.array([1e6]), -50.0, 50.0)).all()
+    logs = soft_clip_log([0.0, 10.0], 0.5, 2.0)
+    np.testing.assert_allclose(logs, np.log(heisenberg_soft_clip_range([0.0, 10.0], 0.5, 2.0)))
+    with pytest.raises(ValueError):
+        soft_clip_log(1.0, -1.0, 1.0)
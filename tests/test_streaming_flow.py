@@ -0,0 +1,81 @@
+"""CIEL/Ω Quantum Consciousness Suite
+
+Copyright (c) 2025 Adrian Lipa / Intention Lab
+Licensed under the CIEL Research Non-Commercial License v1.1.
+"""
+
+import json
+import threading
+
+import numpy as np
+import pytest
+
+from integration.information_flow import InformationFlow
+from integration.streaming_flow import StageQueue, StreamingInformationFlow
+from memory.long_term_memory import LongTermMemory
+
+
+def test_stage_queue_overflow_policies():
+    q = StageQueue(2, "drop_oldest")
+    for item in range(4):
+        q.put(item)
+    assert q.get_batch(5) == [2, 3] and q.dropped == 2
+
+    q = StageQueue(2, "drop_newest")
+    assert [q.put(item) for item in range(3)] == [True, True, False]
+
+    q = StageQueue(1, "coalesce", merge=lambda a, b: np.concatenate([a, b]))
+    q.put(np.arange(2))
+    q.put(np.arange(2, 5))
+    assert np.array_equal(q.get_batch()[0], np.arange(5)) and q.coalesced == 1
+
+    q = StageQueue(1, "block")
+    q.put("a")
+    assert q.put("b", timeout=0.01) is False
+    with pytest.raises(ValueError):
+        StageQueue(1, "spill")
+
+
+def test_streaming_flow_stores_every_chunk(tmp_path):
+    storage = tmp_path / "memory.json"
+    flow = InformationFlow.build(storage_path=storage, intention_seed=7, sample_rate=250.0)
+    seen = []
+    signal = np.sin(np.linspace(0.0, 20.0, 400))
+    with StreamingInformationFlow(flow, policies={"filter": "block"}, on_entry=seen.append) as streaming:
+        for chunk in np.split(signal, 10):
+            assert streaming.submit(chunk)
+        assert streaming.flush(timeout=10.0)
+        stats = streaming.stats()
+
+    saved = json.loads(storage.read_text(encoding="utf-8"))
+    assert len(saved) == len(seen) == 10
+    assert all(stats[name]["processed"] == 10 for name in ("filter", "project", "analyse", "sink"))
+    assert stats["sink"]["batches"] <= 10 and stats["sink"]["errors"] == 0
+    assert isinstance(seen[0]["filtered"], list) and set(seen[0]) == set(flow.step(signal[:40]))
+
+    expected = flow.eeg.stream().process(signal)  # not flow.step: streaming uses the causal filter
+    channels = flow.receiver.intention.channels
+    for index, entry in enumerate(saved):
+        assert np.allclose(entry["filtered"], expected[40 * index:40 * index + channels])
+
+
+def test_slow_sink_does_not_stall_acquisition(tmp_path):
+    gate = threading.Event()
+
+    class SlowMemory(LongTermMemory):
+        def store_many(self, entries):
+            gate.wait(5.0)
+            LongTermMemory.store_many(self, entries)
+
+    flow = InformationFlow.build(storage_path=tmp_path / "memory.json", intention_seed=1)
+    flow.memory = SlowMemory(tmp_path / "memory.json")
+    streaming = StreamingInformationFlow(flow, queue_sizes={"sink": 1, "analyse": 1, "project": 1, "filter": 2})
+    assert all(streaming.submit(np.ones(16), timeout=0) for _ in range(200))  # never waits for the sink
+
+    stats = streaming.stats()
+    assert stats["filter"]["coalesced"] > 0 and stats["filter"]["max_depth"] <= 2
+    gate.set()
+    assert streaming.flush(timeout=10.0)
+    streaming.close()
+    assert streaming.stream.samples_seen == 200 * 16  # coalescing lost no samples
+    assert 0 < len(flow.memory.entries) < 200
@@ -0,0 +1,55 @@
+"""CIEL/Ω Quantum Consciousness Suite
+
+Copyright (c) 2025 Adrian Lipa / Intention Lab
+Licensed under the CIEL Research Non-Commercial License v1.1.
+"""
+
+import json
+import os
+
+import pytest
+
+from experiments.exp_registry import ExpRegistry
+from experiments.sweep import THREAD_LIMIT_VARS, parameter_grid, run_sweep, universal_law_4d_run
+
+
+def test_parameter_grid_expands_cartesian_product():
+    runs = parameter_grid({"dt": [0.01, 0.02], "steps": [1, 2, 3]})
+    assert len(runs) == 6
+    assert {"dt": 0.02, "steps": 3} in runs
+
+
+def test_sweep_streams_results_and_resumes(tmp_path):
+    store = tmp_path / "sweep.jsonl"
+    grid = {"grid_size": [(3, 3, 3, 2)], "steps": [1, 2], "dt": [0.01]}
+
+    first = run_sweep(universal_law_4d_run, grid, results_path=store, max_workers=2)
+    assert first.completed == 2 and first.failed == 0
+    lines = [json.loads(line) for line in store.read_text().splitlines()]
+    assert {line["params"]["steps"] for line in lines} == {1, 2}
+
+    registry = ExpRegistry()
+    registry.add("ule4d", universal_law_4d_run)
+    grid["steps"].append(3)
+    second = registry.sweep("ule4d", grid, results_path=store, max_workers=1)
+    assert second.skipped == 2 and second.completed == 1
+    assert second.runs_per_second > 0
+
+
+def _blas_threads():
+    import numpy  # noqa: F401 - loads the BLAS library inside the worker
+    from threadpoolctl import threadpool_info
+
+    blas = [info["num_threads"] for info in threadpool_info() if info["user_api"] == "blas"]
+    return {"blas": blas, "env": os.environ.get("OPENBLAS_NUM_THREADS")}
+
+
+def test_sweep_workers_start_with_capped_blas_threads(tmp_path):
+    pytest.importorskip("threadpoolctl")
+    before = {var: os.environ.get(var) for var in THREAD_LIMIT_VARS}
+
+    report = run_sweep(_blas_threads, [{}], results_path=tmp_path / "threads.jsonl", threads_per_worker=1)
+    assert report.completed == 1
+    metrics = report.results[0]["metrics"]
+    assert metrics["env"] == "1" and metrics["blas"] and set(metrics["blas"]) == {1}
+    assert {var: os.environ.get(var) for var in THREAD_LIMIT_VARS} == before
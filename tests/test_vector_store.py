@@ -0,0 +1,69 @@
+"""CIEL/Ω Quantum Consciousness Suite
+
+Copyright (c) 2025 Adrian Lipa / Intention Lab
+Licensed under the CIEL Research Non-Commercial License v1.1.
+"""
+
+import json
+
+import numpy as np
+
+from persistent.vector_store import VectorStore, main, migrate_legacy_files
+
+
+def test_batched_appends_span_segments_and_reopen(tmp_path):
+    store = VectorStore(tmp_path / "store", segment_bytes=10 * 8)
+    ids = store.append_many((f"s{i % 3}", "intent", np.full(4, float(i))) for i in range(10))
+    assert list(ids) == list(range(10))
+    assert store.append("odd", "long", range(25)) == 10
+    assert len(list((tmp_path / "store").glob("vectors-*.seg"))) > 3
+
+    reopened = VectorStore(tmp_path / "store", segment_bytes=10 * 8)
+    assert len(reopened) == 11
+    assert reopened.get(7).tolist() == [7.0] * 4 and reopened.label(7) == ("s1", "intent")
+    assert reopened[10].tolist() == list(map(float, range(25)))
+    assert [vid for vid, *_ in reopened.scan(symbol="s0")] == [0, 3, 6, 9]
+    np.testing.assert_array_equal(reopened.matrix(symbol="s1")[:, 0], [1.0, 4.0, 7.0])
+
+
+def test_reopen_discards_a_torn_append(tmp_path):
+    store = VectorStore(tmp_path)
+    store.append_many([("a", "b", [1.0, 2.0]), ("a", "b", [3.0])])
+    with (tmp_path / "vectors-000000.seg").open("ab") as fh:
+        fh.write(np.ones(5).tobytes())  # data written, index record never made it
+    with (tmp_path / "index.bin").open("ab") as fh:
+        fh.write(b"\x01\x02\x03")
+    store = VectorStore(tmp_path)
+    assert len(store) == 2
+    assert store.append("a", "b", [4.0]) == 2 and store.get(2).tolist() == [4.0]
+    assert (tmp_path / "vectors-000000.seg").stat().st_size == 4 * 8  # remnant trimmed under the lock
+
+
+def test_migrates_legacy_per_file_store(tmp_path, capsys):
+    legacy = tmp_path / "legacy"
+    legacy.mkdir()
+    for i in range(5):
+        doc = {"symbol": "nauka", "intent": f"i{i % 2}", "tensor": [i, i + 0.5]}
+        (legacy / f"nauka_i{i % 2}_{i:032x}.h5").write_text(json.dumps(doc), encoding="utf-8")
+    (legacy / "binary.h5").write_bytes(b"\x89HDF\r\n\x1a\n")
+
+    store = VectorStore(tmp_path / "packed")
+    assert migrate_legacy_files(legacy, store, batch_size=2)["imported"] == 5
+    assert sorted(v.tolist() for *_, v in store.scan(intent="i0")) == [[0.0, 0.5], [2.0, 2.5], [4.0, 4.5]]
+    rerun = migrate_legacy_files(legacy, store)
+    assert (rerun["imported"], rerun["skipped"], len(store)) == (0, 5, 5)
+
+    assert main(["migrate", str(legacy), str(tmp_path / "cli"), "--remove"]) == 0
+    assert json.loads(capsys.readouterr().out)["imported"] == 5
+    assert sorted(p.name for p in legacy.iterdir()) == ["binary.h5"]
+
+
+def test_two_instances_on_one_root_do_not_lose_appends(tmp_path):
+    a, b = VectorStore(tmp_path), VectorStore(tmp_path)
+    assert a.append("s", "i", [1.0, 2.0]) == 0
+    assert b.append("t", "j", [3.0, 4.0]) == 1  # b sees a's vector before writing
+    c = VectorStore(tmp_path)  # opening must not trim what a and b wrote
+    assert a.append_many([("s", "i", [5.0])]) == range(2, 3)
+    assert a.get(1).tolist() == [3.0, 4.0] and a.label(1) == ("t", "j")
+    assert [v.tolist() for *_, v in VectorStore(tmp_path).scan()] == [[1.0, 2.0], [3.0, 4.0], [5.0]]
+    assert c.get(2).tolist() == [5.0]
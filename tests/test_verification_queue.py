@@ -0,0 +1,66 @@
+"""CIEL/Ω Quantum Consciousness Suite
+
+Copyright (c) 2025 Adrian Lipa / Intention Lab
+Licensed under the CIEL Research Non-Commercial License v1.1.
+"""
+
+import pytest
+
+from ciel_memory.orchestrator import UnifiedMemoryOrchestrator, verification_queue_path
+from ciel_memory.verification import VerificationQueue
+
+
+def _reports(n):
+    return [{"report_id": f"r{i}", "level": "IMPORTANT", "payload": {"i": i}} for i in range(n)]
+
+
+def test_queue_pages_decides_and_dequeues(tmp_path):
+    queue = VerificationQueue(tmp_path / "q.db")
+    assert queue.pending() == ([], None) and not (tmp_path / "q.db").exists()
+    assert queue.enqueue_many(_reports(25)) == 25 and not queue.enqueue({"report_id": "r3"})
+
+    seen, cursor = [], None
+    while True:
+        items, cursor = queue.pending(limit=10, after=cursor)
+        seen += [item["report_id"] for item in items]
+        if cursor is None:
+            break
+    assert seen == [f"r{i}" for i in range(25)]
+
+    assert queue.decide_many({"r0": True, "r1": False, "missing": True}) == 2
+    assert queue.approve_many(["r2", "r3"], note="ok") == 2
+    assert queue.count("approved") == 3 and queue.count("rejected") == 1 and len(queue) == 21
+    assert queue.get("r2")["verified_by_user"] and queue.get("r2")["note"] == "ok"
+    with pytest.raises(ValueError):
+        queue.update("r4", "maybe")
+
+    assert [item["report_id"] for item in queue.dequeue(2)] == ["r4", "r5"]
+    assert queue.get("r4") is None and len(queue) == 19
+
+
+def test_orchestrator_queue_survives_restart(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    orch = UnifiedMemoryOrchestrator()
+    for sense in ("too short", "x", "a sentence long enough to pass the checks"):
+        orch.run_tmp(orch.capture(context="c", sense=sense))
+    assert orch.daily_maintenance()["pending_verifications"] == 2
+
+    restarted = UnifiedMemoryOrchestrator()
+    items, _ = restarted.verification.pending()
+    assert restarted.verification.approve_many([items[0]["report_id"]]) == 1
+    assert restarted.daily_maintenance()["pending_verifications"] == 1
+
+
+def test_run_tmp_buffers_reports_until_flushed(tmp_path):
+    orch = UnifiedMemoryOrchestrator(tmp_path)
+    for sense in ("too short", "x", "also short"):
+        orch.run_tmp(orch.capture(context="c", sense=sense))
+    assert not (tmp_path / "TSM").exists()
+    assert orch.flush_verifications() == 3 and orch.flush_verifications() == 0
+    orch.close()
+    assert len(VerificationQueue(verification_queue_path(tmp_path))) == 3
+
+    shared = VerificationQueue(tmp_path / "shared.db")
+    injected = UnifiedMemoryOrchestrator(tmp_path, verification=shared)
+    injected.run_tmp(injected.capture(context="c", sense="short"))
+    assert injected.verification is shared and len(shared) == 1
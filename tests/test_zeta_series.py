@@ -0,0 +1,53 @@
+"""CIEL/Ω Quantum Consciousness Suite
+
+Copyright (c) 2025 Adrian Lipa / Intention Lab
+Licensed under the CIEL Research Non-Commercial License v1.1.
+"""
+
+import numpy as np
+import pytest
+
+from mathematics import zeta_series
+from mathematics.zeta_series import zeta, zeta_critical_line, zeta_scalar_loop
+from universal_law_4d.universal_engine import StableRiemannZetaOperator
+
+# mpmath reference values
+REFERENCE = {
+    2.0: 1.6449340668482264,
+    -1.0: -1.0 / 12.0,
+    0.5 + 14.134725141734693j: 0.0,
+    0.5 + 3.0j: 0.5327366709742328 - 0.07889651342583338j,
+    1.5 + 10.0j: 1.2783911664347598 - 0.09572405598670886j,
+    -1.5 + 2.0j: 0.12424726557777474 - 0.015707749528273203j,
+}
+
+
+@pytest.mark.parametrize("method", ["euler_maclaurin", "borwein"])
+def test_accelerated_methods_match_reference(method):
+    points = np.array(list(REFERENCE))
+    expected = np.array(list(REFERENCE.values()))
+    assert np.allclose(zeta(points, method=method), expected, atol=1e-8)
+
+
+def test_direct_method_matches_scalar_loop_on_arrays():
+    points = np.array([[1.5 + 1j, 2.0, 3.0 - 4j], [-1.5 + 2j, -0.5 + 7j, 4.0 + 30j]])
+    values = zeta(points)
+    assert values.shape == (2, 3)
+    loop = np.array([[zeta_scalar_loop(complex(s)) for s in row] for row in points])
+    assert np.allclose(values, loop, rtol=1e-12)
+    assert isinstance(zeta(2.0), complex)
+    assert zeta(-4.0) == 0 and np.isinf(zeta(1.0))
+
+
+def test_critical_line_is_memoised_and_finite_far_up_the_axis():
+    zeta_series.clear_critical_line_cache()
+    t = np.array([3.0, 3.0, 500.0])
+    values = zeta_critical_line(t)
+    assert len(zeta_series._CRITICAL_CACHE) == 2
+    assert values[0] == values[1] and np.isfinite(values).all()
+    assert np.isfinite(zeta(0.2 + 500j, method="euler_maclaurin"))
+
+
+def test_critical_line_modulation_no_longer_collapses_to_zero():
+    modulation = StableRiemannZetaOperator.critical_line_modulation(np.linspace(1.0, 40.0, 8))
+    assert modulation.shape == (8,) and np.all(np.abs(modulation) > 0)
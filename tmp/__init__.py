@@ -11,11 +11,11 @@ from .analysis import analyze_input
 from .bifurcation import decide_branch
 from .capture import capture
 from .heuristics import Heuristics
-from .policy import Policy
+from .policy import Policy, PolicyHolder, get_policy
 from .prefilter import prefilter
 from .reports import daily_report
 from .spectral_weighting import compute_weight
-from .weighting import spectral_weight
+from .weighting import spectral_weight, spectral_weight_many
 
 __all__ = [
     "analyze_input",
@@ -23,8 +23,11 @@ __all__ = [
     "compute_weight",
     "daily_report",
     "decide_branch",
+    "get_policy",
     "Heuristics",
     "Policy",
+    "PolicyHolder",
     "prefilter",
     "spectral_weight",
+    "spectral_weight_many",
 ]
@@ -8,7 +8,7 @@ Deterministic bifurcation helpers for the kata tests.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Mapping, Optional
 
 DEFAULT_TO_MEM = 1.65
 DEFAULT_TO_OUT = 0.50
@@ -22,7 +22,7 @@ class DecisionThresholds:
     to_out: float = DEFAULT_TO_OUT
 
     @classmethod
-    def from_mapping(cls, mapping: Optional[dict]) -> "DecisionThresholds":
+    def from_mapping(cls, mapping: Optional[Mapping[str, float]]) -> "DecisionThresholds":
         if not mapping:
             return cls()
         return cls(
@@ -31,10 +31,10 @@ class DecisionThresholds:
         )
 
 
-def decide_branch(weight: float, thresholds: Optional[DecisionThresholds | dict] = None) -> str:
+def decide_branch(weight: float, thresholds: Optional[DecisionThresholds | Mapping[str, float]] = None) -> str:
     """Classify ``weight`` into ``mem``, ``out`` or ``tmp``."""
 
-    if isinstance(thresholds, dict):
+    if isinstance(thresholds, Mapping):
         thresholds = DecisionThresholds.from_mapping(thresholds)
     elif thresholds is None:
         thresholds = DecisionThresholds()
@@ -4,13 +4,37 @@ Copyright (c) 2025 Adrian Lipa / Intention Lab
 Licensed under the CIEL Research Non-Commercial License v1.1.
 
 Simplified TMP policy implementation.
+
+Rules are compiled once per policy into lookup tables:
+
+* keyword and ``contains`` rules go through one regular-expression scan;
+* tags, symbols and intents are dictionary lookups;
+* length thresholds are found by bisection.
+
+The cost of an evaluation therefore does not grow with the number of rules.
+
+Rules may be scoped by D_type, but only when the configuration opts in with
+``"scope_rules_by_d_type": true``.  A rule in such a configuration may then
+carry a ``d_type`` (a string or a list) restricting it to inputs whose
+``features["T"]["type"]`` matches, and tables are compiled separately for each
+D_type.  Without the flag a ``d_type`` key is ignored and every rule applies
+to every input, as before.  To migrate a configuration, set the flag and
+check that its existing rules carry no stray ``d_type`` keys.
+
+:func:`get_policy` is the process-wide registry.  It loads each policy file
+once and reloads it when the file's mtime or size changes.
 """
 from __future__ import annotations
 
+import bisect
 import json
-from dataclasses import dataclass
+import os
+import re
+import threading
+from types import MappingProxyType
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, Mapping
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
 
 
 @dataclass(frozen=True)
@@ -39,12 +63,187 @@ DEFAULT_CONFIG: Mapping[str, object] = {
 }
 
 
+class _SubstringScan:
+    """Which of a set of lowercase substrings occur in a text, in one regex scan.
+
+    A lookahead alternation, longest pattern first, reports the longest
+    pattern starting at each position.  Any other pattern matching at that
+    position is a prefix of it, so each pattern carries its prefix closure.
+    """
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        unique = sorted({p for p in patterns if p}, key=lambda p: (-len(p), p))
+        self._regex = re.compile("(?=(" + "|".join(map(re.escape, unique)) + "))", re.DOTALL) if unique else None
+        self._closure = {p: frozenset(q for q in unique if p.startswith(q)) for p in unique}
+
+    def find(self, text: str) -> FrozenSet[str]:
+        if self._regex is None:
+            return frozenset()
+        found: set = set()
+        for match in self._regex.finditer(text):
+            hit = match.group(1)
+            if hit not in found:
+                found |= self._closure[hit]
+        return frozenset(found)
+
+
+def _lookup_table(rules: Iterable[Tuple[int, Any]]) -> Tuple[Dict[Any, List[int]], List[int]]:
+    """Map each member of a rule's collection to the rule indices holding it.
+
+    Rules whose collection is not a list/tuple/set of hashables (``in`` would
+    mean something else) are returned separately for direct evaluation.
+    """
+
+    table: Dict[Any, List[int]] = {}
+    direct: List[int] = []
+    for index, members in rules:
+        try:
+            if not isinstance(members, (list, tuple, set, frozenset)):
+                raise TypeError
+            for member in set(members):
+                table.setdefault(member, []).append(index)
+        except TypeError:
+            direct.append(index)
+    return table, direct
+
+
+def _scoped(conf: Mapping[str, Any]) -> bool:
+    return bool(conf.get("scope_rules_by_d_type", False))
+
+
+def _applies(rule: Mapping[str, Any], d_type: Optional[str]) -> bool:
+    wanted = rule.get("d_type")
+    if wanted is None:
+        return True
+    return d_type == wanted if isinstance(wanted, str) else d_type in wanted
+
+
+@dataclass
+class _CompiledRules:
+    """Rule tables for one D_type; ``*_adds`` keep the rule order for exact sums."""
+
+    keywords: Dict[str, float] = field(default_factory=dict)
+    tags: Dict[str, float] = field(default_factory=dict)
+    user_adds: List[float] = field(default_factory=list)
+    user_always: List[int] = field(default_factory=list)
+    contains: Dict[str, List[int]] = field(default_factory=dict)
+    lengths: List[Tuple[int, int]] = field(default_factory=list)
+    self_adds: List[float] = field(default_factory=list)
+    symbols: Dict[Any, List[int]] = field(default_factory=dict)
+    intents: Dict[Any, List[int]] = field(default_factory=dict)
+    direct_self: List[Tuple[int, str, Any]] = field(default_factory=list)
+    scan: _SubstringScan = field(default_factory=lambda: _SubstringScan(()))
+
+    @classmethod
+    def build(cls, conf: Mapping[str, Any], d_type: Optional[str]) -> "_CompiledRules":
+        table = cls()
+        scoped = _scoped(conf)
+        for rule in conf.get("immutable_rules", []):
+            if not isinstance(rule, Mapping) or (scoped and not _applies(rule, d_type)):
+                continue
+            weight = float(rule.get("weight", 0.0))
+            if weight <= 0.0:
+                continue  # cannot raise the max above its 0.0 start
+            if rule.get("type") == "keyword":
+                value = str(rule.get("value", "")).lower()
+                if value:
+                    table.keywords[value] = max(weight, table.keywords.get(value, 0.0))
+            elif rule.get("type") == "tag":
+                value = str(rule.get("value", ""))
+                if value:
+                    table.tags[value] = max(weight, table.tags.get(value, 0.0))
+
+        for rule in conf.get("float_rules_user", []):
+            if not isinstance(rule, Mapping) or (scoped and not _applies(rule, d_type)):
+                continue
+            index = len(table.user_adds)
+            if rule.get("type") == "length_threshold":
+                table.lengths.append((int(rule.get("gte", 0)), index))
+            elif rule.get("type") == "contains":
+                for value in rule.get("value", []) or []:
+                    value = str(value).lower()
+                    if value:
+                        table.contains.setdefault(value, []).append(index)
+                    else:
+                        table.user_always.append(index)  # "" is in every string
+            else:
+                continue
+            table.user_adds.append(float(rule.get("add", 0.0)))
+        table.lengths.sort()
+
+        symbol_rules, intent_rules = [], []
+        for rule in conf.get("float_rules_self", []):
+            if not isinstance(rule, Mapping) or (scoped and not _applies(rule, d_type)):
+                continue
+            index = len(table.self_adds)
+            if rule.get("type") == "interest_symbol":
+                symbol_rules.append((index, rule.get("symbols", [])))
+            elif rule.get("type") == "intent_match":
+                intent_rules.append((index, rule.get("intents", [])))
+            else:
+                continue
+            table.self_adds.append(float(rule.get("add", 0.0)))
+        table.symbols, direct_symbols = _lookup_table(symbol_rules)
+        table.intents, direct_intents = _lookup_table(intent_rules)
+        members = dict(symbol_rules + intent_rules)
+        table.direct_self = [(i, "symbol", members[i]) for i in direct_symbols] + [
+            (i, "intent", members[i]) for i in direct_intents
+        ]
+        table.scan = _SubstringScan(list(table.keywords) + list(table.contains))
+        return table
+
+    def immutable(self, found: FrozenSet[str], tags: Any) -> float:
+        total = 0.0
+        for value in found:
+            total = max(total, self.keywords.get(value, 0.0))
+        if self.tags:
+            if isinstance(tags, (list, tuple, set, frozenset)):
+                for tag in tags:
+                    if isinstance(tag, str):
+                        total = max(total, self.tags.get(tag, 0.0))
+            else:
+                for value, weight in self.tags.items():
+                    if value in tags:
+                        total = max(total, weight)
+        return total
+
+    def user(self, found: FrozenSet[str], length: int) -> float:
+        matched = set(self.user_always)
+        for value in found:
+            matched.update(self.contains.get(value, ()))
+        if self.lengths:
+            cut = bisect.bisect_right(self.lengths, (length, len(self.user_adds)))
+            matched.update(index for _, index in self.lengths[:cut])
+        return sum((self.user_adds[i] for i in sorted(matched)), 0.0)
+
+    def self_(self, symbol: Any, intent: Any) -> float:
+        matched = set()
+        for table, key in ((self.symbols, symbol), (self.intents, intent)):
+            try:
+                matched.update(table.get(key, ()))
+            except TypeError:  # unhashable metadata never equals a table key
+                pass
+        for index, kind, members in self.direct_self:
+            if (symbol if kind == "symbol" else intent) in members:
+                matched.add(index)
+        return sum((self.self_adds[i] for i in sorted(matched)), 0.0)
+
+
+def _meta(features: Mapping[str, object]) -> Mapping[str, Any]:
+    return features.get("M", {}) if isinstance(features, Mapping) else {}
+
+
+def _d_type(features: Mapping[str, object]) -> Optional[str]:
+    section = features.get("T", {}) if isinstance(features, Mapping) else {}
+    return section.get("type") if isinstance(section, Mapping) else None
+
+
 class Policy:
     """Policy facade with a tiny subset of the production behaviour."""
 
     def __init__(self, path: str | Path | None = "config/policies.json") -> None:
         self.path = Path(path) if path is not None else None
-        self.conf: Mapping[str, object] = DEFAULT_CONFIG
+        self.conf = DEFAULT_CONFIG
         if self.path is not None and self.path.exists():
             try:
                 loaded = json.loads(self.path.read_text(encoding="utf-8"))
@@ -55,65 +254,73 @@ class Policy:
                 merged.update(loaded)
                 self.conf = merged
 
+    @property
+    def conf(self) -> Mapping[str, object]:
+        """Active configuration; assigning a new one drops the compiled rule and spectral caches."""
+
+        return self._conf
+
+    @conf.setter
+    def conf(self, value: Mapping[str, object]) -> None:
+        self._conf = value
+        self._tables: Dict[Optional[str], _CompiledRules] = {}
+        self._spectral: Optional[Mapping[str, object]] = None
+
+    def rules_for(self, d_type: Optional[str] = None) -> _CompiledRules:
+        """Compiled rule tables for inputs of ``d_type`` (built on first use).
+
+        Unless the configuration sets ``scope_rules_by_d_type`` every D_type
+        shares one table that ignores the rules' ``d_type`` keys.
+        """
+
+        if not _scoped(self.conf):
+            d_type = None
+        table = self._tables.get(d_type)
+        if table is None:
+            table = self._tables[d_type] = _CompiledRules.build(self.conf, d_type)
+        return table
+
     # --- immutable boosts -------------------------------------------------
     def immutable_boost(self, data: str, features: Mapping[str, object]) -> float:
-        total = 0.0
-        for rule in self.conf.get("immutable_rules", []):
-            if not isinstance(rule, Mapping):
-                continue
-            rtype = rule.get("type")
-            weight = float(rule.get("weight", 0.0))
-            if rtype == "keyword":
-                value = str(rule.get("value", "")).lower()
-                if value and value in data.lower():
-                    total = max(total, weight)
-            elif rtype == "tag":
-                tags = features.get("M", {}).get("tags", []) if isinstance(features, Mapping) else []
-                tag_value = str(rule.get("value", ""))
-                if tag_value and tag_value in tags:
-                    total = max(total, weight)
-        return total
+        rules = self.rules_for(_d_type(features))
+        return rules.immutable(rules.scan.find(data.lower()), _meta(features).get("tags", []))
 
     def float_boost_user(self, data: str, features: Mapping[str, object]) -> float:
-        total = 0.0
-        for rule in self.conf.get("float_rules_user", []):
-            if not isinstance(rule, Mapping):
-                continue
-            rtype = rule.get("type")
-            if rtype == "length_threshold":
-                if len(data) >= int(rule.get("gte", 0)):
-                    total += float(rule.get("add", 0.0))
-            elif rtype == "contains":
-                values = rule.get("value", [])
-                if any(str(v).lower() in data.lower() for v in values):
-                    total += float(rule.get("add", 0.0))
-        return total
+        rules = self.rules_for(_d_type(features))
+        return rules.user(rules.scan.find(data.lower()), len(data))
 
     def float_boost_self(self, data: str, features: Mapping[str, object]) -> float:
-        total = 0.0
-        symbol = features.get("M", {}).get("symbol") if isinstance(features, Mapping) else None
-        intent = features.get("M", {}).get("intent") if isinstance(features, Mapping) else None
-        for rule in self.conf.get("float_rules_self", []):
-            if not isinstance(rule, Mapping):
-                continue
-            rtype = rule.get("type")
-            if rtype == "interest_symbol" and symbol in rule.get("symbols", []):
-                total += float(rule.get("add", 0.0))
-            elif rtype == "intent_match" and intent in rule.get("intents", []):
-                total += float(rule.get("add", 0.0))
-        return total
+        meta = _meta(features)
+        return self.rules_for(_d_type(features)).self_(meta.get("symbol"), meta.get("intent"))
+
+    def boosts(self, data: str, features: Mapping[str, object]) -> Tuple[float, float, float]:
+        """``(immutable, user, self)`` boosts with a single substring scan."""
+
+        meta = _meta(features)
+        rules = self.rules_for(_d_type(features))
+        found = rules.scan.find(data.lower())
+        return (
+            rules.immutable(found, meta.get("tags", [])),
+            rules.user(found, len(data)),
+            rules.self_(meta.get("symbol"), meta.get("intent")),
+        )
 
     # --- configuration ----------------------------------------------------
     def spectral_conf(self) -> Mapping[str, object]:
+        """Spectral settings merged over the defaults (computed once, returned read-only)."""
+
+        if self._spectral is not None:
+            return self._spectral
         spectral = self.conf.get("spectral", {})
         if not isinstance(spectral, Mapping):
-            return DEFAULT_CONFIG["spectral"]
+            spectral = {}
         merged = dict(DEFAULT_CONFIG["spectral"])
         merged.update(spectral)
         decision = dict(DEFAULT_CONFIG["spectral"]["decision"])
         decision.update(spectral.get("decision", {}))
-        merged["decision"] = decision
-        return merged
+        merged["decision"] = MappingProxyType(decision)
+        self._spectral = MappingProxyType(merged)
+        return self._spectral
 
     def bias(self) -> Mapping[str, float]:
         return {
@@ -122,4 +329,57 @@ class Policy:
         }
 
 
-__all__ = ["Policy", "DEFAULT_CONFIG"]
+class PolicyHolder:
+    """Mixin giving a ``policy`` attribute that falls back to :func:`get_policy`."""
+
+    _policy: Optional[Policy] = None
+
+    @property
+    def policy(self) -> Policy:
+        """An explicitly assigned policy, else the shared one (reloaded when its file changes)."""
+
+        return self._policy or get_policy()
+
+    @policy.setter
+    def policy(self, value: Optional[Policy]) -> None:
+        self._policy = value
+
+
+_REGISTRY: Dict[str, Tuple[Optional[Tuple[int, int]], Policy]] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+def _stamp(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        info = os.stat(path)
+    except OSError:
+        return None
+    return info.st_mtime_ns, info.st_size
+
+
+def get_policy(path: str | Path = "config/policies.json") -> Policy:
+    """Shared :class:`Policy` for ``path``, reloaded when the file changes.
+
+    Each call costs one ``stat``.  The file is only read and the rules are
+    only recompiled when its mtime or size differs from the cached load, or
+    when it appears or disappears.
+    """
+
+    key = os.path.abspath(path)
+    stamp = _stamp(key)
+    cached = _REGISTRY.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    with _REGISTRY_LOCK:
+        cached = _REGISTRY.get(key)
+        if cached is None or cached[0] != stamp:
+            cached = _REGISTRY[key] = (stamp, Policy(key))
+        return cached[1]
+
+
+def clear_policy_cache() -> None:
+    with _REGISTRY_LOCK:
+        _REGISTRY.clear()
+
+
+__all__ = ["Policy", "PolicyHolder", "DEFAULT_CONFIG", "clear_policy_cache", "get_policy"]
@@ -4,12 +4,20 @@ Copyright (c) 2025 Adrian Lipa / Intention Lab
 Licensed under the CIEL Research Non-Commercial License v1.1.
 
 Spectral weighting helpers used in the tests.
+
+``policy=None`` means the shared :func:`~tmp.policy.get_policy` instance, so
+no call re-reads ``config/policies.json`` unless the file has changed.
+:func:`spectral_weight_many` scores a batch with the G/M channels computed
+column-wise; each result equals the matching :func:`spectral_weight` call.
 """
 from __future__ import annotations
 
-from typing import Mapping, Tuple
+from typing import Any, Iterable, List, Mapping, Sequence, Tuple
+
+import numpy as np
 
-from .policy import Policy
+from .analysis import analyze_input
+from .policy import Policy, get_policy
 
 
 def clamp(value: float, low: float, high: float) -> float:
@@ -48,9 +56,9 @@ def _compute_components(
     cap_low = float(conf.get("cap_low", 0.0))
     cap_high = float(conf.get("cap_high", 2.0))
 
-    immutable = policy.immutable_boost(data, features)
-    user_boost = policy.float_boost_user(data, features) * max(user_subjective, 0.0)
-    self_boost = policy.float_boost_self(data, features) * max(self_subjective, 0.0)
+    immutable, user_boost, self_boost = policy.boosts(data, features)
+    user_boost *= max(user_subjective, 0.0)
+    self_boost *= max(self_subjective, 0.0)
 
     subjective = max(-0.5, user_subjective) + max(-0.5, self_subjective)
 
@@ -68,13 +76,13 @@ def spectral_weight(
 ) -> float:
     """Compute a simplified spectral weight for the tests."""
 
-    policy = policy or Policy()
+    policy = policy or get_policy()
     weight, _, _ = _compute_components(entry, features, user_subjective, self_subjective, policy)
     return weight
 
 
 def decision_thresholds(policy: Policy | None = None) -> Mapping[str, float]:
-    conf = (policy or Policy()).spectral_conf()
+    conf = (policy or get_policy()).spectral_conf()
     decision = conf.get("decision", {})
     return {
         "to_mem": float(decision.get("to_mem", 1.65)),
@@ -82,4 +90,61 @@ def decision_thresholds(policy: Policy | None = None) -> Mapping[str, float]:
     }
 
 
-__all__ = ["spectral_weight", "decision_thresholds", "clamp"]
+def spectral_weight_many(
+    entries: Iterable[Mapping[str, object] | str],
+    features: Sequence[Mapping[str, Mapping[str, object]]] | None = None,
+    user_subjective: float | Sequence[float] | np.ndarray = 0.0,
+    self_subjective: float | Sequence[float] | np.ndarray = 0.0,
+    policy: Policy | None = None,
+) -> np.ndarray:
+    """:func:`spectral_weight` for a batch of entries (``{"data": ...}`` or plain text).
+
+    ``features`` defaults to :func:`~tmp.analysis.analyze_input` of each
+    entry.  The subjective scores may be scalars or per-entry arrays.
+    """
+
+    policy = policy or get_policy()
+    entries = [e if isinstance(e, Mapping) else {"data": e} for e in entries]
+    texts: List[Any] = [e.get("data", "") for e in entries]
+    if features is None:
+        features = [analyze_input(str(text)) for text in texts]
+    if len(features) != len(entries):
+        raise ValueError("features must match entries")
+    n = len(entries)
+    if n == 0:
+        return np.zeros(0)
+
+    ctxs = [f.get("C", {}) if isinstance(f, Mapping) else {} for f in features]
+    metas = [f.get("M", {}) if isinstance(f, Mapping) else {} for f in features]
+    tokens = np.fromiter((float(c.get("tokens", 0) or 0) for c in ctxs), dtype=float, count=n)
+    length = np.fromiter((float(c.get("length", 0) or 0) for c in ctxs), dtype=float, count=n)
+    diversity = np.fromiter((len(set(str(t).split())) for t in texts), dtype=float, count=n)
+    G = np.minimum(1.0, (tokens / 6.0) + (diversity / 20.0) + (length / 300.0))
+
+    def flag(test) -> np.ndarray:
+        return np.fromiter((bool(test(m)) for m in metas), dtype=bool, count=n)
+
+    novelty = np.where(flag(lambda m: m.get("intent")), 1.0, 0.5)
+    novelty = novelty + np.where(flag(lambda m: m.get("symbol")), 0.2, 0.0)
+    novelty = novelty + np.where(flag(lambda m: isinstance(m.get("tags"), (list, tuple, set)) and m["tags"]), 0.1, 0.0)
+    M = np.clip(novelty, 0.0, 1.2)
+
+    conf = policy.spectral_conf()
+    base = float(conf.get("base", 0.4))
+    G_weight = float(conf.get("G_weight", 0.6))
+    M_weight = float(conf.get("M_weight", 0.4))
+    cap_low = float(conf.get("cap_low", 0.0))
+    cap_high = float(conf.get("cap_high", 2.0))
+
+    boosts = np.array([policy.boosts(text, f) for text, f in zip(texts, features)], dtype=float).reshape(n, 3)
+    user = np.broadcast_to(np.asarray(user_subjective, dtype=float), (n,))
+    own = np.broadcast_to(np.asarray(self_subjective, dtype=float), (n,))
+    user_boost = boosts[:, 1] * np.maximum(user, 0.0)
+    self_boost = boosts[:, 2] * np.maximum(own, 0.0)
+    subjective = np.maximum(-0.5, user) + np.maximum(-0.5, own)
+
+    weight = base + (G_weight * G) + (M_weight * M) + boosts[:, 0] + user_boost + self_boost + subjective
+    return np.clip(weight, cap_low, cap_high)
+
+
+__all__ = ["spectral_weight", "spectral_weight_many", "decision_thresholds", "clamp"]
@@ -14,17 +14,18 @@ FIXED: All scaling errors resolved, complete implementation with proper normaliz
 
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy import linalg, integrate, special, ndimage
-from scipy.interpolate import RectBivariateSpline
+from scipy import linalg, integrate
+from scipy.interpolate import make_interp_spline
 from dataclasses import dataclass, field
+from functools import lru_cache
 from enum import Enum
 from typing import Dict, List, Tuple, Optional, Callable, Any, Union
 import warnings
 warnings.filterwarnings('ignore')
 import numpy.typing as npt
-from sympy import isprime
-
-from mathematics.safe_operations import heisenberg_soft_clip_range
+from config.simulation_config import PrecisionPolicy, resolve_precision
+from mathematics import number_tables, zeta_series
+from mathematics.safe_operations import heisenberg_soft_clip_range, soft_clip_exp
 
 # =============================================================================
 # 🎯 REALITY LAYERS FRAMEWORK (PURE MATHEMATICAL)
@@ -120,7 +121,8 @@ class SchrodingerFoundation4D:
     intention_operator: complex = 1j
     hyper_dimension: int = 4
 
-    def create_primordial_superposition(self, symbolic_states: List[complex], shape: Tuple[int, ...]) -> npt.NDArray:
+    def create_primordial_superposition(self, symbolic_states: Union[List[complex], npt.NDArray],
+                                        shape: Tuple[int, ...]) -> npt.NDArray:
         states_array = np.array(symbolic_states, dtype=complex)
         norm = np.linalg.norm(states_array)
         if norm > 0:
@@ -150,6 +152,7 @@ class RamanujanStructure4D:
         self.ramanujan_pi = 9801/(2206*np.sqrt(2))
         self.golden_ratio = (1 + np.sqrt(5))/2
         self.magic_squares = self._generate_magic_squares()
+        self._taxicab_table = number_tables.taxicab_counts(1001) / 10.0
 
     def _generate_magic_squares(self) -> List[npt.NDArray]:
         squares = []
@@ -170,14 +173,8 @@ class RamanujanStructure4D:
 
     def taxicab_resonance_4d(self, coordinates: npt.NDArray) -> npt.NDArray:
         norms = np.sqrt(np.sum(coordinates**2, axis=-1))
-        taxicab_field = np.zeros_like(norms)
-        it = np.nditer(norms, flags=['multi_index'])
-        for norm_val in it:
-            idx = it.multi_index
-            n_val = int(abs(norm_val * 100)) + 1
-            taxicab_res = self._calculate_taxicab_representations(n_val % 1000 + 1)
-            taxicab_field[idx] = taxicab_res / 10.0
-        return taxicab_field
+        n_val = np.abs(norms * 100).astype(np.int64) + 1
+        return self._taxicab_table[n_val % 1000 + 1]
 
     def _calculate_taxicab_representations(self, n: int) -> float:
         representations = 0
@@ -198,27 +195,19 @@ class CollatzTwinPrimeRhythm4D:
     """Number-theoretic rhythms as cosmic computational engine"""
 
     def __init__(self):
-        self.collatz_cache = {}
         self.twin_primes = self._generate_twin_primes(200)
         self.prime_constellations = self._find_prime_constellations()
+        # Resonance lookup tables gathered by the 4D operators.
+        self._collatz_table = np.exp(-number_tables.collatz_lengths(10000) / 100.0)
+        twins = np.asarray(self.twin_primes, dtype=float)
+        self._twin_amplitude = np.sin(twins[:, 0] * 0.001) * np.cos(twins[:, 1] * 0.001)
+        self._constellation_table = np.asarray(self.prime_constellations, dtype=float)
 
     def _generate_twin_primes(self, n_pairs: int) -> List[Tuple[int, int]]:
-        twins = []
-        num = 3
-        while len(twins) < n_pairs:
-            if isprime(num) and isprime(num + 2):
-                twins.append((num, num + 2))
-            num += 2
-        return twins
+        return [tuple(pair) for pair in number_tables.twin_prime_pairs(n_pairs).tolist()]
 
     def _find_prime_constellations(self) -> List[List[int]]:
-        constellations = []
-        primes = [p for p in range(3, 1000) if isprime(p)]
-        for i in range(len(primes) - 3):
-            constellation = primes[i:i+4]
-            if all(isprime(p) for p in constellation):
-                constellations.append(constellation)
-        return constellations[:20]
+        return number_tables.consecutive_prime_groups(20, size=4, start=3, limit=1000).tolist()
 
     def collatz_sequence(self, n: int) -> List[int]:
         sequence = [n]
@@ -231,47 +220,22 @@ class CollatzTwinPrimeRhythm4D:
         return sequence
 
     def collatz_resonance_4d(self, coordinates: npt.NDArray) -> npt.NDArray:
-        resonance_field = np.zeros(coordinates.shape[:-1])
-        flat_coords = coordinates.reshape(-1, 4)
-        for idx, coord in enumerate(flat_coords):
-            n = int(np.sum(np.abs(coord * 1000))) % 10000 + 1
-            if n in self.collatz_cache:
-                resonance = self.collatz_cache[n]
-            else:
-                sequence = self.collatz_sequence(n)
-                resonance = np.exp(-len(sequence) / 100.0)
-                self.collatz_cache[n] = resonance
-            resonance_field.flat[idx] = resonance
-        return resonance_field
+        n = np.sum(np.abs(coordinates * 1000), axis=-1).astype(np.int64) % 10000 + 1
+        return self._collatz_table[n]
 
     def twin_prime_resonance_4d(self, coordinates: npt.NDArray) -> npt.NDArray:
-        resonance_field = np.zeros(coordinates.shape[:-1])
-        flat_coords = coordinates.reshape(-1, 4)
-        for idx, coord in enumerate(flat_coords):
-            coord_hash = int(np.sum(np.abs(coord * 100))) % len(self.twin_primes)
-            twin_pair = self.twin_primes[coord_hash]
-            resonance = (np.sin(twin_pair[0] * 0.001) * 
-                        np.cos(twin_pair[1] * 0.001) * 
-                        np.exp(1j * 0.01 * np.sum(coord)))
-            resonance_field.flat[idx] = np.real(resonance)
+        coord_hash = np.sum(np.abs(coordinates * 100), axis=-1).astype(np.int64) % len(self.twin_primes)
+        resonance_field = self._twin_amplitude[coord_hash] * np.cos(0.01 * np.sum(coordinates, axis=-1))
         return heisenberg_soft_clip_range(resonance_field, -1.0, 1.0)
 
     def prime_constellation_resonance(self, coordinates: npt.NDArray) -> npt.NDArray:
         """Prime constellation resonance for 4D structure"""
-        resonance_field = np.ones(coordinates.shape[:-1])
-        flat_coords = coordinates.reshape(-1, 4)
-
-        for idx, coord in enumerate(flat_coords):
-            constellation_idx = int(np.sum(coord * 100)) % len(self.prime_constellations)
-            constellation = self.prime_constellations[constellation_idx]
-
-            prime_resonance = 1.0
-            for prime in constellation:
-                prime_resonance *= np.sin(prime * 0.0001 * np.sum(coord))
-
-            resonance_field.flat[idx] = prime_resonance
-
-        return resonance_field
+        coord_sum = np.sum(coordinates, axis=-1)
+        # int() truncates toward zero; Python's % keeps the index non-negative.
+        constellation_idx = np.mod(np.trunc(np.sum(coordinates * 100, axis=-1)).astype(np.int64),
+                                   len(self.prime_constellations))
+        constellation = self._constellation_table[constellation_idx]
+        return np.prod(np.sin(constellation * 0.0001 * coord_sum[..., None]), axis=-1)
 
 class RiemannZetaProtection4D:
     """Riemann zeta function as topological protection field"""
@@ -411,9 +375,13 @@ class BanachTarskiCreation4D:
 class UniversalLawEngine4D:
     """4D Universal Law Engine - Pure Mathematical Implementation"""
 
-    def __init__(self, grid_size: Tuple[int, int, int, int] = (8, 8, 8, 6)):
+    FIELD_NAMES = ('symbolic_field', 'intention_field', 'resonance_field', 'creation_field')
+
+    def __init__(self, grid_size: Tuple[int, int, int, int] = (8, 8, 8, 6),
+                 precision: Optional[Union[PrecisionPolicy, str]] = None):
         self.grid_size = grid_size
         self.dimensions = 4
+        self.precision = resolve_precision(precision)
         self.schrodinger = SchrodingerFoundation4D()
         self.ramanujan = RamanujanStructure4D()
         self.collatz_twinprime = CollatzTwinPrimeRhythm4D()
@@ -424,71 +392,74 @@ class UniversalLawEngine4D:
         self.resonance_field = None
         self.creation_field = None
         self.hyper_coordinates = None
+        self._coordinate_fields: Dict[str, npt.NDArray] = {}
         self.current_step = 0
         self.initialize_cosmic_fields_4d()
 
     def initialize_cosmic_fields_4d(self):
-        x = np.linspace(-np.pi, np.pi, self.grid_size[0])
-        y = np.linspace(-np.pi, np.pi, self.grid_size[1])
-        z = np.linspace(-np.pi, np.pi, self.grid_size[2])
-        w = np.linspace(-np.pi, np.pi, self.grid_size[3])
-        self.X, self.Y, self.Z, self.W = np.meshgrid(x, y, z, w, indexing='ij')
+        self._coordinate_fields = {}
+        self.X, self.Y, self.Z, self.W = (self.precision.cast(axis) for axis in self._coordinate_axes())
         self.hyper_coordinates = np.stack([self.X, self.Y, self.Z, self.W], axis=-1)
-        symbolic_states = []
-        for i in range(self.grid_size[0]):
-            for j in range(self.grid_size[1]):
-                for k in range(self.grid_size[2]):
-                    for l in range(self.grid_size[3]):
-                        state = (np.sin(i + j) + 1j * np.cos(k + l)) * np.exp(1j * (i * k + j * l) * 0.1)
-                        symbolic_states.append(state)
+        i, j, k, l = np.ogrid[:self.grid_size[0], :self.grid_size[1], :self.grid_size[2], :self.grid_size[3]]
+        symbolic_states = (np.sin(i + j) + 1j * np.cos(k + l)) * np.exp(1j * (i * k + j * l) * 0.1)
         primordial_superposition = self.schrodinger.create_primordial_superposition(
             symbolic_states, self.grid_size)
-        self.symbolic_field = primordial_superposition
+        self.symbolic_field = self.precision.cast(primordial_superposition)
         self.intention_field = self.create_ramanujan_intention_4d()
         self.resonance_field = self.compute_universal_resonance_4d()
         self.creation_field = np.zeros_like(self.symbolic_field)
+        self.precision.enforce(self, self.FIELD_NAMES)
+
+    def _coordinate_axes(self) -> List[npt.NDArray]:
+        axes = (np.linspace(-np.pi, np.pi, n) for n in self.grid_size)
+        return np.meshgrid(*axes, indexing='ij')
+
+    def _coordinate_field(self, name: str) -> npt.NDArray:
+        """Output of a coordinate-only operator, evaluated once per grid.
+
+        The operators depend on nothing but the fixed hyper-coordinates, so they
+        are computed from float64 coordinates (their integer hashes must not
+        depend on the field precision) and stored at the field precision.
+        """
+        cached = self._coordinate_fields.get(name)
+        if cached is None:
+            operator = {
+                'modular': self.ramanujan.modular_forms_resonance_4d,
+                'taxicab': self.ramanujan.taxicab_resonance_4d,
+                'collatz': self.collatz_twinprime.collatz_resonance_4d,
+                'twin_prime': self.collatz_twinprime.twin_prime_resonance_4d,
+                'zeta': self.riemann.zeta_resonance_field_4d,
+            }[name]
+            coordinates = np.stack(self._coordinate_axes(), axis=-1)
+            cached = self._coordinate_fields[name] = self.precision.cast(operator(coordinates))
+        return cached
 
     def create_ramanujan_intention_4d(self) -> npt.NDArray:
-        intention = np.ones(self.grid_size, dtype=complex)
-        modular_contribution = self.ramanujan.modular_forms_resonance_4d(self.hyper_coordinates)
-        taxicab_pattern = self.ramanujan.taxicab_resonance_4d(self.hyper_coordinates)
+        intention = self.precision.ones(self.grid_size)
+        modular_contribution = self._coordinate_field('modular')
+        taxicab_pattern = self._coordinate_field('taxicab')
         intention = intention * modular_contribution * (1 + 0.1 * taxicab_pattern)
         magic_modulation = np.ones_like(intention)
         for i in range(4):
             magic_modulation *= np.sin(0.1 * self.hyper_coordinates[..., i] * 
                                      self.ramanujan.magic_squares[0].shape[0])
         intention *= (1 + 0.05 * magic_modulation)
-        norm = np.linalg.norm(intention)
+        norm = self.precision.norm(intention)
         if norm > 0:
             intention /= norm
         return intention
 
     def compute_universal_resonance_4d(self) -> npt.NDArray:
-        resonance = np.zeros(self.grid_size, dtype=float)
-        symbolic_flat = self.symbolic_field.reshape(-1)
-        intention_flat = self.intention_field.reshape(-1)
-        resonance_flat = resonance.reshape(-1)
-        coords_flat = self.hyper_coordinates.reshape(-1, 4)
-        for i in range(len(symbolic_flat)):
-            quantum_resonance = self.schrodinger.resonance_function(
-                np.array([symbolic_flat[i]]),
-                np.array([intention_flat[i]])
-            )
-            collatz_res = self.collatz_twinprime.collatz_resonance_4d(
-                coords_flat[i].reshape(1, -1)
-            ).item()
-            twin_prime_res = self.collatz_twinprime.twin_prime_resonance_4d(
-                coords_flat[i].reshape(1, -1)
-            ).item()
-            riemann_protection = np.abs(self.riemann.zeta_resonance_field_4d(
-                coords_flat[i].reshape(1, -1)
-            )).item()
-            universal_resonance = (quantum_resonance *
-                                 (1 + 0.1 * collatz_res) *
-                                 (1 + 0.1 * twin_prime_res) *
-                                 (1 + 0.05 * riemann_protection))
-            resonance_flat[i] = heisenberg_soft_clip_range(universal_resonance, 0.0, 2.0)
-        return resonance
+        # Point-wise |<symbolic|intention>|^2 weighted by the number-theoretic rhythms.
+        quantum_resonance = np.abs(np.conj(self.symbolic_field) * self.intention_field) ** 2
+        collatz_res = self._coordinate_field('collatz')
+        twin_prime_res = self._coordinate_field('twin_prime')
+        riemann_protection = np.abs(self._coordinate_field('zeta'))
+        universal_resonance = (quantum_resonance *
+                             (1 + 0.1 * collatz_res) *
+                             (1 + 0.1 * twin_prime_res) *
+                             (1 + 0.05 * riemann_protection))
+        return heisenberg_soft_clip_range(universal_resonance, 0.0, 2.0)
 
     def cosmic_evolution_step_4d(self, dt: float = 0.01) -> Dict[str, float]:
         self.current_step += 1
@@ -499,14 +470,15 @@ class UniversalLawEngine4D:
         self.riemann_protection_4d()
         self.banach_tarski_creation_4d()
         self.resonance_field = self.compute_universal_resonance_4d()
+        self.precision.enforce(self, self.FIELD_NAMES)
         return self.get_cosmic_state_4d()
 
     def schrodinger_evolution_4d(self, dt: float):
         laplacian = self.schrodinger.hyper_laplacian(self.symbolic_field)
-        potential = 0.1 * (np.abs(self.riemann.zeta_resonance_field_4d(self.hyper_coordinates)) +
+        potential = 0.1 * (np.abs(self._coordinate_field('zeta')) +
                           np.abs(self.intention_field))
         self.symbolic_field += dt * (1j * laplacian - potential * self.symbolic_field)
-        norm = np.linalg.norm(self.symbolic_field)
+        norm = self.precision.norm(self.symbolic_field)
         if norm > 0:
             self.symbolic_field /= norm
 
@@ -514,7 +486,7 @@ class UniversalLawEngine4D:
         target_pattern = np.exp(1j * (self.X + self.Y + self.Z + self.W))
         self.symbolic_field = (0.85 * self.symbolic_field +
                              0.15 * target_pattern * np.exp(1j * self.ramanujan.ramanujan_pi))
-        taxicab_mod = self.ramanujan.taxicab_resonance_4d(self.hyper_coordinates)
+        taxicab_mod = self._coordinate_field('taxicab')
         self.symbolic_field *= (1 + 0.08 * taxicab_mod)
 
     def evolve_intention_field_4d(self):
@@ -524,19 +496,19 @@ class UniversalLawEngine4D:
                    np.sin(self.X) * np.cos(self.Y) * 
                    np.sin(self.Z) * np.cos(self.W) * 
                    self.symbolic_field)
-        norm = np.linalg.norm(evolution)
+        norm = self.precision.norm(evolution)
         if norm > 0:
             self.intention_field = evolution / norm
 
     def collatz_twinprime_rhythm_4d(self):
-        collatz_rhythm = self.collatz_twinprime.collatz_resonance_4d(self.hyper_coordinates)
-        twin_prime_rhythm = self.collatz_twinprime.twin_prime_resonance_4d(self.hyper_coordinates)
+        collatz_rhythm = self._coordinate_field('collatz')
+        twin_prime_rhythm = self._coordinate_field('twin_prime')
         combined_rhythm = 0.5 * collatz_rhythm + 0.5 * twin_prime_rhythm
         phase_modulation = np.exp(1j * combined_rhythm * np.pi)
         self.symbolic_field *= phase_modulation
 
     def riemann_protection_4d(self):
-        zeta_protection = self.riemann.zeta_resonance_field_4d(self.hyper_coordinates)
+        zeta_protection = self._coordinate_field('zeta')
         protection = 0.5 * np.abs(zeta_protection)
         self.symbolic_field *= (1 + 0.15 * protection)
 
@@ -547,13 +519,14 @@ class UniversalLawEngine4D:
         self.symbolic_field = 0.8 * self.symbolic_field + 0.2 * self.creation_field
 
     def get_cosmic_state_4d(self) -> Dict[str, float]:
-        quantum_coherence = np.mean(np.abs(self.symbolic_field))
-        intention_strength = np.mean(np.abs(self.intention_field))
-        universal_resonance = np.mean(self.resonance_field)
-        creation_intensity = np.mean(np.abs(self.creation_field))
-        protection_field = self.riemann.zeta_resonance_field_4d(self.hyper_coordinates)
-        protection_strength = np.mean(np.abs(protection_field))
-        field_variance = np.var(np.abs(self.symbolic_field))
+        mean = self.precision.mean
+        quantum_coherence = mean(np.abs(self.symbolic_field))
+        intention_strength = mean(np.abs(self.intention_field))
+        universal_resonance = mean(self.resonance_field)
+        creation_intensity = mean(np.abs(self.creation_field))
+        protection_field = self._coordinate_field('zeta')
+        protection_strength = mean(np.abs(protection_field))
+        field_variance = np.var(np.abs(self.symbolic_field), dtype=np.float64)
         return {
             'quantum_coherence': float(quantum_coherence),
             'intention_strength': float(intention_strength),
@@ -570,37 +543,14 @@ class UniversalLawEngine4D:
 
 class StableRiemannZetaOperator:
     @staticmethod
-    def zeta(s: complex, terms: int = 100) -> complex:
-        try:
-            if s.real > 1:
-                result = 0.0
-                for n in range(1, terms):
-                    term = 1.0 / (n ** s)
-                    result += term
-                    if abs(term) < 1e-15:
-                        break
-                return result
-            else:
-                pi = np.pi
-                if abs(s.imag) < 1e-10 and s.real < 0 and abs(s.real - round(s.real)) < 1e-10:
-                    if round(s.real) % 2 == 0:
-                        return 0.0
-                if abs(s.imag) < 1e-10:
-                    s += 1e-10j
-                return (2 ** s * pi ** (s - 1) * np.sin(pi * s / 2) * 
-                        special.gamma(1 - s) * StableRiemannZetaOperator.zeta(1 - s, terms))
-        except (OverflowError, ValueError, ZeroDivisionError):
-            return complex(0, 0)
+    def zeta(s: complex | np.ndarray, terms: int = 100, method: str = "direct") -> complex | np.ndarray:
+        """Zeta of a scalar or complex array; see :func:`mathematics.zeta_series.zeta`."""
+        return zeta_series.zeta(s, terms=terms, method=method)
 
     @staticmethod
-    def critical_line_modulation(t: float, amplitude: float = 0.001) -> complex:
-        try:
-            t_clipped = heisenberg_soft_clip_range(t, -100.0, 100.0)
-            s = 0.5 + 1j * t_clipped
-            zeta_val = StableRiemannZetaOperator.zeta(s)
-            return amplitude * zeta_val
-        except:
-            return complex(0, 0)
+    def critical_line_modulation(t: float | np.ndarray, amplitude: float = 0.001) -> complex | np.ndarray:
+        t_clipped = heisenberg_soft_clip_range(t, -100.0, 100.0)
+        return amplitude * zeta_series.zeta_critical_line(t_clipped)
 
 class EnhancedMathematicalStructure:
     @staticmethod
@@ -640,6 +590,52 @@ class EnhancedMathematicalStructure:
 # 🌌 SEVEN FUNDAMENTAL FIELDS (EXTENDED WITH 4D ENGINE) - FIXED SCALING
 # =============================================================================
 
+def _linear_resize_matrix(n_in: int, n_out: int) -> np.ndarray:
+    """Row-stochastic (n_out, n_in) matrix equivalent to ``ndimage.zoom(order=1)``."""
+    W = np.zeros((n_out, n_in))
+    if n_in == 1 or n_out == 1:
+        W[:, 0] = 1.0
+        return W
+    coords = np.arange(n_out) * (n_in - 1) / (n_out - 1)
+    lo = np.minimum(np.floor(coords).astype(int), n_in - 2)
+    frac = coords - lo
+    rows = np.arange(n_out)
+    W[rows, lo] = 1.0 - frac
+    W[rows, lo + 1] += frac
+    return W
+
+
+def _spline_resize_matrix(n_in: int, n_out: int) -> np.ndarray:
+    """(n_out, n_in) weights of the interpolating spline used for extreme zooms."""
+    if n_in == 1:
+        return np.ones((n_out, 1))
+    x_old = np.linspace(0, 1, n_in)
+    x_new = np.linspace(0, 1, n_out)
+    spline = make_interp_spline(x_old, np.eye(n_in), k=min(3, n_in - 1))
+    return spline(x_new)
+
+
+@lru_cache(maxsize=32)
+def _resize_weights(source_shape: Tuple[int, int],
+                    target_shape: Tuple[int, int]) -> Tuple[np.ndarray, np.ndarray]:
+    """Separable interpolation weights for resizing ``source_shape`` to ``target_shape``.
+
+    Resizing a 2D field then reduces to ``W_x @ field @ W_y.T``; the weights
+    depend only on the shape pair, so they are computed once and reused.
+    """
+    zoom_factors = [target_shape[0] / source_shape[0],
+                    target_shape[1] / source_shape[1]]
+    if any(z <= 0 or z > 100 for z in zoom_factors):
+        build = _spline_resize_matrix
+    else:
+        build = _linear_resize_matrix
+    weights = (build(source_shape[0], target_shape[0]),
+               build(source_shape[1], target_shape[1]))
+    for W in weights:
+        W.setflags(write=False)
+    return weights
+
+
 class UnifiedSevenFundamentalFields:
     def __init__(self, constants: UnifiedCIELConstants, spacetime_shape: tuple):
         self.C = constants
@@ -727,24 +723,8 @@ class UnifiedSevenFundamentalFields:
                 if field_2d.shape[0] == 0 or field_2d.shape[1] == 0:
                     return np.zeros(target_shape, dtype=field_2d.dtype)
 
-                zoom_factors = [target_shape[0]/field_2d.shape[0], 
-                              target_shape[1]/field_2d.shape[1]]
-
-                if any(z <= 0 or z > 100 for z in zoom_factors):
-                    x_old = np.linspace(0, 1, field_2d.shape[0])
-                    y_old = np.linspace(0, 1, field_2d.shape[1])
-                    x_new = np.linspace(0, 1, target_shape[0])
-                    y_new = np.linspace(0, 1, target_shape[1])
-
-                    if np.iscomplexobj(field_2d):
-                        real_interp = RectBivariateSpline(x_old, y_old, field_2d.real)
-                        imag_interp = RectBivariateSpline(x_old, y_old, field_2d.imag)
-                        result = real_interp(x_new, y_new) + 1j * imag_interp(x_new, y_new)
-                    else:
-                        interp = RectBivariateSpline(x_old, y_old, field_2d)
-                        result = interp(x_new, y_new)
-                else:
-                    result = ndimage.zoom(field_2d, zoom_factors, order=1)
+                W_x, W_y = _resize_weights(field_2d.shape, tuple(target_shape))
+                result = W_x @ field_2d @ W_y.T
 
                 # POPRAWKA 3: Normalizacja po resize
                 norm_before = np.linalg.norm(field_2d)
@@ -762,11 +742,7 @@ class UnifiedSevenFundamentalFields:
 
             # POPRAWKA 4: Kontrola overflow w exp()
             def safe_exp(arg, max_arg=50):
-                arg_clipped = heisenberg_soft_clip_range(np.real(arg), -max_arg, max_arg)
-                if np.iscomplexobj(arg):
-                    imag_part = np.imag(arg)
-                    return np.exp(arg_clipped) * np.exp(1j * imag_part)
-                return np.exp(arg_clipped)
+                return soft_clip_exp(arg, -max_arg, max_arg)
 
             # POPRAWKA 5: Unified scaling strategy
             def normalize_field(field, target_max=1.0):
@@ -782,20 +758,20 @@ class UnifiedSevenFundamentalFields:
 
             alpha = 0.3
 
-            for t_idx in range(self.spacetime_shape[2]):
-                time_phase = 0.1 * t_idx
-                time_factor = safe_exp(1j * time_phase)
+            # All time-slice phases at once: one (nt,) vector per angular rate,
+            # broadcast against the (nx, ny) projections as an outer product.
+            t_idx = np.arange(self.spacetime_shape[2])
+            rates = np.array([0.1, 0.05, 0.02, 0.03, 0.04])
+            time_factors = safe_exp(1j * rates[:, np.newaxis] * t_idx)
 
-                self.schrodinger_4d_field[:, :, t_idx] = symbolic_resized * time_factor
-                self.ramanujan_4d_field[:, :, t_idx] = intention_resized * safe_exp(1j * 0.05 * t_idx)
-                self.collatz_4d_field[:, :, t_idx] = resonance_resized * safe_exp(1j * 0.02 * t_idx)
-                self.riemann_4d_field[:, :, t_idx] = np.abs(symbolic_resized) * safe_exp(1j * 0.03 * t_idx)
-                self.banach_tarski_4d_field[:, :, t_idx] = creation_resized * safe_exp(1j * 0.04 * t_idx)
+            self.schrodinger_4d_field[...] = symbolic_resized[..., np.newaxis] * time_factors[0]
+            self.ramanujan_4d_field[...] = intention_resized[..., np.newaxis] * time_factors[1]
+            self.collatz_4d_field[...] = resonance_resized[..., np.newaxis] * time_factors[2]
+            self.riemann_4d_field[...] = np.abs(symbolic_resized)[..., np.newaxis] * time_factors[3]
+            self.banach_tarski_4d_field[...] = creation_resized[..., np.newaxis] * time_factors[4]
 
-                self.psi[:, :, t_idx] = ((1 - alpha) * self.psi[:, :, t_idx] + 
-                                         alpha * symbolic_resized)
-                self.I_field[:, :, t_idx] = ((1 - alpha) * self.I_field[:, :, t_idx] + 
-                                             alpha * intention_resized)
+            self.psi = (1 - alpha) * self.psi + alpha * symbolic_resized[..., np.newaxis]
+            self.I_field = (1 - alpha) * self.I_field + alpha * intention_resized[..., np.newaxis]
 
             # POPRAWKA 6: Renormalizacja końcowa
             self.psi = normalize_field(self.psi, 1.0)
@@ -979,6 +955,10 @@ class Lie4Constants:
     RESONANCE_COUPLING: float = 0.733
     TEMPORAL_COUPLING: float = 0.219
 
+# The generators are fixed, so the structure constants depend only on TOTAL_DIM.
+_LIE4_STRUCTURE_CACHE: Dict[int, np.ndarray] = {}
+
+
 class Lie4Algebra:
     def __init__(self, constants: Lie4Constants):
         self.C = constants
@@ -1028,42 +1008,30 @@ class Lie4Algebra:
     def commutator(self, A: np.ndarray, B: np.ndarray) -> np.ndarray:
         return A @ B - B @ A
 
+    def generator_list(self) -> np.ndarray:
+        """All generators stacked as (M..., P..., Q..., Omega), shape (15, 4, 4)."""
+        g = self.generators
+        return np.concatenate([g['M'], g['P'], g['Q'], g['Omega'][None]])
+
     def structure_constants(self) -> np.ndarray:
         n = self.C.TOTAL_DIM
-        f = np.zeros((n, n, n), dtype=np.complex128)
-
-        gen_list = []
-        for M_gen in self.generators['M']:
-            gen_list.append(M_gen)
-        for mu in range(4):
-            gen_list.append(self.generators['P'][mu])
-        for Q_gen in self.generators['Q']:
-            gen_list.append(Q_gen)
-        gen_list.append(self.generators['Omega'])
-
-        for a in range(min(len(gen_list), n)):
-            for b in range(min(len(gen_list), n)):
-                comm = self.commutator(gen_list[a], gen_list[b])
-                for c in range(min(len(gen_list), n)):
-                    f[a, b, c] = np.trace(comm @ gen_list[c].T.conj())
-
+        f = _LIE4_STRUCTURE_CACHE.get(n)
+        if f is None:
+            gens = self.generator_list()[:n]
+            comm = np.einsum('aij,bjk->abik', gens, gens) - np.einsum('bij,ajk->abik', gens, gens)
+            f = np.zeros((n, n, n), dtype=np.complex128)
+            k = len(gens)
+            f[:k, :k, :k] = np.einsum('abij,cij->abc', comm, gens.conj())
+            f.setflags(write=False)
+            _LIE4_STRUCTURE_CACHE[n] = f
         return f
 
     def adjoint_action(self, X: np.ndarray, Y: np.ndarray) -> np.ndarray:
         return self.commutator(X, Y)
 
     def casimir_operator(self) -> np.ndarray:
-        gen_list = []
-        for M_gen in self.generators['M']:
-            gen_list.append(M_gen)
-        for mu in range(4):
-            gen_list.append(self.generators['P'][mu])
-
-        casimir = np.zeros((4, 4), dtype=np.complex128)
-        for gen in gen_list:
-            casimir += gen @ gen
-
-        return casimir
+        gens = np.concatenate([self.generators['M'], self.generators['P']])
+        return np.einsum('aij,ajk->ik', gens, gens)
 
 # =============================================================================
 # 🎯 COMPLETE UNIFIED EVOLUTION ENGINE